@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark which compares the old in-memory BIND zone export with the streaming
+export on a synthetic zone.
+
+Use it as following (run it in the root of the repo directory):
+    $ python contrib/benchmarks/benchmark_dns_bind_export.py --records 500000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from libcloud.dns.base import DNSDriver, Zone, Record
+from libcloud.dns.types import RecordType
+
+
+class SyntheticDNSDriver(DNSDriver):
+    name = 'Synthetic DNS'
+
+    def __init__(self, records_count):
+        self.records_count = records_count
+
+    def iterate_records(self, zone):
+        # Records are returned in a random id order, the same as with most of
+        # the providers
+        ids = list(range(self.records_count))
+        random.Random(42).shuffle(ids)
+
+        for record_id in ids:
+            yield Record(id=str(record_id), name='host%s' % (record_id),
+                         type=RecordType.A,
+                         data='10.%s.%s.%s' % (record_id >> 16 & 255, record_id >> 8 & 255, record_id & 255),
+                         zone=zone, driver=self, extra={'ttl': 300})
+
+
+def export_in_memory(driver, zone, file_path):
+    # Behavior of export_zone_to_bind_zone_file prior to the streaming export
+    records = sorted(driver.list_records(zone), key=Record._get_numeric_id)
+    lines = ['; header', '$ORIGIN %s.' % (zone.domain), '$TTL %s\n' % (zone.ttl)]
+
+    for record in records:
+        lines.append(driver._get_bind_record_line(record=record))
+
+    with open(file_path, 'w') as fp:
+        fp.write('\n'.join(lines))
+
+
+def export_streaming(driver, zone, file_path, sort=True):
+    with open(file_path, 'w') as fp:
+        driver.export_zone_to_bind_stream(zone=zone, stream=fp, sort=sort)
+
+
+def measure(name, func, *args, **kwargs):
+    tracemalloc.start()
+    start = time.time()
+    func(*args, **kwargs)
+    duration = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('%-28s %8.2f s %10.1f MB peak' % (name, duration, peak / 1024.0 / 1024.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BIND zone export benchmark')
+    parser.add_argument('--records', type=int, default=500000,
+                        help='Number of records in the synthetic zone')
+    args = parser.parse_args()
+
+    driver = SyntheticDNSDriver(records_count=args.records)
+    zone = Zone(id='1', domain='example.com', type='master', ttl=300, driver=driver)
+    file_path = tempfile.mkstemp(suffix='.zone')[1]
+
+    print('Exporting zone with %s records' % (args.records))
+
+    try:
+        measure('in-memory (previous)', export_in_memory, driver, zone, file_path)
+        measure('streaming, sorted', export_streaming, driver, zone, file_path)
+        measure('streaming, unsorted', export_streaming, driver, zone, file_path, sort=False)
+    finally:
+        os.unlink(file_path)
+
+
+if __name__ == '__main__':
+    main()
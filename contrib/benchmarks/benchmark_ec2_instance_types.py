@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark which measures time and memory (RSS) needed to load the EC2
+instance type data on the first EC2NodeDriver.list_sizes() call (pricing data
+is loaded before the measurement).
+
+Each measurement runs in a new Python process.
+
+Use it as following (run it in the root of the repo directory):
+    $ python contrib/benchmarks/benchmark_ec2_instance_types.py --runs 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+
+MEASURE_CODE = """
+import gc
+import json
+import ctypes
+import time
+import resource
+
+def get_rss():
+    try:
+        with open('/proc/self/statm') as fp:
+            return int(fp.read().split()[1]) * resource.getpagesize()
+    except IOError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+from libcloud.compute.drivers.ec2 import EC2NodeDriver
+from libcloud.pricing import get_pricing
+
+driver = EC2NodeDriver('key', 'secret', region=%(region)r)
+
+# Pricing data is loaded in advance so only the instance types data is
+# measured
+get_pricing(driver_type='compute', driver_name='ec2_linux')
+
+# Return memory which has been freed while loading the pricing data to the
+# OS so it's not reused by the measured code
+gc.collect()
+try:
+    ctypes.CDLL('libc.so.6').malloc_trim(0)
+except (OSError, AttributeError):
+    pass
+
+rss_before = get_rss()
+start = time.perf_counter()
+sizes = driver.list_sizes()
+first_call = time.perf_counter() - start
+rss_after = get_rss()
+
+start = time.perf_counter()
+driver.list_sizes()
+second_call = time.perf_counter() - start
+
+print(json.dumps({'sizes': len(sizes), 'first_call': first_call,
+                  'second_call': second_call, 'rss': rss_after - rss_before}))
+"""
+
+
+def run(region):
+    env = os.environ.copy()
+    env['PYTHONPATH'] = ROOT_DIRECTORY
+    env['PYTHONWARNINGS'] = 'ignore'
+
+    output = subprocess.check_output([sys.executable, '-c', MEASURE_CODE % {'region': region}],
+                                     cwd=ROOT_DIRECTORY, env=env)
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EC2 instance types loading benchmark')
+    parser.add_argument('--region', default='us-east-1')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    # First run makes sure the bytecode and data files are cached
+    run(args.region)
+    results = [run(args.region) for _ in range(args.runs)]
+
+    print('region: %s, sizes: %s, runs: %s' % (args.region, results[0]['sizes'], args.runs))
+    print('first list_sizes() call (incl. loading data): %.1f ms' %
+          (min(r['first_call'] for r in results) * 1000))
+    print('second list_sizes() call: %.1f ms' % (min(r['second_call'] for r in results) * 1000))
+    print('RSS increase: %.1f MB' % (min(r['rss'] for r in results) / 1024.0 / 1024))
+
+
+if __name__ == '__main__':
+    main()
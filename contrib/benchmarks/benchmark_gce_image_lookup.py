@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark which measures wall clock time and the number of API requests
+needed to resolve a public image name (e.g. create_node(image='debian-7')) with
+GCENodeDriver.ex_get_image().
+
+API responses are served from the GCE test fixtures (using requests_mock) with
+an artificial latency per request.
+
+Use it as following (run it in the root of the repo directory):
+    $ python contrib/benchmarks/benchmark_gce_image_lookup.py --latency 50
+"""
+
+import os
+import re
+import sys
+import time
+import json
+import argparse
+import tempfile
+import threading
+
+import requests_mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from libcloud.compute.drivers.gce import GCENodeDriver
+from libcloud.http import LibcloudConnection
+from libcloud.test.file_fixtures import ComputeFileFixtures
+
+PROJECT_IMAGES_RE = re.compile(r'/compute/v1/projects/([^/]+)/global/images(\?|$)')
+TOKEN_URL = 'http://metadata/computeMetadata/v1/instance/service-accounts/default/token'
+
+# Mocked API responses are served by a transport adapter which is mounted on
+# each connection session (unlike requests_mock.mock(), it doesn't serialize
+# concurrent requests)
+ADAPTER = requests_mock.Adapter()
+
+
+class MockConnection(LibcloudConnection):
+    def __init__(self, *args, **kwargs):
+        super(MockConnection, self).__init__(*args, **kwargs)
+        self.session.mount('https://', ADAPTER)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GCE image lookup benchmark')
+    parser.add_argument('--image', default='debian-7')
+    parser.add_argument('--latency', type=int, default=50,
+                        help='Latency of each API request in milliseconds')
+    parser.add_argument('--lookups', type=int, default=5,
+                        help='Number of lookups with already created drivers')
+    args = parser.parse_args()
+
+    fixtures = ComputeFileFixtures('gce')
+    lock = threading.Lock()
+    requests = []
+
+    def callback(request, context):
+        with lock:
+            requests.append(request.url)
+
+        time.sleep(args.latency / 1000.0)
+        project = PROJECT_IMAGES_RE.search(request.path).group(1)
+
+        try:
+            return fixtures.load('projects_%s_global_images.json' % (project))
+        except IOError:
+            return json.dumps({'kind': 'compute#imageList', 'items': []})
+
+    ADAPTER.register_uri('GET', re.compile(r'/projects/project-name/zones$'),
+                         text=fixtures.load('zones.json'))
+    ADAPTER.register_uri('GET', re.compile(r'/projects/project-name/regions$'),
+                         text=fixtures.load('regions.json'))
+    ADAPTER.register_uri('GET', PROJECT_IMAGES_RE, text=callback)
+    GCENodeDriver.connectionCls.conn_class = MockConnection
+
+    drivers = []
+    with requests_mock.mock(real_http=True) as m, tempfile.NamedTemporaryFile() as fp:
+        m.get(TOKEN_URL, json={'access_token': 'token', 'token_type': 'Bearer',
+                               'expires_in': 3600})
+
+        for _ in range(args.lookups + 1):
+            drivers.append(GCENodeDriver('user@example.com', 'key', project='project-name',
+                                         auth_type='GCE', credential_file=fp.name))
+
+    print('Resolving "%s" (%s ms latency per request)' % (args.image, args.latency))
+
+    start = time.time()
+    image = drivers[0].ex_get_image(args.image)
+    duration = time.time() - start
+    print('first lookup: %s, %.1f ms, %s requests' % (image.name, duration * 1000, len(requests)))
+
+    del requests[:]
+    start = time.time()
+    for driver in drivers[1:]:
+        driver.ex_get_image(args.image)
+    duration = (time.time() - start) / args.lookups
+    print('next lookups (new driver instances): %.1f ms, %.1f requests per lookup' %
+          (duration * 1000, float(len(requests)) / args.lookups))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark which measures CPU time needed to convert EC2 DescribeInstances
+response with a large number of instances to Node objects.
+
+"lazy" only converts the nodes, "eager" also decodes all the extra
+attributes (which matches the behavior before the extra attributes became
+lazy).
+
+Use it as following (run it in the root of the repo directory):
+    $ python contrib/benchmarks/benchmark_lazy_node_extra.py --instances 5000
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from libcloud.compute.drivers.ec2 import EC2NodeDriver
+from libcloud.compute.drivers.ec2 import NAMESPACE
+from libcloud.test.file_fixtures import ComputeFileFixtures
+from libcloud.utils.py3 import ET
+from libcloud.utils.xml import findall
+
+INSTANCE_ITEM_RE = re.compile(r'(<instancesSet>\s*)(<item>.*?</item>)(\s*</instancesSet>)', re.S)
+
+
+def get_describe_instances_element(instances):
+    fixtures = ComputeFileFixtures('ec2')
+    body = fixtures.load('describe_instances.xml')
+    match = INSTANCE_ITEM_RE.search(body)
+    item = match.group(2)
+
+    items = [item.replace('i-4382922a', 'i-%08x' % (index))
+             for index in range(instances)]
+    body = body[:match.start(2)] + '\n'.join(items) + body[match.end(2):]
+    return ET.XML(body)
+
+
+def to_nodes(driver, element):
+    nodes = []
+
+    for rs in findall(element=element, xpath='reservationSet/item', namespace=NAMESPACE):
+        nodes += driver._to_nodes(rs, 'instancesSet/item')
+
+    return nodes
+
+
+def convert_lazy(driver, element):
+    nodes = to_nodes(driver, element)
+
+    for node in nodes:
+        (node.id, node.state, node.public_ips, node.private_ips)
+
+    return nodes
+
+
+def convert_lazy_access_few(driver, element):
+    nodes = to_nodes(driver, element)
+
+    for node in nodes:
+        (node.extra['instance_type'], node.extra['availability'])
+
+    return nodes
+
+
+def convert_eager(driver, element):
+    nodes = to_nodes(driver, element)
+
+    for node in nodes:
+        node.extra.materialize()
+
+    return nodes
+
+
+def measure(name, func, driver, element, iterations):
+    durations = []
+
+    for _ in range(iterations):
+        start = time.process_time()
+        nodes = func(driver, element)
+        durations.append(time.process_time() - start)
+
+    best = min(durations)
+    print('%-30s %10.3f s %10.1f us/node' % (name, best, best / len(nodes) * 1000000))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lazy node extra benchmark')
+    parser.add_argument('--instances', type=int, default=5000,
+                        help='Number of instances in the response')
+    parser.add_argument('--iterations', type=int, default=5)
+    args = parser.parse_args()
+
+    driver = EC2NodeDriver('key', 'secret')
+    element = get_describe_instances_element(args.instances)
+
+    print('Converting %s instances (best of %s runs)' % (args.instances, args.iterations))
+    eager = measure('eager (all extra decoded)', convert_eager, driver, element, args.iterations)
+    lazy = measure('lazy (id, state, ips)', convert_lazy, driver, element, args.iterations)
+    measure('lazy (two extra attributes)', convert_lazy_access_few, driver, element, args.iterations)
+    print('speedup: %.1fx' % (eager / lazy))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark which compares the previous busy-waiting local storage lock with the
+lock registry using many concurrent writers and the previous user space file
+copy with the kernel accelerated copy.
+
+Use it as following (run it in the root of the repo directory):
+    $ python contrib/benchmarks/benchmark_local_storage.py --writers 32
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from libcloud.common.types import LibcloudError
+from libcloud.storage.drivers.local import LockLocalStorage
+from libcloud.storage.drivers.local import _copy_file
+
+
+class SpinningLockLocalStorage(LockLocalStorage):
+    # Behavior of LockLocalStorage prior to the lock registry - thread lock is
+    # created for every instance and it's polled in a loop
+    def __init__(self, path, timeout=5):
+        super(SpinningLockLocalStorage, self).__init__(path, timeout=timeout)
+        self.thread_lock = threading.Lock()
+
+    def __enter__(self):
+        end_time = int(time.time()) + self.lock_acquire_timeout
+
+        while int(time.time()) < end_time:
+            success = self.thread_lock.acquire(blocking=False)
+
+            if success:
+                break
+
+        if not success:
+            raise LibcloudError('Failed to acquire thread lock')
+
+        self.ipc_lock.acquire(blocking=True,
+                              timeout=self.lock_acquire_timeout)
+
+
+def write_files(lock_cls, directory, writers, writes):
+    # Each write is a read-modify-write of a counter so updates are lost if
+    # the lock doesn't serialize the writers
+    file_path = os.path.join(directory, 'counter')
+
+    with open(file_path, 'w') as fp:
+        fp.write('0')
+
+    def write():
+        for _ in range(writes):
+            with lock_cls(file_path, timeout=60):
+                with open(file_path, 'r') as fp:
+                    # File is empty if another writer is writing it
+                    value = int(fp.read() or 0)
+
+                time.sleep(0.0001)
+
+                with open(file_path, 'w') as fp:
+                    fp.write(str(value + 1))
+
+    threads = [threading.Thread(target=write) for _ in range(writers)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    with open(file_path, 'r') as fp:
+        return '%s lost updates' % (writers * writes - int(fp.read()))
+
+
+def copy_user_space(source_path, destination_path):
+    # Behavior of the local storage driver prior to the kernel accelerated copy
+    with open(source_path, 'rb') as source:
+        with open(destination_path, 'wb') as destination:
+            shutil.copyfileobj(source, destination)
+
+
+def measure(name, func, *args, **kwargs):
+    start = time.time()
+    start_cpu = time.process_time()
+    result = func(*args, **kwargs)
+    duration = time.time() - start
+    cpu_time = time.process_time() - start_cpu
+
+    print('%-28s %8.2f s %8.2f s CPU  %s' % (name, duration, cpu_time,
+                                             result or ''))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local storage benchmark')
+    parser.add_argument('--writers', type=int, default=32,
+                        help='Number of concurrent writer threads')
+    parser.add_argument('--writes', type=int, default=50,
+                        help='Number of writes per thread')
+    parser.add_argument('--file-size', type=int, default=256,
+                        help='Size of the copied file in MB')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+
+    try:
+        print('%s writers, %s writes each' % (args.writers, args.writes))
+        measure('spinning lock (previous)', write_files,
+                SpinningLockLocalStorage, directory, args.writers, args.writes)
+        measure('lock registry', write_files, LockLocalStorage, directory,
+                args.writers, args.writes)
+
+        source_path = os.path.join(directory, 'source')
+        destination_path = os.path.join(directory, 'destination')
+
+        with open(source_path, 'wb') as fp:
+            for _ in range(args.file_size):
+                fp.write(os.urandom(1024 * 1024))
+
+        print('Copying %s MB file' % (args.file_size))
+        measure('user space copy (previous)', copy_user_space, source_path,
+                destination_path)
+        measure('kernel copy', _copy_file, source_path, destination_path)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
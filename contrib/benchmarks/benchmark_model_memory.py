@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark which measures memory usage (bytes per object) of the base model
+classes (Node, StorageVolume, Object, Record, ...).
+
+"before" creates the objects with string interning disabled, "after" with
+short repeated strings (states, record types, extra values) interned.
+
+Use it as following (run it in the root of the repo directory):
+    $ python contrib/benchmarks/benchmark_model_memory.py --count 100000
+"""
+
+import os
+import sys
+import argparse
+import contextlib
+import tracemalloc
+
+import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from libcloud.compute.base import Node
+from libcloud.compute.base import NodeSize
+from libcloud.compute.base import NodeImage
+from libcloud.compute.base import StorageVolume
+from libcloud.storage.base import Container
+from libcloud.storage.base import Object
+from libcloud.dns.base import Record
+from libcloud.dns.base import Zone
+
+
+def copy_string(value):
+    # Return a new string object with the same value, like the one created
+    # when parsing an API response
+    return ''.join(list(value))
+
+
+def create_node(index, cls, driver):
+    return cls(id='i-%08x' % (index), name='node-%s' % (index),
+               state=copy_string('running'),
+               public_ips=['54.1.%s.%s' % (index // 256 % 256, index % 256)],
+               private_ips=['10.0.%s.%s' % (index // 256 % 256, index % 256)],
+               driver=driver,
+               extra={'availability': copy_string('us-east-1a'),
+                      'instance_type': copy_string('m5.large'),
+                      'image_id': copy_string('ami-0abcdef1234567890'),
+                      'status': copy_string('running'),
+                      'architecture': copy_string('x86_64'),
+                      'launch_time': copy_string('2021-06-01T10:00:00.000Z')})
+
+
+def create_volume(index, cls, driver):
+    return cls(id='vol-%08x' % (index), name='volume-%s' % (index), size=10,
+               driver=driver, state=copy_string('available'),
+               extra={'zone': copy_string('us-east-1a'),
+                      'volume_type': copy_string('gp2')})
+
+
+def create_object(index, cls, container, driver):
+    return cls(name='logs/2021/06/01/object-%s.log' % (index), size=index,
+               hash='%032x' % (index),
+               extra={'content_type': copy_string('text/plain'),
+                      'last_modified': copy_string('2021-06-01T10:00:00')},
+               meta_data={}, container=container, driver=driver)
+
+
+def create_record(index, cls, zone, driver):
+    return cls(id=str(index), name='host-%s' % (index),
+               type=copy_string('A'),
+               data='10.0.%s.%s' % (index // 256 % 256, index % 256),
+               zone=zone, driver=driver, ttl=3600, extra={})
+
+
+@contextlib.contextmanager
+def disable_interning():
+    patches = []
+
+    for module in ['libcloud.compute.base', 'libcloud.storage.base', 'libcloud.dns.base']:
+        patches.append(mock.patch(module + '.intern_string', lambda value: value))
+        patches.append(mock.patch(module + '.intern_values', lambda value: value))
+
+    for patch in patches:
+        patch.start()
+
+    try:
+        yield
+    finally:
+        for patch in patches:
+            patch.stop()
+
+
+def measure(count, func):
+    tracemalloc.start()
+    objects = [func(index) for index in range(count)]
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(objects) == count
+    return current / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Model memory usage benchmark')
+    parser.add_argument('--count', type=int, default=100000,
+                        help='Number of objects of each type which are created')
+    args = parser.parse_args()
+
+    driver = object()
+    container = Container(name='logs', extra={}, driver=driver)
+    zone = Zone(id='1', domain='example.com', type='master', ttl=3600, driver=driver)
+
+    classes = [
+        ('Node', Node, lambda index, cls: create_node(index, cls, driver)),
+        ('StorageVolume', StorageVolume, lambda index, cls: create_volume(index, cls, driver)),
+        ('NodeSize', NodeSize, lambda index, cls: cls(id='m5.large', name='m5.large', ram=8192,
+                                                      disk=0, bandwidth=None, price=0.096, driver=driver)),
+        ('NodeImage', NodeImage, lambda index, cls: cls(id='ami-%08x' % (index), name='image',
+                                                        driver=driver)),
+        ('Object', Object, lambda index, cls: create_object(index, cls, container, driver)),
+        ('Record', Record, lambda index, cls: create_record(index, cls, zone, driver)),
+    ]
+
+    print('%-15s %15s %15s %10s' % ('class', 'before (B/obj)', 'after (B/obj)', 'saved'))
+
+    for name, cls, func in classes:
+        with disable_interning():
+            before = measure(args.count, lambda index: func(index, cls))
+
+        after = measure(args.count, lambda index: func(index, cls))
+        print('%-15s %15.1f %15.1f %9.1f%%' % (name, before, after, (1 - after / before) * 100))
+
+
+if __name__ == '__main__':
+    main()
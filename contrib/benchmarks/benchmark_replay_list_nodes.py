@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark which measures end-to-end EC2 list_nodes throughput using a
+replayed cassette.
+
+If no cassette is provided, a synthetic one with the requested number of
+instances is recorded first (using the EC2 test fixtures and requests_mock).
+
+Use it as following (run it in the root of the repo directory):
+    $ python contrib/benchmarks/benchmark_replay_list_nodes.py --instances 10000
+    $ python contrib/benchmarks/benchmark_replay_list_nodes.py --cassette ec2.jsonl.gz
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import tempfile
+
+import requests_mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from libcloud.compute.drivers.ec2 import EC2NodeDriver
+from libcloud.test.file_fixtures import ComputeFileFixtures
+from libcloud.utils.cassette import use_cassette
+from libcloud.utils.py3 import parse_qs
+from libcloud.utils.py3 import urlparse
+
+INSTANCE_ITEM_RE = re.compile(r'(<instancesSet>\s*)(<item>.*?</item>)(\s*</instancesSet>)', re.S)
+
+
+def get_describe_instances_body(instances):
+    fixtures = ComputeFileFixtures('ec2')
+    body = fixtures.load('describe_instances.xml')
+    match = INSTANCE_ITEM_RE.search(body)
+    item = match.group(2)
+
+    items = [item.replace('i-4382922a', 'i-%08x' % (index))
+             for index in range(instances)]
+    return body[:match.start(2)] + '\n'.join(items) + body[match.end(2):]
+
+
+def record_cassette(path, instances):
+    fixtures = ComputeFileFixtures('ec2')
+    bodies = {
+        'DescribeInstances': get_describe_instances_body(instances),
+        'DescribeAddresses': fixtures.load('describe_addresses_multi.xml')
+    }
+
+    def callback(request, context):
+        action = parse_qs(urlparse.urlparse(request.url).query)['Action'][0]
+        return bodies[action]
+
+    with requests_mock.mock() as m:
+        m.get(requests_mock.ANY, text=callback)
+
+        with use_cassette(path, mode='record'):
+            EC2NodeDriver('key', 'secret').list_nodes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replayed list_nodes benchmark')
+    parser.add_argument('--instances', type=int, default=10000,
+                        help='Number of instances in the synthetic cassette')
+    parser.add_argument('--cassette', default=None,
+                        help='Path to an already recorded cassette')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Latency (in seconds) injected to each response')
+    parser.add_argument('--iterations', type=int, default=5)
+    args = parser.parse_args()
+
+    path = args.cassette
+
+    if path is None:
+        path = tempfile.mkstemp(suffix='.jsonl.gz')[1]
+        print('Recording synthetic cassette with %s instances' % (args.instances))
+        record_cassette(path, args.instances)
+
+    try:
+        with use_cassette(path, mode='replay', latency=args.latency):
+            driver = EC2NodeDriver('key', 'secret')
+            durations = []
+
+            for _ in range(args.iterations):
+                start = time.time()
+                nodes = driver.list_nodes()
+                durations.append(time.time() - start)
+
+        best = min(durations)
+        print('list_nodes: %s nodes, best %.3f s, mean %.3f s, %.0f nodes/s' %
+              (len(nodes), best, sum(durations) / len(durations), len(nodes) / best))
+    finally:
+        if args.cassette is None:
+            os.unlink(path)
+
+
+if __name__ == '__main__':
+    main()
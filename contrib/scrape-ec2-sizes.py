@@ -20,7 +20,9 @@
 """
 This script downloads and parses AWS EC2 from
 https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/current/index.json.
-It writes a Python module with constants about EC2's sizes and regions.
+It writes a compact catalog with EC2's sizes and the sizes available in each
+region (libcloud/data/ec2_instance_types.json) and a Python module with
+constants about EC2's regions.
 
 Use it as following (run it in the root of the repo directory):
     $ python contrib/scrape-ec2-sizes.py
@@ -28,6 +30,7 @@ Use it as following (run it in the root of the repo directory):
 
 import re
 import os
+import sys
 import json
 import atexit
 
@@ -35,6 +38,11 @@ import requests
 import tqdm  # pylint: disable=import-error
 import ijson  # pylint: disable=import-error
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from libcloud.compute.constants.ec2_catalog import build_catalog
+from libcloud.compute.constants.ec2_catalog import write_catalog
+
 FILEPATH = os.environ.get('TMP_JSON', '/tmp/ec.json')
 URL = "https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/current/index.json"
 IGNORED_FIELDS = ['locationType', 'operatingSystem']
@@ -349,30 +357,16 @@ def dump():
 
     separators = (',', ': ')
 
-    # 1. Write file with instance types constants
-    file_path = "libcloud/compute/constants/ec2_instance_types.py"
-    with open(file_path, "w") as fp:
-        fp.write(FILE_HEADER + "\n")
-        fp.write("\n")
-        fp.write("INSTANCE_TYPES = " + json.dumps(sizes, indent=4, sort_keys=True,
-                                                  separators=separators).replace('null', 'None'))
+    # 1. Write compact catalog with instance types and full details for each
+    # region
+    file_path = "libcloud/data/ec2_instance_types.json"
+    write_catalog(build_catalog(sizes, regions), file_path=file_path)
 
     print("")
     print("Data written to %s" % (file_path))
     print("")
 
-    # 2. Write file with full details for each region
-    file_path = "libcloud/compute/constants/ec2_region_details_complete.py"
-    with open(file_path, "w") as fp:
-        fp.write(FILE_HEADER + "\n")
-        fp.write("\n")
-        fp.write("REGION_DETAILS = " + json.dumps(regions, indent=4, sort_keys=True,
-                                                  separators=separators).replace('null', 'None'))
-
-    print("Data written to %s" % (file_path))
-    print("")
-
-    # 3. Write file with partial region details (everything except instance_types attribute)
+    # 2. Write file with partial region details (everything except instance_types attribute)
     regions_partial = {}
     keys_to_keep = ["api_name", "country", "id", "endpoint", "signature_version"]
 
@@ -0,0 +1,22 @@
+from libcloud.compute.types import Provider
+from libcloud.compute.providers import get_driver
+from libcloud.compute.cache import CatalogCache, FileCacheBackend
+
+cls = get_driver(Provider.GCE)
+
+# Cache is stored on disk so it's shared by all the processes on this host
+cache = CatalogCache(backend=FileCacheBackend('/var/cache/libcloud'),
+                     ttl=3600, method_ttls={'list_locations': 24 * 3600})
+
+driver = cache.attach(cls('service-account@project.iam.gserviceaccount.com',
+                          'key.json', project='project',
+                          datacenter='us-central1-a'))
+
+sizes = driver.list_sizes()  # API requests
+sizes = driver.list_sizes()  # Cached
+image = driver.ex_get_image('debian-10')
+
+print(cache.stats)
+
+# Remove all the cached values for this driver (e.g. after creating an image)
+cache.invalidate(driver=driver)
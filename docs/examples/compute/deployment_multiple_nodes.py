@@ -0,0 +1,41 @@
+from __future__ import with_statement
+
+import os
+
+from libcloud.compute.types import Provider
+from libcloud.compute.providers import get_driver
+from libcloud.compute.deployment import MultiStepDeployment
+from libcloud.compute.deployment import ScriptDeployment, SSHKeyDeployment
+
+# Path to the private SSH key file used to authenticate
+PRIVATE_SSH_KEY_PATH = os.path.expanduser('~/.ssh/id_rsa')
+
+# Path to the public key you would like to install
+KEY_PATH = os.path.expanduser('~/.ssh/id_rsa.pub')
+
+RACKSPACE_USER = 'your username'
+RACKSPACE_KEY = 'your key'
+
+Driver = get_driver(Provider.RACKSPACE)
+conn = Driver(RACKSPACE_USER, RACKSPACE_KEY)
+
+with open(KEY_PATH) as fp:
+    content = fp.read()
+
+msd = MultiStepDeployment([SSHKeyDeployment(content),
+                           ScriptDeployment('apt-get -y install nginx')])
+
+images = conn.list_images()
+sizes = conn.list_sizes()
+
+# Nodes will be named web-1, web-2, ..., web-20. At most 10 nodes are
+# deployed at the same time.
+results = conn.deploy_nodes(name='web', count=20, image=images[0],
+                            size=sizes[0], deploy=msd,
+                            ssh_key=PRIVATE_SSH_KEY_PATH, max_workers=10)
+
+for result in results:
+    if result.success:
+        print('Node %s deployed' % (result.result.name))
+    else:
+        print('Deploying node %s failed: %s' % (result.item, result.error))
@@ -0,0 +1,28 @@
+from libcloud.dns.base import RecordChange
+from libcloud.dns.providers import get_driver
+from libcloud.dns.types import Provider, RecordType
+
+CREDENTIALS_ROUTE53 = ('access key id', 'secret key')
+ZONE_ID = 'Z1234567890'
+
+Cls = get_driver(Provider.ROUTE53)
+driver = Cls(*CREDENTIALS_ROUTE53)
+
+zone = driver.get_zone(zone_id=ZONE_ID)
+old_record = zone.list_records()[0]
+
+# 1. Pass a list of changes
+changes = [RecordChange.create(name='host%s' % (i), type=RecordType.A,
+                               data='10.0.0.%s' % (i)) for i in range(1, 200)]
+changes.append(RecordChange.delete(record=old_record))
+
+for result in driver.ex_apply_changes(zone=zone, changes=changes):
+    if not result.success:
+        print('Failed to apply %s: %s' % (result.item, result.error))
+
+# 2. Use a context manager, changes are applied when the block exits
+with driver.ex_batch_changes(zone=zone) as batch:
+    batch.create_record(name='www', type=RecordType.A, data='10.0.1.1')
+    batch.create_record(name='mail', type=RecordType.A, data='10.0.1.2')
+
+print(batch.results)
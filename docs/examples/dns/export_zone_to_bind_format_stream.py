@@ -0,0 +1,15 @@
+import gzip
+
+from libcloud.dns.providers import get_driver
+from libcloud.dns.types import Provider
+
+CREDENTIALS_ZERIGO = ('email', 'api key')
+ZONE_ID = 'example.myzone.com'
+
+Cls = get_driver(Provider.ZERIGO)
+driver = Cls(*CREDENTIALS_ZERIGO)
+
+zone = driver.get_zone(zone_id=ZONE_ID)
+
+with gzip.open('/tmp/example.com.zone.gz', 'wt') as fp:
+    zone.export_to_bind_stream(stream=fp)
@@ -0,0 +1,33 @@
+import shelve
+
+from libcloud.dns.base import Record
+from libcloud.dns.providers import get_driver
+from libcloud.dns.sync import ZoneSyncer
+from libcloud.dns.types import Provider, RecordType
+
+CREDENTIALS_POWERDNS = ('api key', )
+ZONE_ID = 'example.com.'
+
+Cls = get_driver(Provider.POWERDNS)
+driver = Cls(*CREDENTIALS_POWERDNS, host='localhost', port=8081)
+zone = driver.get_zone(zone_id=ZONE_ID)
+
+desired = [
+    Record(id=None, name='www', type=RecordType.A, data='10.0.0.1',
+           zone=zone, driver=driver, extra={'ttl': 300}),
+    Record(id=None, name='mail', type=RecordType.MX, data='mx.example.com.',
+           zone=zone, driver=driver, extra={'priority': 10}),
+]
+
+# Last seen zone serials are persisted so unchanged zones are skipped on the
+# next run without listing the records
+with shelve.open('/var/cache/dns-sync') as state_cache:
+    syncer = ZoneSyncer(driver=driver, state_cache=state_cache)
+
+    print(syncer.diff(zone=zone, desired=desired).changes)
+
+    result = syncer.sync(zone=zone, desired=desired)
+    print(result)
+
+    for error in result.errors:
+        print('Failed to apply %s: %s' % (error.item, error.error))
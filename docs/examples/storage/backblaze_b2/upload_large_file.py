@@ -0,0 +1,17 @@
+from libcloud.storage.types import Provider
+from libcloud.storage.providers import get_driver
+
+key_id = 'XXXXXX'
+application_key = 'YYYYYY'
+
+cls = get_driver(Provider.BACKBLAZE_B2)
+driver = cls(key_id, application_key)
+
+container = driver.get_container(container_name='backups')
+
+# File is uploaded in 100 MB parts, 4 parts are uploaded in parallel
+obj = driver.upload_object(file_path='/data/backup.tar.gz',
+                           container=container,
+                           object_name='backup.tar.gz',
+                           ex_part_size=100 * 1024 * 1024,
+                           ex_max_workers=4)
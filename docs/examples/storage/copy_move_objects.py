@@ -0,0 +1,20 @@
+from libcloud.storage.types import Provider
+from libcloud.storage.providers import get_driver
+
+s3_driver = get_driver(Provider.S3)('api key', 'api secret key')
+azure_driver = get_driver(Provider.AZURE_BLOBS)('account name', 'access key')
+
+container = s3_driver.get_container(container_name='backups')
+archive = s3_driver.get_container(container_name='archive')
+obj = s3_driver.get_object(container_name='backups',
+                           object_name='2021/backup.tar.gz')
+
+# Server side copy and move
+s3_driver.copy_object(obj=obj, destination_container=container,
+                      destination_name='latest/backup.tar.gz')
+obj = s3_driver.move_object(obj=obj, destination_container=archive)
+obj = s3_driver.rename_object(obj=obj, new_name='2021/backup-old.tar.gz')
+
+# Copy to a different provider, object data is streamed between the drivers
+azure_container = azure_driver.get_container(container_name='backups')
+s3_driver.copy_object(obj=obj, destination_container=azure_container)
@@ -0,0 +1,14 @@
+from libcloud.storage.types import Provider
+from libcloud.storage.providers import get_driver
+
+Driver = get_driver(Provider.S3)
+driver = Driver('api key', 'api secret key')
+
+container = driver.get_container(container_name='my-backups')
+objects = container.list_objects(prefix='2020/')
+
+results = driver.delete_objects(objects=objects)
+
+for result in results:
+    if not result.success:
+        print('Failed to delete %s: %s' % (result.item.name, result.error))
@@ -0,0 +1,15 @@
+from libcloud.storage.types import Provider
+from libcloud.storage.providers import get_driver
+
+driver = get_driver(Provider.S3)('api key', 'api secret key')
+container = driver.get_container(container_name='logs')
+
+# List "directories" and objects directly under the logs/2021/ prefix
+for entry in driver.ex_iterate_directory(container=container,
+                                         prefix='logs/2021/'):
+    print(entry)
+
+# List all the objects, each top level "directory" is listed concurrently
+objects = driver.ex_iterate_container_objects_sharded(container=container,
+                                                      max_workers=16)
+total_size = sum(obj.size for obj in objects)
@@ -0,0 +1,29 @@
+import shelve
+
+from libcloud.storage.types import Provider
+from libcloud.storage.providers import get_driver
+from libcloud.storage.sync import ContainerSyncer
+
+s3_driver = get_driver(Provider.S3)('api key', 'api secret key')
+azure_driver = get_driver(Provider.AZURE_BLOBS)('account name', 'access key')
+
+source = s3_driver.get_container(container_name='backups')
+destination = azure_driver.get_container(container_name='backups')
+
+checkpoint_store = shelve.open('sync-checkpoints.db')
+syncer = ContainerSyncer(source_container=source,
+                         destination_container=destination,
+                         delete=True, checkpoint_store=checkpoint_store,
+                         max_workers=16)
+
+# See what would change without modifying the destination container
+for change in syncer.diff():
+    print(change.action, change.name)
+
+result = syncer.sync()
+print(result.stats)
+
+for error in result.errors:
+    print('Failed to synchronize %s: %s' % (error.item.name, error.error))
+
+checkpoint_store.close()
@@ -24,6 +24,8 @@ import socket
 import copy
 import binascii
 import time
+import threading
+from collections import OrderedDict
 
 from libcloud.utils.py3 import ET
 
@@ -35,7 +37,12 @@ from libcloud.utils.py3 import urlencode
 
 from libcloud.utils.misc import lowercase_keys
 from libcloud.utils.retry import Retry
+from libcloud.utils.retry import get_rate_limiter
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.common.exceptions import exception_from_message
+from libcloud.common.jobs import AsyncJob, get_default_poller
+from libcloud.common.metrics import RequestEvent
+from libcloud.common.metrics import has_request_hooks, emit_request_event
 from libcloud.common.types import LibcloudError, MalformedResponseError
 from libcloud.http import LibcloudConnection, HttpLibResponseProxy
 
@@ -50,6 +57,8 @@ __all__ = [
     'ConnectionUserAndKey',
     'CertificateConnection',
 
+    'ConditionalRequestCache',
+
     'Response',
     'HTTPResponse',
     'JsonResponse',
@@ -67,6 +76,12 @@ RETRY_FAILED_HTTP_REQUESTS = False
 # We default it to False for backward compatibility reasons.
 ALLOW_PATH_DOUBLE_SLASHES = False
 
+# Default maximum number of responses stored in the ConditionalRequestCache
+DEFAULT_CONDITIONAL_CACHE_ENTRIES = 512
+
+# HTTP methods for which conditional requests are performed
+CONDITIONAL_REQUEST_METHODS = ('GET', 'HEAD')
+
 
 class LazyObject(object):
     """An object that doesn't get initialized until accessed."""
@@ -140,6 +155,10 @@ class Response(object):
     connection = None  # Parent connection class
     parse_zero_length_body = False
 
+    # True if this response has been served from the ConditionalRequestCache
+    # after the server returned "304 Not Modified"
+    not_modified = False
+
     def __init__(self, response, connection):
         """
         :param response: HTTP response object. (optional)
@@ -308,6 +327,109 @@ class RawResponse(Response):
         return self._reason
 
 
+class ConditionalRequestCache(object):
+    """
+    Least recently used cache of responses which were returned together with
+    an ``ETag`` header.
+
+    When a cache is assigned to the ``conditional_cache`` attribute of a
+    :class:`.Connection`, GET and HEAD requests for a cached resource are sent
+    with the ``If-None-Match`` header. If the server responds with
+    ``304 Not Modified``, a copy of the cached response is returned and the
+    body doesn't need to be transferred and parsed again.
+
+    Parsed response objects are shared between the returned responses. Set
+    ``copy_objects`` to ``True`` when the caller modifies ``response.object``.
+
+    A single cache can be shared between multiple connections and threads.
+    """
+
+    def __init__(self, max_entries=DEFAULT_CONDITIONAL_CACHE_ENTRIES,
+                 copy_objects=False):
+        """
+        :param max_entries: Maximum number of cached responses.
+        :type max_entries: ``int``
+
+        :param copy_objects: True to return a deep copy of the parsed
+                             response object on each cache hit.
+        :type copy_objects: ``bool``
+        """
+        self.max_entries = max_entries
+        self.copy_objects = copy_objects
+
+        # Number of "304 Not Modified" responses
+        self.hits = 0
+        # Number of requests which had to transfer the response body
+        self.misses = 0
+
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return (etag, response) tuple for the provided key or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key, etag, response):
+        with self._lock:
+            self._entries[key] = (etag, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_not_modified_response(self, response):
+        """
+        Return a copy of the cached response which is returned to the caller
+        when the server responds with "304 Not Modified".
+        """
+        self.hits += 1
+
+        response = copy.copy(response)
+        response.not_modified = True
+        response.headers = copy.copy(response.headers)
+
+        if self.copy_objects:
+            response.object = copy.deepcopy(response.object)
+
+        return response
+
+    def get_key(self, connection, action, params, headers, method):
+        """
+        Return the cache key for the provided request.
+
+        The key is calculated from the parameters passed to
+        :meth:`.Connection.request` before the default parameters and the
+        request signature (which usually changes on each request) are added.
+        """
+        if isinstance(params, dict):
+            params = sorted(params.items())
+
+        headers = sorted((key.lower(), value) for key, value in
+                         headers.items() if key.lower() != 'if-none-match')
+
+        return (connection.__class__.__name__, method, connection.host,
+                connection.port, action, repr(params), repr(headers))
+
+
 class Connection(object):
     """
     A Base Connection class to derive from.
@@ -325,8 +447,19 @@ class Connection(object):
     driver = None  # type:  Type[BaseDriver]
     action = None
     cache_busting = False
+    # ConditionalRequestCache instance. If set, GET and HEAD requests are
+    # performed as conditional requests using the "If-None-Match" header
+    conditional_cache = None  # type: Optional[ConditionalRequestCache]
     backoff = None
     retry_delay = None
+    # Use randomized ("decorrelated jitter") delays instead of the fixed
+    # exponential backoff when retrying failed requests
+    retry_jitter = False
+    # Keyword arguments for the client side RateLimiter which is shared by
+    # the connections to the same host with the same credentials (None means
+    # libcloud.utils.retry.RATE_LIMITS configuration of the driver type is
+    # used)
+    rate_limit = None  # type: Optional[Dict[str, Any]]
 
     allow_insecure = True
 
@@ -570,6 +703,21 @@ class Connection(object):
         self.method = method
         self.data = data
 
+        cache_key = None
+        cached_response = None
+
+        if (self.conditional_cache is not None and not raw and not stream and
+                not data and method in CONDITIONAL_REQUEST_METHODS):
+            cache_key = self.conditional_cache.get_key(
+                connection=self, action=action, params=params,
+                headers=headers, method=method)
+            entry = self.conditional_cache.get(cache_key)
+            has_header = any(key.lower() == 'if-none-match' for key in headers)
+
+            if entry is not None and not has_header:
+                etag, cached_response = entry
+                headers['If-None-Match'] = etag
+
         # Extend default parameters
         params = self.add_default_params(params)
 
@@ -606,27 +754,105 @@ class Connection(object):
         else:
             url = action
 
+        event = None
+
+        if has_request_hooks():
+            event = RequestEvent(connection=self, action=action,
+                                 method=method, params=params)
+
+            if isinstance(data, (bytes, str)):
+                event.request_bytes = len(data)
+
         # IF connection has not yet been established
         if self.connection is None:
+            connect_start = time.time()
             self.connect()
 
+            if event is not None:
+                event.connect_time = time.time() - connect_start
+
         request_to_be_executed = self._retryable_request
 
+        if get_rate_limiter(self) is not None:
+            request_to_be_executed = self._rate_limited_request
+
         if retry_enabled:
             retry_request = self.retryCls(retry_delay=self.retry_delay,
                                           timeout=self.timeout,
-                                          backoff=self.backoff)
-            request_to_be_executed = retry_request(self._retryable_request)
+                                          backoff=self.backoff,
+                                          jitter=self.retry_jitter)
+            request_to_be_executed = retry_request(request_to_be_executed)
+
+        try:
+            response = request_to_be_executed(url=url, method=method,
+                                              raw=raw, stream=stream,
+                                              headers=headers,
+                                              data=data,
+                                              cached_response=cached_response,
+                                              event=event)
+        except Exception as e:
+            if event is not None:
+                event.finish(error=e)
+                emit_request_event(event)
+            raise
+
+        if event is not None:
+            event.finish(response=response)
+            emit_request_event(event)
+
+        if cache_key is not None and not response.not_modified:
+            self._cache_response(key=cache_key, response=response)
+
+        return response
+
+    def _cache_response(self, key, response):
+        """
+        Store response which contains an "ETag" header in the conditional
+        request cache.
+        """
+        cache = self.conditional_cache
+        cache.misses += 1
+
+        etag = response.headers.get('etag', None)
+
+        if etag and response.status == httplib.OK:
+            cache.set(key, etag, response)
+        else:
+            cache.delete(key)
 
-        return request_to_be_executed(url=url, method=method,
-                                      raw=raw, stream=stream,
-                                      headers=headers,
-                                      data=data)
+    def _rate_limited_request(self, **kwargs):
+        """
+        Perform a request once the shared rate limiter of this connection
+        allows it and report the outcome back to the limiter.
+        """
+        rate_limiter = get_rate_limiter(self)
+        token = rate_limiter.acquire()
+        status = None
+        headers = None
+
+        try:
+            response = self._retryable_request(**kwargs)
+            status = getattr(response, 'status', None)
+            headers = getattr(response, 'headers', None)
+            return response
+        except BaseHTTPError as e:
+            status = e.code
+            headers = e.headers
+            raise
+        finally:
+            rate_limiter.release(token, status=status, headers=headers)
 
     def _retryable_request(self, url: str, data: bytes,
                            headers: Dict[str, Any],
                            method: str, raw: bool,
-                           stream: bool) -> Union[RawResponse, Response]:
+                           stream: bool,
+                           cached_response: Optional[Response] = None,
+                           event: Optional[RequestEvent] = None
+                           ) -> Union[RawResponse, Response]:
+        if event is not None:
+            event.attempts += 1
+            sent_at = time.time()
+
         try:
             # @TODO: Should we just pass File object as body to request method
             # instead of dealing with splitting and sending the file ourselves?
@@ -668,6 +894,11 @@ class Connection(object):
             self.reset_context()
             raise ssl.SSLError(str(e))
 
+        if event is not None:
+            event.record_response(self.connection.getresponse(),
+                                  sent_at=sent_at,
+                                  body_read=not (raw or stream))
+
         if raw:
             responseCls = self.rawResponseCls
             kwargs = {'connection': self,
@@ -677,12 +908,24 @@ class Connection(object):
             kwargs = {'connection': self,
                       'response': self.connection.getresponse()}
 
+            if (cached_response is not None and
+                    kwargs['response'].status_code == httplib.NOT_MODIFIED):
+                # Resource hasn't changed, re-use the already parsed response
+                self.reset_context()
+                cache = self.conditional_cache
+                return cache.get_not_modified_response(cached_response)
+
+        parse_start = time.time()
+
         try:
             response = responseCls(**kwargs)
         finally:
             # Always reset the context after the request has completed
             self.reset_context()
 
+            if event is not None:
+                event.parse_time = time.time() - parse_start
+
         return response
 
     def morph_action_hook(self, action):
@@ -780,13 +1023,22 @@ class PollingConnection(Connection):
     timeout = 200
     request_method = 'request'
 
+    # True if poll_async_jobs() retrieves status of multiple jobs using a
+    # single request
+    supports_batch_polling = False
+
     def async_request(self, action, params=None, data=None, headers=None,
-                      method='GET', context=None):
+                      method='GET', context=None, wait=True, poller=None,
+                      result_func=None):
         """
         Perform an 'async' request to the specified path. Keep in mind that
-        this function is *blocking* and 'async' in this case means that the
-        hit URL only returns a job ID which is the periodically polled until
-        the job has completed.
+        by default this function is *blocking* and 'async' in this case means
+        that the hit URL only returns a job ID which is the periodically
+        polled until the job has completed.
+
+        If ``wait`` is False, :class:`libcloud.common.jobs.AsyncJob` handle is
+        returned right after the initial request and the job is polled in the
+        background by the shared job poller.
 
         This function works like this:
 
@@ -819,8 +1071,23 @@ class PollingConnection(Connection):
         :param context: Context dictionary which is passed to the functions
                         which construct initial and poll URL.
 
-        :return: An :class:`Response` instance.
-        :rtype: :class:`Response` instance
+        :type wait: ``bool``
+        :param wait: False to return a job handle instead of waiting for the
+                     job to complete.
+
+        :type poller: :class:`libcloud.common.jobs.AsyncJobPoller`
+        :param poller: Poller used for polling the job if ``wait`` is False.
+                       Defaults to the shared poller.
+
+        :type result_func: ``callable``
+        :param result_func: Function which is called with the final poll
+                            response and returns the job result (only used
+                            if ``wait`` is False).
+
+        :return: An :class:`Response` instance or a job handle whose result
+                 is the final poll response.
+        :rtype: :class:`Response` instance or
+                :class:`libcloud.common.jobs.AsyncJob`
         """
 
         request = getattr(self, self.request_method)
@@ -833,6 +1100,11 @@ class PollingConnection(Connection):
                                               context=context,
                                               request_kwargs=kwargs)
 
+        if not wait:
+            job = AsyncJob(connection=self, poll_kwargs=kwargs,
+                           result_func=result_func)
+            return (poller or get_default_poller()).submit(job)
+
         end = time.time() + self.timeout
         completed = False
         while time.time() < end and not completed:
@@ -884,6 +1156,33 @@ class PollingConnection(Connection):
         """
         raise NotImplementedError('has_completed not implemented')
 
+    def poll_async_jobs(self, jobs):
+        """
+        Retrieve status of the provided pending jobs.
+
+        Used by :class:`libcloud.common.jobs.AsyncJobPoller`. By default each
+        job is polled using a separate request, connections which set
+        ``supports_batch_polling`` can override it and retrieve status of
+        multiple jobs using a single request.
+
+        :param jobs: Jobs to poll.
+        :type jobs: ``list`` of :class:`libcloud.common.jobs.AsyncJob`
+
+        :return: Poll response (or an exception which was raised while
+                 polling) for each job, in the same order as ``jobs``.
+        :rtype: ``list``
+        """
+        request = getattr(self, self.request_method)
+        responses = []
+
+        for job in jobs:
+            try:
+                responses.append(request(**job.poll_kwargs))
+            except Exception as e:
+                responses.append(e)
+
+        return responses
+
 
 class ConnectionKey(Connection):
     """
@@ -62,6 +62,9 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
     ASYNC_SUCCESS = 1
     ASYNC_FAILURE = 2
 
+    # Status of multiple pending jobs is retrieved using listAsyncJobs
+    supports_batch_polling = True
+
     def encode_data(self, data):
         """
         Must of the data is sent as part of query params (eeww),
@@ -103,7 +106,7 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
         return params, headers
 
     def _async_request(self, command, action=None, params=None, data=None,
-                       headers=None, method='GET', context=None):
+                       headers=None, method='GET', context=None, wait=True):
         if params:
             context = copy.deepcopy(params)
         else:
@@ -113,8 +116,16 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
         context['command'] = command
         result = super(CloudStackConnection, self).async_request(
             action=action, params=params, data=data, headers=headers,
-            method=method, context=context)
-        return result['jobresult']
+            method=method, context=context, wait=wait,
+            result_func=self._get_job_result)
+
+        if not wait:
+            return result
+
+        return self._get_job_result(result)
+
+    def _get_job_result(self, response):
+        return response['jobresult']
 
     def get_request_kwargs(self, action, params=None, data='', headers=None,
                            method='GET', context=None):
@@ -139,6 +150,38 @@ class CloudStackConnection(ConnectionUserAndKey, PollingConnection):
 
         return status == self.ASYNC_SUCCESS
 
+    def poll_async_jobs(self, jobs):
+        """
+        Retrieve status of multiple jobs using a single listAsyncJobs call.
+
+        Jobs which are not included in the listAsyncJobs response are polled
+        using queryAsyncJobResult.
+
+        @inherits: :class:`PollingConnection.poll_async_jobs`
+        """
+        if len(jobs) <= 1:
+            return super(CloudStackConnection, self).poll_async_jobs(jobs)
+
+        result = self._sync_request(command='listAsyncJobs',
+                                    params={'listall': 'true'})
+        statuses = dict((job['jobid'], job) for job in
+                        result.get('asyncjobs', []))
+
+        responses = []
+        pending_jobs = []
+
+        for job in jobs:
+            job_id = job.poll_kwargs['params']['jobid']
+            responses.append(statuses.get(job_id, None))
+
+            if job_id not in statuses:
+                pending_jobs.append(job)
+
+        missing_responses = iter(super(CloudStackConnection, self)
+                                 .poll_async_jobs(pending_jobs))
+        return [response if response is not None else next(missing_responses)
+                for response in responses]
+
     def _sync_request(self, command, action=None, params=None, data=None,
                       headers=None, method='GET'):
         """
@@ -196,8 +239,8 @@ class CloudStackDriverMixIn(object):
                                              headers=headers, method=method)
 
     def _async_request(self, command, action=None, params=None, data=None,
-                       headers=None, method='GET', context=None):
+                       headers=None, method='GET', context=None, wait=True):
         return self.connection._async_request(command=command, action=action,
                                               params=params, data=data,
                                               headers=headers, method=method,
-                                              context=context)
+                                              context=context, wait=wait)
@@ -0,0 +1,341 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Non-blocking handling of the provider async jobs.
+
+``PollingConnection.async_request(..., wait=False)`` returns an
+:class:`AsyncJob` handle right after the job has been submitted. Pending jobs
+are polled by a shared :class:`AsyncJobPoller` which multiplexes all of them
+in a single background thread using exponential, jittered poll intervals.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import copy
+import time
+import random
+import threading
+from concurrent import futures
+
+from libcloud.common.types import LibcloudError
+
+__all__ = [
+    'DEFAULT_MAX_POLL_INTERVAL',
+    'DEFAULT_POLL_BACKOFF',
+    'DEFAULT_POLL_JITTER',
+
+    'AsyncJob',
+    'AsyncJobPoller',
+
+    'get_default_poller',
+    'wait_for_jobs',
+    'wait_for_any_job'
+]
+
+# Upper bound (in seconds) for the poll interval of a single job
+DEFAULT_MAX_POLL_INTERVAL = 15
+
+# Poll interval is multiplied by this value after each poll
+DEFAULT_POLL_BACKOFF = 1.5
+
+# Poll interval is randomly shifted by up to this fraction so jobs which were
+# submitted at the same time don't hit the API at the same time
+DEFAULT_POLL_JITTER = 0.2
+
+_default_poller = None
+_default_poller_lock = threading.Lock()
+
+
+class AsyncJob(futures.Future):
+    """
+    Handle for a pending provider job.
+
+    This is a :class:`concurrent.futures.Future` so it can also be used with
+    :func:`concurrent.futures.wait` and
+    :func:`concurrent.futures.as_completed`.
+    :meth:`result` returns the final poll response (or the value returned by
+    ``result_func`` if provided).
+
+    Callbacks added with :meth:`add_done_callback` are called from the poller
+    thread.
+    """
+
+    def __init__(self, connection, poll_kwargs, timeout=None,
+                 result_func=None):
+        """
+        :param connection: Connection which submitted the job.
+        :type connection: :class:`libcloud.common.base.PollingConnection`
+
+        :param poll_kwargs: Keyword arguments which are passed to the
+                            request method when polling for the job status.
+        :type poll_kwargs: ``dict``
+
+        :param timeout: How long to wait (in seconds) for the job to complete.
+                        Defaults to ``connection.timeout``.
+        :type timeout: ``int``
+
+        :param result_func: Optional function which is called with the final
+                            poll response and returns the job result.
+        :type result_func: ``callable``
+        """
+        super(AsyncJob, self).__init__()
+        self.connection = connection
+        self.poll_kwargs = poll_kwargs
+        self.timeout = timeout or connection.timeout
+        self.result_func = result_func
+
+        self.created_at = time.time()
+        self.deadline = self.created_at + self.timeout
+        self.interval = connection.poll_interval
+        self.next_poll = self.created_at + self.interval
+        self.poll_count = 0
+
+    def __repr__(self):
+        return ('<AsyncJob: poll_kwargs=%s, done=%s, poll_count=%s>' %
+                (self.poll_kwargs, self.done(), self.poll_count))
+
+
+class AsyncJobPoller(object):
+    """
+    Polls all the pending jobs in a single background thread.
+
+    After each poll, interval of the job is multiplied by ``backoff`` (up to
+    ``max_interval`` seconds) and randomly shifted by ``jitter``. Connections
+    which set ``supports_batch_polling`` receive all the jobs which are due
+    within ``batch_window`` seconds in a single ``poll_async_jobs`` call.
+
+    Jobs are polled using a copy of the submitting connection so polling
+    doesn't interfere with the requests performed by the caller.
+    """
+
+    def __init__(self, max_interval=DEFAULT_MAX_POLL_INTERVAL,
+                 backoff=DEFAULT_POLL_BACKOFF, jitter=DEFAULT_POLL_JITTER,
+                 batch_window=1):
+        """
+        :param max_interval: Maximum poll interval of a single job.
+        :type max_interval: ``float``
+
+        :param backoff: Factor the poll interval is multiplied by.
+        :type backoff: ``float``
+
+        :param jitter: Fraction of the poll interval by which it is randomly
+                       shifted.
+        :type jitter: ``float``
+
+        :param batch_window: Jobs which are due within this many seconds are
+                             polled together (only used with connections
+                             which support batch polling).
+        :type batch_window: ``float``
+        """
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.batch_window = batch_window
+
+        self._jobs = []  # type: List[AsyncJob]
+        self._condition = threading.Condition()
+        self._thread = None  # type: Optional[threading.Thread]
+        # Poll connections keyed by id() of the submitting connection. The
+        # submitting connection is referenced by its pending jobs so the id
+        # can't be reused while the entry exists.
+        self._connections = {}  # type: Dict[int, object]
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def submit(self, job):
+        """
+        Start polling the provided job.
+
+        :type job: :class:`AsyncJob`
+
+        :rtype: :class:`AsyncJob`
+        """
+        # Provider job is already running so it can't be cancelled anymore
+        job.set_running_or_notify_cancel()
+
+        with self._condition:
+            self._jobs.append(job)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='libcloud-job-poller')
+                self._thread.daemon = True
+                self._thread.start()
+
+            self._condition.notify()
+
+        return job
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._jobs = [job for job in self._jobs if not job.done()]
+                self._release_connections()
+
+                if not self._jobs:
+                    # Thread is started again when a new job is submitted
+                    self._thread = None
+                    return
+
+                now = time.time()
+                next_poll = min(min(job.next_poll, job.deadline)
+                                for job in self._jobs)
+
+                if next_poll > now:
+                    self._condition.wait(next_poll - now)
+                    continue
+
+                jobs = list(self._jobs)
+
+            for connection, due_jobs in self._get_due_jobs(jobs, now).items():
+                self._poll(connection, due_jobs)
+
+    def _get_due_jobs(self, jobs, now):
+        due_jobs = {}  # type: Dict[object, List[AsyncJob]]
+
+        for job in jobs:
+            connection = job.connection
+
+            if job.deadline <= now:
+                job.set_exception(LibcloudError(
+                    'Job did not complete in %s seconds' % (job.timeout)))
+                continue
+
+            window = 0
+
+            if getattr(connection, 'supports_batch_polling', False):
+                window = self.batch_window
+
+            if job.next_poll <= now + window:
+                due_jobs.setdefault(connection, []).append(job)
+
+        return due_jobs
+
+    def _poll(self, connection, jobs):
+        try:
+            poll_connection = self._get_connection(connection)
+            responses = poll_connection.poll_async_jobs(jobs)
+        except Exception as e:
+            poll_connection = connection
+            responses = [e] * len(jobs)
+
+        now = time.time()
+
+        for job, response in zip(jobs, responses):
+            job.poll_count += 1
+
+            try:
+                if isinstance(response, Exception):
+                    raise response
+
+                completed = poll_connection.has_completed(response=response)
+            except Exception as e:
+                job.set_exception(e)
+                continue
+
+            if completed:
+                if job.result_func is not None:
+                    try:
+                        response = job.result_func(response)
+                    except Exception as e:
+                        job.set_exception(e)
+                        continue
+
+                job.set_result(response)
+                continue
+
+            job.interval = min(job.interval * self.backoff, self.max_interval)
+            shift = random.uniform(-self.jitter, self.jitter)
+            job.next_poll = now + job.interval * (1 + shift)
+
+    def _get_connection(self, connection):
+        """
+        Return a copy of the provided connection with a dedicated HTTP
+        connection which is used for polling.
+        """
+        poll_connection = self._connections.get(id(connection), None)
+
+        if poll_connection is None:
+            poll_connection = copy.copy(connection)
+            poll_connection.context = {}
+            poll_connection.connection = None
+            poll_connection.connect()
+            self._connections[id(connection)] = poll_connection
+
+        return poll_connection
+
+    def _release_connections(self):
+        """
+        Remove poll connections of the connections which don't have any
+        pending jobs so the connections (and their drivers) can be garbage
+        collected.
+        """
+        pending = set(id(job.connection) for job in self._jobs)
+
+        for key in [key for key in self._connections if key not in pending]:
+            del self._connections[key]
+
+
+def get_default_poller():
+    """
+    Return the poller which is shared by all the connections.
+
+    :rtype: :class:`AsyncJobPoller`
+    """
+    global _default_poller
+
+    with _default_poller_lock:
+        if _default_poller is None:
+            _default_poller = AsyncJobPoller()
+
+    return _default_poller
+
+
+def wait_for_jobs(jobs, timeout=None):
+    """
+    Wait for all the provided jobs to complete.
+
+    :param jobs: Jobs to wait for.
+    :type jobs: ``list`` of :class:`AsyncJob`
+
+    :param timeout: Maximum number of seconds to wait.
+    :type timeout: ``float``
+
+    :return: (done, not_done) tuple of sets with jobs.
+    :rtype: ``tuple``
+    """
+    return futures.wait(jobs, timeout=timeout,
+                        return_when=futures.ALL_COMPLETED)
+
+
+def wait_for_any_job(jobs, timeout=None):
+    """
+    Wait until at least one of the provided jobs completes.
+
+    :param jobs: Jobs to wait for.
+    :type jobs: ``list`` of :class:`AsyncJob`
+
+    :param timeout: Maximum number of seconds to wait.
+    :type timeout: ``float``
+
+    :return: (done, not_done) tuple of sets with jobs.
+    :rtype: ``tuple``
+    """
+    return futures.wait(jobs, timeout=timeout,
+                        return_when=futures.FIRST_COMPLETED)
@@ -0,0 +1,455 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lightweight request metrics and tracing hooks.
+
+Hooks registered with :func:`register_request_hook` are called with a
+:class:`RequestEvent` after each ``Connection.request`` call has completed
+(successfully or not). Events are only created when at least one hook is
+registered so the instrumentation doesn't slow down requests otherwise.
+
+:class:`RequestMetricsAggregator` is a hook which aggregates the events into
+per-action latency histograms and error rates::
+
+    aggregator = RequestMetricsAggregator()
+    register_request_hook(aggregator)
+    ...
+    aggregator.snapshot()
+"""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import re
+import time
+import bisect
+import logging
+import threading
+
+__all__ = [
+    'DEFAULT_LATENCY_BUCKETS',
+
+    'RequestEvent',
+    'LatencyHistogram',
+    'RequestMetricsAggregator',
+
+    'register_request_hook',
+    'unregister_request_hook',
+    'has_request_hooks',
+    'emit_request_event',
+    'get_event_key'
+]
+
+# Upper bounds (in seconds) of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5,
+                           5, 10, 30)
+
+# Path segments which contain a digit are (most likely) resource IDs, unless
+# they look like an API version (e.g. "v2" or "v2.1")
+RESOURCE_ID_RE = re.compile(r'^(?!v\d+(\.\d+)*$)[^/]*\d[^/]*$')
+
+_logger = logging.getLogger(__name__)
+
+# NOTE: List is replaced (not modified in place) when hooks are registered so
+# it can be iterated without a lock
+_request_hooks = []  # type: List[Callable[[RequestEvent], Any]]
+_request_hooks_lock = threading.Lock()
+
+
+class RequestEvent(object):
+    """
+    Metrics of a single ``Connection.request`` call.
+
+    All the durations are in seconds:
+
+    * ``latency`` - total duration of the call, including all the retries and
+      response parsing
+    * ``connect_time`` - time spent in ``Connection.connect`` (0 if an
+      already established connection has been re-used). Note that TCP / TLS
+      handshakes performed by the underlying connection pool are included in
+      ``ttfb``.
+    * ``ttfb`` - time from sending the request until the response headers
+      have been received (last attempt)
+    * ``body_time`` - time spent downloading the response body (last attempt,
+      ``None`` for streamed and raw responses)
+    * ``parse_time`` - time spent instantiating (parsing) the response class
+      (last attempt)
+    """
+
+    def __init__(self, connection, action, method, params=None):
+        driver = getattr(connection, 'driver', None)
+
+        self.driver = getattr(driver, 'name', None)
+        self.driver_type = getattr(driver, 'type', None)
+        self.connection_class = connection.__class__.__name__
+        self.host = connection.host
+        self.action = action
+        self.method = method
+        self.params = params or {}
+
+        self.status = None  # type: Optional[int]
+        self.error = None  # type: Optional[Exception]
+        self.attempts = 0
+
+        self.start_time = time.time()
+        self.latency = None  # type: Optional[float]
+        self.connect_time = 0.0
+        self.ttfb = None  # type: Optional[float]
+        self.body_time = None  # type: Optional[float]
+        self.parse_time = None  # type: Optional[float]
+
+        self.request_bytes = None  # type: Optional[int]
+        self.response_bytes = None  # type: Optional[int]
+
+    def __repr__(self):
+        return ('<RequestEvent: driver=%s, method=%s, action=%s, status=%s, '
+                'latency=%s, attempts=%s>' %
+                (self.driver, self.method, self.action, self.status,
+                 self.latency, self.attempts))
+
+    @property
+    def retry_count(self):
+        return max(self.attempts - 1, 0)
+
+    @property
+    def success(self):
+        return self.error is None
+
+    def record_response(self, http_response, sent_at, body_read):
+        """
+        Record timing and size of the (raw) HTTP response of an attempt.
+
+        :param http_response: Response returned by the underlying connection.
+        :type http_response: :class:`requests.Response`
+
+        :param sent_at: Time when the request has been sent.
+        :type sent_at: ``float``
+
+        :param body_read: True if the whole body has already been read.
+        :type body_read: ``bool``
+        """
+        duration = time.time() - sent_at
+        elapsed = getattr(http_response, 'elapsed', None)
+
+        self.status = getattr(http_response, 'status_code', None)
+        self.ttfb = duration
+        self.body_time = None
+        self.response_bytes = None
+
+        if elapsed is not None:
+            self.ttfb = min(elapsed.total_seconds(), duration)
+
+        headers = getattr(http_response, 'headers', None) or {}
+        content_length = headers.get('content-length', None)
+
+        if body_read:
+            self.body_time = duration - self.ttfb
+
+            if content_length is None:
+                content = getattr(http_response, 'content', None)
+                content_length = len(content) if content is not None else None
+
+        if content_length is not None:
+            try:
+                self.response_bytes = int(content_length)
+            except ValueError:
+                pass
+
+    def finish(self, response=None, error=None):
+        """
+        Mark the request as completed.
+        """
+        self.latency = time.time() - self.start_time
+        self.error = error
+
+        if error is not None:
+            code = getattr(error, 'code', None)
+
+            if isinstance(code, int):
+                self.status = code
+        elif self.status is None and response is not None:
+            self.status = getattr(response, 'status', None)
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        return {
+            'driver': self.driver,
+            'driver_type': self.driver_type,
+            'host': self.host,
+            'action': self.action,
+            'method': self.method,
+            'status': self.status,
+            'error': repr(self.error) if self.error is not None else None,
+            'retry_count': self.retry_count,
+            'latency': self.latency,
+            'connect_time': self.connect_time,
+            'ttfb': self.ttfb,
+            'body_time': self.body_time,
+            'parse_time': self.parse_time,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes
+        }
+
+
+class LatencyHistogram(object):
+    """
+    Histogram with fixed bucket boundaries.
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None  # type: Optional[float]
+        self.max = None  # type: Optional[float]
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def get_percentile(self, percentile):
+        """
+        Return upper bound of the bucket which contains the provided
+        percentile (``max`` for the last bucket).
+
+        :param percentile: Percentile (0 - 100).
+        :type percentile: ``float``
+
+        :rtype: ``float``
+        """
+        if not self.count:
+            return None
+
+        threshold = self.count * percentile / 100.0
+        cumulative = 0
+
+        for index, count in enumerate(self.counts):
+            cumulative += count
+
+            if cumulative >= threshold and count:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], self.max)
+
+                return self.max
+
+        return self.max
+
+    def snapshot(self):
+        # type: () -> Dict[str, Any]
+        buckets = dict(zip([str(bucket) for bucket in self.buckets] +
+                           ['+Inf'], self.counts))
+
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.get_percentile(50),
+            'p90': self.get_percentile(90),
+            'p99': self.get_percentile(99),
+            'buckets': buckets
+        }
+
+
+class _ActionMetrics(object):
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_codes = {}  # type: Dict[Any, int]
+        self.latency = LatencyHistogram(buckets=buckets)
+        self.ttfb = LatencyHistogram(buckets=buckets)
+        self.parse_time = LatencyHistogram(buckets=buckets)
+
+    def add(self, event):
+        self.count += 1
+        self.retries += event.retry_count
+        self.request_bytes += event.request_bytes or 0
+        self.response_bytes += event.response_bytes or 0
+        self.status_codes[event.status] = (
+            self.status_codes.get(event.status, 0) + 1)
+
+        if not event.success:
+            self.errors += 1
+
+        self.latency.add(event.latency or 0)
+
+        if event.ttfb is not None:
+            self.ttfb.add(event.ttfb)
+
+        if event.parse_time is not None:
+            self.parse_time.add(event.parse_time)
+
+    def snapshot(self):
+        # type: () -> Dict[str, Any]
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'error_rate': float(self.errors) / self.count,
+            'retries': self.retries,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'status_codes': dict(self.status_codes),
+            'latency': self.latency.snapshot(),
+            'ttfb': self.ttfb.snapshot(),
+            'parse_time': self.parse_time.snapshot()
+        }
+
+
+class RequestMetricsAggregator(object):
+    """
+    Request hook which aggregates events per action.
+
+    Events are grouped using ``key_func`` (:func:`get_event_key` by default)
+    and for each group request and error counts, status codes, transferred
+    bytes and latency, time to first byte and parse time histograms are
+    collected.
+    """
+
+    def __init__(self, key_func=None, buckets=DEFAULT_LATENCY_BUCKETS):
+        """
+        :param key_func: Function which returns the aggregation key for an
+                         event.
+        :type key_func: ``callable``
+
+        :param buckets: Upper bounds of the histogram buckets (in seconds).
+        :type buckets: ``tuple`` of ``float``
+        """
+        self.key_func = key_func or get_event_key
+        self.buckets = buckets
+
+        self._metrics = {}  # type: Dict[Any, _ActionMetrics]
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        key = self.key_func(event)
+
+        with self._lock:
+            metrics = self._metrics.get(key, None)
+
+            if metrics is None:
+                metrics = _ActionMetrics(buckets=self.buckets)
+                self._metrics[key] = metrics
+
+            metrics.add(event)
+
+    def snapshot(self, reset=False):
+        """
+        Return aggregated metrics.
+
+        :param reset: True to also reset the collected metrics.
+        :type reset: ``bool``
+
+        :return: Dictionary which maps aggregation key to the metrics.
+        :rtype: ``dict``
+        """
+        with self._lock:
+            snapshot = dict((key, metrics.snapshot()) for key, metrics in
+                            self._metrics.items())
+
+            if reset:
+                self._metrics = {}
+
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._metrics = {}
+
+
+def get_event_key(event):
+    """
+    Return aggregation key for the provided event.
+
+    Key consists of the driver name, HTTP method and the request path where
+    the segments which contain a digit (most likely resource IDs) are
+    replaced with ``*``. API versions such as ``v2`` are kept. Value of the
+    ``Action`` parameter (used by the query based APIs such as EC2) is
+    appended to the path.
+
+    :rtype: ``str``
+    """
+    path = (event.action or '').split('?')[0]
+    path = '/'.join(['*' if RESOURCE_ID_RE.match(segment) else segment
+                     for segment in path.split('/')])
+
+    action = event.params.get('Action', None)
+
+    if action:
+        path = '%s:%s' % (path, action)
+
+    return '%s %s %s' % (event.driver or event.connection_class,
+                         event.method, path)
+
+
+def register_request_hook(hook):
+    """
+    Register a function which is called with a :class:`RequestEvent` after
+    each request.
+
+    Hooks are called from the thread which performed the request and the
+    exceptions they throw are logged and ignored.
+
+    :type hook: ``callable``
+    """
+    global _request_hooks
+
+    with _request_hooks_lock:
+        _request_hooks = _request_hooks + [hook]
+
+
+def unregister_request_hook(hook):
+    """
+    Unregister a hook which has been registered using
+    :func:`register_request_hook`.
+
+    :type hook: ``callable``
+    """
+    global _request_hooks
+
+    with _request_hooks_lock:
+        _request_hooks = [item for item in _request_hooks if item != hook]
+
+
+def has_request_hooks():
+    """
+    Return True if there is at least one request hook registered.
+
+    :rtype: ``bool``
+    """
+    return bool(_request_hooks)
+
+
+def emit_request_event(event):
+    """
+    Call all the registered hooks with the provided event.
+
+    :type event: :class:`RequestEvent`
+    """
+    for hook in _request_hooks:
+        try:
+            hook(event)
+        except Exception:
+            _logger.exception('Request hook %r failed', hook)
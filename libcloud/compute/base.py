@@ -20,6 +20,7 @@ Provides base classes for working with drivers
 from __future__ import with_statement
 
 from typing import Dict
+from typing import Set
 from typing import List
 from typing import Tuple
 from typing import Type
@@ -29,6 +30,7 @@ from typing import Union
 from typing import Callable
 from typing import TYPE_CHECKING
 
+import copy
 import time
 import hashlib
 import os
@@ -39,6 +41,7 @@ import binascii
 import datetime
 import traceback
 import atexit
+from concurrent.futures import ThreadPoolExecutor
 
 from libcloud.utils.py3 import b
 
@@ -61,6 +64,11 @@ from libcloud.compute.ssh import SSHCommandTimeoutError
 
 from libcloud.utils.networking import is_private_subnet
 from libcloud.utils.networking import is_valid_ip_address
+from libcloud.utils.misc import intern_string
+from libcloud.utils.misc import intern_values
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import TaskResult
+from libcloud.utils.parallel import run_in_parallel
 
 if have_paramiko:
     from paramiko.ssh_exception import SSHException
@@ -83,6 +91,21 @@ NODE_ONLINE_WAIT_TIMEOUT = 10 * 60
 # script.
 SSH_CONNECT_TIMEOUT = 5 * 60
 
+# Factor the wait period is multiplied by after each wait_until_running()
+# loop iteration, upper bound for the wait period and the random fraction by
+# which the wait period is shortened so nodes which were created at the same
+# time aren't polled at the same time
+WAIT_PERIOD_BACKOFF = 1.5
+MAX_WAIT_PERIOD = 30
+WAIT_PERIOD_JITTER = 0.25
+
+# Timeout for a single TCP connection attempt when probing the SSH port
+PORT_PROBE_TIMEOUT = 3
+
+# Drivers which retrieve nodes one by one in _refresh_nodes() fall back to
+# listing all the nodes when refreshing more nodes than this
+MAX_NODE_REFRESH_REQUESTS = 10
+
 # Error message which should be considered fatal for deploy_node() method and
 # on which we should abort retrying and immediately propagate the error
 SSH_FATAL_ERROR_MSGS = [
@@ -207,6 +230,9 @@ class Node(UuidMixin):
 
     >>> node.extra
     {'foo': 'bar'}
+
+    Repeated short strings (state and ``extra`` values) are interned to keep
+    large inventories compact.
     """
 
     def __init__(self,
@@ -257,14 +283,14 @@ class Node(UuidMixin):
         """
         self.id = str(id) if id else None
         self.name = name
-        self.state = state
+        self.state = intern_string(state)
         self.public_ips = public_ips if public_ips else []
         self.private_ips = private_ips if private_ips else []
         self.driver = driver
         self.size = size
         self.created_at = created_at
         self.image = image
-        self.extra = extra or {}
+        self.extra = intern_values(extra or {})
         UuidMixin.__init__(self)
 
     def reboot(self):
@@ -407,7 +433,7 @@ class NodeSize(UuidMixin):
         self.bandwidth = bandwidth
         self.price = price
         self.driver = driver
-        self.extra = extra or {}
+        self.extra = intern_values(extra or {})
         UuidMixin.__init__(self)
 
     def __repr__(self):
@@ -462,7 +488,7 @@ class NodeImage(UuidMixin):
         self.id = str(id)
         self.name = name
         self.driver = driver
-        self.extra = extra or {}
+        self.extra = intern_values(extra or {})
         UuidMixin.__init__(self)
 
     def __repr__(self):
@@ -658,8 +684,8 @@ class StorageVolume(UuidMixin):
         self.name = name
         self.size = size
         self.driver = driver
-        self.extra = extra
-        self.state = state
+        self.extra = intern_values(extra)
+        self.state = intern_string(state)
         UuidMixin.__init__(self)
 
     def list_snapshots(self):
@@ -861,6 +887,16 @@ class NodeDriver(BaseDriver):
 
     NODE_STATE_MAP = {}  # type: Dict[str, NodeState]
 
+    # Methods which return rarely changing data and can be cached using
+    # libcloud.compute.cache.CatalogCache
+    catalog_methods = ['list_sizes', 'list_images', 'list_locations',
+                       'get_image']  # type: List[str]
+
+    # Driver specific model classes (besides the base Node, NodeImage,
+    # NodeSize and NodeLocation classes) which can be loaded from the values
+    # cached by libcloud.compute.cache.CatalogCache
+    catalog_classes = []  # type: List[Type[Any]]
+
     def list_nodes(self, *args, **kwargs):
         # type: (Any, Any) -> List[Node]
         """
@@ -1114,76 +1150,26 @@ class NodeDriver(BaseDriver):
         :type wait_period: ``int``
 
         """
-        if not libcloud.compute.ssh.have_paramiko:
-            raise RuntimeError('paramiko is not installed. You can install ' +
-                               'it using pip: pip install paramiko')
+        self._check_deploy_auth(auth=auth, ssh_key=ssh_key)
 
-        if auth:
-            if not isinstance(auth, (NodeAuthSSHKey, NodeAuthPassword)):
-                raise NotImplementedError(
-                    'If providing auth, only NodeAuthSSHKey or'
-                    'NodeAuthPassword is supported')
-        elif ssh_key:
-            # If an ssh_key is provided we can try deploy_node
-            pass
-        elif 'create_node' in self.features:
-            f = self.features['create_node']
-            if 'generates_password' not in f and "password" not in f:
-                raise NotImplementedError(
-                    'deploy_node not implemented for this driver')
-        else:
-            raise NotImplementedError(
-                'deploy_node not implemented for this driver')
-
-        # NOTE 1: This is a workaround for legacy code. Sadly a lot of legacy
-        # code uses **kwargs in "create_node()" method and simply ignores
-        # "deploy_node()" arguments which are passed to it.
-        # That's obviously far from idea that's why we first try to pass only
-        # non-deploy node arguments to the "create_node()" methods and if it
-        # that doesn't work, fall back to the old approach and simply pass in
-        # all the arguments
-        # NOTE 2: Some drivers which use password based SSH authentication
-        # rely on password being stored on the "auth" argument and that's why
-        # we also propagate that argument to "create_node()" method.
-        try:
-            # NOTE: We only pass auth to the method if auth argument is
-            # provided
-            if auth:
-                node = self.create_node(auth=auth, **create_node_kwargs)
-            else:
-                node = self.create_node(**create_node_kwargs)
-        except TypeError as e:
-            msg_1_re = (r'create_node\(\) missing \d+ required '
-                        'positional arguments.*')
-            msg_2_re = r'create_node\(\) takes at least \d+ arguments.*'
-            if re.match(msg_1_re, str(e)) or re.match(msg_2_re, str(e)):
-                # pylint: disable=unexpected-keyword-arg
-                node = self.create_node(  # type: ignore
-                    deploy=deploy,
-                    ssh_username=ssh_username,
-                    ssh_alternate_usernames=ssh_alternate_usernames,
-                    ssh_port=ssh_port,
-                    ssh_timeout=ssh_timeout,
-                    ssh_key=ssh_key,
-                    auth=auth,
-                    timeout=timeout,
-                    max_tries=max_tries,
-                    ssh_interface=ssh_interface,
-                    **create_node_kwargs)
-                # pylint: enable=unexpected-keyword-arg
-            else:
-                raise e
+        deploy_kwargs = dict(
+            deploy=deploy,
+            ssh_username=ssh_username,
+            ssh_alternate_usernames=ssh_alternate_usernames,
+            ssh_port=ssh_port,
+            ssh_timeout=ssh_timeout,
+            ssh_key=ssh_key,
+            auth=auth,
+            timeout=timeout,
+            max_tries=max_tries,
+            ssh_interface=ssh_interface)
+        node = self._create_node_for_deployment(
+            auth=auth, deploy_kwargs=deploy_kwargs,
+            create_node_kwargs=create_node_kwargs)
 
         if at_exit_func:
             atexit.register(at_exit_func, driver=self, node=node)
 
-        password = None
-        if auth:
-            if isinstance(auth, NodeAuthPassword):
-                password = auth.password
-        elif 'password' in node.extra:
-            password = node.extra['password']
-
         wait_timeout = timeout or NODE_ONLINE_WAIT_TIMEOUT
 
         # Wait until node is up and running and has IP assigned
@@ -1199,41 +1185,257 @@ class NodeDriver(BaseDriver):
 
             raise DeploymentError(node=node, original_exception=e, driver=self)
 
-        ssh_alternate_usernames = ssh_alternate_usernames or []
-        deploy_timeout = timeout or SSH_CONNECT_TIMEOUT
+        try:
+            self._run_deployment_with_usernames(
+                task=deploy, node=node, ip_addresses=ip_addresses,
+                auth=auth, ssh_username=ssh_username,
+                ssh_alternate_usernames=ssh_alternate_usernames,
+                ssh_port=ssh_port, ssh_key=ssh_key,
+                ssh_key_password=ssh_key_password, ssh_timeout=ssh_timeout,
+                timeout=timeout, max_tries=max_tries)
+        finally:
+            if at_exit_func:
+                atexit.unregister(at_exit_func)
 
-        deploy_error = None
+        return node
 
-        for username in ([ssh_username] + ssh_alternate_usernames):
-            try:
-                self._connect_and_run_deployment_script(
-                    task=deploy, node=node,
-                    ssh_hostname=ip_addresses[0], ssh_port=ssh_port,
-                    ssh_username=username, ssh_password=password,
-                    ssh_key_file=ssh_key, ssh_key_password=ssh_key_password,
-                    ssh_timeout=ssh_timeout,
-                    timeout=deploy_timeout, max_tries=max_tries)
-            except Exception as e:
-                # Try alternate username
-                # Todo: Need to fix paramiko so we can catch a more specific
-                # exception
-                deploy_error = e
-            else:
-                # Script successfully executed, don't try alternate username
-                deploy_error = None
-                break
+    def deploy_nodes(self,
+                     deploy,  # type: Deployment
+                     count=None,  # type: Optional[int]
+                     names=None,  # type: Optional[List[str]]
+                     ssh_username='root',  # type: str
+                     ssh_alternate_usernames=None,  # type: Optional[List[str]]
+                     ssh_port=22,  # type: int
+                     ssh_timeout=10,  # type: int
+                     ssh_key=None,  # type: Optional[T_Ssh_key]
+                     ssh_key_password=None,  # type: Optional[str]
+                     auth=None,  # type: Optional[T_Auth]
+                     timeout=SSH_CONNECT_TIMEOUT,  # type: int
+                     max_tries=3,  # type: int
+                     ssh_interface='public_ips',  # type: str
+                     wait_period=5,  # type: int
+                     max_workers=DEFAULT_MAX_WORKERS,  # type: int
+                     **create_node_kwargs):
+        # type: (...) -> List[TaskResult]
+        """
+        Create multiple nodes and run the deployment on all of them.
+
+        This method works the same way as :meth:`deploy_node`, but instead of
+        handling a single node at a time, it creates the nodes concurrently,
+        waits for all of them to come online using a single polling loop
+        (one ``list_nodes`` call per iteration) and runs the deployment over a
+        bounded pool of SSH connections.
+
+        Each node is deployed using its own copy of the ``deploy`` object so
+        deployment output (e.g. ``ScriptDeployment.stdout``) is not shared
+        between the nodes.
+
+        Failures are reported per node and don't affect deployment of other
+        nodes.
 
-        if deploy_error is not None:
-            if at_exit_func:
-                atexit.unregister(at_exit_func)
+        >>> from libcloud.compute.drivers.dummy import DummyNodeDriver
+        >>> from libcloud.compute.deployment import ScriptDeployment
+        >>> driver = DummyNodeDriver(0)
+        >>> script = ScriptDeployment("yum -y install emacs strace tcpdump")
+        >>> def d():
+        ...     try:
+        ...         driver.deploy_nodes(deploy=script, count=10)
+        ...     except NotImplementedError:
+        ...         print ("not implemented for dummy driver")
+        >>> d()
+        not implemented for dummy driver
 
-            raise DeploymentError(node=node, original_exception=deploy_error,
-                                  driver=self)
+        :param deploy: Deployment to run once the nodes are online and
+                       available to SSH.
+        :type deploy: :class:`Deployment`
 
-        if at_exit_func:
-            atexit.unregister(at_exit_func)
+        :param count: Number of nodes to create. Node names are generated by
+                      appending an index to the ``name`` argument (e.g.
+                      ``name-1``, ``name-2``).
+        :type count: ``int``
+
+        :param names: Explicit names of the nodes to create (mutually
+                      exclusive with ``count``).
+        :type names: ``list`` of ``str``
+
+        :param max_workers: Maximum number of nodes which are created or
+                            deployed concurrently. This also bounds the number
+                            of open SSH connections. (default is 8)
+        :type max_workers: ``int``
+
+        Other arguments have the same meaning as in :meth:`deploy_node`.
+
+        :return: Result for each of the nodes in the same order as the node
+                 names. ``result`` attribute contains :class:`.Node` on
+                 success, ``error`` attribute contains the exception on
+                 failure (:class:`DeploymentError` if the node has been
+                 created, but deployment failed).
+        :rtype: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
+        """
+        names = self._get_node_names(count=count, names=names,
+                                     create_node_kwargs=create_node_kwargs)
+
+        self._check_deploy_auth(auth=auth, ssh_key=ssh_key)
+
+        deploy_kwargs = dict(
+            deploy=deploy,
+            ssh_username=ssh_username,
+            ssh_alternate_usernames=ssh_alternate_usernames,
+            ssh_port=ssh_port,
+            ssh_timeout=ssh_timeout,
+            ssh_key=ssh_key,
+            auth=auth,
+            timeout=timeout,
+            max_tries=max_tries,
+            ssh_interface=ssh_interface)
+
+        def create_node(driver, name):
+            kwargs = dict(create_node_kwargs, name=name)
+            node = driver._create_node_for_deployment(
+                auth=auth, deploy_kwargs=deploy_kwargs,
+                create_node_kwargs=kwargs)
+            node.driver = self
+            return node
+
+        results = run_in_parallel(self, create_node, names,
+                                  max_workers=max_workers)
+        nodes = [result.result for result in results if result.success]
+
+        # Wait for all the created nodes at once
+        wait_timeout = timeout or NODE_ONLINE_WAIT_TIMEOUT
+        running = {}  # type: Dict[str, Tuple[Node, List[str]]]
 
-        return node
+        try:
+            running = self._wait_until_nodes_running(
+                nodes=nodes, wait_period=wait_period, timeout=wait_timeout,
+                ssh_interface=ssh_interface)
+        except Exception as e:
+            # Listing nodes failed, all the created nodes are affected
+            for result in results:
+                if result.success:
+                    result.error = DeploymentError(
+                        node=result.result, original_exception=e, driver=self)
+
+        for result in results:
+            if result.success and result.result.uuid not in running:
+                error = LibcloudError(value='Timed out after %s seconds' %
+                                      (wait_timeout), driver=self)
+                result.error = DeploymentError(
+                    node=result.result, original_exception=error, driver=self)
+
+        def run_deployment(driver, result):
+            node, ip_addresses = running[result.result.uuid]
+            driver._run_deployment_with_usernames(
+                task=copy.deepcopy(deploy), node=node,
+                ip_addresses=ip_addresses, auth=auth,
+                ssh_username=ssh_username,
+                ssh_alternate_usernames=ssh_alternate_usernames,
+                ssh_port=ssh_port, ssh_key=ssh_key,
+                ssh_key_password=ssh_key_password, ssh_timeout=ssh_timeout,
+                timeout=timeout, max_tries=max_tries)
+            node.driver = self
+            return node
+
+        pending = [result for result in results if result.success]
+        deploy_results = run_in_parallel(self, run_deployment, pending,
+                                         max_workers=max_workers)
+
+        for deploy_result in deploy_results:
+            result = deploy_result.item
+            result.result = deploy_result.result or result.result
+            result.error = deploy_result.error
+
+        return results
+
+    def create_nodes(self,
+                     count=None,  # type: Optional[int]
+                     names=None,  # type: Optional[List[str]]
+                     max_workers=DEFAULT_MAX_WORKERS,  # type: int
+                     **create_node_kwargs):
+        # type: (...) -> List[TaskResult]
+        """
+        Create multiple nodes.
+
+        Drivers for providers which can create multiple nodes using a single
+        API call override this method, other drivers call
+        :meth:`create_node` concurrently using a bounded pool of worker
+        threads.
+
+        Failures are reported per node and don't affect creation of other
+        nodes.
+
+        >>> from libcloud.compute.drivers.dummy import DummyNodeDriver
+        >>> driver = DummyNodeDriver(0)
+        >>> size = driver.list_sizes()[0]
+        >>> image = driver.list_images()[0]
+        >>> results = driver.create_nodes(count=2, name='test', size=size,
+        ...                               image=image, max_workers=1)
+        >>> [result.success for result in results]
+        [True, True]
+
+        :param count: Number of nodes to create. Node names are generated by
+                      appending an index to the ``name`` argument (e.g.
+                      ``name-1``, ``name-2``).
+        :type count: ``int``
+
+        :param names: Explicit names of the nodes to create (mutually
+                      exclusive with ``count``).
+        :type names: ``list`` of ``str``
+
+        :param max_workers: Maximum number of nodes which are created
+                            concurrently. (default is 8)
+        :type max_workers: ``int``
+
+        Other keyword arguments are passed to :meth:`create_node`.
+
+        :return: Result for each of the nodes in the same order as the node
+                 names. ``result`` attribute contains :class:`.Node` on
+                 success, ``error`` attribute contains the exception on
+                 failure.
+        :rtype: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
+        """
+        names = self._get_node_names(count=count, names=names,
+                                     create_node_kwargs=create_node_kwargs)
+
+        def create_node(driver, name):
+            node = driver.create_node(name=name, **create_node_kwargs)
+            node.driver = self
+            return node
+
+        return run_in_parallel(self, create_node, names,
+                               max_workers=max_workers)
+
+    def destroy_nodes(self,
+                      nodes,  # type: List[Node]
+                      max_workers=DEFAULT_MAX_WORKERS  # type: int
+                      ):
+        # type: (...) -> List[TaskResult]
+        """
+        Destroy multiple nodes.
+
+        Drivers for providers which can destroy multiple nodes using a single
+        API call override this method, other drivers call
+        :meth:`destroy_node` concurrently using a bounded pool of worker
+        threads.
+
+        :param nodes: Nodes to destroy.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :param max_workers: Maximum number of nodes which are destroyed
+                            concurrently. (default is 8)
+        :type max_workers: ``int``
+
+        :return: Result for each of the nodes in the same order as the
+                 nodes. ``result`` attribute contains the value returned by
+                 :meth:`destroy_node`, ``error`` attribute contains the
+                 exception on failure.
+        :rtype: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
+        """
+        def destroy_node(driver, node):
+            return driver.destroy_node(node)
+
+        return run_in_parallel(self, destroy_node, nodes,
+                               max_workers=max_workers)
 
     def reboot_node(self, node):
         # type: (Node) -> bool
@@ -1610,7 +1812,10 @@ class NodeDriver(BaseDriver):
                            timeout=600,  # type: int
                            ssh_interface='public_ips',  # type: str
                            force_ipv4=True,  # type: bool
-                           ex_list_nodes_kwargs=None  # type: Optional[Dict]
+                           ex_list_nodes_kwargs=None,  # type: Optional[Dict]
+                           backoff=WAIT_PERIOD_BACKOFF,  # type: float
+                           max_wait_period=MAX_WAIT_PERIOD,  # type: float
+                           ssh_port=None  # type: Optional[int]
                            ):
         # type: (...) -> List[Tuple[Node, List[str]]]
         """
@@ -1619,11 +1824,16 @@ class NodeDriver(BaseDriver):
         Node is considered running when it's state is "running" and when it has
         at least one IP address assigned.
 
+        Only the nodes which are not running yet are retrieved on each loop
+        iteration (see :meth:`_refresh_nodes`) and the time between the
+        iterations grows exponentially (with a random jitter) from
+        ``wait_period`` up to ``max_wait_period`` seconds.
+
         :param nodes: List of nodes to wait for.
         :type nodes: ``list`` of :class:`.Node`
 
-        :param wait_period: How many seconds to wait between each loop
-                            iteration. (default is 3)
+        :param wait_period: How many seconds to wait after the first loop
+                            iteration. (default is 5)
         :type wait_period: ``int``
 
         :param timeout: How many seconds to wait before giving up.
@@ -1643,12 +1853,77 @@ class NodeDriver(BaseDriver):
                                      method.
         :type ex_list_nodes_kwargs: ``dict``
 
+        :param backoff: Factor the wait period is multiplied by after each
+                        loop iteration. (default is 1.5)
+        :type backoff: ``float``
+
+        :param max_wait_period: Maximum number of seconds to wait between the
+                                loop iterations. (default is 30)
+        :type max_wait_period: ``float``
+
+        :param ssh_port: If provided, node is only considered running once a
+                         TCP connection to this port on one of its addresses
+                         succeeds. Nodes are probed concurrently.
+        :type ssh_port: ``int``
+
         :return: ``[(Node, ip_addresses)]`` list of tuple of Node instance and
                  list of ip_address on success.
         :rtype: ``list`` of ``tuple``
         """
-        ex_list_nodes_kwargs = ex_list_nodes_kwargs or {}
+        running = self._wait_until_nodes_running(
+            nodes=nodes, wait_period=wait_period, timeout=timeout,
+            ssh_interface=ssh_interface, force_ipv4=force_ipv4,
+            ex_list_nodes_kwargs=ex_list_nodes_kwargs, backoff=backoff,
+            max_wait_period=max_wait_period, ssh_port=ssh_port)
+
+        if len(running) != len(set([node.uuid for node in nodes])):
+            raise LibcloudError(value='Timed out after %s seconds' %
+                                (timeout), driver=self)
+
+        return [running[node.uuid] for node in nodes]
+
+    def _refresh_nodes(self,
+                       nodes,  # type: List[Node]
+                       ex_list_nodes_kwargs=None  # type: Optional[Dict]
+                       ):
+        # type: (...) -> List[Node]
+        """
+        Retrieve current state of the provided nodes.
+
+        Nodes which don't exist (anymore) are not included in the result. The
+        default implementation retrieves all the nodes using a single
+        ``list_nodes`` call, drivers which can efficiently retrieve only the
+        specified nodes (e.g. by filtering on the node IDs) override it.
+
+        :param nodes: Nodes to retrieve.
+        :type nodes: ``list`` of :class:`.Node`
+
+        :param ex_list_nodes_kwargs: Optional driver-specific keyword arguments
+                                     which are passed to the ``list_nodes``
+                                     method.
+        :type ex_list_nodes_kwargs: ``dict``
+
+        :rtype: ``list`` of :class:`.Node`
+        """
+        uuids = set([node.uuid for node in nodes])
+        all_nodes = self.list_nodes(**(ex_list_nodes_kwargs or {}))
+        return [node for node in all_nodes if node.uuid in uuids]
+
+    def _get_running_nodes(self,
+                           nodes,  # type: List[Node]
+                           ssh_interface='public_ips',  # type: str
+                           force_ipv4=True,  # type: bool
+                           ex_list_nodes_kwargs=None  # type: Optional[Dict]
+                           ):
+        # type: (...) -> List[Tuple[Node, List[str]]]
+        """
+        Return the provided nodes which are running and have at least one IP
+        address assigned.
 
+        :return: ``[(Node, ip_addresses)]`` list of tuple of Node instance and
+                 list of ip_address.
+        :rtype: ``list`` of ``tuple``
+        """
         def is_supported(address):
             # type: (str) -> bool
             """
@@ -1666,43 +1941,270 @@ class NodeDriver(BaseDriver):
             """
             return [address for address in addresses if is_supported(address)]
 
+        uuids = set([node.uuid for node in nodes])
+        matching_nodes = self._refresh_nodes(
+            nodes=nodes, ex_list_nodes_kwargs=ex_list_nodes_kwargs)
+
+        if len(matching_nodes) > len(uuids):
+            found_uuids = [node.uuid for node in matching_nodes]
+            msg = ('Unable to match specified uuids ' +
+                   '(%s) with existing nodes. Found ' % (uuids) +
+                   'multiple nodes with same uuid: (%s)' % (found_uuids))
+            raise LibcloudError(value=msg, driver=self)
+
+        running_nodes = []
+        for node in matching_nodes:
+            if node.state != NodeState.RUNNING:
+                continue
+
+            node_addresses = filter_addresses(getattr(node, ssh_interface))
+            if len(node_addresses) >= 1:
+                running_nodes.append((node, node_addresses))
+
+        return running_nodes
+
+    def _wait_until_nodes_running(self,
+                                  nodes,  # type: List[Node]
+                                  wait_period=5,  # type: float
+                                  timeout=600,  # type: int
+                                  ssh_interface='public_ips',  # type: str
+                                  force_ipv4=True,  # type: bool
+                                  ex_list_nodes_kwargs=None,  # type: Any
+                                  backoff=WAIT_PERIOD_BACKOFF,  # type: float
+                                  max_wait_period=MAX_WAIT_PERIOD,  # type: Any
+                                  ssh_port=None  # type: Optional[int]
+                                  ):
+        # type: (...) -> Dict[str, Tuple[Node, List[str]]]
+        """
+        Wait for the provided nodes using a single polling loop.
+
+        Unlike :meth:`wait_until_running` this method doesn't fail if some of
+        the nodes don't come online in time, it returns the nodes which are
+        running instead.
+
+        :return: Dictionary which maps node uuid to a tuple of Node instance
+                 and list of ip addresses for nodes which are running.
+        :rtype: ``dict``
+        """
         if ssh_interface not in ['public_ips', 'private_ips']:
             raise ValueError('ssh_interface argument must either be ' +
                              'public_ips or private_ips')
 
-        start = time.time()
-        end = start + timeout
+        end = time.time() + timeout
+        pending = dict((node.uuid, node) for node in nodes)
+        running = {}  # type: Dict[str, Tuple[Node, List[str]]]
 
-        uuids = set([node.uuid for node in nodes])
+        while pending:
+            running_nodes = self._get_running_nodes(
+                nodes=list(pending.values()), ssh_interface=ssh_interface,
+                force_ipv4=force_ipv4,
+                ex_list_nodes_kwargs=ex_list_nodes_kwargs)
 
-        while time.time() < end:
-            all_nodes = self.list_nodes(**ex_list_nodes_kwargs)
-            matching_nodes = list([node for node in all_nodes
-                                   if node.uuid in uuids])
-
-            if len(matching_nodes) > len(uuids):
-                found_uuids = [node.uuid for node in matching_nodes]
-                msg = ('Unable to match specified uuids ' +
-                       '(%s) with existing nodes. Found ' % (uuids) +
-                       'multiple nodes with same uuid: (%s)' % (found_uuids))
-                raise LibcloudError(value=msg, driver=self)
-
-            running_nodes = [node for node in matching_nodes
-                             if node.state == NodeState.RUNNING]
-            addresses = []
-            for node in running_nodes:
-                node_addresses = filter_addresses(getattr(node, ssh_interface))
-                if len(node_addresses) >= 1:
-                    addresses.append(node_addresses)
-
-            if len(running_nodes) == len(uuids) == len(addresses):
-                return list(zip(running_nodes, addresses))
+            if ssh_port:
+                running_nodes = self._get_nodes_with_open_port(
+                    running_nodes=running_nodes, port=ssh_port)
+
+            for node, addresses in running_nodes:
+                running[node.uuid] = (node, addresses)
+                pending.pop(node.uuid, None)
+
+            if not pending or time.time() + wait_period >= end:
+                break
+
+            time.sleep(wait_period * (1 - random.uniform(0,
+                                                         WAIT_PERIOD_JITTER)))
+            wait_period = min(wait_period * backoff,
+                              max(max_wait_period or 0, wait_period))
+
+        return running
+
+    def _get_nodes_with_open_port(self,
+                                  running_nodes,  # type: List[Tuple[Any, Any]]
+                                  port  # type: int
+                                  ):
+        # type: (...) -> List[Tuple[Node, List[str]]]
+        """
+        Return the running nodes which accept TCP connections on the provided
+        port on at least one of their addresses.
+
+        Nodes are probed concurrently.
+        """
+        def is_port_open(item):
+            # type: (Tuple[Node, List[str]]) -> bool
+            for address in item[1]:
+                try:
+                    sock = socket.create_connection(
+                        (address, port), timeout=PORT_PROBE_TIMEOUT)
+                except (socket.error, socket.timeout):
+                    continue
+
+                sock.close()
+                return True
+
+            return False
+
+        if not running_nodes:
+            return []
+
+        max_workers = min(len(running_nodes), DEFAULT_MAX_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            port_open = list(executor.map(is_port_open, running_nodes))
+
+        return [item for item, is_open in zip(running_nodes, port_open)
+                if is_open]
+
+    def _check_deploy_auth(self, auth, ssh_key):
+        # type: (Optional[T_Auth], Optional[T_Ssh_key]) -> None
+        """
+        Verify that the provided authentication information can be used to
+        SSH into the deployed node(s).
+        """
+        if not libcloud.compute.ssh.have_paramiko:
+            raise RuntimeError('paramiko is not installed. You can install ' +
+                               'it using pip: pip install paramiko')
+
+        if auth:
+            if not isinstance(auth, (NodeAuthSSHKey, NodeAuthPassword)):
+                raise NotImplementedError(
+                    'If providing auth, only NodeAuthSSHKey or'
+                    'NodeAuthPassword is supported')
+        elif ssh_key:
+            # If an ssh_key is provided we can try deploy_node
+            pass
+        elif 'create_node' in self.features:
+            f = self.features['create_node']
+            if 'generates_password' not in f and "password" not in f:
+                raise NotImplementedError(
+                    'deploy_node not implemented for this driver')
+        else:
+            raise NotImplementedError(
+                'deploy_node not implemented for this driver')
+
+    def _get_node_names(self,
+                        count,  # type: Optional[int]
+                        names,  # type: Optional[List[str]]
+                        create_node_kwargs  # type: Dict[str, Any]
+                        ):
+        # type: (...) -> List[str]
+        """
+        Return names of the nodes which are created by the bulk methods.
+
+        ``name`` argument (used as a prefix if ``count`` is provided) is
+        removed from ``create_node_kwargs``.
+        """
+        if (count is None) == (names is None):
+            raise ValueError('Exactly one of "count" and "names" arguments '
+                             'needs to be provided')
+
+        prefix = create_node_kwargs.pop('name', 'node')
+
+        if names is not None:
+            return list(names)
+
+        assert count is not None
+        return ['%s-%d' % (prefix, index + 1) for index in range(count)]
+
+    def _create_node_for_deployment(self, auth, deploy_kwargs,
+                                    create_node_kwargs):
+        # type: (Optional[T_Auth], Dict[str, Any], Dict[str, Any]) -> Node
+        """
+        Create a node which is to be deployed.
+
+        :param deploy_kwargs: Arguments of the deploy method which are only
+                              passed to ``create_node`` by legacy drivers.
+        :type deploy_kwargs: ``dict``
+        """
+        # NOTE 1: This is a workaround for legacy code. Sadly a lot of legacy
+        # code uses **kwargs in "create_node()" method and simply ignores
+        # "deploy_node()" arguments which are passed to it.
+        # That's obviously far from idea that's why we first try to pass only
+        # non-deploy node arguments to the "create_node()" methods and if it
+        # that doesn't work, fall back to the old approach and simply pass in
+        # all the arguments
+        # NOTE 2: Some drivers which use password based SSH authentication
+        # rely on password being stored on the "auth" argument and that's why
+        # we also propagate that argument to "create_node()" method.
+        try:
+            # NOTE: We only pass auth to the method if auth argument is
+            # provided
+            if auth:
+                node = self.create_node(auth=auth, **create_node_kwargs)
             else:
-                time.sleep(wait_period)
-                continue
+                node = self.create_node(**create_node_kwargs)
+        except TypeError as e:
+            msg_1_re = (r'create_node\(\) missing \d+ required '
+                        'positional arguments.*')
+            msg_2_re = r'create_node\(\) takes at least \d+ arguments.*'
+            if re.match(msg_1_re, str(e)) or re.match(msg_2_re, str(e)):
+                kwargs = dict(create_node_kwargs, **deploy_kwargs)
+                # pylint: disable=unexpected-keyword-arg
+                node = self.create_node(**kwargs)  # type: ignore
+                # pylint: enable=unexpected-keyword-arg
+            else:
+                raise e
+
+        return node
+
+    def _run_deployment_with_usernames(
+        self,
+        task,  # type: Deployment
+        node,  # type: Node
+        ip_addresses,  # type: List[str]
+        auth,  # type: T_Auth
+        ssh_username,  # type: str
+        ssh_alternate_usernames,  # type: Optional[List[str]]
+        ssh_port,  # type: int
+        ssh_key,  # type: Optional[T_Ssh_key]
+        ssh_key_password,  # type: Optional[str]
+        ssh_timeout,  # type: int
+        timeout,  # type: int
+        max_tries  # type: int
+    ):
+        # type: (...) -> Node
+        """
+        Run the deployment task on a running node, trying all the provided
+        usernames.
+
+        :raises: :class:`DeploymentError` if the deployment fails for all
+                 the usernames.
+        """
+        password = None
+        if auth:
+            if isinstance(auth, NodeAuthPassword):
+                password = auth.password
+        elif 'password' in node.extra:
+            password = node.extra['password']
 
-        raise LibcloudError(value='Timed out after %s seconds' % (timeout),
-                            driver=self)
+        ssh_alternate_usernames = ssh_alternate_usernames or []
+        deploy_timeout = timeout or SSH_CONNECT_TIMEOUT
+
+        deploy_error = None
+
+        for username in ([ssh_username] + ssh_alternate_usernames):
+            try:
+                self._connect_and_run_deployment_script(
+                    task=task, node=node,
+                    ssh_hostname=ip_addresses[0], ssh_port=ssh_port,
+                    ssh_username=username, ssh_password=password,
+                    ssh_key_file=ssh_key, ssh_key_password=ssh_key_password,
+                    ssh_timeout=ssh_timeout,
+                    timeout=deploy_timeout, max_tries=max_tries)
+            except Exception as e:
+                # Try alternate username
+                # Todo: Need to fix paramiko so we can catch a more specific
+                # exception
+                deploy_error = e
+            else:
+                # Script successfully executed, don't try alternate username
+                deploy_error = None
+                break
+
+        if deploy_error is not None:
+            raise DeploymentError(node=node, original_exception=deploy_error,
+                                  driver=self)
+
+        return node
 
     def _get_and_check_auth(self, auth):
         # type: (T_Auth) -> T_Auth
@@ -0,0 +1,572 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache for the results of the node driver methods which return rarely
+changing data (sizes, images, locations, etc.).
+
+Cached values are stored in a pluggable backend which can be shared by many
+driver instances. Entries are keyed by the driver class, credentials, region
+and method arguments so drivers for different accounts and regions never see
+each other's data.
+"""
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import io
+import os
+import json
+import stat
+import time
+import base64
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from libcloud.common.base import BaseDriver
+
+__all__ = [
+    'DEFAULT_TTL',
+    'DEFAULT_MAX_ENTRIES',
+
+    'CacheStats',
+    'MemoryCacheBackend',
+    'FileCacheBackend',
+    'CatalogCache',
+
+    'get_driver_cache_key'
+]
+
+# Default number of seconds after which a cached value expires
+DEFAULT_TTL = 60 * 60
+
+# Default maximum number of entries stored in a backend
+DEFAULT_MAX_ENTRIES = 1000
+
+# Persistent id which is used in place of the driver when pickling values
+DRIVER_PERSISTENT_ID = 'libcloud-driver'
+
+# Classes (besides the libcloud model classes) which cached values can
+# contain. Other classes and functions are refused when a value is loaded.
+SAFE_CLASSES = {
+    'builtins': ('dict', 'list', 'tuple', 'set', 'frozenset', 'bytes',
+                 'bytearray', 'str', 'int', 'float', 'complex', 'bool'),
+    'collections': ('OrderedDict', ),
+    'datetime': ('date', 'datetime', 'time', 'timedelta', 'timezone'),
+    'decimal': ('Decimal', )
+}
+
+# libcloud model classes which can be loaded from the cached values. Drivers
+# list their own model classes in the ``catalog_classes`` attribute.
+MODEL_CLASSES = {
+    'libcloud.compute.base': ('Node', 'NodeImage', 'NodeSize',
+                              'NodeLocation'),
+    'libcloud.compute.types': ('NodeState', 'StorageVolumeState',
+                               'VolumeSnapshotState', 'NodeImageMemberState',
+                               'Architecture')
+}
+
+
+class CacheStats(object):
+    """
+    Cache hit and miss counters.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def add(self, hits=0, misses=0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    @property
+    def hit_ratio(self):
+        # type: () -> float
+        total = self.hits + self.misses
+        return float(self.hits) / total if total else 0.0
+
+    def __repr__(self):
+        return ('<CacheStats: hits=%s, misses=%s, hit_ratio=%.2f>' %
+                (self.hits, self.misses, self.hit_ratio))
+
+
+class MemoryCacheBackend(object):
+    """
+    In-process cache backend with TTL expiration and LRU eviction.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        :param max_entries: Maximum number of entries. Least recently used
+                            entries are evicted once the limit is reached.
+        :type max_entries: ``int``
+        """
+        self.max_entries = max_entries
+
+        # key -> (expire time, data)
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        # type: (str) -> Optional[bytes]
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            if entry is None:
+                return None
+
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, data, ttl):
+        # type: (str, bytes, int) -> None
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, data)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix):
+        # type: (str) -> None
+        with self._lock:
+            for key in [key for key in self._entries if
+                        key.startswith(prefix)]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileCacheBackend(object):
+    """
+    Cache backend which stores each entry in a file inside the provided
+    directory so the cache can be shared by multiple processes.
+
+    Modification time of the entry file is updated when the entry is read
+    and it's used for the LRU eviction.
+
+    The directory needs to be trusted - only the user running the process
+    should be able to write to it. The directory is created with 0700
+    permissions, directories and entry files which are owned by a different
+    user (or a directory which is writable by other users) are refused.
+    """
+
+    def __init__(self, directory, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        :param directory: Directory where the entries are stored. It's
+                          created if it doesn't exist.
+        :type directory: ``str``
+
+        :param max_entries: Maximum number of entries. Least recently used
+                            entries are evicted once the limit is reached.
+        :type max_entries: ``int``
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700)
+
+        self._check_directory()
+
+    def get(self, key):
+        # type: (str) -> Optional[bytes]
+        path = self._get_path(key)
+        entry = self._read_entry(path)
+
+        if entry is None or entry[0] != key:
+            return None
+
+        _, expire_time, data = entry
+
+        if expire_time <= time.time():
+            self._remove(path)
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return data
+
+    def set(self, key, data, ttl):
+        # type: (str, bytes, int) -> None
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+
+        try:
+            entry = {
+                'key': key,
+                'expire_time': time.time() + ttl,
+                'data': base64.b64encode(data).decode('ascii')
+            }
+
+            with os.fdopen(fd, 'w') as fp:
+                json.dump(entry, fp)
+
+            # Readers in other processes never see a partially written entry
+            os.replace(temp_path, self._get_path(key))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+        self._evict()
+
+    def delete_prefix(self, prefix):
+        # type: (str) -> None
+        for path in self._list_entries():
+            entry = self._read_entry(path)
+
+            if entry is not None and entry[0].startswith(prefix):
+                self._remove(path)
+
+    def _check_directory(self):
+        if not hasattr(os, 'getuid'):
+            return
+
+        st = os.stat(self.directory)
+
+        if st.st_uid != os.getuid():
+            raise ValueError('Cache directory %s is owned by a different '
+                             'user' % (self.directory))
+
+        if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise ValueError('Cache directory %s is writable by other '
+                             'users' % (self.directory))
+
+    def _read_entry(self, path):
+        # type: (str) -> Optional[Tuple[str, float, bytes]]
+        """
+        Return key, expire time and data of the entry or None if the entry
+        doesn't exist, it's invalid or it's owned by a different user.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+        except OSError:
+            return None
+
+        try:
+            with os.fdopen(fd, 'r') as fp:
+                if (hasattr(os, 'getuid') and
+                        os.fstat(fp.fileno()).st_uid != os.getuid()):
+                    return None
+
+                entry = json.load(fp)
+
+            return (entry['key'], float(entry['expire_time']),
+                    base64.b64decode(entry['data']))
+        except (IOError, OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def _evict(self):
+        paths = self._list_entries()
+
+        if len(paths) <= self.max_entries:
+            return
+
+        entries = []
+
+        for path in paths:
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except OSError:
+                pass
+
+        entries.sort()
+
+        for _, path in entries[:len(entries) - self.max_entries]:
+            self._remove(path)
+
+    def _list_entries(self):
+        # type: () -> List[str]
+        return [os.path.join(self.directory, name) for name in
+                os.listdir(self.directory) if name.endswith('.cache')]
+
+    def _get_path(self, key):
+        # type: (str) -> str
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + '.cache')
+
+    def _remove(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def __len__(self):
+        return len(self._list_entries())
+
+
+class _DriverPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        # Drivers (and their connections) can't be pickled. References to
+        # the driver are restored to the driver which reads the value.
+        if isinstance(obj, BaseDriver):
+            return DRIVER_PERSISTENT_ID
+
+        return None
+
+
+class _DriverUnpickler(pickle.Unpickler):
+    def __init__(self, file, driver):
+        super(_DriverUnpickler, self).__init__(file)
+        self.driver = driver
+
+    def find_class(self, module, name):
+        # Only the allowed model classes and plain data types can be loaded
+        # so a tampered value can't call arbitrary functions
+        if name in SAFE_CLASSES.get(module, ()) or \
+                name in MODEL_CLASSES.get(module, ()):
+            return super(_DriverUnpickler, self).find_class(module, name)
+
+        for klass in getattr(self.driver, 'catalog_classes', []):
+            if klass.__module__ == module and klass.__name__ == name:
+                return klass
+
+        raise pickle.UnpicklingError('Loading %s.%s from the cache is not '
+                                     'allowed' % (module, name))
+
+    def persistent_load(self, pid):
+        if pid == DRIVER_PERSISTENT_ID:
+            return self.driver
+
+        raise pickle.UnpicklingError('Unsupported persistent id: %s' % (pid))
+
+
+class CatalogCache(object):
+    """
+    Cache for the node driver catalog methods.
+
+    Methods listed in the driver ``catalog_methods`` attribute (e.g.
+    ``list_sizes``, ``list_images`` and ``list_locations``) are wrapped
+    on the driver instance when the driver is attached to the cache::
+
+        cache = CatalogCache(ttl=600)
+        cache.attach(driver)
+
+        driver.list_sizes()  # API request
+        driver.list_sizes()  # Cached
+
+    Each call returns a new copy of the cached value so the callers can
+    modify the returned objects.
+    """
+
+    def __init__(self, backend=None, ttl=DEFAULT_TTL, method_ttls=None):
+        """
+        :param backend: Backend used to store the values. Defaults to a new
+                        :class:`MemoryCacheBackend`.
+        :type backend: :class:`MemoryCacheBackend` or
+                       :class:`FileCacheBackend`
+
+        :param ttl: Number of seconds after which a cached value expires.
+        :type ttl: ``int``
+
+        :param method_ttls: TTL overrides for specific methods (method name
+                            -> TTL).
+        :type method_ttls: ``dict``
+        """
+        self.backend = backend if backend is not None else \
+            MemoryCacheBackend()
+        self.ttl = ttl
+        self.method_ttls = method_ttls or {}  # type: Dict[str, int]
+        self.stats = CacheStats()
+
+    def attach(self, driver, methods=None):
+        """
+        Cache the results of the catalog methods of the provided driver.
+
+        :param driver: Driver instance.
+        :type driver: :class:`libcloud.compute.base.NodeDriver`
+
+        :param methods: Names of the methods to cache. Defaults to the
+                        driver ``catalog_methods`` attribute.
+        :type methods: ``list`` of ``str``
+
+        :return: The provided driver.
+        :rtype: :class:`libcloud.compute.base.NodeDriver`
+        """
+        if methods is None:
+            methods = getattr(driver, 'catalog_methods', [])
+
+        for name in methods:
+            method = getattr(driver, name, None)
+
+            if method is None or isinstance(
+                    getattr(method, 'catalog_cache', None), CatalogCache):
+                continue
+
+            cached_method = self._wrap(driver, name, method)
+
+            # Method which has been overridden on the instance is restored
+            # when the driver is detached
+            if name in vars(driver):
+                cached_method.original_method = method  # type: ignore
+
+            setattr(driver, name, cached_method)
+
+        return driver
+
+    def detach(self, driver):
+        """
+        Stop caching the results of the catalog methods of the provided
+        driver.
+
+        :param driver: Driver instance.
+        :type driver: :class:`libcloud.compute.base.NodeDriver`
+        """
+        for name, value in list(vars(driver).items()):
+            if getattr(value, 'catalog_cache', None) is not self:
+                continue
+
+            if hasattr(value, 'original_method'):
+                setattr(driver, name, value.original_method)
+            else:
+                delattr(driver, name)
+
+    def invalidate(self, driver=None, method=None):
+        """
+        Remove cached values.
+
+        :param driver: Only remove values of drivers with the same type,
+                       credentials and region as this driver. If not
+                       provided, all the values are removed.
+        :type driver: :class:`libcloud.compute.base.NodeDriver`
+
+        :param method: Only remove values returned by this method (requires
+                       ``driver`` argument).
+        :type method: ``str``
+        """
+        if driver is None:
+            prefix = ''
+        elif method is None:
+            prefix = get_driver_cache_key(driver) + '/'
+        else:
+            prefix = '%s/%s(' % (get_driver_cache_key(driver), method)
+
+        self.backend.delete_prefix(prefix)
+
+    def _wrap(self, driver, name, method):
+        ttl = self.method_ttls.get(name, self.ttl)
+
+        @wraps(method)
+        def cached_method(*args, **kwargs):
+            key = '%s/%s(%s)' % (get_driver_cache_key(driver), name,
+                                 _get_arguments_key(args, kwargs))
+            data = self.backend.get(key)
+
+            if data is not None:
+                try:
+                    value = _loads(data, driver)
+                except Exception:
+                    # Value stored by an incompatible version, treat it as a
+                    # cache miss
+                    pass
+                else:
+                    self.stats.add(hits=1)
+                    return value
+
+            self.stats.add(misses=1)
+            value = method(*args, **kwargs)
+
+            try:
+                data = _dumps(value)
+            except Exception:
+                # Values which can't be serialized are not cached
+                return value
+
+            self.backend.set(key, data, ttl)
+            return value
+
+        cached_method.catalog_cache = self  # type: ignore
+        return cached_method
+
+
+def get_driver_cache_key(driver):
+    # type: (BaseDriver) -> str
+    """
+    Return a key which identifies the driver type, credentials, region and
+    the default zone / datacenter.
+
+    Credentials are hashed so they are not stored in the cache.
+
+    :rtype: ``str``
+    """
+    connection = getattr(driver, 'connection', None)
+    credentials = '%s:%s' % (getattr(driver, 'key', None),
+                             getattr(driver, 'secret', None))
+    # Default zone is an object on some drivers (e.g. GCEZone)
+    zone = getattr(driver, 'zone', None)
+    zone = getattr(zone, 'name', zone)
+    components = [
+        credentials,
+        getattr(driver, 'region', None),
+        getattr(driver, 'project', None),
+        zone,
+        getattr(driver, 'datacenter', None),
+        getattr(connection, 'host', None)
+    ]
+    digest = hashlib.sha256(repr(components).encode('utf-8')).hexdigest()
+
+    return '%s.%s:%s' % (driver.__class__.__module__,
+                         driver.__class__.__name__, digest[:32])
+
+
+def _get_arguments_key(args, kwargs):
+    # type: (Tuple[Any, ...], Dict[str, Any]) -> str
+    values = [_get_argument_key(value) for value in args]
+    values.extend('%s=%s' % (name, _get_argument_key(kwargs[name])) for name
+                  in sorted(kwargs))
+    return ', '.join(values)
+
+
+def _get_argument_key(value):
+    # type: (Any) -> str
+    # Resources (locations, sizes, ...) are identified by the type and id,
+    # other attributes don't affect the result
+    if getattr(value, 'driver', None) is not None and hasattr(value, 'id'):
+        return '<%s id=%r>' % (value.__class__.__name__, value.id)
+
+    if isinstance(value, (list, tuple)):
+        return '[%s]' % (', '.join(_get_argument_key(item) for item in value))
+
+    return repr(value)
+
+
+def _dumps(value):
+    # type: (Any) -> bytes
+    fp = io.BytesIO()
+    _DriverPickler(fp, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return fp.getvalue()
+
+
+def _loads(data, driver):
+    # type: (bytes, BaseDriver) -> Any
+    return _DriverUnpickler(io.BytesIO(data), driver=driver).load()
@@ -0,0 +1,294 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact catalog of the EC2 instance types and the instance types which are
+available in each region.
+
+The catalog is stored in a JSON file (generated by
+``contrib/scrape-ec2-sizes.py``) which is only loaded on first use. Extra
+attribute names and values are stored in shared string tables and instance
+types are referenced by their index so the loaded catalog is small and
+instance type dictionaries are only built when they are requested.
+"""
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import os
+import json
+import threading
+
+__all__ = [
+    'CATALOG_FORMAT_VERSION',
+    'DEFAULT_CATALOG_FILE_PATH',
+
+    'EC2InstanceTypeCatalog',
+
+    'build_catalog',
+    'write_catalog',
+    'get_catalog',
+    'get_instance_type',
+    'get_region_instance_types'
+]
+
+CATALOG_FORMAT_VERSION = 1
+
+DEFAULT_CATALOG_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'data', 'ec2_instance_types.json')
+
+# Loaded catalog instance (see get_catalog)
+_CATALOG = None  # type: Optional[EC2InstanceTypeCatalog]
+_CATALOG_LOCK = threading.Lock()
+
+
+class EC2InstanceTypeCatalog(object):
+    """
+    EC2 instance types catalog.
+    """
+
+    def __init__(self, data):
+        """
+        :param data: Decoded catalog data (see :func:`build_catalog`).
+        :type data: ``dict``
+        """
+        if data.get('version') != CATALOG_FORMAT_VERSION:
+            raise ValueError('Unsupported catalog format version: %s' %
+                             (data.get('version')))
+
+        self._strings = data['strings']  # type: List[str]
+        self._fields = data['fields']  # type: List[str]
+        self._names = data['instance_types']  # type: List[str]
+        self._sizes = data['sizes']  # type: List[List[Any]]
+        self._regions = data['regions']  # type: Dict[str, Dict[str, Any]]
+        self._index = dict((name, index) for index, name in
+                           enumerate(self._names))
+
+    @classmethod
+    def load(cls, file_path=DEFAULT_CATALOG_FILE_PATH):
+        """
+        Load catalog from a file.
+
+        :param file_path: Path to the catalog file.
+        :type file_path: ``str``
+
+        :rtype: :class:`EC2InstanceTypeCatalog`
+        """
+        with open(file_path, 'r') as fp:
+            return cls(json.load(fp))
+
+    def list_instance_types(self):
+        """
+        Return names of all the instance types in the catalog.
+
+        :rtype: ``list`` of ``str``
+        """
+        return list(self._names)
+
+    def list_regions(self):
+        """
+        Return IDs of all the regions in the catalog.
+
+        :rtype: ``list`` of ``str``
+        """
+        return sorted(self._regions.keys())
+
+    def get_instance_type(self, instance_type):
+        """
+        Return attributes of the instance type (``id``, ``name``, ``ram``,
+        ``disk``, ``bandwidth`` and ``extra``).
+
+        A new dictionary is returned on each call so it can be modified by
+        the caller.
+
+        :param instance_type: Instance type name (e.g. ``m5.large``).
+        :type instance_type: ``str``
+
+        :rtype: ``dict``
+        """
+        index = self._index.get(instance_type, None)
+
+        if index is None:
+            raise KeyError(instance_type)
+
+        return self._get_instance_type(index)
+
+    def get_region_instance_types(self, region):
+        """
+        Return names of the instance types which are available in the region.
+
+        :param region: Region ID (e.g. ``us-east-1``).
+        :type region: ``str``
+
+        :rtype: ``list`` of ``str``
+        """
+        indexes = self._regions[region]['instance_types']
+        return [self._names[index] for index in indexes]
+
+    def get_region_details(self, region):
+        """
+        Return details (``id``, ``endpoint``, ``api_name``, ``country``,
+        ``signature_version`` and ``instance_types``) of the region.
+
+        :param region: Region ID (e.g. ``us-east-1``).
+        :type region: ``str``
+
+        :rtype: ``dict``
+        """
+        details = dict(self._regions[region])
+        details['instance_types'] = self.get_region_instance_types(region)
+        return details
+
+    def _get_instance_type(self, index):
+        ram, disk, bandwidth, values = self._sizes[index]
+        strings = self._strings
+        extra = {}
+
+        for field, value in zip(self._fields, values):
+            if value is not None:
+                extra[field] = strings[value]
+
+        name = self._names[index]
+        return {
+            'id': name,
+            'name': name,
+            'ram': ram,
+            'disk': disk,
+            'bandwidth': bandwidth,
+            'extra': extra
+        }
+
+
+def build_catalog(instance_types, regions):
+    """
+    Build catalog data which can be serialized to JSON.
+
+    :param instance_types: Dictionary which maps instance type name to the
+                           instance type attributes (``id``, ``name``,
+                           ``ram``, ``disk``, ``bandwidth`` and ``extra``).
+    :type instance_types: ``dict``
+
+    :param regions: Dictionary which maps region ID to the region details
+                    including ``instance_types`` list.
+    :type regions: ``dict``
+
+    :rtype: ``dict``
+    """
+    names = sorted(instance_types.keys())
+    fields = sorted(set(field for attributes in instance_types.values()
+                        for field in attributes['extra']))
+    strings = sorted(set(value for attributes in instance_types.values()
+                         for value in attributes['extra'].values()))
+
+    string_indexes = dict((value, index) for index, value in
+                          enumerate(strings))
+    name_indexes = dict((name, index) for index, name in enumerate(names))
+
+    sizes = []
+    for name in names:
+        attributes = instance_types[name]
+        extra = attributes['extra']
+        values = [string_indexes[extra[field]] if field in extra else None
+                  for field in fields]
+        sizes.append([attributes['ram'], attributes['disk'],
+                      attributes['bandwidth'], values])
+
+    catalog_regions = {}
+    for region, details in regions.items():
+        details = dict(details)
+        details['instance_types'] = sorted(
+            name_indexes[name] for name in details['instance_types'])
+        catalog_regions[region] = details
+
+    return {
+        'version': CATALOG_FORMAT_VERSION,
+        'strings': strings,
+        'fields': fields,
+        'instance_types': names,
+        'sizes': sizes,
+        'regions': catalog_regions
+    }
+
+
+def write_catalog(data, file_path=DEFAULT_CATALOG_FILE_PATH):
+    """
+    Write catalog data to a file.
+
+    Each instance type and region is written on a separate line to keep the
+    diffs of the generated file readable.
+
+    :param data: Catalog data (see :func:`build_catalog`).
+    :type data: ``dict``
+
+    :param file_path: Path to the catalog file.
+    :type file_path: ``str``
+    """
+    def dumps(value):
+        return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+    lines = []
+    for key in sorted(data.keys()):
+        value = data[key]
+
+        if isinstance(value, list):
+            items = [dumps(item) for item in value]
+            lines.append('%s:[\n%s\n]' % (dumps(key), ',\n'.join(items)))
+        elif isinstance(value, dict):
+            items = ['%s:%s' % (dumps(name), dumps(value[name]))
+                     for name in sorted(value.keys())]
+            lines.append('%s:{\n%s\n}' % (dumps(key), ',\n'.join(items)))
+        else:
+            lines.append('%s:%s' % (dumps(key), dumps(value)))
+
+    with open(file_path, 'w') as fp:
+        fp.write('{\n%s\n}\n' % (',\n'.join(lines)))
+
+
+def get_catalog():
+    """
+    Return catalog which is loaded from the default file on first use.
+
+    :rtype: :class:`EC2InstanceTypeCatalog`
+    """
+    global _CATALOG
+
+    if _CATALOG is None:
+        with _CATALOG_LOCK:
+            if _CATALOG is None:
+                _CATALOG = EC2InstanceTypeCatalog.load()
+
+    return _CATALOG
+
+
+def get_instance_type(instance_type):
+    """
+    Return attributes of the instance type from the default catalog.
+
+    :rtype: ``dict``
+    """
+    return get_catalog().get_instance_type(instance_type)
+
+
+def get_region_instance_types(region):
+    """
+    Return names of the instance types which are available in the region
+    from the default catalog.
+
+    :rtype: ``list`` of ``str``
+    """
+    return get_catalog().get_region_instance_types(region)
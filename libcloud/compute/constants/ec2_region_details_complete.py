@@ -1,4 +1,3 @@
-# File generated by contrib/scrape-ec2-sizes.py script - DO NOT EDIT manually
 # Licensed to the Apache Software Foundation (ASF) under one or more
 # contributor license agreements.  See the NOTICE file distributed with
 # this work for additional information regarding copyright ownership.
@@ -14,4911 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-REGION_DETAILS = {
-    "ap-northeast-1": {
-        "api_name": "ec2_ap_northeast",
-        "country": "Japan",
-        "endpoint": "ec2.ap-northeast-1.amazonaws.com",
-        "id": "ap-northeast-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "c6gn.12xlarge",
-            "c6gn.16xlarge",
-            "c6gn.2xlarge",
-            "c6gn.4xlarge",
-            "c6gn.8xlarge",
-            "c6gn.large",
-            "c6gn.medium",
-            "c6gn.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "p4d.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "vt1.24xlarge",
-            "vt1.3xlarge",
-            "vt1.6xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "2"
-    },
-    "ap-northeast-2": {
-        "api_name": "ec2_ap_northeast",
-        "country": "South Korea",
-        "endpoint": "ec2.ap-northeast-2.amazonaws.com",
-        "id": "ap-northeast-2",
-        "instance_types": [
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p4d.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "ap-northeast-3": {
-        "api_name": "ec2_ap_northeast",
-        "country": "Japan",
-        "endpoint": "ec2.ap-northeast-3.amazonaws.com",
-        "id": "ap-northeast-3",
-        "instance_types": [],
-        "signature_version": "4"
-    },
-    "ap-south-1": {
-        "api_name": "ec2_ap_south_1",
-        "country": "India",
-        "endpoint": "ec2.ap-south-1.amazonaws.com",
-        "id": "ap-south-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "ap-southeast-1": {
-        "api_name": "ec2_ap_southeast",
-        "country": "Singapore",
-        "endpoint": "ec2.ap-southeast-1.amazonaws.com",
-        "id": "ap-southeast-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-12tb1.112xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "u-9tb1.112xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "2"
-    },
-    "ap-southeast-2": {
-        "api_name": "ec2_ap_southeast_2",
-        "country": "Australia",
-        "endpoint": "ec2.ap-southeast-2.amazonaws.com",
-        "id": "ap-southeast-2",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "2"
-    },
-    "ca-central-1": {
-        "api_name": "ec2_ca_central_1",
-        "country": "Canada",
-        "endpoint": "ec2.ca-central-1.amazonaws.com",
-        "id": "ca-central-1",
-        "instance_types": [
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "cn-north-1": {
-        "api_name": "ec2_cn_north",
-        "country": "China",
-        "endpoint": "ec2.cn-north-1.amazonaws.com.cn",
-        "id": "cn-north-1",
-        "instance_types": [],
-        "signature_version": "4"
-    },
-    "cn-northwest-1": {
-        "api_name": "ec2_cn_northwest",
-        "country": "China",
-        "endpoint": "ec2.cn-northwest-1.amazonaws.com.cn",
-        "id": "cn-northwest-1",
-        "instance_types": [],
-        "signature_version": "4"
-    },
-    "eu-central-1": {
-        "api_name": "ec2_eu_central",
-        "country": "Frankfurt",
-        "endpoint": "ec2.eu-central-1.amazonaws.com",
-        "id": "eu-central-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p4d.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-12tb1.112xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "u-9tb1.112xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "eu-north-1": {
-        "api_name": "ec2_eu_north_stockholm",
-        "country": "Stockholm",
-        "endpoint": "ec2.eu-north-1.amazonaws.com",
-        "id": "eu-north-1",
-        "instance_types": [
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "eu-west-1": {
-        "api_name": "ec2_eu_west",
-        "country": "Ireland",
-        "endpoint": "ec2.eu-west-1.amazonaws.com",
-        "id": "eu-west-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "c6gn.12xlarge",
-            "c6gn.16xlarge",
-            "c6gn.2xlarge",
-            "c6gn.4xlarge",
-            "c6gn.8xlarge",
-            "c6gn.large",
-            "c6gn.medium",
-            "c6gn.xlarge",
-            "c6i.12xlarge",
-            "c6i.16xlarge",
-            "c6i.24xlarge",
-            "c6i.2xlarge",
-            "c6i.32xlarge",
-            "c6i.4xlarge",
-            "c6i.8xlarge",
-            "c6i.large",
-            "c6i.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "d3en.12xlarge",
-            "d3en.2xlarge",
-            "d3en.4xlarge",
-            "d3en.6xlarge",
-            "d3en.8xlarge",
-            "d3en.xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "p4d.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-12tb1.112xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "u-9tb1.112xlarge",
-            "vt1.24xlarge",
-            "vt1.3xlarge",
-            "vt1.6xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "x2gd.12xlarge",
-            "x2gd.16xlarge",
-            "x2gd.2xlarge",
-            "x2gd.4xlarge",
-            "x2gd.8xlarge",
-            "x2gd.large",
-            "x2gd.medium",
-            "x2gd.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "2"
-    },
-    "eu-west-2": {
-        "api_name": "ec2_eu_west_london",
-        "country": "United Kingdom",
-        "endpoint": "ec2.eu-west-2.amazonaws.com",
-        "id": "eu-west-2",
-        "instance_types": [
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.large",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "eu-west-3": {
-        "api_name": "ec2_eu_west_paris",
-        "country": "France",
-        "endpoint": "ec2.eu-west-3.amazonaws.com",
-        "id": "eu-west-3",
-        "instance_types": [
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.18xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "sa-east-1": {
-        "api_name": "ec2_sa_east",
-        "country": "Brazil",
-        "endpoint": "ec2.sa-east-1.amazonaws.com",
-        "id": "sa-east-1",
-        "instance_types": [
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge"
-        ],
-        "signature_version": "2"
-    },
-    "us-east-1": {
-        "api_name": "ec2_us_east",
-        "country": "USA",
-        "endpoint": "ec2.us-east-1.amazonaws.com",
-        "id": "us-east-1",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "c6gn.12xlarge",
-            "c6gn.16xlarge",
-            "c6gn.2xlarge",
-            "c6gn.4xlarge",
-            "c6gn.8xlarge",
-            "c6gn.large",
-            "c6gn.medium",
-            "c6gn.xlarge",
-            "c6i.12xlarge",
-            "c6i.16xlarge",
-            "c6i.24xlarge",
-            "c6i.2xlarge",
-            "c6i.32xlarge",
-            "c6i.4xlarge",
-            "c6i.8xlarge",
-            "c6i.large",
-            "c6i.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "d3en.12xlarge",
-            "d3en.2xlarge",
-            "d3en.4xlarge",
-            "d3en.6xlarge",
-            "d3en.8xlarge",
-            "d3en.xlarge",
-            "dl1.24xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "p4d.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-12tb1.112xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "u-9tb1.112xlarge",
-            "vt1.24xlarge",
-            "vt1.3xlarge",
-            "vt1.6xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "x2gd.12xlarge",
-            "x2gd.16xlarge",
-            "x2gd.2xlarge",
-            "x2gd.4xlarge",
-            "x2gd.8xlarge",
-            "x2gd.large",
-            "x2gd.medium",
-            "x2gd.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "2"
-    },
-    "us-east-2": {
-        "api_name": "ec2_us_east_ohio",
-        "country": "USA",
-        "endpoint": "ec2.us-east-2.amazonaws.com",
-        "id": "us-east-2",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "c6gn.12xlarge",
-            "c6gn.16xlarge",
-            "c6gn.2xlarge",
-            "c6gn.4xlarge",
-            "c6gn.8xlarge",
-            "c6gn.large",
-            "c6gn.medium",
-            "c6gn.xlarge",
-            "c6i.12xlarge",
-            "c6i.16xlarge",
-            "c6i.24xlarge",
-            "c6i.2xlarge",
-            "c6i.32xlarge",
-            "c6i.4xlarge",
-            "c6i.8xlarge",
-            "c6i.large",
-            "c6i.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p4d.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "x2gd.12xlarge",
-            "x2gd.16xlarge",
-            "x2gd.2xlarge",
-            "x2gd.4xlarge",
-            "x2gd.8xlarge",
-            "x2gd.large",
-            "x2gd.medium",
-            "x2gd.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "4"
-    },
-    "us-gov-west-1": {
-        "api_name": "ec2_us_govwest",
-        "country": "US",
-        "endpoint": "ec2.us-gov-west-1.amazonaws.com",
-        "id": "us-gov-west-1",
-        "instance_types": [],
-        "signature_version": "2"
-    },
-    "us-west-1": {
-        "api_name": "ec2_us_west",
-        "country": "USA",
-        "endpoint": "ec2.us-west-1.amazonaws.com",
-        "id": "us-west-1",
-        "instance_types": [
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "2"
-    },
-    "us-west-2": {
-        "api_name": "ec2_us_west_oregon",
-        "country": "US",
-        "endpoint": "ec2.us-west-2.amazonaws.com",
-        "id": "us-west-2",
-        "instance_types": [
-            "a1.2xlarge",
-            "a1.4xlarge",
-            "a1.large",
-            "a1.medium",
-            "a1.xlarge",
-            "c1.medium",
-            "c1.xlarge",
-            "c3.2xlarge",
-            "c3.4xlarge",
-            "c3.8xlarge",
-            "c3.large",
-            "c3.xlarge",
-            "c4.2xlarge",
-            "c4.4xlarge",
-            "c4.8xlarge",
-            "c4.large",
-            "c4.xlarge",
-            "c5.12xlarge",
-            "c5.18xlarge",
-            "c5.24xlarge",
-            "c5.2xlarge",
-            "c5.4xlarge",
-            "c5.9xlarge",
-            "c5.large",
-            "c5.xlarge",
-            "c5a.12xlarge",
-            "c5a.16xlarge",
-            "c5a.24xlarge",
-            "c5a.2xlarge",
-            "c5a.4xlarge",
-            "c5a.8xlarge",
-            "c5a.large",
-            "c5a.xlarge",
-            "c5ad.12xlarge",
-            "c5ad.16xlarge",
-            "c5ad.24xlarge",
-            "c5ad.2xlarge",
-            "c5ad.4xlarge",
-            "c5ad.8xlarge",
-            "c5ad.large",
-            "c5ad.xlarge",
-            "c5d.12xlarge",
-            "c5d.18xlarge",
-            "c5d.24xlarge",
-            "c5d.2xlarge",
-            "c5d.4xlarge",
-            "c5d.9xlarge",
-            "c5d.large",
-            "c5d.xlarge",
-            "c5n.18xlarge",
-            "c5n.2xlarge",
-            "c5n.4xlarge",
-            "c5n.9xlarge",
-            "c5n.large",
-            "c5n.xlarge",
-            "c6g.12xlarge",
-            "c6g.16xlarge",
-            "c6g.2xlarge",
-            "c6g.4xlarge",
-            "c6g.8xlarge",
-            "c6g.large",
-            "c6g.medium",
-            "c6g.xlarge",
-            "c6gd.12xlarge",
-            "c6gd.16xlarge",
-            "c6gd.2xlarge",
-            "c6gd.4xlarge",
-            "c6gd.8xlarge",
-            "c6gd.large",
-            "c6gd.medium",
-            "c6gd.xlarge",
-            "c6gn.12xlarge",
-            "c6gn.16xlarge",
-            "c6gn.2xlarge",
-            "c6gn.4xlarge",
-            "c6gn.8xlarge",
-            "c6gn.large",
-            "c6gn.medium",
-            "c6gn.xlarge",
-            "c6i.12xlarge",
-            "c6i.16xlarge",
-            "c6i.24xlarge",
-            "c6i.2xlarge",
-            "c6i.32xlarge",
-            "c6i.4xlarge",
-            "c6i.8xlarge",
-            "c6i.large",
-            "c6i.xlarge",
-            "cc2.8xlarge",
-            "cr1.8xlarge",
-            "d2.2xlarge",
-            "d2.4xlarge",
-            "d2.8xlarge",
-            "d2.xlarge",
-            "d3.2xlarge",
-            "d3.4xlarge",
-            "d3.8xlarge",
-            "d3.xlarge",
-            "d3en.12xlarge",
-            "d3en.2xlarge",
-            "d3en.4xlarge",
-            "d3en.6xlarge",
-            "d3en.8xlarge",
-            "d3en.xlarge",
-            "dl1.24xlarge",
-            "f1.16xlarge",
-            "f1.2xlarge",
-            "f1.4xlarge",
-            "g2.2xlarge",
-            "g2.8xlarge",
-            "g3.16xlarge",
-            "g3.4xlarge",
-            "g3.8xlarge",
-            "g3s.xlarge",
-            "g4ad.16xlarge",
-            "g4ad.2xlarge",
-            "g4ad.4xlarge",
-            "g4ad.8xlarge",
-            "g4ad.xlarge",
-            "g4dn.12xlarge",
-            "g4dn.16xlarge",
-            "g4dn.2xlarge",
-            "g4dn.4xlarge",
-            "g4dn.8xlarge",
-            "g4dn.xlarge",
-            "h1.16xlarge",
-            "h1.2xlarge",
-            "h1.4xlarge",
-            "h1.8xlarge",
-            "hs1.8xlarge",
-            "i2.2xlarge",
-            "i2.4xlarge",
-            "i2.8xlarge",
-            "i2.large",
-            "i2.xlarge",
-            "i3.16xlarge",
-            "i3.2xlarge",
-            "i3.4xlarge",
-            "i3.8xlarge",
-            "i3.large",
-            "i3.xlarge",
-            "i3en.12xlarge",
-            "i3en.24xlarge",
-            "i3en.2xlarge",
-            "i3en.3xlarge",
-            "i3en.6xlarge",
-            "i3en.large",
-            "i3en.xlarge",
-            "inf1.24xlarge",
-            "inf1.2xlarge",
-            "inf1.6xlarge",
-            "inf1.xlarge",
-            "m1.large",
-            "m1.medium",
-            "m1.small",
-            "m1.xlarge",
-            "m2.2xlarge",
-            "m2.4xlarge",
-            "m2.xlarge",
-            "m3.2xlarge",
-            "m3.large",
-            "m3.medium",
-            "m3.xlarge",
-            "m4.10xlarge",
-            "m4.16xlarge",
-            "m4.2xlarge",
-            "m4.4xlarge",
-            "m4.large",
-            "m4.xlarge",
-            "m5.12xlarge",
-            "m5.16xlarge",
-            "m5.24xlarge",
-            "m5.2xlarge",
-            "m5.4xlarge",
-            "m5.8xlarge",
-            "m5.large",
-            "m5.xlarge",
-            "m5a.12xlarge",
-            "m5a.16xlarge",
-            "m5a.24xlarge",
-            "m5a.2xlarge",
-            "m5a.4xlarge",
-            "m5a.8xlarge",
-            "m5a.large",
-            "m5a.xlarge",
-            "m5ad.12xlarge",
-            "m5ad.16xlarge",
-            "m5ad.24xlarge",
-            "m5ad.2xlarge",
-            "m5ad.4xlarge",
-            "m5ad.8xlarge",
-            "m5ad.large",
-            "m5ad.xlarge",
-            "m5d.12xlarge",
-            "m5d.16xlarge",
-            "m5d.24xlarge",
-            "m5d.2xlarge",
-            "m5d.4xlarge",
-            "m5d.8xlarge",
-            "m5d.large",
-            "m5d.xlarge",
-            "m5dn.12xlarge",
-            "m5dn.16xlarge",
-            "m5dn.24xlarge",
-            "m5dn.2xlarge",
-            "m5dn.4xlarge",
-            "m5dn.8xlarge",
-            "m5dn.large",
-            "m5dn.xlarge",
-            "m5n.12xlarge",
-            "m5n.16xlarge",
-            "m5n.24xlarge",
-            "m5n.2xlarge",
-            "m5n.4xlarge",
-            "m5n.8xlarge",
-            "m5n.large",
-            "m5n.xlarge",
-            "m5zn.12xlarge",
-            "m5zn.2xlarge",
-            "m5zn.3xlarge",
-            "m5zn.6xlarge",
-            "m5zn.large",
-            "m5zn.xlarge",
-            "m6g.12xlarge",
-            "m6g.16xlarge",
-            "m6g.2xlarge",
-            "m6g.4xlarge",
-            "m6g.8xlarge",
-            "m6g.large",
-            "m6g.medium",
-            "m6g.xlarge",
-            "m6gd.12xlarge",
-            "m6gd.16xlarge",
-            "m6gd.2xlarge",
-            "m6gd.4xlarge",
-            "m6gd.8xlarge",
-            "m6gd.large",
-            "m6gd.medium",
-            "m6gd.xlarge",
-            "m6i.12xlarge",
-            "m6i.16xlarge",
-            "m6i.24xlarge",
-            "m6i.2xlarge",
-            "m6i.32xlarge",
-            "m6i.4xlarge",
-            "m6i.8xlarge",
-            "m6i.large",
-            "m6i.xlarge",
-            "p2.16xlarge",
-            "p2.8xlarge",
-            "p2.xlarge",
-            "p3.16xlarge",
-            "p3.2xlarge",
-            "p3.8xlarge",
-            "p3dn.24xlarge",
-            "p4d.24xlarge",
-            "r3.2xlarge",
-            "r3.4xlarge",
-            "r3.8xlarge",
-            "r3.large",
-            "r3.xlarge",
-            "r4.16xlarge",
-            "r4.2xlarge",
-            "r4.4xlarge",
-            "r4.8xlarge",
-            "r4.large",
-            "r4.xlarge",
-            "r5.12xlarge",
-            "r5.16xlarge",
-            "r5.24xlarge",
-            "r5.2xlarge",
-            "r5.4xlarge",
-            "r5.8xlarge",
-            "r5.large",
-            "r5.xlarge",
-            "r5a.12xlarge",
-            "r5a.16xlarge",
-            "r5a.24xlarge",
-            "r5a.2xlarge",
-            "r5a.4xlarge",
-            "r5a.8xlarge",
-            "r5a.large",
-            "r5a.xlarge",
-            "r5ad.12xlarge",
-            "r5ad.16xlarge",
-            "r5ad.24xlarge",
-            "r5ad.2xlarge",
-            "r5ad.4xlarge",
-            "r5ad.8xlarge",
-            "r5ad.large",
-            "r5ad.xlarge",
-            "r5b.12xlarge",
-            "r5b.16xlarge",
-            "r5b.24xlarge",
-            "r5b.2xlarge",
-            "r5b.4xlarge",
-            "r5b.8xlarge",
-            "r5b.large",
-            "r5b.xlarge",
-            "r5d.12xlarge",
-            "r5d.16xlarge",
-            "r5d.24xlarge",
-            "r5d.2xlarge",
-            "r5d.4xlarge",
-            "r5d.8xlarge",
-            "r5d.large",
-            "r5d.xlarge",
-            "r5dn.12xlarge",
-            "r5dn.16xlarge",
-            "r5dn.24xlarge",
-            "r5dn.2xlarge",
-            "r5dn.4xlarge",
-            "r5dn.8xlarge",
-            "r5dn.large",
-            "r5dn.xlarge",
-            "r5n.12xlarge",
-            "r5n.16xlarge",
-            "r5n.24xlarge",
-            "r5n.2xlarge",
-            "r5n.4xlarge",
-            "r5n.8xlarge",
-            "r5n.large",
-            "r5n.xlarge",
-            "r6g.12xlarge",
-            "r6g.16xlarge",
-            "r6g.2xlarge",
-            "r6g.4xlarge",
-            "r6g.8xlarge",
-            "r6g.large",
-            "r6g.medium",
-            "r6g.xlarge",
-            "r6gd.12xlarge",
-            "r6gd.16xlarge",
-            "r6gd.2xlarge",
-            "r6gd.4xlarge",
-            "r6gd.8xlarge",
-            "r6gd.large",
-            "r6gd.medium",
-            "r6gd.xlarge",
-            "t1.micro",
-            "t2.2xlarge",
-            "t2.large",
-            "t2.medium",
-            "t2.micro",
-            "t2.nano",
-            "t2.small",
-            "t2.xlarge",
-            "t3.2xlarge",
-            "t3.large",
-            "t3.medium",
-            "t3.micro",
-            "t3.nano",
-            "t3.small",
-            "t3.xlarge",
-            "t3a.2xlarge",
-            "t3a.large",
-            "t3a.medium",
-            "t3a.micro",
-            "t3a.nano",
-            "t3a.small",
-            "t3a.xlarge",
-            "t4g.2xlarge",
-            "t4g.large",
-            "t4g.medium",
-            "t4g.micro",
-            "t4g.nano",
-            "t4g.small",
-            "t4g.xlarge",
-            "u-12tb1.112xlarge",
-            "u-6tb1.112xlarge",
-            "u-6tb1.56xlarge",
-            "u-9tb1.112xlarge",
-            "vt1.24xlarge",
-            "vt1.3xlarge",
-            "vt1.6xlarge",
-            "x1.16xlarge",
-            "x1.32xlarge",
-            "x1e.16xlarge",
-            "x1e.2xlarge",
-            "x1e.32xlarge",
-            "x1e.4xlarge",
-            "x1e.8xlarge",
-            "x1e.xlarge",
-            "x2gd.12xlarge",
-            "x2gd.16xlarge",
-            "x2gd.2xlarge",
-            "x2gd.4xlarge",
-            "x2gd.8xlarge",
-            "x2gd.large",
-            "x2gd.medium",
-            "x2gd.xlarge",
-            "z1d.12xlarge",
-            "z1d.2xlarge",
-            "z1d.3xlarge",
-            "z1d.6xlarge",
-            "z1d.large",
-            "z1d.xlarge"
-        ],
-        "signature_version": "2"
-    }
-}
\ No newline at end of file
+"""
+EC2 region details are stored in a compact catalog which is generated by
+contrib/scrape-ec2-sizes.py (see libcloud.compute.constants.ec2_catalog).
+
+This module is kept for backward compatibility - importing it builds the full
+dictionary with details of all the regions.
+"""
+
+from libcloud.compute.constants.ec2_catalog import get_catalog
+
+__all__ = [
+    'REGION_DETAILS'
+]
+
+REGION_DETAILS = dict((region, get_catalog().get_region_details(region))
+                      for region in get_catalog().list_regions())
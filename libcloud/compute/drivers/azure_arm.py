@@ -168,6 +168,7 @@ class AzureNodeDriver(NodeDriver):
     website = 'http://azure.microsoft.com/en-us/services/virtual-machines/'
     type = Provider.AZURE_ARM
     features = {'create_node': ['ssh_key', 'password']}
+    catalog_classes = [AzureImage, AzureVhdImage]
 
     # The API doesn't provide state or country information, so fill it in.
     # Information from https://azure.microsoft.com/en-us/regions/
@@ -138,6 +138,7 @@ class BlueboxNodeDriver(NodeDriver):
     name = 'Bluebox Blocks'
     website = 'http://bluebox.net'
     features = {'create_node': ['ssh_key', 'password']}
+    catalog_classes = [BlueboxNodeSize]
 
     def list_nodes(self):
         result = self.connection.request('/api/blocks.json')
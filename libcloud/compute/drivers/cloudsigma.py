@@ -152,6 +152,7 @@ class CloudSigma_1_0_NodeDriver(CloudSigmaNodeDriver):
     name = 'CloudSigma (API v1.0)'
     website = 'http://www.cloudsigma.com/'
     connectionCls = CloudSigma_1_0_Connection
+    catalog_classes = [CloudSigmaNodeSize]
 
     IMAGING_TIMEOUT = 20 * 60  # Default timeout (in seconds) for the drive
     # imaging process
@@ -982,6 +983,7 @@ class CloudSigma_2_0_NodeDriver(CloudSigmaNodeDriver):
     api_name = 'cloudsigma_zrh'
     website = 'http://www.cloudsigma.com/'
     connectionCls = CloudSigma_2_0_Connection
+    catalog_classes = [CloudSigmaNodeSize, CloudSigmaDrive]
 
     # Default drive transition timeout in seconds
     DRIVE_TRANSITION_TIMEOUT = 500
@@ -20,6 +20,7 @@ Dummy Driver
 import uuid
 import socket
 import struct
+import threading
 
 from libcloud.common.base import ConnectionKey
 from libcloud.compute.base import NodeImage, NodeSize, Node
@@ -112,6 +113,7 @@ class DummyNodeDriver(NodeDriver):
                      extra={'foo': 'bar'}),
             ]
         self.connection = DummyConnection(self.creds)
+        self._lock = threading.Lock()
 
     def get_uuid(self, unique_field=None):
         """
@@ -312,19 +314,22 @@ class DummyNodeDriver(NodeDriver):
 
         @inherits: :class:`NodeDriver.create_node`
         """
-        num = len(self.nl) + 1
-        n = Node(id=num,
-                 name='dummy-%d' % (num),
-                 state=NodeState.RUNNING,
-                 public_ips=['127.0.0.%d' % (num)],
-                 private_ips=[],
-                 driver=self,
-                 size=NodeSize(id='s1', name='foo', ram=2048,
-                               disk=160, bandwidth=None, price=0.0,
-                               driver=self),
-                 image=NodeImage(id='i2', name='image', driver=self),
-                 extra={'foo': 'bar'})
-        self.nl.append(n)
+        # Lock is shared with driver copies which are used by the bulk
+        # operations so node ids are unique
+        with self._lock:
+            num = len(self.nl) + 1
+            n = Node(id=num,
+                     name='dummy-%d' % (num),
+                     state=NodeState.RUNNING,
+                     public_ips=['127.0.0.%d' % (num)],
+                     private_ips=[],
+                     driver=self,
+                     size=NodeSize(id='s1', name='foo', ram=2048,
+                                   disk=160, bandwidth=None, price=0.0,
+                                   driver=self),
+                     image=NodeImage(id='i2', name='image', driver=self),
+                     extra={'foo': 'bar'})
+            self.nl.append(n)
         return n
 
     def import_key_pair_from_string(self, name, key_material):
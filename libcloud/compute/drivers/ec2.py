@@ -17,11 +17,14 @@
 Amazon EC2, Eucalyptus, Nimbus and Outscale drivers.
 """
 
+from typing import Dict
 from typing import List
+from typing import Optional
 
 import re
 import base64
 import copy
+import functools
 import warnings
 import time
 
@@ -32,6 +35,7 @@ from libcloud.utils.xml import fixxpath, findtext, findattr, findall
 from libcloud.utils.publickey import get_pubkey_ssh2_fingerprint
 from libcloud.utils.publickey import get_pubkey_comment
 from libcloud.utils.iso8601 import parse_date
+from libcloud.utils.misc import LazyDict
 from libcloud.common.aws import AWSBaseResponse, SignedAWSConnection
 from libcloud.common.aws import DEFAULT_SIGNATURE_VERSION
 from libcloud.common.types import (InvalidCredsError, MalformedResponseError,
@@ -42,9 +46,14 @@ from libcloud.compute.base import NodeImage, StorageVolume, VolumeSnapshot
 from libcloud.compute.base import KeyPair
 from libcloud.compute.types import NodeState, KeyPairDoesNotExistError, \
     StorageVolumeState, VolumeSnapshotState
+from libcloud.compute.constants.ec2_catalog import get_catalog
 from libcloud.compute.constants.ec2_region_details_partial import \
     REGION_DETAILS as REGION_DETAILS_PARTIAL
 from libcloud.pricing import get_size_price
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import TaskResult
+from libcloud.utils.parallel import chunks
+from libcloud.utils.parallel import run_in_parallel
 
 __all__ = [
     'API_VERSION',
@@ -83,6 +92,12 @@ __all__ = [
 API_VERSION = '2016-11-15'
 NAMESPACE = 'http://ec2.amazonaws.com/doc/%s/' % (API_VERSION)
 
+# Maximum number of instance IDs passed to a single TerminateInstances call
+TERMINATE_INSTANCES_BATCH_SIZE = 1000
+
+# Maximum number of values of a single DescribeInstances filter
+DESCRIBE_INSTANCES_FILTER_SIZE = 200
+
 # Eucalyptus Constants
 DEFAULT_EUCA_API_VERSION = '3.3.0'
 EUCA_NAMESPACE = 'http://msgs.eucalyptus.com/%s' % (DEFAULT_EUCA_API_VERSION)
@@ -1612,6 +1627,7 @@ class BaseEC2NodeDriver(NodeDriver):
 
     connectionCls = EC2Connection
     features = {'create_node': ['ssh_key']}
+    catalog_classes = [EC2NodeLocation, ExEC2AvailabilityZone]
     path = '/'
     region_name = ''
     country = ''
@@ -1641,6 +1657,10 @@ class BaseEC2NodeDriver(NodeDriver):
         'error': VolumeSnapshotState.ERROR,
     }
 
+    # Functions which decode the node extra attributes (see
+    # _get_node_extra_fields)
+    _node_extra_fields = None  # type: Optional[Dict]
+
     def list_nodes(self, ex_node_ids=None, ex_filters=None):
         # type: (str, str) -> List[Node]
         """
@@ -1684,20 +1704,13 @@ class BaseEC2NodeDriver(NodeDriver):
         return nodes
 
     def list_sizes(self, location=None):
-        # NOTE: Those two imports are intentionally here and made lazy to
-        # avoid importing massive constant file in case it's not actually
-        # needed
-        from libcloud.compute.constants.ec2_region_details_complete import \
-            REGION_DETAILS
-        from libcloud.compute.constants.ec2_instance_types import \
-            INSTANCE_TYPES
-
-        available_types = REGION_DETAILS[self.region_name]['instance_types']
+        # NOTE: Instance types catalog is only loaded on first use
+        catalog = get_catalog()
+        available_types = catalog.get_region_instance_types(self.region_name)
         sizes = []
 
         for instance_type in available_types:
-            attributes = INSTANCE_TYPES[instance_type]
-            attributes = copy.deepcopy(attributes)
+            attributes = catalog.get_instance_type(instance_type)
             try:
                 # we are only interested in pure size price so linux
                 price = get_size_price(driver_type='compute',
@@ -2079,6 +2092,146 @@ class BaseEC2NodeDriver(NodeDriver):
         res = self.connection.request(self.path, params=params).object
         return self._get_terminate_boolean(res)
 
+    def create_nodes(self, count=None, names=None,
+                     max_workers=DEFAULT_MAX_WORKERS, **create_node_kwargs):
+        """
+        Create multiple nodes.
+
+        If ``count`` is provided, all the nodes are launched using a single
+        RunInstances call and the launched instances are then tagged with
+        the per-index names (``name-1``, ``name-2``, ...). CreateTags applies
+        the same tags to all the resources in a call, so the instances are
+        tagged concurrently, one call per instance. If tagging of an instance
+        fails, its result contains both the node and the error. Nodes with
+        explicit ``names`` are created concurrently using
+        :meth:`create_node`.
+
+        ``ex_mincount`` argument can be used to specify the minimum number of
+        nodes which need to be launched for the request to succeed (defaults
+        to ``count``).
+
+        @inherits: :class:`NodeDriver.create_nodes`
+        """
+        if count is None:
+            return super(BaseEC2NodeDriver, self).create_nodes(
+                count=count, names=names, max_workers=max_workers,
+                **create_node_kwargs)
+
+        prefix = create_node_kwargs.get('name', 'node')
+        names = self._get_node_names(count=count, names=names,
+                                     create_node_kwargs=create_node_kwargs)
+        mincount = create_node_kwargs.pop('ex_mincount', count)
+        create_node_kwargs.pop('ex_maxcount', None)
+
+        try:
+            nodes = self.create_node(name=prefix, ex_mincount=mincount,
+                                     ex_maxcount=count, **create_node_kwargs)
+        except Exception as e:
+            return [TaskResult(item=name, error=e) for name in names]
+
+        if not isinstance(nodes, list):
+            nodes = [nodes]
+
+        def tag_node(driver, item):
+            node, name = item
+            driver.ex_create_tags(resource=node, tags={'Name': name})
+            node.name = name
+            node.extra['tags'] = dict(node.extra.get('tags', {}), Name=name)
+            return node
+
+        items = list(zip(nodes, names))
+        tag_results = run_in_parallel(self, tag_node, items,
+                                      max_workers=max_workers)
+
+        results = [TaskResult(item=name, result=node, error=result.error)
+                   for (node, name), result in zip(items, tag_results)]
+
+        for name in names[len(nodes):]:
+            error = LibcloudError(value='Instance has not been launched',
+                                  driver=self)
+            results.append(TaskResult(item=name, error=error))
+
+        return results
+
+    def destroy_nodes(self, nodes, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Destroy multiple nodes.
+
+        Nodes are terminated using a single TerminateInstances call per up to
+        1000 nodes. If a call fails (e.g. one of the instances doesn't exist
+        anymore), nodes from that call are destroyed one by one so the errors
+        can be reported per node.
+
+        @inherits: :class:`NodeDriver.destroy_nodes`
+        """
+        results = []
+
+        for batch in chunks(nodes, TERMINATE_INSTANCES_BATCH_SIZE):
+            params = {'Action': 'TerminateInstances'}
+            params.update(self._pathlist('InstanceId',
+                                         [node.id for node in batch]))
+
+            try:
+                res = self.connection.request(self.path,
+                                              params=params).object
+            except Exception:
+                results.extend(super(BaseEC2NodeDriver, self).destroy_nodes(
+                    nodes=batch, max_workers=max_workers))
+                continue
+
+            statuses = {}
+
+            for item in findall(element=res, xpath='instancesSet/item',
+                                namespace=NAMESPACE):
+                instance_id = findtext(element=item, xpath='instanceId',
+                                       namespace=NAMESPACE)
+                statuses[instance_id] = self._get_terminate_boolean(item)
+
+            for node in batch:
+                if node.id in statuses:
+                    results.append(TaskResult(item=node,
+                                              result=statuses[node.id]))
+                else:
+                    error = LibcloudError(value='Instance %s has not been '
+                                          'terminated' % (node.id),
+                                          driver=self)
+                    results.append(TaskResult(item=node, error=error))
+
+        return results
+
+    def _refresh_nodes(self, nodes, ex_list_nodes_kwargs=None):
+        """
+        Retrieve the provided nodes using an ``instance-id`` filter.
+
+        Filter is used instead of ``ex_node_ids`` because DescribeInstances
+        fails if any of the specified instances doesn't exist.
+
+        @inherits: :class:`NodeDriver._refresh_nodes`
+        """
+        kwargs = dict(ex_list_nodes_kwargs or {})
+
+        if kwargs.get('ex_node_ids', None):
+            return super(BaseEC2NodeDriver, self)._refresh_nodes(
+                nodes=nodes, ex_list_nodes_kwargs=kwargs)
+
+        node_ids = []  # type: List[str]
+
+        for node in nodes:
+            if node.id not in node_ids:
+                node_ids.append(node.id)
+
+        uuids = set([node.uuid for node in nodes])
+        result = []
+
+        for batch in chunks(node_ids, DESCRIBE_INSTANCES_FILTER_SIZE):
+            filters = dict(kwargs.get('ex_filters', None) or {})
+            filters['instance-id'] = batch
+            kwargs['ex_filters'] = filters
+            result.extend([node for node in self.list_nodes(**kwargs)
+                           if node.uuid in uuids])
+
+        return result
+
     def create_volume(self, size, name, location=None, snapshot=None,
                       ex_volume_type='standard', ex_iops=None,
                       ex_encrypted=False, ex_kms_key_id=None,
@@ -4735,27 +4888,14 @@ class BaseEC2NodeDriver(NodeDriver):
         private_ip = findtext(element=element, xpath='privateIpAddress',
                               namespace=NAMESPACE)
         private_ips = [private_ip] if private_ip else []
-        product_codes = []
-        for p in findall(element=element,
-                         xpath="productCodesSet/item/productCode",
-                         namespace=NAMESPACE):
-            product_codes.append(p)
 
         # Get our tags
         tags = self._get_resource_tags(element)
         name = tags.get('Name', instance_id)
 
-        # Get our extra dictionary
-        extra = self._get_extra_dict(
-            element, RESOURCE_EXTRA_ATTRIBUTES_MAP['node'])
-
-        # Add additional properties to our extra dictionary
-        extra['block_device_mapping'] = self._to_instance_device_mappings(
-            element)
-        extra['groups'] = self._get_security_groups(element)
-        extra['network_interfaces'] = self._to_interfaces(element)
-        extra['product_codes'] = product_codes
-        extra['tags'] = tags
+        # Extra attributes are only decoded from the element when they are
+        # accessed which makes conversion of large inventories much cheaper
+        extra = LazyDict(element, self._get_node_extra_fields(), tags=tags)
 
         return Node(id=instance_id, name=name, state=state,
                     public_ips=public_ips, private_ips=private_ips,
@@ -5500,6 +5640,54 @@ class BaseEC2NodeDriver(NodeDriver):
 
         return state in ('stopping', 'pending', 'starting')
 
+    def _get_node_extra_fields(self):
+        """
+        Return dictionary which maps node extra attributes to the functions
+        which decode them from the instance element.
+
+        :rtype: ``dict``
+        """
+        if self._node_extra_fields is None:
+            fields = self._get_extra_fields(
+                RESOURCE_EXTRA_ATTRIBUTES_MAP['node'])
+            fields['block_device_mapping'] = \
+                self._to_instance_device_mappings
+            fields['groups'] = self._get_security_groups
+            fields['network_interfaces'] = self._to_interfaces
+            fields['product_codes'] = self._get_product_codes
+            self._node_extra_fields = fields
+
+        return self._node_extra_fields
+
+    def _get_extra_fields(self, mapping):
+        """
+        Return dictionary which maps extra attributes to the functions which
+        decode them from the element based on rules provided in the mapping
+        dictionary (see :meth:`_get_extra_dict`).
+
+        :rtype: ``dict``
+        """
+        fields = {}
+        for attribute, values in mapping.items():
+            fields[attribute] = functools.partial(
+                self._get_extra_value, xpath=values['xpath'],
+                transform_func=values['transform_func'])
+
+        return fields
+
+    def _get_extra_value(self, element, xpath, transform_func):
+        value = findattr(element=element, xpath=xpath, namespace=NAMESPACE)
+
+        if value is not None:
+            return transform_func(value)
+
+        return None
+
+    def _get_product_codes(self, element):
+        return findall(element=element,
+                       xpath='productCodesSet/item/productCode',
+                       namespace=NAMESPACE)
+
     def _get_extra_dict(self, element, mapping):
         """
         Extract attributes from the element based on rules provided in the
@@ -5961,15 +6149,12 @@ class NimbusNodeDriver(BaseEC2NodeDriver):
     signature_version = '2'
 
     def list_sizes(self, location=None):
-        from libcloud.compute.constants.ec2_instance_types import \
-            INSTANCE_TYPES
-
+        catalog = get_catalog()
         available_types = REGION_DETAILS_NIMBUS['instance_types']
         sizes = []
 
         for instance_type in available_types:
-            attributes = INSTANCE_TYPES[instance_type]
-            attributes = copy.deepcopy(attributes)
+            attributes = catalog.get_instance_type(instance_type)
             attributes['price'] = None  # pricing not available
             sizes.append(NodeSize(driver=self, **attributes))
 
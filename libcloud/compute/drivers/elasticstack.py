@@ -167,6 +167,7 @@ class ElasticStackBaseNodeDriver(NodeDriver):
     website = 'http://www.elasticstack.com'
     connectionCls = ElasticStackBaseConnection
     features = {"create_node": ["generates_password"]}
+    catalog_classes = [ElasticStackNodeSize]
 
     # Dynamically populated by sub-classes
     _standard_drives = {}
@@ -21,8 +21,10 @@ from __future__ import with_statement
 
 import datetime
 import time
+import inspect
 import itertools
 import sys
+import threading
 
 from libcloud.common.base import LazyObject
 from libcloud.common.google import GoogleOAuth2Credential
@@ -36,15 +38,27 @@ from libcloud.common.types import LibcloudError
 from libcloud.compute.base import Node, NodeDriver, NodeImage, NodeLocation
 from libcloud.compute.base import NodeSize, StorageVolume, VolumeSnapshot
 from libcloud.compute.base import UuidMixin
+from libcloud.compute.base import MAX_NODE_REFRESH_REQUESTS
 from libcloud.compute.providers import Provider
 from libcloud.compute.types import NodeState
 from libcloud.utils.iso8601 import parse_date
+from libcloud.utils.misc import LazyDict
 from libcloud.pricing import get_pricing
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import TaskResult
+from libcloud.utils.parallel import run_in_parallel
 
 
 API_VERSION = 'v1'
 DEFAULT_TASK_COMPLETION_TIMEOUT = 180
 
+# Time (in seconds) for which the public image project indexes are cached
+IMAGE_INDEX_CACHE_TTL = 30 * 60
+
+# Image indexes shared by all the driver instances (see GCEImageIndex)
+_IMAGE_INDEXES = {}
+_IMAGE_INDEXES_LOCK = threading.Lock()
+
 
 def timestamp_to_datetime(timestamp):
     """
@@ -66,6 +80,15 @@ def timestamp_to_datetime(timestamp):
     return ts + tz_delta
 
 
+def clear_image_index_cache():
+    """
+    Remove all the cached image project indexes so the next image lookup in
+    the standard image projects retrieves fresh data.
+    """
+    with _IMAGE_INDEXES_LOCK:
+        _IMAGE_INDEXES.clear()
+
+
 class GCEResponse(GoogleResponse):
     pass
 
@@ -117,13 +140,24 @@ class GCEConnection(GoogleBaseConnection):
             params.update(self.gce_params)
         return params, headers
 
-    def request(self, *args, **kwargs):
+    def request(self, action, *args, **kwargs):
         """
         Perform request then do GCE-specific processing of URL params.
 
+        :keyword  project: Name of the project to send the request to
+                           instead of the connection's project (e.g.
+                           'debian-cloud'). The connection itself is not
+                           modified so this is safe to use concurrently.
+        :type     project: ``str`` or ``None``
+
         @inherits: :class:`GoogleBaseConnection.request`
         """
-        response = super(GCEConnection, self).request(*args, **kwargs)
+        project = kwargs.pop('project', None)
+
+        if project is not None and not action.startswith('https://'):
+            action = self.get_project_url(project) + action
+
+        response = super(GCEConnection, self).request(action, *args, **kwargs)
 
         # If gce_params has been set, then update the pageToken with the
         # nextPageToken so it can be used in the next request.
@@ -136,6 +170,18 @@ class GCEConnection(GoogleBaseConnection):
 
         return response
 
+    def get_project_url(self, project):
+        """
+        Return the base URL for the requests to the provided project.
+
+        :param  project: Name of the project (e.g. 'debian-cloud').
+        :type   project: ``str``
+
+        :rtype: ``str``
+        """
+        return 'https://%s/compute/%s/projects/%s' % (self.host, API_VERSION,
+                                                      project)
+
     def request_aggregated_items(self, api_name, zone=None):
         """
         Perform request(s) to obtain all results from 'api_name'.
@@ -327,6 +373,85 @@ class GCEList(object):
         return self
 
 
+class GCEImageIndex(object):
+    """
+    Index of the images in an image project (e.g. 'debian-cloud') which can
+    be queried by the image name or the beginning of the image name.
+    Deprecated images are only matched by the beginning of the name if no
+    non-deprecated image matches it.
+
+    Raw image dictionaries (as returned by the API) are stored so the index
+    doesn't reference any driver and can be shared by all the driver
+    instances.
+    """
+
+    def __init__(self, project, images, ttl=IMAGE_INDEX_CACHE_TTL):
+        """
+        :param  project: Name of the image project.
+        :type   project: ``str``
+
+        :param  images: Image dictionaries as returned by the API.
+        :type   images: ``list`` of ``dict``
+
+        :param  ttl: Number of seconds after which the index expires.
+        :type   ttl: ``int``
+        """
+        self.project = project
+        self.expires_at = time.time() + ttl
+        self._names = {}
+        self._prefixes = {}
+        self._deprecated_prefixes = {}
+
+        # Newer images are indexed last so they replace the older ones
+        images = sorted(images, key=lambda image: timestamp_to_datetime(
+            image['creationTimestamp']))
+
+        for image in images:
+            name = image['name']
+            self._names[name] = image
+
+            if 'deprecated' in image:
+                prefixes = self._deprecated_prefixes
+            else:
+                prefixes = self._prefixes
+
+            for index in range(1, len(name) + 1):
+                prefixes[name[:index]] = image
+
+    def __repr__(self):
+        return '<GCEImageIndex project="%s" images=%s>' % (self.project,
+                                                           len(self._names))
+
+    def is_expired(self):
+        """
+        :rtype: ``bool``
+        """
+        return time.time() >= self.expires_at
+
+    def get_image(self, name):
+        """
+        Return the image with the provided name.
+
+        :rtype: ``dict`` or ``None``
+        """
+        return self._names.get(name, None)
+
+    def get_latest_image(self, partial_name):
+        """
+        Return the latest non-deprecated image which name starts with the
+        provided string or the latest deprecated one if there is no such
+        image.
+
+        :rtype: ``dict`` or ``None``
+        """
+        image = self._prefixes.get(partial_name, None)
+
+        if image is None:
+            image = self._deprecated_prefixes.get(partial_name, None)
+
+        return image
+
+
 class GCELicense(UuidMixin, LazyObject):
     """A GCE License used to track software usage in GCE nodes."""
 
@@ -342,23 +467,9 @@ class GCELicense(UuidMixin, LazyObject):
         self._request()
 
     def _request(self):
-        # TODO(crunkleton@google.com): create new connection? or make
-        # connection thread-safe? Saving, modifying, and restoring
-        # driver.connection.request_path is really hacky and thread-unsafe.
-        saved_request_path = self.driver.connection.request_path
-        try:
-            new_request_path = saved_request_path.replace(self.driver.project,
-                                                          self.project)
-            self.driver.connection.request_path = new_request_path
-
-            request = '/global/licenses/%s' % self.name
-            response = self.driver.connection.request(request,
-                                                      method='GET').object
-        except Exception:
-            raise
-        finally:
-            # Restore the connection request_path
-            self.driver.connection.request_path = saved_request_path
+        request = '/global/licenses/%s' % self.name
+        response = self.driver.connection.request(request, method='GET',
+                                                  project=self.project).object
 
         self.extra = {
             'selfLink': response.get('selfLink'),
@@ -1757,6 +1868,16 @@ class GCENodeDriver(NodeDriver):
     type = Provider.GCE
     website = 'https://cloud.google.com/'
     features = {'create_node': ['ssh_key']}
+    catalog_methods = NodeDriver.catalog_methods + [
+        'ex_list_zones', 'ex_list_regions', 'ex_list_project_images',
+        'ex_get_image', 'ex_get_image_from_family', 'ex_get_size'
+    ]
+    catalog_classes = [GCENodeImage, GCENodeSize, GCEZone, GCERegion,
+                       GCELicense]
+
+    # Maximum number of image projects which are listed concurrently when
+    # building the image indexes (see GCEImageIndex)
+    image_index_max_workers = DEFAULT_MAX_WORKERS
 
     # Google Compute Engine node states are mapped to Libcloud node states
     # per the following dict. GCE does not have an actual 'stopped' state
@@ -1778,6 +1899,10 @@ class GCENodeDriver(NodeDriver):
         "UNKNOWN": NodeState.UNKNOWN
     }
 
+    # Functions which decode the node extra attributes (see
+    # _get_node_extra_fields)
+    _node_extra_fields = None
+
     AUTH_URL = "https://www.googleapis.com/auth/"
     SA_SCOPES_MAP = {
         # list derived from 'gcloud compute instances create --help'
@@ -2452,23 +2577,11 @@ class GCENodeDriver(NodeDriver):
                         list_images.append(self._to_node_image(img))
         else:
             list_images = []
-            # Save the connection request_path
-            save_request_path = self.connection.request_path
             if isinstance(ex_project, str):
                 ex_project = [ex_project]
             for proj in ex_project:
-                # Override the connection request path
-                new_request_path = save_request_path.replace(self.project,
-                                                             proj)
-                self.connection.request_path = new_request_path
-                try:
-                    response = self.connection.request(request,
-                                                       method='GET').object
-                except Exception:
-                    raise
-                finally:
-                    # Restore the connection request_path
-                    self.connection.request_path = save_request_path
+                response = self.connection.request(request, method='GET',
+                                                   project=proj).object
                 for img in response.get('items', []):
                     if 'deprecated' not in img:
                         list_images.append(self._to_node_image(img))
@@ -4979,7 +5092,8 @@ class GCENodeDriver(NodeDriver):
             description=None, ex_can_ip_forward=None, ex_disks_gce_struct=None,
             ex_nic_gce_struct=None, ex_on_host_maintenance=None,
             ex_automatic_restart=None, ex_image_family=None,
-            ex_preemptible=None, ex_labels=None, ex_disk_size=None):
+            ex_preemptible=None, ex_labels=None, ex_disk_size=None,
+            ex_names=None):
         """
         Create multiple nodes and return a list of Node objects.
 
@@ -5126,6 +5240,11 @@ class GCENodeDriver(NodeDriver):
                                 Integer in gigabytes.
         :type     ex_disk_size: ``int`` or ``None``
 
+        :keyword  ex_names: Explicit names of the nodes. If provided,
+                            ``base_name`` is ignored and ``number`` needs to
+                            match the number of names.
+        :type     ex_names: ``list`` of ``str`` or ``None``
+
         :return:  A list of Node objects for the new nodes.
         :rtype:   ``list`` of :class:`Node`
 
@@ -5183,8 +5302,12 @@ class GCENodeDriver(NodeDriver):
         # List for holding the status information for disk/node creation.
         status_list = []
 
-        for i in range(number):
-            name = '%s-%03d' % (base_name, i)
+        if ex_names is None:
+            ex_names = ['%s-%03d' % (base_name, i) for i in range(number)]
+        elif len(ex_names) != number:
+            raise ValueError("Number of names doesn't match 'number'")
+
+        for name in ex_names:
             status = {'name': name, 'node_response': None, 'node': None}
             status_list.append(status)
 
@@ -6895,6 +7018,97 @@ class GCENodeDriver(NodeDriver):
             node.extra['boot_disk'].destroy()
         return True
 
+    def create_nodes(self, count=None, names=None,
+                     max_workers=DEFAULT_MAX_WORKERS, **create_node_kwargs):
+        """
+        Create multiple nodes.
+
+        Nodes are created using :meth:`ex_create_multiple_nodes` which
+        submits all the insert operations first and then polls them in a
+        single loop. If some of the provided arguments are not supported by
+        that method, nodes are created concurrently using :meth:`create_node`.
+
+        @inherits: :class:`NodeDriver.create_nodes`
+        """
+        names = self._get_node_names(count=count, names=names,
+                                     create_node_kwargs=create_node_kwargs)
+        supported_args = inspect.signature(
+            self.ex_create_multiple_nodes).parameters
+
+        if any(key not in supported_args for key in create_node_kwargs):
+            return super(GCENodeDriver, self).create_nodes(
+                names=names, max_workers=max_workers, **create_node_kwargs)
+
+        create_node_kwargs.setdefault('image', None)
+        nodes = self.ex_create_multiple_nodes(base_name=None,
+                                              number=len(names),
+                                              ex_names=names,
+                                              **create_node_kwargs)
+        results = []
+
+        for name, node in zip(names, nodes):
+            if isinstance(node, GCEFailedNode):
+                error = LibcloudError(value=node.error, driver=self)
+                results.append(TaskResult(item=name, error=error))
+            else:
+                results.append(TaskResult(item=name, result=node))
+
+        return results
+
+    def _refresh_nodes(self, nodes, ex_list_nodes_kwargs=None):
+        """
+        Retrieve the provided nodes using a request per node (unless there
+        are too many of them) instead of listing nodes in all the zones.
+
+        @inherits: :class:`NodeDriver._refresh_nodes`
+        """
+        unique_nodes = list(dict((node.uuid, node) for node in nodes).values())
+
+        if (len(unique_nodes) > MAX_NODE_REFRESH_REQUESTS or
+                not all(node.extra.get('zone', None) for node in nodes)):
+            return super(GCENodeDriver, self)._refresh_nodes(
+                nodes=nodes, ex_list_nodes_kwargs=ex_list_nodes_kwargs)
+
+        result = []
+
+        for node in unique_nodes:
+            try:
+                result.append(self.ex_get_node(node.name,
+                                               zone=node.extra['zone']))
+            except ResourceNotFoundError:
+                continue
+
+        return result
+
+    def destroy_nodes(self, nodes, max_workers=DEFAULT_MAX_WORKERS,
+                      destroy_boot_disk=False):
+        """
+        Destroy multiple nodes.
+
+        Nodes are destroyed using :meth:`ex_destroy_multiple_nodes` which
+        submits all the delete operations first and then polls them in a
+        single loop.
+
+        :keyword  destroy_boot_disk: If true, also destroy the nodes' boot
+                                     disks.
+        :type     destroy_boot_disk: ``bool``
+
+        @inherits: :class:`NodeDriver.destroy_nodes`
+        """
+        destroyed = self.ex_destroy_multiple_nodes(
+            node_list=nodes, destroy_boot_disk=destroy_boot_disk)
+        results = []
+
+        for node, success in zip(nodes, destroyed):
+            if success:
+                results.append(TaskResult(item=node, result=True))
+            else:
+                error = LibcloudError(value='Failed to destroy node %s' %
+                                      (node.name), driver=self)
+                results.append(TaskResult(item=node, error=error))
+
+        return results
+
     def ex_destroy_multiple_nodes(self, node_list, ignore_errors=True,
                                   destroy_boot_disk=False, poll_interval=2,
                                   timeout=DEFAULT_TASK_COMPLETION_TIMEOUT):
@@ -7303,12 +7517,18 @@ class GCENodeDriver(NodeDriver):
         if partial_name.startswith('https://'):
             response = self.connection.request(partial_name, method='GET')
             return self._to_node_image(response.object)
-        image = self._match_images(ex_project_list, partial_name)
-        if not image and ex_standard_projects:
-            for img_proj, short_list in self.IMAGE_PROJECTS.items():
-                for short_name in short_list:
-                    if partial_name.startswith(short_name):
-                        image = self._match_images(img_proj, partial_name)
+        if ex_project_list:
+            image = self._match_images(ex_project_list, partial_name)
+            if not image and ex_standard_projects:
+                image = self._match_standard_images(partial_name)
+        else:
+            # Same images as list_images() returns (the own project and all
+            # the standard projects), but only the own project is listed and
+            # standard projects are searched using the shared image index
+            image = self._match_images(self.project, partial_name)
+            if not image:
+                image = self._match_standard_images(
+                    partial_name, projects=list(self.IMAGE_PROJECTS.keys()))
 
         if not image:
             raise ResourceNotFoundError('Could not find image \'%s\'' %
@@ -7339,18 +7559,12 @@ class GCENodeDriver(NodeDriver):
 
         def _try_image_family(image_family, project=None):
             request = '/global/images/family/%s' % (image_family)
-            save_request_path = self.connection.request_path
-            if project:
-                new_request_path = save_request_path.replace(self.project,
-                                                             project)
-                self.connection.request_path = new_request_path
             try:
-                response = self.connection.request(request, method='GET')
+                response = self.connection.request(request, method='GET',
+                                                   project=project)
                 image = self._to_node_image(response.object)
             except ResourceNotFoundError:
                 image = None
-            finally:
-                self.connection.request_path = save_request_path
 
             return image
 
@@ -7368,13 +7582,10 @@ class GCENodeDriver(NodeDriver):
                     break
 
         if not image and ex_standard_projects:
-            for img_proj, short_list in self.IMAGE_PROJECTS.items():
-                for short_name in short_list:
-                    if image_family.startswith(short_name):
-                        image = _try_image_family(image_family,
-                                                  project=img_proj)
-                        if image:
-                            break
+            for img_proj in self._get_standard_image_projects(image_family):
+                image = _try_image_family(image_family, project=img_proj)
+                if image:
+                    break
 
         if not image:
             raise ResourceNotFoundError('Could not find image for family '
@@ -8110,6 +8321,134 @@ class GCENodeDriver(NodeDriver):
         if partial_match:
             return partial_match[1]
 
+    def _get_standard_image_projects(self, name):
+        """
+        Return the standard image projects (see IMAGE_PROJECTS) which contain
+        an image family the provided image (or family) name starts with.
+
+        :param  name: The name or partial name of an image or image family.
+        :type   name: ``str``
+
+        :rtype: ``list`` of ``str``
+        """
+        return [project for project, short_list in self.IMAGE_PROJECTS.items()
+                if any(name.startswith(short_name)
+                       for short_name in short_list)]
+
+    def _match_standard_images(self, partial_name, projects=None):
+        """
+        Find an image in the standard image projects (see IMAGE_PROJECTS),
+        given a name or a partial name. Deprecated images are only returned
+        for a partial name if no non-deprecated image matches it.
+
+        :param  partial_name: The full name or beginning of a name for an
+                              image.
+        :type   partial_name: ``str``
+
+        :param  projects: Standard image projects to search. Defaults to the
+                          projects with an image family the partial name
+                          starts with. Only indexes of these projects are
+                          built.
+        :type   projects: ``list`` of ``str`` or ``None``
+
+        :return:  The image with the provided name, the latest image which
+                  name starts with the partial name or None if no matching
+                  image is found.
+        :rtype:   :class:`GCENodeImage` or ``None``
+        """
+        if projects is None:
+            projects = self._get_standard_image_projects(partial_name)
+
+        if not projects:
+            return None
+
+        indexes = self._get_image_indexes(projects)
+
+        for index in indexes:
+            image = index.get_image(partial_name)
+            if image:
+                return self._to_node_image(image)
+
+        images = [index.get_latest_image(partial_name) for index in indexes]
+        images = [image for image in images if image]
+        current = [image for image in images if 'deprecated' not in image]
+        return self._to_latest_node_image(current or images)
+
+    def _to_latest_node_image(self, images):
+        """
+        Return the image (of the provided image dictionaries) which was
+        created last.
+
+        :rtype:   :class:`GCENodeImage` or ``None``
+        """
+        if not images:
+            return None
+
+        image = max(images, key=lambda image: timestamp_to_datetime(
+            image['creationTimestamp']))
+        return self._to_node_image(image)
+
+    def _get_image_indexes(self, projects):
+        """
+        Return image indexes of the provided image projects.
+
+        Indexes are cached (for IMAGE_INDEX_CACHE_TTL seconds) and shared by
+        all the driver instances. Missing and expired indexes are built
+        concurrently. Projects which can't be listed are skipped.
+
+        :param  projects: Names of the image projects.
+        :type   projects: ``list`` of ``str``
+
+        :rtype: ``list`` of :class:`GCEImageIndex`
+        """
+        indexes = {}
+
+        with _IMAGE_INDEXES_LOCK:
+            for project in projects:
+                index = _IMAGE_INDEXES.get(project, None)
+                if index is not None and not index.is_expired():
+                    indexes[project] = index
+
+        missing = [project for project in projects if project not in indexes]
+
+        if missing:
+            results = run_in_parallel(
+                self, lambda driver, project: driver._build_image_index(
+                    project), missing,
+                max_workers=self.image_index_max_workers)
+
+            with _IMAGE_INDEXES_LOCK:
+                for result in results:
+                    # do not break if an image project is invalid
+                    if result.success:
+                        _IMAGE_INDEXES[result.item] = result.result
+                        indexes[result.item] = result.result
+
+        return [indexes[project] for project in projects
+                if project in indexes]
+
+    def _build_image_index(self, project):
+        """
+        Retrieve all the images in the project and return their index.
+
+        :param  project: Name of the image project.
+        :type   project: ``str``
+
+        :rtype: :class:`GCEImageIndex`
+        """
+        images = []
+
+        params = {'maxResults': 500}
+        more_results = True
+        while more_results:
+            self.connection.gce_params = params
+            response = self.connection.request('/global/images', method='GET',
+                                               project=project).object
+            images.extend(response.get('items', []))
+            more_results = 'pageToken' in params
+
+        return GCEImageIndex(project, images)
+
     def _set_region(self, region):
         """
         Return the region to use for listing resources.
@@ -8926,35 +9265,14 @@ class GCENodeDriver(NodeDriver):
         """
         public_ips = []
         private_ips = []
-        extra = {}
 
-        extra['status'] = node.get('status', "UNKNOWN")
-        extra['statusMessage'] = node.get('statusMessage')
-        extra['description'] = node.get('description')
-        extra['zone'] = self.ex_get_zone(node['zone'])
+        # Most of the extra attributes are only decoded from the response
+        # when they are accessed
+        extra = LazyDict(node, self._get_node_extra_fields())
         extra['image'] = node.get('image')
-        extra['machineType'] = node.get('machineType')
-        extra['cpuPlatform'] = node.get('cpuPlatform')
-        extra['minCpuPlatform'] = node.get('minCpuPlatform')
-        extra['disks'] = node.get('disks', [])
-        extra['networkInterfaces'] = node.get('networkInterfaces')
-        extra['id'] = node['id']
-        extra['selfLink'] = node.get('selfLink')
-        extra['kind'] = node.get('kind')
-        extra['creationTimestamp'] = node.get('creationTimestamp')
-        extra['name'] = node['name']
-        extra['metadata'] = node.get('metadata', {})
-        extra['tags_fingerprint'] = node['tags']['fingerprint']
-        extra['scheduling'] = node.get('scheduling', {})
-        extra['deprecated'] = True if node.get('deprecated', None) else False
-        extra['canIpForward'] = node.get('canIpForward')
-        extra['serviceAccounts'] = node.get('serviceAccounts', [])
-        extra['scheduling'] = node.get('scheduling', {})
         extra['boot_disk'] = None
-        extra['labels'] = node.get('labels')
-        extra['labelFingerprint'] = node.get('labelFingerprint')
 
-        for disk in extra['disks']:
+        for disk in node.get('disks', []):
             if disk.get('boot') and disk.get('type') == 'PERSISTENT':
                 bd = self._get_components_from_path(disk['source'])
                 extra['boot_disk'] = self.ex_get_volume(
@@ -8993,6 +9311,48 @@ class GCENodeDriver(NodeDriver):
                     public_ips=public_ips, private_ips=private_ips,
                     driver=self, size=size, image=image, extra=extra)
 
+    def _get_node_extra_fields(self):
+        """
+        Return dictionary which maps node extra attributes to the functions
+        which decode them from the JSON-response dictionary.
+
+        :rtype: ``dict``
+        """
+        if self._node_extra_fields is None:
+            self._node_extra_fields = {
+                'status': lambda node: node.get('status', "UNKNOWN"),
+                'statusMessage': lambda node: node.get('statusMessage'),
+                'description': lambda node: node.get('description'),
+                'zone': lambda node: self.ex_get_zone(node['zone']),
+                'image': lambda node: node.get('image'),
+                'machineType': lambda node: node.get('machineType'),
+                'cpuPlatform': lambda node: node.get('cpuPlatform'),
+                'minCpuPlatform': lambda node: node.get('minCpuPlatform'),
+                'disks': lambda node: node.get('disks', []),
+                'networkInterfaces':
+                    lambda node: node.get('networkInterfaces'),
+                'id': lambda node: node['id'],
+                'selfLink': lambda node: node.get('selfLink'),
+                'kind': lambda node: node.get('kind'),
+                'creationTimestamp':
+                    lambda node: node.get('creationTimestamp'),
+                'name': lambda node: node['name'],
+                'metadata': lambda node: node.get('metadata', {}),
+                'tags_fingerprint': lambda node: node['tags']['fingerprint'],
+                'scheduling': lambda node: node.get('scheduling', {}),
+                'deprecated':
+                    lambda node: True if node.get('deprecated') else False,
+                'canIpForward': lambda node: node.get('canIpForward'),
+                'serviceAccounts':
+                    lambda node: node.get('serviceAccounts', []),
+                'boot_disk': lambda node: None,
+                'labels': lambda node: node.get('labels'),
+                'labelFingerprint': lambda node: node.get('labelFingerprint'),
+                'tags': lambda node: node['tags'].get('items', [])
+            }
+
+        return self._node_extra_fields
+
     def _to_node_size(self, machine_type, instance_prices):
         """
         Return a Size object from the JSON-response dictionary.
@@ -279,6 +279,7 @@ class OpenNebulaNodeDriver(NodeDriver):
     name = 'OpenNebula'
     website = 'http://opennebula.org/'
     type = Provider.OPENNEBULA
+    catalog_classes = [OpenNebulaNodeSize]
 
     NODE_STATE_MAP = {
         'INIT': NodeState.PENDING,
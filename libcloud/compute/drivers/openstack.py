@@ -39,11 +39,13 @@ from libcloud.common.openstack import OpenStackDriverMixin
 from libcloud.common.openstack import OpenStackException
 from libcloud.common.openstack import OpenStackResponse
 from libcloud.utils.networking import is_public_subnet
+from libcloud.utils.misc import LazyDict
 from libcloud.compute.base import NodeSize, NodeImage, NodeImageMember, \
     UuidMixin
 from libcloud.compute.base import (NodeDriver, Node, NodeLocation,
                                    StorageVolume, VolumeSnapshot)
 from libcloud.compute.base import KeyPair
+from libcloud.compute.base import MAX_NODE_REFRESH_REQUESTS
 from libcloud.compute.types import NodeState, StorageVolumeState, Provider, \
     VolumeSnapshotState, Type, LibcloudError
 from libcloud.pricing import get_size_price
@@ -570,6 +572,7 @@ class OpenStack_1_0_NodeDriver(OpenStackNodeDriver):
     type = Provider.OPENSTACK
 
     features = {'create_node': ['generates_password']}
+    catalog_classes = [OpenStackNodeSize]
 
     def __init__(self, *args, **kwargs):
         self._ex_force_api_version = str(kwargs.pop('ex_force_api_version',
@@ -1378,13 +1381,48 @@ class OpenStack_1_1_NodeDriver(OpenStackNodeDriver):
     type = Provider.OPENSTACK
 
     features = {"create_node": ["generates_password"]}
+    catalog_methods = OpenStackNodeDriver.catalog_methods + [
+        'ex_get_size', 'ex_get_size_extra_specs'
+    ]
+    catalog_classes = [OpenStackNodeSize]
     _networks_url_prefix = '/os-networks'
 
+    # Functions which decode the node extra attributes (see
+    # _get_node_extra_fields)
+    _node_extra_fields = None
+
     def __init__(self, *args, **kwargs):
         self._ex_force_api_version = str(kwargs.pop('ex_force_api_version',
                                                     None))
         super(OpenStack_1_1_NodeDriver, self).__init__(*args, **kwargs)
 
+    def _refresh_nodes(self, nodes, ex_list_nodes_kwargs=None):
+        """
+        Retrieve the provided nodes using a ``/servers/{id}`` request per
+        node (unless there are too many of them).
+
+        @inherits: :class:`NodeDriver._refresh_nodes`
+        """
+        node_ids = []
+
+        for node in nodes:
+            if node.id not in node_ids:
+                node_ids.append(node.id)
+
+        if len(node_ids) > MAX_NODE_REFRESH_REQUESTS:
+            return super(OpenStack_1_1_NodeDriver, self)._refresh_nodes(
+                nodes=nodes, ex_list_nodes_kwargs=ex_list_nodes_kwargs)
+
+        result = []
+
+        for node_id in node_ids:
+            node = self.ex_get_node_details(node_id)
+
+            if node is not None:
+                result.append(node)
+
+        return result
+
     def create_node(self, name, size, image=None, ex_keyname=None,
                     ex_userdata=None,
                     ex_config_drive=None, ex_security_groups=None,
@@ -2353,14 +2391,13 @@ class OpenStack_1_1_NodeDriver(OpenStackNodeDriver):
                 else:
                     private_ips.append(ip)
 
-        # Sometimes 'image' attribute is not present if the node is in an error
-        # state
-        image = api_node.get('image', None)
-        image_id = image.get('id', None) if image else None
-        config_drive = api_node.get("config_drive", False)
-        volumes_attached = api_node.get('os-extended-volumes:volumes_attached')
         created = parse_date(api_node["created"])
 
+        # Extra attributes are only decoded from the response when they are
+        # accessed
+        extra = LazyDict(api_node, self._get_node_extra_fields(),
+                         addresses=api_node['addresses'])
+
         return Node(
             id=api_node['id'],
             name=api_node['name'],
@@ -2370,38 +2407,69 @@ class OpenStack_1_1_NodeDriver(OpenStackNodeDriver):
             private_ips=private_ips,
             created_at=created,
             driver=self,
-            extra=dict(
-                addresses=api_node['addresses'],
-                hostId=api_node['hostId'],
-                access_ip=api_node.get('accessIPv4'),
-                access_ipv6=api_node.get('accessIPv6', None),
-                # Docs says "tenantId", but actual is "tenant_id". *sigh*
-                # Best handle both.
-                tenantId=api_node.get('tenant_id') or api_node['tenantId'],
-                userId=api_node.get('user_id', None),
-                imageId=image_id,
-                flavorId=api_node['flavor']['id'],
-                uri=next(link['href'] for link in api_node['links'] if
-                         link['rel'] == 'self'),
-                # pylint: disable=no-member
-                service_name=self.connection.get_service_name(),
-                metadata=api_node['metadata'],
-                password=api_node.get('adminPass', None),
-                created=api_node['created'],
-                updated=api_node['updated'],
-                key_name=api_node.get('key_name', None),
-                disk_config=api_node.get('OS-DCF:diskConfig', None),
-                config_drive=config_drive,
-                availability_zone=api_node.get('OS-EXT-AZ:availability_zone'),
-                volumes_attached=volumes_attached,
-                task_state=api_node.get("OS-EXT-STS:task_state", None),
-                vm_state=api_node.get("OS-EXT-STS:vm_state", None),
-                power_state=api_node.get("OS-EXT-STS:power_state", None),
-                progress=api_node.get("progress", None),
-                fault=api_node.get('fault')
-            ),
+            extra=extra,
         )
 
+    def _get_node_extra_fields(self):
+        """
+        Return dictionary which maps node extra attributes to the functions
+        which decode them from the API response dictionary.
+
+        :rtype: ``dict``
+        """
+        if self._node_extra_fields is not None:
+            return self._node_extra_fields
+
+        def get_image_id(api_node):
+            # Sometimes 'image' attribute is not present if the node is in
+            # an error state
+            image = api_node.get('image', None)
+            return image.get('id', None) if image else None
+
+        def get_uri(api_node):
+            return next(link['href'] for link in api_node['links'] if
+                        link['rel'] == 'self')
+
+        self._node_extra_fields = {
+            'addresses': lambda api_node: api_node['addresses'],
+            'hostId': lambda api_node: api_node['hostId'],
+            'access_ip': lambda api_node: api_node.get('accessIPv4'),
+            'access_ipv6': lambda api_node: api_node.get('accessIPv6', None),
+            # Docs says "tenantId", but actual is "tenant_id". *sigh*
+            # Best handle both.
+            'tenantId': lambda api_node: (api_node.get('tenant_id') or
+                                          api_node['tenantId']),
+            'userId': lambda api_node: api_node.get('user_id', None),
+            'imageId': get_image_id,
+            'flavorId': lambda api_node: api_node['flavor']['id'],
+            'uri': get_uri,
+            # pylint: disable=no-member
+            'service_name':
+                lambda api_node: self.connection.get_service_name(),
+            'metadata': lambda api_node: api_node['metadata'],
+            'password': lambda api_node: api_node.get('adminPass', None),
+            'created': lambda api_node: api_node['created'],
+            'updated': lambda api_node: api_node['updated'],
+            'key_name': lambda api_node: api_node.get('key_name', None),
+            'disk_config':
+                lambda api_node: api_node.get('OS-DCF:diskConfig', None),
+            'config_drive':
+                lambda api_node: api_node.get('config_drive', False),
+            'availability_zone':
+                lambda api_node: api_node.get('OS-EXT-AZ:availability_zone'),
+            'volumes_attached': lambda api_node: api_node.get(
+                'os-extended-volumes:volumes_attached'),
+            'task_state':
+                lambda api_node: api_node.get('OS-EXT-STS:task_state', None),
+            'vm_state':
+                lambda api_node: api_node.get('OS-EXT-STS:vm_state', None),
+            'power_state':
+                lambda api_node: api_node.get('OS-EXT-STS:power_state', None),
+            'progress': lambda api_node: api_node.get('progress', None),
+            'fault': lambda api_node: api_node.get('fault')
+        }
+        return self._node_extra_fields
+
     def _to_volume(self, api_node):
         if 'volume' in api_node:
             api_node = api_node['volume']
@@ -17,6 +17,7 @@
 Wraps multiple ways to communicate over SSH.
 """
 
+from typing import Callable
 from typing import Type
 from typing import Optional
 from typing import Tuple
@@ -39,6 +40,7 @@ except ImportError:
 import os
 import re
 import time
+import select
 import subprocess
 import logging
 import warnings
@@ -54,6 +56,7 @@ __all__ = [
     'BaseSSHClient',
     'ParamikoSSHClient',
     'ShellOutSSHClient',
+    'ChannelOutputBuffer',
 
     'SSHCommandTimeoutError'
 ]
@@ -83,6 +86,72 @@ class SSHCommandTimeoutError(Exception):
         return self.__repr__()
 
 
+class ChannelOutputBuffer(object):
+    """
+    Buffer which accumulates output of a single channel stream (stdout or
+    stderr) of a command.
+
+    Data is stored as raw bytes and only decoded once the whole output has
+    been received since a single chunk could contain a part of a multi byte
+    UTF-8 character.
+    """
+
+    def __init__(self, line_callback=None, max_size=None):
+        # type: (Optional[Callable[[str], None]], Optional[int]) -> None
+        """
+        :param line_callback: Function which is called with each complete
+                              line (without the trailing new line).
+        :type line_callback: ``callable``
+
+        :param max_size: Maximum number of bytes to retain. Older data is
+                         discarded once the limit is reached.
+        :type max_size: ``int``
+        """
+        self.line_callback = line_callback
+        self.max_size = max_size
+
+        self._buffer = bytearray()
+        self._pending_line = bytearray()
+
+    def write(self, data):
+        # type: (bytes) -> None
+        self._buffer += data
+
+        # Trimming is amortized, buffer is only trimmed once it grows to twice
+        # the maximum size
+        if self.max_size and len(self._buffer) > 2 * self.max_size:
+            del self._buffer[:-self.max_size]
+
+        if self.line_callback:
+            self._pending_line += data
+
+            if b'\n' in data:
+                lines = self._pending_line.split(b'\n')
+                self._pending_line = lines.pop()
+
+                for line in lines:
+                    self.line_callback(line.decode('utf-8', errors='ignore'))
+
+    def flush(self):
+        # type: () -> None
+        """
+        Pass the last incomplete line (if any) to the line callback.
+        """
+        if self.line_callback and self._pending_line:
+            line = self._pending_line.decode('utf-8', errors='ignore')
+            self._pending_line = bytearray()
+            self.line_callback(line)
+
+    def getvalue(self):
+        # type: () -> str
+        data = self._buffer
+
+        if self.max_size and len(data) > self.max_size:
+            data = data[-self.max_size:]
+
+        return data.decode('utf-8', errors='ignore')
+
+
 class BaseSSHClient(object):
     """
     Base class representing a connection over SSH/SCP to a remote node.
@@ -249,9 +318,13 @@ class ParamikoSSHClient(BaseSSHClient):
     CHUNK_SIZE = 4096
 
     # How long to sleep while waiting for command to finish (to prevent busy
-    # waiting)
+    # waiting). Only used with channels which don't support select().
     SLEEP_DELAY = 0.2
 
+    # Maximum time to block waiting for channel data before checking exit
+    # status and command timeout again
+    MAX_WAIT_DELAY = 1.0
+
     def __init__(self,
                  hostname,  # type: str
                  port=22,  # type: int
@@ -457,15 +530,42 @@ class ParamikoSSHClient(BaseSSHClient):
         sftp.close()
         return True
 
-    def run(self, cmd, timeout=None):
-        # type: (str, Optional[float]) -> Tuple[str, str, int]
+    def run(self,
+            cmd,  # type: str
+            timeout=None,  # type: Optional[float]
+            stdout_line_callback=None,  # type: Optional[Callable[[str], None]]  # noqa: E501
+            stderr_line_callback=None,  # type: Optional[Callable[[str], None]]  # noqa: E501
+            max_output_size=None  # type: Optional[int]
+            ):
+        # type: (...) -> Tuple[str, str, int]
         """
         Note: This function is based on paramiko's exec_command()
         method.
 
+        Instead of polling the channel in a sleep loop, this method waits for
+        the channel to become readable (or for the exit status to arrive)
+        using ``select``.
+
         :param timeout: How long to wait (in seconds) for the command to
                         finish (optional).
         :type timeout: ``float``
+
+        :param stdout_line_callback: Function which is called with each line
+                                     of the command standard output as soon
+                                     as it's received (optional).
+        :type stdout_line_callback: ``callable``
+
+        :param stderr_line_callback: Function which is called with each line
+                                     of the command standard error as soon as
+                                     it's received (optional).
+        :type stderr_line_callback: ``callable``
+
+        :param max_output_size: Maximum number of bytes of stdout and stderr
+                                (each) which are retained in memory. If the
+                                command produces more output, only the last
+                                ``max_output_size`` bytes are returned
+                                (optional).
+        :type max_output_size: ``int``
         """
         extra1 = {'_cmd': cmd}
         self.logger.debug('Executing command', extra=extra1)
@@ -480,8 +580,10 @@ class ParamikoSSHClient(BaseSSHClient):
         start_time = time.time()
         chan.exec_command(cmd)
 
-        stdout = StringIO()
-        stderr = StringIO()
+        stdout = ChannelOutputBuffer(line_callback=stdout_line_callback,
+                                     max_size=max_output_size)
+        stderr = ChannelOutputBuffer(line_callback=stderr_line_callback,
+                                     max_size=max_output_size)
 
         # Create a stdin file and immediately close it to prevent any
         # interactive script from hanging the process.
@@ -496,44 +598,41 @@ class ParamikoSSHClient(BaseSSHClient):
         # Note #2: If you are going to remove "ready" checks inside the loop
         # you are going to have a bad time. Trying to consume from a channel
         # which is not ready will block for indefinitely.
-        exit_status_ready = chan.exit_status_ready()
-
-        if exit_status_ready:
-            # It's possible that some data is already available when exit
-            # status is ready
-            stdout.write(self._consume_stdout(chan).getvalue())
-            stderr.write(self._consume_stderr(chan).getvalue())
-
-        while not exit_status_ready:
-            current_time = time.time()
-            elapsed_time = (current_time - start_time)
+        while True:
+            self._read_channel_output(chan=chan, stdout=stdout, stderr=stderr)
+
+            if chan.exit_status_ready():
+                # All the output is received before the exit status, but it
+                # could have arrived after the read above
+                self._read_channel_output(chan=chan, stdout=stdout,
+                                          stderr=stderr)
+                break
 
-            if timeout and (elapsed_time > timeout):
-                # TODO: Is this the right way to clean up?
-                chan.close()
+            wait_delay = self.MAX_WAIT_DELAY
 
-                stdout_str = stdout.getvalue()  # type: str
-                stderr_str = stderr.getvalue()  # type: str
-                raise SSHCommandTimeoutError(cmd=cmd, timeout=timeout,
-                                             stdout=stdout_str,
-                                             stderr=stderr_str)
+            if timeout:
+                elapsed_time = (time.time() - start_time)
 
-            stdout.write(self._consume_stdout(chan).getvalue())
-            stderr.write(self._consume_stderr(chan).getvalue())
+                if elapsed_time > timeout:
+                    # TODO: Is this the right way to clean up?
+                    chan.close()
 
-            # We need to check the exist status here, because the command could
-            # print some output and exit during this sleep below.
-            exit_status_ready = chan.exit_status_ready()
+                    stdout_str = stdout.getvalue()  # type: str
+                    stderr_str = stderr.getvalue()  # type: str
+                    raise SSHCommandTimeoutError(cmd=cmd, timeout=timeout,
+                                                 stdout=stdout_str,
+                                                 stderr=stderr_str)
 
-            if exit_status_ready:
-                break
+                wait_delay = min(wait_delay, timeout - elapsed_time)
 
-            # Short sleep to prevent busy waiting
-            time.sleep(self.SLEEP_DELAY)
+            self._wait_for_channel(chan=chan, timeout=max(wait_delay, 0))
 
         # Receive the exit status code of the command we ran.
         status = chan.recv_exit_status()  # type: int
 
+        stdout.flush()
+        stderr.flush()
+
         stdout_str = stdout.getvalue()
         stderr_str = stderr.getvalue()
 
@@ -555,6 +654,44 @@ class ParamikoSSHClient(BaseSSHClient):
 
         return True
 
+    def _wait_for_channel(self, chan, timeout):
+        """
+        Block until the channel has some data to read, the remote side has
+        sent the exit status or the timeout has been reached.
+        """
+        if chan.eof_received:
+            # No more data is going to arrive and the pipe behind the channel
+            # file descriptor stays readable
+            chan.status_event.wait(timeout)
+            return
+
+        try:
+            select.select([chan], [], [], timeout)
+        except (TypeError, ValueError, OSError):
+            # Channel doesn't support fileno(), fall back to sleeping
+            time.sleep(min(self.SLEEP_DELAY, timeout))
+
+    def _read_channel_output(self, chan, stdout, stderr):
+        """
+        Read all the stdout and stderr data which is currently available on
+        the channel without blocking.
+        """
+        self._read_available_data(recv_method=chan.recv,
+                                  recv_ready_method=chan.recv_ready,
+                                  output=stdout)
+        self._read_available_data(recv_method=chan.recv_stderr,
+                                  recv_ready_method=chan.recv_stderr_ready,
+                                  output=stderr)
+
+    def _read_available_data(self, recv_method, recv_ready_method, output):
+        while recv_ready_method():
+            data = recv_method(self.CHUNK_SIZE)
+
+            if not data:
+                break
+
+            output.write(b(data))
+
     def _consume_stdout(self, chan):
         """
         Try to consume stdout data from chan if it's receive ready.
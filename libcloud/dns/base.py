@@ -22,20 +22,39 @@ from typing import Optional
 from typing import Union
 from typing import Type
 from typing import Any
+from typing import IO
+from typing import Tuple
 
 import datetime
+import heapq
+import json
+import operator
+import tempfile
 
 from libcloud import __version__
+from libcloud.utils.py3 import StringIO
 from libcloud.common.base import Connection
 from libcloud.common.base import ConnectionUserAndKey, BaseDriver
-from libcloud.dns.types import RecordType
+from libcloud.dns.types import RecordType, RecordChangeAction
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import TaskResult, run_in_parallel
+from libcloud.utils.misc import intern_string
+from libcloud.utils.misc import intern_values
 
 __all__ = [
+    'DEFAULT_SORT_BUFFER_SIZE',
+
     'Zone',
     'Record',
+    'RecordChange',
+    'RecordChangeBatch',
     'DNSDriver'
 ]
 
+# Maximum number of records which are sorted in memory when exporting a zone
+# to the BIND format. Bigger zones are sorted using an external merge sort.
+DEFAULT_SORT_BUFFER_SIZE = 100000
+
 
 class Zone(object):
     """
@@ -71,10 +90,10 @@ class Zone(object):
         """
         self.id = str(id) if id else None
         self.domain = domain
-        self.type = type
+        self.type = intern_string(type)
         self.ttl = ttl or None
         self.driver = driver
-        self.extra = extra or {}
+        self.extra = intern_values(extra or {})
 
     def list_records(self):
         # type: () -> List[Record]
@@ -108,6 +127,11 @@ class Zone(object):
         self.driver.export_zone_to_bind_zone_file(zone=self,
                                                   file_path=file_path)
 
+    def export_to_bind_stream(self, stream, sort=True):
+        # type: (IO[str], bool) -> None
+        self.driver.export_zone_to_bind_stream(zone=self, stream=stream,
+                                               sort=sort)
+
     def __repr__(self):
         # type: () -> str
         return ('<Zone: domain=%s, ttl=%s, provider=%s ...>' %
@@ -156,12 +180,12 @@ class Record(object):
         """
         self.id = str(id) if id else None
         self.name = name
-        self.type = type
+        self.type = intern_string(type)
         self.data = data
         self.zone = zone
         self.driver = driver
         self.ttl = ttl
-        self.extra = extra or {}
+        self.extra = intern_values(extra or {})
 
     def update(self,
                name=None,  # type: Optional[str]
@@ -205,6 +229,152 @@ class Record(object):
                  self.driver.name, self.ttl))
 
 
+class RecordChange(object):
+    """
+    A single record change (create, update or delete) which is part of a
+    batch of changes applied using :meth:`DNSDriver.ex_apply_changes`.
+    """
+
+    def __init__(self,
+                 action,  # type: str
+                 record=None,  # type: Optional[Record]
+                 name=None,  # type: Optional[str]
+                 type=None,  # type: Optional[RecordType]
+                 data=None,  # type: Optional[str]
+                 extra=None  # type: Optional[dict]
+                 ):
+        """
+        :param action: Change action.
+        :type action: :class:`RecordChangeAction`
+
+        :param record: Existing record (required for update and delete).
+        :type record: :class:`Record`
+
+        :param name: Record name without the domain name (e.g. www).
+        :type name: ``str``
+
+        :param type: DNS record type (A, AAAA, ...).
+        :type type: :class:`RecordType`
+
+        :param data: Data for the record (depends on the record type,
+                     required for create).
+        :type data: ``str``
+
+        :param extra: (optional) Extra attributes (driver specific).
+        :type extra: ``dict``
+        """
+        if action not in [RecordChangeAction.CREATE,
+                          RecordChangeAction.UPDATE,
+                          RecordChangeAction.DELETE]:
+            raise ValueError('Invalid change action: %s' % (action))
+
+        if action != RecordChangeAction.CREATE:
+            if record is None:
+                raise ValueError('record argument is required for %s '
+                                 'changes' % (action))
+
+            if action == RecordChangeAction.UPDATE:
+                name = record.name if name is None else name
+                type = type or record.type
+                data = record.data if data is None else data
+        elif name is None or type is None or data is None:
+            raise ValueError('name, type and data arguments are required for '
+                             'CREATE changes')
+
+        self.action = action
+        self.record = record
+        self.name = name
+        self.type = type
+        self.data = data
+        self.extra = extra
+
+    @classmethod
+    def create(cls, name, type, data, extra=None):
+        # type: (str, RecordType, str, Optional[dict]) -> RecordChange
+        return cls(action=RecordChangeAction.CREATE, name=name, type=type,
+                   data=data, extra=extra)
+
+    @classmethod
+    def update(cls, record, name=None, type=None, data=None, extra=None):
+        # type: (Record, Optional[str], Optional[RecordType], Optional[str], Optional[dict]) -> RecordChange  # noqa: E501
+        return cls(action=RecordChangeAction.UPDATE, record=record, name=name,
+                   type=type, data=data, extra=extra)
+
+    @classmethod
+    def delete(cls, record):
+        # type: (Record) -> RecordChange
+        return cls(action=RecordChangeAction.DELETE, record=record)
+
+    def __repr__(self):
+        # type: () -> str
+        return ('<RecordChange: action=%s, name=%s, type=%s, data=%s ...>' %
+                (self.action, self.name, self.type, self.data))
+
+
+class RecordChangeBatch(object):
+    """
+    Context manager which collects record changes and applies them using a
+    single :meth:`DNSDriver.ex_apply_changes` call on exit.
+
+    >>> with driver.ex_batch_changes(zone=zone) as batch:  # doctest: +SKIP
+    ...     batch.create_record(name='www', type=RecordType.A,
+    ...                         data='127.0.0.1')
+    ...     batch.delete_record(record=old_record)
+    >>> batch.results  # doctest: +SKIP
+    """
+
+    def __init__(self, driver, zone, max_workers=DEFAULT_MAX_WORKERS):
+        # type: (DNSDriver, Zone, int) -> None
+        self.driver = driver
+        self.zone = zone
+        self.max_workers = max_workers
+        self.changes = []  # type: List[RecordChange]
+        self.results = None  # type: Optional[List[TaskResult]]
+
+    def add(self, change):
+        # type: (RecordChange) -> RecordChange
+        self.changes.append(change)
+        return change
+
+    def create_record(self, name, type, data, extra=None):
+        # type: (str, RecordType, str, Optional[dict]) -> RecordChange
+        return self.add(RecordChange.create(name=name, type=type, data=data,
+                                            extra=extra))
+
+    def update_record(self, record, name=None, type=None, data=None,
+                      extra=None):
+        # type: (Record, Optional[str], Optional[RecordType], Optional[str], Optional[dict]) -> RecordChange  # noqa: E501
+        return self.add(RecordChange.update(record=record, name=name,
+                                            type=type, data=data,
+                                            extra=extra))
+
+    def delete_record(self, record):
+        # type: (Record) -> RecordChange
+        return self.add(RecordChange.delete(record=record))
+
+    def apply(self):
+        # type: () -> List[TaskResult]
+        """
+        Apply all the pending changes.
+
+        :return: Per change results.
+        :rtype: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
+        """
+        changes, self.changes = self.changes, []
+        self.results = self.driver.ex_apply_changes(
+            zone=self.zone, changes=changes, max_workers=self.max_workers)
+        return self.results
+
+    def __enter__(self):
+        # type: () -> RecordChangeBatch
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Pending changes are discarded if the block raised
+        if exc_type is None:
+            self.apply()
+
+
 class DNSDriver(BaseDriver):
     """
     A base DNSDriver class to derive from
@@ -287,6 +457,12 @@ class DNSDriver(BaseDriver):
 
         :rtype: ``generator`` of :class:`Record`
         """
+        # Many drivers only implement list_records
+        list_records = getattr(self.list_records, '__func__', None)
+
+        if list_records is not DNSDriver.list_records:
+            return iter(self.list_records(zone))
+
         raise NotImplementedError(
             'iterate_records not implemented for this driver')
 
@@ -473,40 +649,92 @@ class DNSDriver(BaseDriver):
         raise NotImplementedError(
             'delete_record not implemented for this driver')
 
-    def export_zone_to_bind_format(self, zone):
-        # type: (Zone) -> str
+    def ex_apply_changes(self,
+                         zone,  # type: Zone
+                         changes,  # type: List[RecordChange]
+                         max_workers=DEFAULT_MAX_WORKERS  # type: int
+                         ):
+        # type: (...) -> List[TaskResult]
         """
-        Export Zone object to the BIND compatible format.
+        Apply multiple record changes to the provided zone.
 
-        :param zone: Zone to export.
+        Drivers which support native batching (e.g. Route53) override this
+        method and coalesce the changes into as few API calls as possible.
+        The default implementation applies the changes concurrently using
+        ``create_record``, ``update_record`` and ``delete_record``.
+
+        :param zone: Zone the changes are applied to.
         :type  zone: :class:`Zone`
 
-        :return: Zone data in BIND compatible format.
-        :rtype: ``str``
+        :param changes: Changes to apply.
+        :type  changes: ``list`` of :class:`RecordChange`
+
+        :param max_workers: Maximum number of changes which are applied
+                            concurrently by the default implementation.
+        :type  max_workers: ``int``
+
+        :return: Per change results in the same order as ``changes``. Result
+                 value is a :class:`Record` for create and update changes and
+                 ``bool`` for delete changes.
+        :rtype: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
         """
-        if zone.type != 'master':
-            raise ValueError('You can only generate BIND out for master zones')
+        def apply_change(driver, change):
+            return driver._apply_record_change(zone=zone, change=change)
 
-        lines = []
+        return run_in_parallel(driver=self, func=apply_change, items=changes,
+                               max_workers=max_workers)
 
-        # For consistent output, records are sorted based on the id
-        records = zone.list_records()
-        records = sorted(records, key=Record._get_numeric_id)
+    def ex_batch_changes(self, zone, max_workers=DEFAULT_MAX_WORKERS):
+        # type: (Zone, int) -> RecordChangeBatch
+        """
+        Return a context manager which collects record changes for the
+        provided zone and applies them on exit using
+        :meth:`ex_apply_changes`.
 
-        date = datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-        values = {'version': __version__, 'date': date}
+        :param zone: Zone the changes are applied to.
+        :type  zone: :class:`Zone`
 
-        lines.append('; Generated by Libcloud v%(version)s on %(date)s UTC' %
-                     values)
-        lines.append('$ORIGIN %(domain)s.' % {'domain': zone.domain})
-        lines.append('$TTL %(domain_ttl)s\n' % {'domain_ttl': zone.ttl})
+        :rtype: :class:`RecordChangeBatch`
+        """
+        return RecordChangeBatch(driver=self, zone=zone,
+                                 max_workers=max_workers)
+
+    def _apply_record_change(self, zone, change):
+        # type: (Zone, RecordChange) -> Union[Record, bool]
+        """
+        Apply a single record change using the standard record API methods.
+        """
+        if change.action == RecordChangeAction.CREATE:
+            # Validated by the RecordChange constructor
+            assert change.name is not None and change.type is not None
+            assert change.data is not None
+            return self.create_record(name=change.name, zone=zone,
+                                      type=change.type, data=change.data,
+                                      extra=change.extra)
+
+        assert change.record is not None
+
+        if change.action == RecordChangeAction.UPDATE:
+            return self.update_record(record=change.record, name=change.name,
+                                      type=change.type, data=change.data,
+                                      extra=change.extra)
+
+        return self.delete_record(record=change.record)
 
-        for record in records:
-            line = self._get_bind_record_line(record=record)
-            lines.append(line)
+    def export_zone_to_bind_format(self, zone):
+        # type: (Zone) -> str
+        """
+        Export Zone object to the BIND compatible format.
 
-        output = '\n'.join(lines)
-        return output
+        :param zone: Zone to export.
+        :type  zone: :class:`Zone`
+
+        :return: Zone data in BIND compatible format.
+        :rtype: ``str``
+        """
+        stream = StringIO()
+        self.export_zone_to_bind_stream(zone=zone, stream=stream)
+        return stream.getvalue()
 
     def export_zone_to_bind_zone_file(self, zone, file_path):
         # type: (Zone, str) -> None
@@ -520,10 +748,105 @@ class DNSDriver(BaseDriver):
         :param file_path: File path where the output will be saved.
         :type  file_path: ``str``
         """
-        result = self.export_zone_to_bind_format(zone=zone)
-
         with open(file_path, 'w') as fp:
-            fp.write(result)
+            self.export_zone_to_bind_stream(zone=zone, stream=fp)
+
+    def export_zone_to_bind_stream(self,
+                                   zone,  # type: Zone
+                                   stream,  # type: IO[str]
+                                   sort=True,  # type: bool
+                                   max_records_in_memory=DEFAULT_SORT_BUFFER_SIZE  # type: int  # noqa: E501
+                                   ):
+        # type: (...) -> None
+        """
+        Export Zone object to the BIND compatible format and write the result
+        to a file-like object.
+
+        Records are written as they are retrieved from the provider so the
+        whole zone is never held in memory.
+
+        If ``sort`` is True, records are sorted by id for a consistent output.
+        Zones with more than ``max_records_in_memory`` records are sorted
+        using an external merge sort (sorted runs are spilled to temporary
+        files).
+
+        :param zone: Zone to export.
+        :type  zone: :class:`Zone`
+
+        :param stream: File-like object the output is written to.
+        :type  stream: ``file``
+
+        :param sort: True to sort the records by id.
+        :type  sort: ``bool``
+
+        :param max_records_in_memory: Maximum number of records which are
+                                      buffered in memory when sorting.
+        :type  max_records_in_memory: ``int``
+        """
+        if zone.type != 'master':
+            raise ValueError('You can only generate BIND out for master zones')
+
+        date = datetime.datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        values = {'version': __version__, 'date': date}
+
+        stream.write('; Generated by Libcloud v%(version)s on %(date)s UTC\n' %
+                     values)
+        stream.write('$ORIGIN %(domain)s.\n' % {'domain': zone.domain})
+        stream.write('$TTL %(domain_ttl)s\n' % {'domain_ttl': zone.ttl})
+
+        records = self.iterate_records(zone)
+
+        if sort:
+            lines = self._sort_bind_record_lines(
+                records=records, max_records_in_memory=max_records_in_memory)
+        else:
+            lines = (self._get_bind_record_line(record=record)
+                     for record in records)
+
+        for line in lines:
+            stream.write('\n')
+            stream.write(line)
+
+    def _sort_bind_record_lines(self, records, max_records_in_memory):
+        # type: (Iterator[Record], int) -> Iterator[str]
+        """
+        Return BIND record lines for the provided records sorted by the
+        record id.
+
+        Once more than ``max_records_in_memory`` records are buffered, the
+        buffer is sorted and written to a temporary file and the resulting
+        sorted runs are lazily merged.
+        """
+        buffer = []  # type: List[Tuple[Tuple[int, Any], str]]
+        runs = []  # type: List[IO[str]]
+
+        try:
+            for record in records:
+                buffer.append((_get_sort_key(record),
+                               self._get_bind_record_line(record=record)))
+
+                if len(buffer) >= max_records_in_memory:
+                    runs.append(_write_sorted_run(buffer))
+                    buffer = []
+
+            buffer.sort(key=operator.itemgetter(0))
+
+            if not runs:
+                for _, line in buffer:
+                    yield line
+                return
+
+            runs.append(_write_sorted_run(buffer))
+            del buffer
+
+            iterators = [_read_sorted_run(run) for run in runs]
+
+            for _, line in heapq.merge(*iterators,
+                                       key=operator.itemgetter(0)):
+                yield line
+        finally:
+            for run in runs:
+                run.close()
 
     def _get_bind_record_line(self, record):
         # type: (Record) -> str
@@ -583,3 +906,46 @@ class DNSDriver(BaseDriver):
         string = string.upper()
         record_type = getattr(RecordType, string)
         return record_type
+
+
+def _get_sort_key(record):
+    # type: (Record) -> Tuple[int, Any]
+    """
+    Return a sort key for the provided record which orders the records the
+    same way as :meth:`Record._get_numeric_id`, numeric ids first.
+    """
+    record_id = record._get_numeric_id()
+
+    if isinstance(record_id, int):
+        return (0, record_id)
+
+    return (1, record_id)
+
+
+def _write_sorted_run(items):
+    # type: (List[Tuple[Tuple[int, Any], str]]) -> IO[str]
+    """
+    Sort the provided items and write them to a temporary file.
+    """
+    items.sort(key=operator.itemgetter(0))
+    fp = tempfile.TemporaryFile(mode='w+')
+
+    for (kind, key), line in items:
+        # Record lines never contain new lines and string keys are JSON
+        # encoded so they don't contain tabs
+        key = str(key) if kind == 0 else json.dumps(key)
+        fp.write('%s\t%s\t%s\n' % (kind, key, line))
+
+    fp.seek(0)
+    return fp
+
+
+def _read_sorted_run(fp):
+    # type: (IO[str]) -> Iterator[Tuple[Tuple[int, Any], str]]
+    for item in fp:
+        kind, key, line = item[:-1].split('\t', 2)
+
+        if kind == '0':
+            yield ((0, int(key)), line)
+        else:
+            yield ((1, json.loads(key)), line)
@@ -80,6 +80,21 @@ class DummyDNSDriver(DNSDriver):
         """
         return self._zones[zone.id]['records'].values()
 
+    def iterate_records(self, zone):
+        """
+        >>> driver = DummyDNSDriver('key', 'secret')
+        >>> zone = driver.create_zone(domain='apache.org', type='master',
+        ...                           ttl=100)
+        >>> record = driver.create_record(name='libcloud', zone=zone,
+        ...                               type=RecordType.A, data='127.0.0.1')
+        >>> list(driver.iterate_records(zone)) #doctest: +ELLIPSIS
+        [<Record: zone=apache.org, name=libcloud, type=A...>]
+
+        @inherits: :class:`DNSDriver.iterate_records`
+        """
+        for record in list(self.list_records(zone=zone)):
+            yield record
+
     def get_zone(self, zone_id):
         """
         >>> driver = DummyDNSDriver('key', 'secret')
@@ -138,8 +153,8 @@ class DummyDNSDriver(DNSDriver):
         if id in self._zones:
             raise ZoneAlreadyExistsError(zone_id=id, value=None, driver=self)
 
-        zone = Zone(id=id, domain=domain, type=type, ttl=ttl, extra={},
-                    driver=self)
+        zone = Zone(id=id, domain=domain, type=type, ttl=ttl,
+                    extra={'serial': 1}, driver=self)
         self._zones[id] = {'zone': zone,
                            'records': {}}
         return zone
@@ -172,8 +187,42 @@ class DummyDNSDriver(DNSDriver):
         record = Record(id=id, name=name, type=type, data=data, extra=extra,
                         zone=zone, driver=self)
         self._zones[zone.id]['records'][id] = record
+        self._increment_serial(zone=zone)
         return record
 
+    def update_record(self, record, name=None, type=None, data=None,
+                      extra=None):
+        """
+        >>> driver = DummyDNSDriver('key', 'secret')
+        >>> zone = driver.create_zone(domain='apache.org', type='master',
+        ...                           ttl=100)
+        >>> record = driver.create_record(name='libcloud', zone=zone,
+        ...                               type=RecordType.A, data='127.0.0.1')
+        >>> record = driver.update_record(record=record, data='127.0.0.2')
+        >>> record #doctest: +ELLIPSIS
+        <Record: zone=apache.org, name=libcloud, type=A, data=127.0.0.2...>
+
+        @inherits: :class:`DNSDriver.update_record`
+        """
+        self.get_record(zone_id=record.zone.id, record_id=record.id)
+
+        name = record.name if name is None else name
+        id = 'id-%s' % (name)
+        zone_records = self._zones[record.zone.id]['records']
+
+        if id != record.id and id in zone_records:
+            raise RecordAlreadyExistsError(record_id=id, value=None,
+                                           driver=self)
+
+        del zone_records[record.id]
+        updated = Record(id=id, name=name, type=type or record.type,
+                         data=record.data if data is None else data,
+                         extra=record.extra if extra is None else extra,
+                         zone=record.zone, driver=self)
+        zone_records[id] = updated
+        self._increment_serial(zone=record.zone)
+        return updated
+
     def delete_zone(self, zone):
         """
         >>> driver = DummyDNSDriver('key', 'secret')
@@ -210,8 +259,13 @@ class DummyDNSDriver(DNSDriver):
         self.get_record(zone_id=record.zone.id, record_id=record.id)
 
         del self._zones[record.zone.id]['records'][record.id]
+        self._increment_serial(zone=record.zone)
         return True
 
+    def _increment_serial(self, zone):
+        zone = self._zones[zone.id]['zone']
+        zone.extra['serial'] = zone.extra.get('serial', 0) + 1
+
 
 if __name__ == "__main__":
     import doctest
@@ -30,10 +30,12 @@ from libcloud.utils.py3 import ET
 from libcloud.utils.py3 import b, urlencode
 
 from libcloud.utils.xml import findtext, findall, fixxpath
-from libcloud.dns.types import Provider, RecordType
+from libcloud.dns.types import Provider, RecordType, RecordChangeAction
 from libcloud.dns.types import ZoneDoesNotExistError, RecordDoesNotExistError
-from libcloud.dns.base import DNSDriver, Zone, Record
+from libcloud.dns.base import DNSDriver, Zone, Record, RecordChange
 from libcloud.common.types import LibcloudError
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import TaskResult, run_in_parallel
 from libcloud.common.aws import AWSGenericResponse, AWSTokenConnection
 from libcloud.common.base import ConnectionUserAndKey
 
@@ -44,6 +46,10 @@ API_ROOT = '/%s/' % (API_VERSION)
 
 NAMESPACE = 'https://%s/doc%s' % (API_HOST, API_ROOT)
 
+# Maximum number of changes (ResourceRecord elements) in a single
+# ChangeResourceRecordSets request
+MAX_CHANGES_PER_BATCH = 1000
+
 
 class InvalidChangeBatch(LibcloudError):
     pass
@@ -188,14 +194,10 @@ class Route53DNSDriver(DNSDriver):
         return response.status in [httplib.OK]
 
     def create_record(self, name, zone, type, data, extra=None):
-        if type in (RecordType.TXT, RecordType.SPF):
-            data = self._quote_data(data)
-        extra = extra or {}
-        batch = [('CREATE', name, type, data, extra)]
-        self._post_changeset(zone, batch)
-        id = ':'.join((self.RECORD_TYPE_MAP[type], name))
-        return Record(id=id, name=name, type=type, data=data, zone=zone,
-                      driver=self, ttl=extra.get('ttl', None), extra=extra)
+        change = RecordChange.create(name=name, type=type, data=data,
+                                     extra=extra)
+        self._post_changeset(zone, self._to_changeset_entries(change))
+        return self._to_change_result(zone=zone, change=change)
 
     def update_record(self, record, name=None, type=None, data=None,
                       extra=None):
@@ -234,6 +236,59 @@ class Route53DNSDriver(DNSDriver):
                                           record_id=r.id)
         return True
 
+    def ex_apply_changes(self, zone, changes,
+                         max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Apply multiple record changes to the provided zone.
+
+        Changes are coalesced into ``ChangeResourceRecordSets`` requests with
+        at most 1000 changes each. Every request is atomic so if it fails,
+        all the changes which are part of it are reported as failed.
+
+        Updates of multi value records can't be expressed as a simple change
+        pair and are applied one by one using ``update_record``.
+
+        @inherits: :class:`DNSDriver.ex_apply_changes`
+        """
+        results = [None] * len(changes)
+        batch = []
+        batch_size = 0
+        single = []
+
+        for index, change in enumerate(changes):
+            if self._is_multi_value_update(change):
+                single.append((index, change))
+                continue
+
+            entries = self._to_changeset_entries(change)
+
+            if batch and batch_size + len(entries) > MAX_CHANGES_PER_BATCH:
+                self._apply_changes_batch(zone, batch, results)
+                batch = []
+                batch_size = 0
+
+            batch.append((index, change, entries))
+            batch_size += len(entries)
+
+        if batch:
+            self._apply_changes_batch(zone, batch, results)
+
+        if single:
+            def apply_change(driver, item):
+                return driver._apply_record_change(zone=zone, change=item[1])
+
+            single_results = run_in_parallel(driver=self, func=apply_change,
+                                             items=single,
+                                             max_workers=max_workers)
+
+            for item_result in single_results:
+                index, change = item_result.item
+                results[index] = TaskResult(item=change,
+                                            result=item_result.result,
+                                            error=item_result.error)
+
+        return results
+
     def ex_create_multi_value_record(self, name, zone, type, data, extra=None):
         """
         Create a record with multiple values with a single call.
@@ -371,6 +426,76 @@ class Route53DNSDriver(DNSDriver):
 
         return response.status == httplib.OK
 
+    def _apply_changes_batch(self, zone, batch, results):
+        entries = []
+
+        for _, _, change_entries in batch:
+            entries.extend(change_entries)
+
+        try:
+            self._post_changeset(zone, entries)
+        except Exception as e:
+            for index, change, _ in batch:
+                results[index] = TaskResult(item=change, error=e)
+        else:
+            for index, change, _ in batch:
+                result = self._to_change_result(zone=zone, change=change)
+                results[index] = TaskResult(item=change, result=result)
+
+    def _is_multi_value_update(self, change):
+        if change.action != RecordChangeAction.UPDATE:
+            return False
+
+        extra = change.record.extra
+        return bool(extra.get('_multi_value', False) and
+                    extra.get('_other_records', []))
+
+    def _get_change_data(self, change):
+        data = change.data
+
+        if change.action == RecordChangeAction.CREATE and \
+                change.type in (RecordType.TXT, RecordType.SPF):
+            data = self._quote_data(data)
+
+        return data
+
+    def _to_changeset_entries(self, change):
+        """
+        Convert a RecordChange to a list of entries which are passed to
+        _post_changeset.
+        """
+        record = change.record
+
+        if change.action == RecordChangeAction.DELETE:
+            return [('DELETE', record.name, record.type, record.data,
+                     record.extra)]
+
+        data = self._get_change_data(change)
+
+        if change.action == RecordChangeAction.CREATE:
+            return [('CREATE', change.name, change.type, data,
+                     change.extra or {})]
+
+        extra = change.extra or record.extra
+        return [
+            ('DELETE', record.name, record.type, record.data, record.extra),
+            ('CREATE', change.name, change.type, data, extra)
+        ]
+
+    def _to_change_result(self, zone, change):
+        if change.action == RecordChangeAction.DELETE:
+            return True
+
+        if change.action == RecordChangeAction.CREATE:
+            extra = change.extra or {}
+        else:
+            extra = change.extra or change.record.extra
+
+        id = ':'.join((self.RECORD_TYPE_MAP[change.type], change.name))
+        return Record(id=id, name=change.name, type=change.type,
+                      data=self._get_change_data(change), zone=zone,
+                      driver=self, ttl=extra.get('ttl', None), extra=extra)
+
     def _post_changeset(self, zone, changes_list):
         attrs = {'xmlns': NAMESPACE}
         changeset = ET.Element('ChangeResourceRecordSetsRequest', attrs)
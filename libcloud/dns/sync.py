@@ -0,0 +1,534 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module which reconciles the records of a zone with a desired record set.
+
+The current zone state is indexed by (name, type), diffed against the desired
+records and the resulting minimal set of changes is applied using
+:meth:`libcloud.dns.base.DNSDriver.ex_apply_changes`. Drivers with native
+batching receive all the ordered changes at once, other drivers apply them in
+three sequential phases (deletes, updates and creates).
+"""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import hashlib
+from collections import OrderedDict
+
+from libcloud.dns.base import DNSDriver, Record, RecordChange, Zone
+from libcloud.dns.types import RecordType
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+
+__all__ = [
+    'DEFAULT_IGNORED_TYPES',
+
+    'ZoneIndex',
+    'ZoneDiff',
+    'ZoneSyncResult',
+    'ZoneSyncer',
+
+    'diff_zone',
+    'get_zone_serial'
+]
+
+# Record types which are managed by the provider and are ignored by default
+DEFAULT_IGNORED_TYPES = [RecordType.SOA, RecordType.NS]  # type: List[str]
+
+# Record types which data contains a host name
+HOSTNAME_RECORD_TYPES = [RecordType.CNAME, RecordType.DNAME, RecordType.MX,
+                         RecordType.NS, RecordType.PTR, RecordType.SRV]
+
+
+def get_zone_serial(zone):
+    # type: (Zone) -> Optional[Any]
+    """
+    Return a value which changes each time the zone is modified (zone serial
+    or ETag) or None if the driver doesn't expose such value.
+
+    :param zone: Zone to retrieve the state for.
+    :type zone: :class:`Zone`
+    """
+    for key in ['serial', 'etag']:
+        value = zone.extra.get(key, None)
+
+        if value is not None:
+            return value
+
+    return None
+
+
+def _normalize_name(name):
+    # type: (Optional[str]) -> str
+    return (name or '').rstrip('.').lower()
+
+
+def _normalize_data(type, data):
+    # type: (str, Optional[str]) -> str
+    data = data or ''
+
+    if type in HOSTNAME_RECORD_TYPES:
+        return data.rstrip('.').lower()
+
+    if type in [RecordType.TXT, RecordType.SPF] and len(data) >= 2 and \
+            data[0] == '"' and data[-1] == '"':
+        return data[1:-1].replace('\\"', '"')
+
+    return data
+
+
+def _get_ttl(record):
+    # type: (Record) -> Optional[int]
+    ttl = record.ttl if record.ttl is not None else record.extra.get('ttl')
+    return int(ttl) if ttl is not None else None
+
+
+class ZoneIndex(object):
+    """
+    Indexed view of the zone records keyed by (name, type).
+
+    Names are compared case-insensitive and without a trailing dot.
+    """
+
+    def __init__(self, records=None):
+        # type: (Optional[Iterable[Record]]) -> None
+        self._records = OrderedDict()  # type: Dict[Tuple[str, str], List[Record]]  # noqa: E501
+
+        for record in records or []:
+            self.add(record)
+
+    @classmethod
+    def from_zone(cls, zone):
+        # type: (Zone) -> ZoneIndex
+        """
+        Build an index of all the records in the provided zone.
+
+        :param zone: Zone to index.
+        :type zone: :class:`Zone`
+        """
+        return cls(zone.driver.iterate_records(zone))
+
+    def add(self, record):
+        # type: (Record) -> None
+        key = (_normalize_name(record.name), record.type)
+        self._records.setdefault(key, []).append(record)
+
+    def get(self, name, type):
+        # type: (str, str) -> List[Record]
+        """
+        Return all the records with the provided name and type.
+        """
+        return self._records.get((_normalize_name(name), type), [])
+
+    def keys(self):
+        # type: () -> List[Tuple[str, str]]
+        return list(self._records.keys())
+
+    def __contains__(self, key):
+        # type: (Tuple[str, str]) -> bool
+        name, type = key
+        return (_normalize_name(name), type) in self._records
+
+    def __iter__(self):
+        for records in self._records.values():
+            for record in records:
+                yield record
+
+    def __len__(self):
+        # type: () -> int
+        return sum(len(records) for records in self._records.values())
+
+
+class ZoneDiff(object):
+    """
+    Minimal set of changes which turns the current zone records into the
+    desired ones.
+    """
+
+    def __init__(self, creates=None, updates=None, deletes=None):
+        # type: (Optional[List[RecordChange]], Optional[List[RecordChange]], Optional[List[RecordChange]]) -> None  # noqa: E501
+        self.creates = creates or []
+        self.updates = updates or []
+        self.deletes = deletes or []
+
+    @property
+    def changes(self):
+        # type: () -> List[RecordChange]
+        """
+        All the changes in the order in which the phases are applied.
+        """
+        return self.deletes + self.updates + self.creates
+
+    @property
+    def phases(self):
+        # type: () -> List[List[RecordChange]]
+        """
+        Changes split into the phases which are applied one after another.
+        Deletes are applied first so that records which conflict with the new
+        ones (e.g. CNAME) are removed before those are created.
+        """
+        return [self.deletes, self.updates, self.creates]
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+    def __bool__(self):
+        # type: () -> bool
+        return len(self) > 0
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        # type: () -> str
+        return ('<ZoneDiff: creates=%s, updates=%s, deletes=%s>' %
+                (len(self.creates), len(self.updates), len(self.deletes)))
+
+
+def _matches(current, desired):
+    # type: (Record, Record) -> bool
+    """
+    Return True if the current record doesn't need to be updated to match
+    the desired one.
+
+    Only the attributes which are specified on the desired record (TTL and
+    priority) are compared.
+    """
+    desired_ttl = _get_ttl(desired)
+
+    if desired_ttl is not None and desired_ttl != _get_ttl(current):
+        return False
+
+    if 'priority' in desired.extra and \
+            str(desired.extra['priority']) != \
+            str(current.extra.get('priority', None)):
+        return False
+
+    return True
+
+
+def diff_zone(current, desired, ignored_types=None):
+    # type: (ZoneIndex, Iterable[Record], Optional[List[str]]) -> ZoneDiff
+    """
+    Compute the minimal set of changes between the current zone records and
+    the desired records.
+
+    Records with the same (name, type) are first matched by data. Remaining
+    records are paired into updates, leftover desired records become creates
+    and leftover current records become deletes.
+
+    :param current: Index of the current zone records.
+    :type current: :class:`ZoneIndex`
+
+    :param desired: Desired records. Only ``name``, ``type``, ``data``,
+                    ``ttl`` and ``extra`` attributes are used.
+    :type desired: ``iterable`` of :class:`Record`
+
+    :param ignored_types: Record types which are never changed.
+    :type ignored_types: ``list`` of ``str``
+
+    :rtype: :class:`ZoneDiff`
+    """
+    ignored = DEFAULT_IGNORED_TYPES if ignored_types is None \
+        else ignored_types
+
+    desired_index = ZoneIndex(record for record in desired
+                              if record.type not in ignored)
+    diff = ZoneDiff()
+
+    keys = desired_index.keys()
+    keys += [key for key in current.keys() if key not in desired_index]
+
+    for name, type in keys:
+        if type in ignored:
+            continue
+
+        remaining = list(current.get(name, type))
+        unmatched = []
+
+        for record in desired_index.get(name, type):
+            data = _normalize_data(type, record.data)
+
+            for existing in remaining:
+                if _normalize_data(type, existing.data) == data:
+                    break
+            else:
+                existing = None
+
+            if existing is None:
+                unmatched.append(record)
+                continue
+
+            remaining.remove(existing)
+
+            if not _matches(existing, record):
+                diff.updates.append(_to_update(existing, record))
+
+        for existing, record in zip(remaining, unmatched):
+            diff.updates.append(_to_update(existing, record))
+
+        for record in unmatched[len(remaining):]:
+            diff.creates.append(RecordChange.create(
+                name=record.name, type=record.type, data=record.data,
+                extra=_get_extra(record)))
+
+        for existing in remaining[len(unmatched):]:
+            diff.deletes.append(RecordChange.delete(record=existing))
+
+    return diff
+
+
+def _get_extra(record):
+    # type: (Record) -> Optional[dict]
+    extra = dict(record.extra)
+
+    if record.ttl is not None:
+        extra['ttl'] = record.ttl
+
+    return extra or None
+
+
+def _to_update(existing, record):
+    # type: (Record, Record) -> RecordChange
+    extra = _get_extra(record)
+
+    if extra is not None:
+        extra = dict(existing.extra, **extra)
+
+    return RecordChange.update(record=existing, name=existing.name,
+                               type=record.type, data=record.data,
+                               extra=extra)
+
+
+class ZoneSyncResult(object):
+    """
+    Result of a single zone sync.
+    """
+
+    def __init__(self, zone, diff=None, results=None, skipped=False):
+        """
+        :param zone: Synchronized zone.
+        :type zone: :class:`Zone`
+
+        :param diff: Computed diff (None if the sync has been skipped).
+        :type diff: :class:`ZoneDiff`
+
+        :param results: Per change results.
+        :type results: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
+
+        :param skipped: True if the zone hasn't changed since the last sync
+                        and it has been skipped.
+        :type skipped: ``bool``
+        """
+        self.zone = zone
+        self.diff = diff
+        self.results = results or []
+        self.skipped = skipped
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return all(result.success for result in self.results)
+
+    @property
+    def errors(self):
+        return [result for result in self.results if not result.success]
+
+    def __repr__(self):
+        return ('<ZoneSyncResult: zone=%s, skipped=%s, diff=%s, success=%s>' %
+                (self.zone.domain, self.skipped, self.diff, self.success))
+
+
+class ZoneSyncer(object):
+    """
+    Reconciles zone records with a desired record set.
+
+    >>> from libcloud.dns.drivers.dummy import DummyDNSDriver
+    >>> driver = DummyDNSDriver('key', 'secret')
+    >>> zone = driver.create_zone(domain='example.com')
+    >>> desired = [Record(id=None, name='www', type=RecordType.A,
+    ...                   data='127.0.0.1', zone=zone, driver=driver)]
+    >>> syncer = ZoneSyncer(driver=driver)
+    >>> syncer.sync(zone=zone, desired=desired).diff
+    <ZoneDiff: creates=1, updates=0, deletes=0>
+    >>> syncer.sync(zone=zone, desired=desired).skipped
+    True
+    """
+
+    def __init__(self,
+                 driver,  # type: Any
+                 state_cache=None,  # type: Optional[Dict[Any, Any]]
+                 state_func=get_zone_serial,  # type: Optional[Callable[[Zone], Any]]  # noqa: E501
+                 ignored_types=None,  # type: Optional[List[str]]
+                 max_workers=DEFAULT_MAX_WORKERS  # type: int
+                 ):
+        """
+        :param driver: DNS driver instance.
+        :type driver: :class:`libcloud.dns.base.DNSDriver`
+
+        :param state_cache: Dictionary like object where the last seen zone
+                            states are stored (e.g. a ``shelve`` instance for
+                            persistence across runs). Defaults to an
+                            in-memory ``dict``.
+        :type state_cache: ``dict``
+
+        :param state_func: Function which returns a value which changes each
+                           time the zone is modified (e.g. serial or ETag).
+                           Zones are never skipped if it returns None. Pass
+                           None to disable skipping.
+        :type state_func: ``callable``
+
+        :param ignored_types: Record types which are never changed. Defaults
+                              to :data:`DEFAULT_IGNORED_TYPES`.
+        :type ignored_types: ``list`` of ``str``
+
+        :param max_workers: Maximum number of concurrent changes within a
+                            phase (deletes, updates, creates) for drivers
+                            without native batching.
+        :type max_workers: ``int``
+        """
+        self.driver = driver
+        self.state_cache = state_cache if state_cache is not None else {}
+        self.state_func = state_func
+        self.ignored_types = ignored_types
+        self.max_workers = max_workers
+
+    def diff(self, zone, desired):
+        # type: (Zone, Iterable[Record]) -> ZoneDiff
+        """
+        Compute the diff between the current zone records and the desired
+        records.
+        """
+        return diff_zone(current=ZoneIndex.from_zone(zone), desired=desired,
+                         ignored_types=self.ignored_types)
+
+    def sync(self, zone, desired, dry_run=False):
+        # type: (Zone, Iterable[Record], bool) -> ZoneSyncResult
+        """
+        Bring the zone records in sync with the desired records.
+
+        If the zone state (serial / ETag) and the desired records haven't
+        changed since the last successful sync, the zone is not listed at all
+        and the sync is skipped.
+
+        :param zone: Zone to synchronize.
+        :type zone: :class:`Zone`
+
+        :param desired: Desired records.
+        :type desired: ``iterable`` of :class:`Record`
+
+        :param dry_run: Only compute the diff, don't apply it.
+        :type dry_run: ``bool``
+
+        :rtype: :class:`ZoneSyncResult`
+        """
+        desired = list(desired)
+        cache_key = self._get_cache_key(zone=zone)
+        state = self._get_state(zone=zone, desired=desired)
+
+        if state is not None and self.state_cache.get(cache_key) == state:
+            return ZoneSyncResult(zone=zone, skipped=True)
+
+        diff = self.diff(zone=zone, desired=desired)
+
+        if dry_run:
+            return ZoneSyncResult(zone=zone, diff=diff)
+
+        results = []  # type: List[Any]
+
+        if self._supports_native_batching():
+            # Ordered changes are submitted together so the driver can apply
+            # them atomically (e.g. a single Route53 change batch)
+            if diff.changes:
+                results = self.driver.ex_apply_changes(
+                    zone=zone, changes=diff.changes,
+                    max_workers=self.max_workers)
+        else:
+            # Changes are only applied concurrently within a phase
+            for changes in diff.phases:
+                if changes:
+                    results.extend(self.driver.ex_apply_changes(
+                        zone=zone, changes=changes,
+                        max_workers=self.max_workers))
+
+        result = ZoneSyncResult(zone=zone, diff=diff, results=results)
+
+        if result.success:
+            if diff and state is not None:
+                # Applied changes modified the zone state
+                zone = self.driver.get_zone(zone_id=zone.id)
+                state = self._get_state(zone=zone, desired=desired)
+
+            if state is not None:
+                self.state_cache[cache_key] = state
+        else:
+            self.state_cache.pop(cache_key, None)
+
+        return result
+
+    def invalidate(self, zone=None):
+        # type: (Optional[Zone]) -> None
+        """
+        Remove the cached state for the provided zone (or all the zones) so
+        the next sync doesn't get skipped.
+        """
+        if zone is None:
+            self.state_cache.clear()
+        else:
+            self.state_cache.pop(self._get_cache_key(zone=zone), None)
+
+    def _supports_native_batching(self):
+        # type: () -> bool
+        """
+        Return True if the driver overrides the default (concurrent)
+        ``ex_apply_changes`` implementation with a native batch API.
+        """
+        apply_changes = getattr(type(self.driver), 'ex_apply_changes', None)
+        return apply_changes is not DNSDriver.ex_apply_changes
+
+    def _get_cache_key(self, zone):
+        # type: (Zone) -> str
+        driver_type = getattr(self.driver, 'type', None) or \
+            self.driver.__class__.__name__
+        return '%s:%s' % (driver_type, zone.id)
+
+    def _get_state(self, zone, desired):
+        # type: (Zone, List[Record]) -> Optional[Tuple[Any, str]]
+        if self.state_func is None:
+            return None
+
+        zone_state = self.state_func(zone)
+
+        if zone_state is None:
+            return None
+
+        return (zone_state, self._get_fingerprint(desired))
+
+    def _get_fingerprint(self, desired):
+        # type: (List[Record]) -> str
+        """
+        Return a fingerprint of the desired record set.
+        """
+        items = sorted('%s\t%s\t%s\t%s\t%s' % (
+            _normalize_name(record.name), record.type,
+            _normalize_data(record.type, record.data), _get_ttl(record),
+            sorted((record.extra or {}).items())) for record in desired)
+        return hashlib.sha1('\n'.join(items).encode('utf-8')).hexdigest()
@@ -18,6 +18,7 @@ from libcloud.common.types import LibcloudError
 __all__ = [
     'Provider',
     'RecordType',
+    'RecordChangeAction',
     'ZoneError',
     'ZoneDoesNotExistError',
     'ZoneAlreadyExistsError',
@@ -114,6 +115,15 @@ class RecordType(object):
     CAA = 'CAA'
 
 
+class RecordChangeAction(object):
+    """
+    Action performed by a single record change in a batch.
+    """
+    CREATE = 'CREATE'
+    UPDATE = 'UPDATE'
+    DELETE = 'DELETE'
+
+
 class ZoneError(LibcloudError):
     error_type = 'ZoneError'
     kwargs = ('zone_id', )
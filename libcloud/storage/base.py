@@ -21,6 +21,7 @@ Provides base classes for working with storage
 from __future__ import with_statement
 
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
@@ -34,8 +35,15 @@ from os.path import join as pjoin
 
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import b
+from libcloud.utils.py3 import basestring
 
 import libcloud.utils.files
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import TaskResult
+from libcloud.utils.parallel import chunks
+from libcloud.utils.parallel import run_in_parallel
+from libcloud.utils.misc import intern_string
+from libcloud.utils.misc import intern_values
 from libcloud.common.types import LibcloudError
 from libcloud.common.base import Connection
 from libcloud.common.base import ConnectionUserAndKey, BaseDriver
@@ -98,8 +106,8 @@ class Object(object):
         self.size = size
         self.hash = hash
         self.container = container
-        self.extra = extra or {}
-        self.meta_data = meta_data or {}
+        self.extra = intern_values(extra or {})
+        self.meta_data = intern_values(meta_data or {})
         self.driver = driver
 
     def get_cdn_url(self):
@@ -174,8 +182,8 @@ class Container(object):
         :type driver: :class:`libcloud.storage.base.StorageDriver`
         """
 
-        self.name = name
-        self.extra = extra or {}
+        self.name = intern_string(name)
+        self.extra = intern_values(extra or {})
         self.driver = driver
 
     def iterate_objects(self, prefix=None, ex_prefix=None):
@@ -271,6 +279,14 @@ class StorageDriver(BaseDriver):
     hash_type = 'md5'  # type: str
     supports_chunked_encoding = False  # type: bool
 
+    # True if the object ``hash`` attribute contains a digest (``hash_type``)
+    # of the object content and not an opaque value such as a generic ETag
+    hash_is_content_digest = False  # type: bool
+
+    # True if objects are listed ordered by name (lexicographically by code
+    # point which is the same as ordering by UTF-8 encoded bytes)
+    supports_sorted_listing = False  # type: bool
+
     # When strict mode is used, exception will be thrown if no content type is
     # provided and none can be detected when uploading an object
     strict_mode = False  # type: bool
@@ -646,6 +662,117 @@ class StorageDriver(BaseDriver):
         raise NotImplementedError(
             'delete_object not implemented for this driver')
 
+    def delete_objects(self, objects, max_workers=DEFAULT_MAX_WORKERS):
+        # type: (Iterable[Object], int) -> List[TaskResult]
+        """
+        Delete multiple objects.
+
+        Drivers which support a native bulk delete API delete many objects
+        with a single request, other drivers delete the objects concurrently.
+
+        Objects which don't exist are considered deleted.
+
+        :param objects: Objects to delete.
+        :type objects: ``iterable`` of :class:`libcloud.storage.base.Object`
+
+        :param max_workers: Maximum number of concurrent requests.
+        :type max_workers: ``int``
+
+        :return: Result for each of the objects in the same order as the
+                 provided objects. ``error`` attribute of a failed result
+                 contains the exception.
+        :rtype: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
+        """
+        def delete_object(driver, obj):
+            return driver._bulk_delete_object(obj=obj)
+
+        return run_in_parallel(self, delete_object, objects,
+                               max_workers=max_workers)
+
+    def copy_object(self, obj, destination_container, destination_name=None):
+        # type: (Object, Container, Optional[str]) -> Object
+        """
+        Copy an object.
+
+        Drivers which support it copy the object on the server side. If the
+        destination container belongs to a different provider (or account)
+        or if the driver doesn't support server side copy, object data is
+        streamed from the source to the destination.
+
+        Note: When copying an object using a stream and the destination
+        driver doesn't support chunked transfer encoding, the whole object
+        will be buffered in memory.
+
+        :param obj: Object instance to copy.
+        :type obj: :class:`libcloud.storage.base.Object`
+
+        :param destination_container: Destination container. It can belong
+                                      to a different driver.
+        :type destination_container: :class:`libcloud.storage.base.Container`
+
+        :param destination_name: (optional) Destination object name. Defaults
+                                 to the source object name.
+        :type destination_name: ``str``
+
+        :return: Destination object.
+        :rtype: :class:`libcloud.storage.base.Object`
+        """
+        destination_name = destination_name or obj.name
+        return self._copy_object_via_stream(
+            obj=obj, destination_container=destination_container,
+            destination_name=destination_name)
+
+    def move_object(self, obj, destination_container, destination_name=None):
+        # type: (Object, Container, Optional[str]) -> Object
+        """
+        Move an object to a different container and / or name.
+
+        Object is first copied using :meth:`copy_object` and the source
+        object is deleted once the copy succeeds.
+
+        :param obj: Object instance to move.
+        :type obj: :class:`libcloud.storage.base.Object`
+
+        :param destination_container: Destination container.
+        :type destination_container: :class:`libcloud.storage.base.Container`
+
+        :param destination_name: (optional) Destination object name. Defaults
+                                 to the source object name.
+        :type destination_name: ``str``
+
+        :return: Destination object.
+        :rtype: :class:`libcloud.storage.base.Object`
+        """
+        destination_name = destination_name or obj.name
+
+        if (self._supports_server_side_copy(destination_container) and
+                obj.container.name == destination_container.name and
+                obj.name == destination_name):
+            raise ValueError('Source and destination object are the same')
+
+        destination_obj = self.copy_object(
+            obj=obj, destination_container=destination_container,
+            destination_name=destination_name)
+        self.delete_object(obj=obj)
+        return destination_obj
+
+    def rename_object(self, obj, new_name):
+        # type: (Object, str) -> Object
+        """
+        Rename an object inside the same container.
+
+        :param obj: Object instance to rename.
+        :type obj: :class:`libcloud.storage.base.Object`
+
+        :param new_name: New object name.
+        :type new_name: ``str``
+
+        :return: Renamed object.
+        :rtype: :class:`libcloud.storage.base.Object`
+        """
+        return self.move_object(obj=obj, destination_container=obj.container,
+                                destination_name=new_name)
+
     def create_container(self, container_name):
         # type: (str) -> Container
         """
@@ -674,6 +801,98 @@ class StorageDriver(BaseDriver):
         raise NotImplementedError(
             'delete_container not implemented for this driver')
 
+    def _bulk_delete_object(self, obj):
+        # type: (Object) -> bool
+        """
+        Delete a single object as part of the :meth:`delete_objects` call.
+        """
+        try:
+            result = self.delete_object(obj=obj)
+        except ObjectDoesNotExistError:
+            return True
+
+        if not result:
+            raise LibcloudError('Failed to delete object "%s"' % (obj.name),
+                                driver=self)
+
+        return True
+
+    def _delete_objects_in_batches(self, objects, batch_size,
+                                   max_workers=DEFAULT_MAX_WORKERS):
+        # type: (Iterable[Object], int, int) -> List[TaskResult]
+        """
+        Delete objects using a native bulk delete API.
+
+        Objects are grouped by container into batches of up to
+        ``batch_size`` objects which are passed to the
+        ``_delete_objects_batch`` method. Batches are deleted concurrently.
+
+        ``_delete_objects_batch`` method needs to return a list with an
+        exception (or ``None`` on success) for each object in the batch. If it
+        raises, deletion of all the objects in the batch is considered failed.
+        """
+        results = [TaskResult(item=obj) for obj in objects]
+        containers = {}  # type: Dict[str, List[TaskResult]]
+
+        for result in results:
+            containers.setdefault(result.item.container.name, []).append(
+                result)
+
+        batches = []
+        for container_results in containers.values():
+            batches.extend(chunks(container_results, batch_size))
+
+        def delete_batch(driver, batch):
+            return driver._delete_objects_batch(
+                objects=[result.item for result in batch])
+
+        batch_results = run_in_parallel(self, delete_batch, batches,
+                                        max_workers=max_workers)
+
+        for batch_result in batch_results:
+            errors = batch_result.result or ([batch_result.error] *
+                                             len(batch_result.item))
+
+            for result, error in zip(batch_result.item, errors):
+                result.result = error is None
+                result.error = error
+
+        return results
+
+    def _supports_server_side_copy(self, destination_container):
+        # type: (Container) -> bool
+        """
+        Return True if the destination container belongs to the same
+        provider and account as this driver which means an object can be
+        copied on the server side.
+        """
+        driver = destination_container.driver
+        return driver is self or (driver.__class__ is self.__class__ and
+                                  driver.key == self.key)
+
+    def _copy_object_via_stream(self, obj, destination_container,
+                                destination_name):
+        # type: (Object, Container, str) -> Object
+        """
+        Copy an object by streaming its content from the source driver to
+        the destination driver.
+        """
+        extra = {'content_type': obj.extra.get('content_type', None)}
+
+        # Skip values which can't be stored as object meta data (e.g. owner
+        # information returned as part of the object listing by some drivers)
+        meta_data = dict((key, value) for key, value in
+                         (obj.meta_data or {}).items()
+                         if isinstance(value, basestring))
+        if meta_data:
+            extra['meta_data'] = meta_data
+
+        stream = self.download_object_as_stream(obj=obj)
+        driver = destination_container.driver
+        return driver.upload_object_via_stream(
+            iterator=stream, container=destination_container,
+            object_name=destination_name, extra=extra)
+
     def _get_object(self, obj, callback, callback_kwargs, response,
                     success_status_code=None):
         """
@@ -15,10 +15,12 @@
 
 from __future__ import with_statement
 
+import re
 import base64
 import hashlib
 import hmac
 import os
+import time
 import binascii
 from datetime import datetime, timedelta
 
@@ -28,11 +30,14 @@ from libcloud.utils.py3 import urlencode
 from libcloud.utils.py3 import urlquote
 from libcloud.utils.py3 import tostring
 from libcloud.utils.py3 import b
+from libcloud.utils.py3 import ensure_string
 
 from libcloud.utils.xml import fixxpath
 from libcloud.utils.files import read_in_chunks
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
 from libcloud.common.types import LibcloudError
 from libcloud.common.azure import AzureConnection
+from libcloud.common.azure import AZURE_TIME_FORMAT
 
 from libcloud.storage.base import Object, Container, StorageDriver
 from libcloud.storage.types import ContainerIsNotEmptyError
@@ -67,6 +72,15 @@ AZURE_LEASE_PERIOD = int(
     os.getenv('LIBCLOUD_AZURE_LEASE_PERIOD_SECONDS', '60')
 )
 
+# Maximum number of sub-requests in a single blob batch request
+AZURE_MAX_BATCH_REQUESTS = 256
+
+# How often (in seconds) to check the status of a pending blob copy
+AZURE_COPY_POLL_INTERVAL = 1
+
+# How long (in seconds) to wait for a pending blob copy to finish
+AZURE_COPY_TIMEOUT = 600
+
 AZURE_STORAGE_HOST_SUFFIX = 'blob.core.windows.net'
 AZURE_STORAGE_HOST_SUFFIX_CHINA = 'blob.core.chinacloudapi.cn'
 AZURE_STORAGE_HOST_SUFFIX_GOVERNMENT = 'blob.core.usgovcloudapi.net'
@@ -207,6 +221,7 @@ class AzureBlobsStorageDriver(StorageDriver):
     connectionCls = AzureBlobsConnection
     hash_type = 'md5'
     supports_chunked_encoding = False
+    supports_sorted_listing = True
 
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  **kwargs):
@@ -955,6 +970,174 @@ class AzureBlobsStorageDriver(StorageDriver):
 
         return False
 
+    def copy_object(self, obj, destination_container, destination_name=None,
+                    ex_timeout=AZURE_COPY_TIMEOUT):
+        """
+        @inherits: :class:`StorageDriver.copy_object`
+
+        Objects are copied on the server side using Copy Blob request.
+
+        :param ex_timeout: How long (in seconds) to wait for an asynchronous
+                           blob copy to finish.
+        :type ex_timeout: ``int``
+        """
+        destination_name = destination_name or obj.name
+
+        if not self._supports_server_side_copy(destination_container):
+            return super(AzureBlobsStorageDriver, self).copy_object(
+                obj=obj, destination_container=destination_container,
+                destination_name=destination_name)
+
+        source_path = self._get_object_path(obj.container, obj.name)
+        source_url = '{scheme}://{host}:{port}{action}'.format(
+            scheme='https' if self.secure else 'http',
+            host=self.connection.host,
+            port=self.connection.port,
+            action=self.connection.morph_action_hook(source_path))
+
+        object_path = self._get_object_path(destination_container,
+                                            destination_name)
+        headers = {'x-ms-copy-source': source_url, 'Content-Length': '0'}
+        response = self.connection.request(object_path, method='PUT',
+                                           headers=headers)
+
+        if response.status == httplib.NOT_FOUND:
+            raise ObjectDoesNotExistError(value=None, driver=self,
+                                          object_name=obj.name)
+        elif response.status != httplib.ACCEPTED:
+            raise LibcloudError('Unexpected status code, status_code=%s' %
+                                (response.status), driver=self)
+
+        copy_status = response.headers.get('x-ms-copy-status', 'success')
+        timeout = time.time() + ex_timeout
+
+        while copy_status == 'pending':
+            if time.time() >= timeout:
+                raise LibcloudError('Timed out waiting for object "%s" copy '
+                                    'to finish' % (obj.name), driver=self)
+
+            time.sleep(AZURE_COPY_POLL_INTERVAL)
+            response = self.connection.request(object_path, method='HEAD')
+            copy_status = response.headers.get('x-ms-copy-status', 'success')
+
+        if copy_status != 'success':
+            raise LibcloudError('Failed to copy object "%s": %s %s' %
+                                (obj.name, copy_status,
+                                 response.headers.get(
+                                     'x-ms-copy-status-description', '')),
+                                driver=self)
+
+        # Copy Blob response doesn't include blob properties
+        if response.status != httplib.OK:
+            response = self.connection.request(object_path, method='HEAD')
+
+        return self._response_to_object(destination_name,
+                                        destination_container, response)
+
+    def delete_objects(self, objects, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        @inherits: :class:`StorageDriver.delete_objects`
+
+        Objects are deleted using blob batch requests with up to 256 objects
+        each.
+        """
+        return self._delete_objects_in_batches(
+            objects=objects, batch_size=AZURE_MAX_BATCH_REQUESTS,
+            max_workers=max_workers)
+
+    def _delete_objects_batch(self, objects):
+        """
+        Delete objects using a single blob batch request.
+
+        Each of the sub-requests in the multipart body is signed separately.
+        """
+        boundary = 'batch_%s' % (binascii.hexlify(os.urandom(16))
+                                 .decode('ascii'))
+        date = time.strftime(AZURE_TIME_FORMAT, time.gmtime())
+
+        lines = []
+        for index, obj in enumerate(objects):
+            object_path = self._get_object_path(obj.container, obj.name)
+            object_path = self.connection.morph_action_hook(object_path)
+            headers = {'x-ms-date': date}
+            # pylint: disable=protected-access
+            signature = self.connection._get_azure_auth_signature(
+                method='DELETE', headers=headers, params={},
+                account=self.connection.user_id,
+                secret_key=self.connection.key, path=object_path)
+
+            lines.extend([
+                '--%s' % (boundary),
+                'Content-Type: application/http',
+                'Content-Transfer-Encoding: binary',
+                'Content-ID: %s' % (index),
+                '',
+                'DELETE %s HTTP/1.1' % (object_path),
+                'x-ms-date: %s' % (date),
+                'Authorization: %s' % (signature),
+                'Content-Length: 0',
+                ''
+            ])
+
+        lines.extend(['--%s--' % (boundary), ''])
+        data = '\r\n'.join(lines)
+
+        headers = {'Content-Type': 'multipart/mixed; boundary=%s' % (boundary),
+                   'Content-Length': str(len(data))}
+        response = self.connection.request('/', params={'comp': 'batch'},
+                                           method='POST', data=data,
+                                           headers=headers, raw=True)
+
+        if response.status != httplib.ACCEPTED:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        statuses = self._parse_batch_response(
+            body=ensure_string(response.body),
+            content_type=response.headers.get('content-type', ''))
+
+        result = []
+        for index, obj in enumerate(objects):
+            status, message = statuses.get(index, (None, 'Missing response'))
+
+            # Objects which don't exist are considered deleted
+            if status in [httplib.ACCEPTED, httplib.NOT_FOUND]:
+                result.append(None)
+            else:
+                error = LibcloudError('Failed to delete object "%s": %s %s' %
+                                      (obj.name, status, message),
+                                      driver=self)
+                result.append(error)
+
+        return result
+
+    def _parse_batch_response(self, body, content_type):
+        """
+        Parse a blob batch response body.
+
+        :return: Dictionary which maps sub-request content id to a tuple of
+                 status code and status message.
+        :rtype: ``dict``
+        """
+        match = re.search(r'boundary=([^;\s]+)', content_type)
+
+        if not match:
+            raise LibcloudError('Invalid batch response content type: %s' %
+                                (content_type), driver=self)
+
+        statuses = {}
+        for part in body.split('--%s' % (match.group(1))):
+            content_id = re.search(r'^Content-ID:\s*(\d+)', part,
+                                   re.MULTILINE | re.IGNORECASE)
+            status = re.search(r'^HTTP/\d\.\d (\d+) ?([^\r\n]*)', part,
+                               re.MULTILINE)
+
+            if content_id and status:
+                statuses[int(content_id.group(1))] = (int(status.group(1)),
+                                                      status.group(2))
+
+        return statuses
+
     def _fix_headers(self, headers):
         """
         Update common HTTP headers to their equivalent in Azure Storage
@@ -17,8 +17,12 @@
 Driver for Backblaze B2 service.
 """
 
+import os
 import base64
+import socket
 import hashlib
+import itertools
+import threading
 
 try:
     import simplejson as json
@@ -30,11 +34,13 @@ from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import urlparse
 from libcloud.utils.py3 import next
 from libcloud.utils.files import read_in_chunks
-from libcloud.utils.files import exhaust_iterator
 from libcloud.utils.escape import sanitize_object_name
+from libcloud.utils.parallel import chunks
+from libcloud.utils.parallel import run_in_parallel
 
 from libcloud.common.base import ConnectionUserAndKey
 from libcloud.common.base import JsonResponse
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.common.types import InvalidCredsError
 from libcloud.common.types import LibcloudError
 from libcloud.storage.providers import Provider
@@ -52,6 +58,22 @@ __all__ = [
 AUTH_API_HOST = 'api.backblaze.com'
 API_PATH = '/b2api/v1/'
 
+# Files larger than this are uploaded using the large file API in parts of
+# this size. Each part needs to be buffered in memory since Backblaze requires
+# SHA1 of the part to be sent upfront. Minimum part size supported by the API
+# is 5 MB.
+DEFAULT_PART_SIZE = 100 * 1024 * 1024
+
+# Status codes which indicate upload URL or token can't be used anymore and
+# a new one needs to be obtained
+UPLOAD_URL_REFRESH_STATUS_CODES = [httplib.UNAUTHORIZED,
+                                   httplib.REQUEST_TIMEOUT,
+                                   httplib.SERVICE_UNAVAILABLE]
+
+# How many times to try uploading a file or a part using a different upload
+# URL before giving up
+UPLOAD_MAX_ATTEMPTS = 3
+
 
 class BackblazeB2Response(JsonResponse):
     def success(self):
@@ -242,6 +264,17 @@ class BackblazeB2StorageDriver(StorageDriver):
     type = Provider.BACKBLAZE_B2
     hash_type = 'sha1'
     supports_chunked_encoding = False
+    hash_is_content_digest = True
+    supports_sorted_listing = True
+
+    def __init__(self, *args, **kwargs):
+        super(BackblazeB2StorageDriver, self).__init__(*args, **kwargs)
+
+        # Upload URLs and tokens can be reused for multiple uploads, but only
+        # by a single upload at a time. Pool is shared with driver copies
+        # used for parallel uploads.
+        self._upload_data_pool = {}  # type: ignore
+        self._upload_data_pool_lock = threading.Lock()
 
     def iterate_containers(self):
         # pylint: disable=unexpected-keyword-arg
@@ -357,20 +390,38 @@ class BackblazeB2StorageDriver(StorageDriver):
                                 success_status_code=httplib.OK)
 
     def upload_object(self, file_path, container, object_name, extra=None,
-                      verify_hash=True, headers=None):
+                      verify_hash=True, headers=None, ex_part_size=None,
+                      ex_max_workers=1):
         """
         Upload an object.
 
         Note: This will override file with a same name if it already exists.
+
+        Files which are larger than ``ex_part_size`` are uploaded using the
+        large file API.
+
+        :param ex_part_size: Size of the parts used for large files (defaults
+                             to 100 MB).
+        :type ex_part_size: ``int``
+
+        :param ex_max_workers: How many parts of a large file to upload in
+                               parallel. Up to ``ex_max_workers`` parts are
+                               held in memory at the same time.
+        :type ex_max_workers: ``int``
         """
         # Note: We don't use any of the base driver functions since Backblaze
         # API requires you to provide SHA1 has upfront and the base methods
         # don't support that
+        part_size = ex_part_size or DEFAULT_PART_SIZE
 
         with open(file_path, 'rb') as fp:
-            iterator = iter(fp)
-            iterator = read_in_chunks(iterator=iterator)
-            data = exhaust_iterator(iterator=iterator)
+            if os.fstat(fp.fileno()).st_size > part_size:
+                return self._upload_large_file(
+                    iterator=fp, container=container,
+                    object_name=object_name, extra=extra, headers=headers,
+                    part_size=part_size, max_workers=ex_max_workers)
+
+            data = fp.read()
 
         obj = self._perform_upload(data=data, container=container,
                                    object_name=object_name,
@@ -381,19 +432,37 @@ class BackblazeB2StorageDriver(StorageDriver):
         return obj
 
     def upload_object_via_stream(self, iterator, container, object_name,
-                                 extra=None, headers=None):
+                                 extra=None, headers=None, ex_part_size=None,
+                                 ex_max_workers=1):
         """
         Upload an object.
 
-        Note: Backblaze does not yet support uploading via stream,
-        so this calls upload_object internally requiring the object data
-        to be loaded into memory at once
-        """
+        Backblaze requires SHA1 of the data to be provided upfront so the
+        stream is read in parts of ``ex_part_size`` bytes. Streams which are
+        larger than a single part are uploaded using the large file API.
 
-        iterator = read_in_chunks(iterator=iterator)
-        data = exhaust_iterator(iterator=iterator)
+        :param ex_part_size: Size of the parts used for large files (defaults
+                             to 100 MB).
+        :type ex_part_size: ``int``
 
-        obj = self._perform_upload(data=data, container=container,
+        :param ex_max_workers: How many parts of a large file to upload in
+                               parallel.
+        :type ex_max_workers: ``int``
+        """
+        part_size = ex_part_size or DEFAULT_PART_SIZE
+        parts = read_in_chunks(iterator=iterator, chunk_size=part_size,
+                               fill_size=True, yield_empty=True)
+        first_part = next(parts)
+        second_part = next(parts, None)
+
+        if second_part is not None:
+            parts = itertools.chain([first_part, second_part], parts)
+            return self._upload_large_file(
+                iterator=parts, container=container, object_name=object_name,
+                extra=extra, headers=headers, part_size=part_size,
+                max_workers=ex_max_workers)
+
+        obj = self._perform_upload(data=first_part, container=container,
                                    object_name=object_name,
                                    extra=extra,
                                    headers=headers)
@@ -452,7 +521,6 @@ class BackblazeB2StorageDriver(StorageDriver):
 
         :rype: ``dict``
         """
-        # TODO: This is static (AFAIK) so it could be cached
         params = {}
         params['bucketId'] = container_id
         response = self.connection.request(action='b2_get_upload_url',
@@ -470,6 +538,91 @@ class BackblazeB2StorageDriver(StorageDriver):
         upload_url = result['uploadUrl']
         return upload_url
 
+    def ex_start_large_file(self, container_id, object_name,
+                            content_type='b2/x-auto', meta_data=None):
+        """
+        Start a large file upload.
+
+        :return: Id of the started large file.
+        :rtype: ``str``
+        """
+        data = {}
+        data['bucketId'] = container_id
+        data['fileName'] = sanitize_object_name(object_name)
+        data['contentType'] = content_type
+        data['fileInfo'] = meta_data or {}
+        resp = self.connection.request(action='b2_start_large_file',
+                                       data=data, method='POST')
+        return resp.object['fileId']
+
+    def ex_get_upload_part_data(self, file_id):
+        """
+        Retrieve information used for uploading parts of a large file (upload
+        url, auth token, etc).
+
+        :rtype: ``dict``
+        """
+        data = {}
+        data['fileId'] = file_id
+        response = self.connection.request(action='b2_get_upload_part_url',
+                                           data=data, method='POST')
+        return response.object
+
+    def ex_upload_part(self, file_id, part_number, data):
+        """
+        Upload a single part of a large file.
+
+        :param part_number: Number of the part (starting with 1).
+        :type part_number: ``int``
+
+        :param data: Part data.
+        :type data: ``bytes``
+
+        :return: SHA1 of the uploaded part.
+        :rtype: ``str``
+        """
+        sha1 = hashlib.sha1(b(data)).hexdigest()
+
+        headers = {}
+        headers['X-Bz-Part-Number'] = str(part_number)
+        headers['X-Bz-Content-Sha1'] = sha1
+
+        self._upload_with_pooled_url(
+            pool_key=('file', file_id),
+            get_upload_data=lambda: self.ex_get_upload_part_data(file_id),
+            headers=headers, data=data)
+        return sha1
+
+    def ex_finish_large_file(self, file_id, part_sha1s, container=None):
+        """
+        Finish a large file upload.
+
+        :param part_sha1s: SHA1 of each of the uploaded parts (in order).
+        :type part_sha1s: ``list`` of ``str``
+
+        :rtype: :class:`Object`
+        """
+        data = {}
+        data['fileId'] = file_id
+        data['partSha1Array'] = part_sha1s
+        resp = self.connection.request(action='b2_finish_large_file',
+                                       data=data, method='POST')
+        self._discard_upload_data(pool_key=('file', file_id))
+        return self._to_object(item=resp.object, container=container)
+
+    def ex_cancel_large_file(self, file_id):
+        """
+        Cancel a large file upload and delete all the uploaded parts.
+
+        :rtype: ``bool``
+        """
+        data = {}
+        data['fileId'] = file_id
+        resp = self.connection.request(action='b2_cancel_large_file',
+                                       data=data, method='POST')
+        self._discard_upload_data(pool_key=('file', file_id))
+        return resp.status == httplib.OK
+
     def _to_containers(self, data):
         result = []
         for item in data['buckets']:
@@ -537,29 +690,129 @@ class BackblazeB2StorageDriver(StorageDriver):
         headers['X-Bz-Content-Sha1'] = sha1.hexdigest()
 
         # Include optional meta-data (up to 10 items)
-        for key, value in meta_data:
+        for key, value in meta_data.items():
             # TODO: Encode / escape key
             headers['X-Bz-Info-%s' % (key)] = value
 
-        upload_data = self.ex_get_upload_data(
-            container_id=container.extra['id'])
-        upload_token = upload_data['authorizationToken']
-        parsed_url = urlparse.urlparse(upload_data['uploadUrl'])
+        container_id = container.extra['id']
+        response = self._upload_with_pooled_url(
+            pool_key=('bucket', container_id),
+            get_upload_data=lambda: self.ex_get_upload_data(container_id),
+            headers=headers, data=data)
+
+        obj = self._to_object(item=response.object, container=container)
+        return obj
 
-        upload_host = parsed_url.netloc
-        request_path = parsed_url.path
+    def _upload_large_file(self, iterator, container, object_name,
+                           extra=None, headers=None,
+                           part_size=DEFAULT_PART_SIZE, max_workers=1):
+        """
+        Upload data using the large file API.
 
-        # pylint: disable=no-member
-        response = self.connection.upload_request(action=request_path,
-                                                  headers=headers,
-                                                  upload_host=upload_host,
-                                                  auth_token=upload_token,
-                                                  data=data)
-
-        if response.status == httplib.OK:
-            obj = self._to_object(item=response.object, container=container)
-            return obj
-        else:
-            body = response.response.read()
-            raise LibcloudError('Upload failed. status_code=%s, body=%s' %
-                                (response.status, body), driver=self)
+        Only ``max_workers`` parts are held in memory at the same time.
+        """
+        extra = extra or {}
+        file_id = self.ex_start_large_file(
+            container_id=container.extra['id'], object_name=object_name,
+            content_type=extra.get('content_type', 'b2/x-auto'),
+            meta_data=extra.get('meta_data', None))
+
+        def upload_part(driver, item):
+            part_number, data = item
+            return driver.ex_upload_part(file_id=file_id,
+                                         part_number=part_number, data=data)
+
+        parts = read_in_chunks(iterator=iterator, chunk_size=part_size,
+                               fill_size=True)
+        part_sha1s = []
+
+        try:
+            for batch in chunks(enumerate(parts, 1), max_workers):
+                results = run_in_parallel(self, upload_part, batch,
+                                          max_workers=max_workers)
+
+                for result in results:
+                    if not result.success:
+                        raise result.error
+
+                    part_sha1s.append(result.result)
+
+            obj = self.ex_finish_large_file(file_id=file_id,
+                                            part_sha1s=part_sha1s,
+                                            container=container)
+        except Exception as e:
+            try:
+                self.ex_cancel_large_file(file_id=file_id)
+            except Exception:
+                # Parts which were already uploaded are removed by the
+                # service eventually
+                pass
+
+            raise e
+
+        return obj
+
+    def _upload_with_pooled_url(self, pool_key, get_upload_data, headers,
+                                data):
+        """
+        Upload data using an upload URL from the pool. If the upload URL
+        can't be used anymore, it's discarded and a new one is retrieved.
+        """
+        for attempt in range(1, UPLOAD_MAX_ATTEMPTS + 1):
+            upload_data = self._acquire_upload_data(
+                pool_key=pool_key, get_upload_data=get_upload_data)
+            upload_token = upload_data['authorizationToken']
+            parsed_url = urlparse.urlparse(upload_data['uploadUrl'])
+
+            try:
+                # pylint: disable=no-member
+                response = self.connection.upload_request(
+                    action=parsed_url.path, headers=dict(headers),
+                    upload_host=parsed_url.netloc, auth_token=upload_token,
+                    data=data)
+            except Exception as e:
+                if (attempt < UPLOAD_MAX_ATTEMPTS and
+                        self._is_upload_url_error(e)):
+                    continue
+
+                raise e
+
+            if response.status != httplib.OK:
+                body = response.response.read()
+                raise LibcloudError('Upload failed. status_code=%s, body=%s' %
+                                    (response.status, body), driver=self)
+
+            self._release_upload_data(pool_key=pool_key,
+                                      upload_data=upload_data)
+            return response
+
+    def _acquire_upload_data(self, pool_key, get_upload_data):
+        with self._upload_data_pool_lock:
+            pool = self._upload_data_pool.get(pool_key, None)
+
+            if pool:
+                return pool.pop()
+
+        return get_upload_data()
+
+    def _release_upload_data(self, pool_key, upload_data):
+        with self._upload_data_pool_lock:
+            self._upload_data_pool.setdefault(pool_key, []).append(
+                upload_data)
+
+    def _discard_upload_data(self, pool_key):
+        with self._upload_data_pool_lock:
+            self._upload_data_pool.pop(pool_key, None)
+
+    def _is_upload_url_error(self, e):
+        """
+        Return True if the provided upload exception indicates upload URL
+        should be discarded and the upload retried using a new URL.
+        """
+        if isinstance(e, InvalidCredsError):
+            return True
+
+        if isinstance(e, BaseHTTPError):
+            return e.code in UPLOAD_URL_REFRESH_STATUS_CODES
+
+        return isinstance(e, (socket.error, socket.timeout))
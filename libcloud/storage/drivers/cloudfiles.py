@@ -35,6 +35,8 @@ if PY3:
     from io import FileIO as file
 
 from libcloud.utils.files import read_in_chunks
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import run_in_parallel
 from libcloud.common.types import MalformedResponseError, LibcloudError
 from libcloud.common.base import Response, RawResponse
 
@@ -54,6 +56,10 @@ from libcloud.common.rackspace import AUTH_URL
 CDN_HOST = 'cdn.clouddrive.com'
 API_VERSION = 'v1.0'
 
+# Maximum number of objects which can be deleted using a single bulk delete
+# request (default "max_deletes_per_request" value of the bulk middleware)
+MAX_BULK_DELETES_PER_REQUEST = 10000
+
 # Keys which are used to select a correct endpoint from the service catalog.
 INTERNAL_ENDPOINT_KEY = 'internalURL'
 PUBLIC_ENDPOINT_KEY = 'publicURL'
@@ -248,6 +254,8 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
     connectionCls = CloudFilesConnection
     hash_type = 'md5'
     supports_chunked_encoding = True
+    hash_is_content_digest = True
+    supports_sorted_listing = True
 
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
                  region='ord', use_internal_url=False, **kwargs):
@@ -509,6 +517,98 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
 
         raise LibcloudError('Unexpected status code: %s' % (response.status))
 
+    def copy_object(self, obj, destination_container, destination_name=None):
+        """
+        @inherits: :class:`StorageDriver.copy_object`
+
+        Objects are copied on the server side using COPY request.
+        """
+        destination_name = destination_name or obj.name
+
+        if not self._supports_server_side_copy(destination_container):
+            return super(CloudFilesStorageDriver, self).copy_object(
+                obj=obj, destination_container=destination_container,
+                destination_name=destination_name)
+
+        container_name = self._encode_container_name(obj.container.name)
+        object_name = self._encode_object_name(obj.name)
+        destination = '/%s/%s' % (
+            self._encode_container_name(destination_container.name),
+            self._encode_object_name(destination_name))
+
+        response = self.connection.request(
+            '/%s/%s' % (container_name, object_name), method='COPY',
+            headers={'Destination': destination})
+
+        if response.status == httplib.NOT_FOUND:
+            raise ObjectDoesNotExistError(value='', object_name=obj.name,
+                                          driver=self)
+        elif response.status != httplib.CREATED:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        extra = {'content_type': response.headers.get(
+            'content-type', obj.extra.get('content_type', None)),
+            'last_modified': response.headers.get('last-modified', None)}
+
+        return Object(name=destination_name, size=obj.size,
+                      hash=response.headers.get('etag', obj.hash),
+                      extra=extra, meta_data=obj.meta_data,
+                      container=destination_container, driver=self)
+
+    def delete_objects(self, objects, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        @inherits: :class:`StorageDriver.delete_objects`
+
+        Objects are deleted using the bulk delete middleware with up to 10000
+        objects per request.
+        """
+        return self._delete_objects_in_batches(
+            objects=objects, batch_size=MAX_BULK_DELETES_PER_REQUEST,
+            max_workers=max_workers)
+
+    def _delete_objects_batch(self, objects):
+        """
+        Delete objects using a single bulk delete request.
+        """
+        paths = []
+        for obj in objects:
+            container_name = self._encode_container_name(obj.container.name)
+            object_name = self._encode_object_name(obj.name)
+            paths.append('/%s/%s' % (container_name, object_name))
+
+        headers = {'Content-Type': 'text/plain',
+                   'Accept': 'application/json'}
+        response = self.connection.request('', method='POST',
+                                           params={'bulk-delete': ''},
+                                           data='\n'.join(paths),
+                                           headers=headers)
+
+        if response.status != httplib.OK:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        body = response.object
+        status = body.get('Response Status', '')
+        errors = dict((path, status) for path, status in body['Errors'])
+
+        if not errors and not status.startswith('2'):
+            # Whole request failed
+            raise LibcloudError('Bulk delete failed: %s %s' %
+                                (status, body.get('Response Body', '')),
+                                driver=self)
+
+        result = []
+        for path, obj in zip(paths, objects):
+            error = None
+            if path in errors:
+                error = LibcloudError('Failed to delete object "%s": %s' %
+                                      (obj.name, errors[path]), driver=self)
+
+            result.append(error)
+
+        return result
+
     def ex_purge_object_from_cdn(self, obj, email=None):
         """
         Purge edge cache for the specified object.
@@ -557,20 +657,61 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
 
     def ex_multipart_upload_object(self, file_path, container, object_name,
                                    chunk_size=33554432, extra=None,
-                                   verify_hash=True):
+                                   verify_hash=True, ex_max_workers=1,
+                                   ex_use_slo=False):
+        """
+        Upload a large file as multiple segments and a manifest object.
+
+        :param chunk_size: Size of a single segment in bytes.
+        :type chunk_size: ``int``
+
+        :param ex_max_workers: How many segments to upload in parallel. Each
+                               segment is read directly from its offset in
+                               the file.
+        :type ex_max_workers: ``int``
+
+        :param ex_use_slo: True to create a Static Large Object manifest
+                           which lists all the segments with their ETags and
+                           sizes instead of a Dynamic Large Object manifest
+                           which relies on listing the segments (slower and
+                           only eventually consistent).
+        :type ex_use_slo: ``bool``
+        """
         object_size = os.path.getsize(file_path)
         if object_size < chunk_size:
             return self.upload_object(file_path, container, object_name,
                                       extra=extra, verify_hash=verify_hash)
 
-        iter_chunk_reader = FileChunkReader(file_path, chunk_size)
-
-        for index, iterator in enumerate(iter_chunk_reader):
-            self._upload_object_part(container=container,
-                                     object_name=object_name,
-                                     part_number=index,
-                                     iterator=iterator,
-                                     verify_hash=verify_hash)
+        segments = []
+        for index, start_block in enumerate(range(0, object_size,
+                                                  chunk_size)):
+            end_block = min(start_block + chunk_size, object_size)
+            segments.append((index, start_block, end_block))
+
+        def upload_segment(driver, segment):
+            index, start_block, end_block = segment
+            iterator = ChunkStreamReader(file_path=file_path,
+                                         start_block=start_block,
+                                         end_block=end_block,
+                                         chunk_size=8192)
+            return driver._upload_object_part(container=container,
+                                              object_name=object_name,
+                                              part_number=index,
+                                              iterator=iterator,
+                                              verify_hash=verify_hash)
+
+        results = run_in_parallel(self, upload_segment, segments,
+                                  max_workers=ex_max_workers)
+
+        for result in results:
+            if not result.success:
+                raise result.error
+
+        if ex_use_slo:
+            return self._upload_object_slo_manifest(
+                container=container, object_name=object_name,
+                segments=[result.result for result in results],
+                extra=extra, verify_hash=verify_hash)
 
         return self._upload_object_manifest(container=container,
                                             object_name=object_name,
@@ -695,10 +836,10 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
         part_name = object_name + '/%08d' % part_number
         extra = {'content_type': 'application/octet-stream'}
 
-        self._put_object(container=container,
-                         object_name=part_name,
-                         extra=extra, stream=iterator,
-                         verify_hash=verify_hash)
+        return self._put_object(container=container,
+                                object_name=part_name,
+                                extra=extra, stream=iterator,
+                                verify_hash=verify_hash)
 
     def _upload_object_manifest(self, container, object_name, extra=None,
                                 verify_hash=True):
@@ -740,6 +881,72 @@ class CloudFilesStorageDriver(StorageDriver, OpenStackDriverMixin):
 
         return obj
 
+    def _upload_object_slo_manifest(self, container, object_name, segments,
+                                    extra=None, verify_hash=True):
+        """
+        Create a Static Large Object manifest for the provided segments.
+
+        :param segments: Uploaded segment objects (in order).
+        :type segments: ``list`` of :class:`Object`
+        """
+        extra = extra or {}
+        meta_data = extra.get('meta_data')
+        content_type = extra.get('content_type', None)
+
+        container_name_encoded = self._encode_container_name(container.name)
+        object_name_encoded = self._encode_object_name(object_name)
+        request_path = '/%s/%s' % (container_name_encoded, object_name_encoded)
+
+        manifest = []
+        for segment in segments:
+            manifest.append({
+                'path': '/%s/%s' % (container.name, segment.name),
+                'etag': segment.hash,
+                'size_bytes': segment.size
+            })
+
+        headers = {}
+        if content_type:
+            headers['Content-Type'] = content_type
+
+        if meta_data:
+            for key, value in list(meta_data.items()):
+                headers['X-Object-Meta-%s' % (key)] = value
+
+        response = self.connection.request(request_path, method='PUT',
+                                           params={'multipart-manifest':
+                                                   'put'},
+                                           data=json.dumps(manifest),
+                                           headers=headers)
+
+        if response.status != httplib.CREATED:
+            raise LibcloudError('Unexpected status code: %s' %
+                                (response.status), driver=self)
+
+        # ETag of a Static Large Object is a MD5 hash of the concatenated
+        # segment ETags
+        object_hash = response.headers.get('etag', '').strip('"')
+
+        if verify_hash:
+            hash_function = self._get_hash_function()
+            hash_function.update(b(''.join([segment.hash for segment in
+                                            segments])))
+            data_hash = hash_function.hexdigest()
+
+            if object_hash != data_hash:
+                raise ObjectHashMismatchError(
+                    value=('MD5 hash checksum does not match (expected=%s, ' +
+                           'actual=%s)') %
+                          (data_hash, object_hash),
+                    object_name=object_name, driver=self)
+
+        size = sum([segment.size for segment in segments])
+        obj = Object(name=object_name, size=size, hash=object_hash,
+                     extra={'static_large_object': True},
+                     meta_data=meta_data, container=container, driver=self)
+
+        return obj
+
     def iterate_container_objects(self, container, prefix=None,
                                   ex_prefix=None):
         """
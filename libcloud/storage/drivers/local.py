@@ -21,11 +21,24 @@ from __future__ import with_statement
 
 import errno
 import os
-import time
+import sys
 import shutil
+import weakref
 import tempfile
 import threading
+from functools import partial
 from hashlib import sha256
+from stat import S_ISDIR
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
 
 try:
     import fasteners
@@ -35,7 +48,6 @@ except ImportError:
 
 from libcloud.utils.files import read_in_chunks
 from libcloud.utils.files import exhaust_iterator
-from libcloud.utils.py3 import relpath
 from libcloud.utils.py3 import u
 from libcloud.common.base import Connection
 from libcloud.storage.base import Object, Container, StorageDriver
@@ -47,7 +59,125 @@ from libcloud.storage.types import ObjectError
 from libcloud.storage.types import ObjectDoesNotExistError
 from libcloud.storage.types import InvalidContainerNameError
 
-IGNORE_FOLDERS = ['.lock', '.hash']
+# Folder inside the container directory which holds partially written files
+TEMP_FOLDER = '.libcloud_tmp'
+
+IGNORE_FOLDERS = ['.lock', '.hash', TEMP_FOLDER]
+
+# Name of the object index database file which is stored in the base path
+INDEX_FILE_NAME = '.libcloud_index.sqlite3'
+
+# Number of index rows retrieved with a single query when listing objects
+INDEX_PAGE_SIZE = 1000
+
+# ioctl request which clones (reflinks) a file on Linux (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+# Error codes which indicate that a copy method is not supported for the
+# provided files and the next method should be used instead
+COPY_FALLBACK_ERRNOS = set(getattr(errno, name) for name in
+                           ['ENOSYS', 'EXDEV', 'EINVAL', 'ENOTTY',
+                            'EOPNOTSUPP', 'ENOTSUP']
+                           if hasattr(errno, name))
+
+# Thread locks shared by all the LockLocalStorage instances for the same
+# path. Locks are removed from the registry once nobody holds a reference
+_THREAD_LOCKS = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary  # noqa: E501
+_THREAD_LOCKS_LOCK = threading.Lock()
+
+
+def _get_thread_lock(path):
+    with _THREAD_LOCKS_LOCK:
+        lock = _THREAD_LOCKS.get(path, None)
+
+        if lock is None:
+            lock = threading.Lock()
+            _THREAD_LOCKS[path] = lock
+
+        return lock
+
+
+def _reflink(source_fd, destination_fd, size):
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+
+    fcntl.ioctl(destination_fd, FICLONE, source_fd)
+    return True
+
+
+def _copy_file_range(source_fd, destination_fd, size):
+    if not hasattr(os, 'copy_file_range'):
+        return False
+
+    offset = 0
+
+    while offset < size:
+        copied = os.copy_file_range(source_fd, destination_fd, size - offset,
+                                    offset, offset)
+
+        if copied == 0:
+            break
+
+        offset += copied
+
+    return True
+
+
+def _sendfile(source_fd, destination_fd, size):
+    # Only Linux supports sendfile with a regular file as the destination
+    if not hasattr(os, 'sendfile') or not sys.platform.startswith('linux'):
+        return False
+
+    offset = 0
+
+    while offset < size:
+        sent = os.sendfile(destination_fd, source_fd, offset, size - offset)
+
+        if sent == 0:
+            break
+
+        offset += sent
+
+    return True
+
+
+def _copy_file(source_path, destination_path):
+    """
+    Copy file data using the fastest method supported by the OS and the
+    file-system.
+
+    The file is cloned if the file-system supports it, otherwise the data is
+    copied in the kernel (``copy_file_range`` or ``sendfile``) and only if
+    none of those is available, through user space buffers.
+    """
+    with open(source_path, 'rb') as source:
+        with open(destination_path, 'wb') as destination:
+            size = os.fstat(source.fileno()).st_size
+
+            for method in [_reflink, _copy_file_range, _sendfile]:
+                try:
+                    if method(source.fileno(), destination.fileno(), size):
+                        return
+                except OSError as e:
+                    if e.errno not in COPY_FALLBACK_ERRNOS:
+                        raise
+
+                    # Method might have failed after copying some of the data
+                    destination.seek(0)
+                    destination.truncate()
+
+            shutil.copyfileobj(source, destination)
+
+
+def _is_dir(entry):
+    """
+    Return True if the directory entry (following symlinks) is a directory.
+    Errors (e.g. symlink loops) are ignored the same way as in os.walk.
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
 
 
 class LockLocalStorage(object):
@@ -64,62 +194,200 @@ class LockLocalStorage(object):
 
         # NOTE: fasteners.InterProcess lock has no guarantees regards usage by
         # multiple threads in a single process which means we also need to
-        # use threading.lock for that purpose
-        self.thread_lock = threading.Lock()
+        # use threading.lock for that purpose. The same lock is used by all
+        # the instances for this path.
+        self.thread_lock = _get_thread_lock(path)
         self.ipc_lock = fasteners.InterProcessLock(self.ipc_lock_path)
 
     def __enter__(self):
         lock_acquire_timeout = self.lock_acquire_timeout
-        start_time = int(time.time())
-        end_time = start_time + lock_acquire_timeout
-
-        while int(time.time()) < end_time:
-            # pylint: disable=assignment-from-no-return
-            success = self.thread_lock.acquire(blocking=False)
-            # enable: disable=assignment-from-no-return
 
-            if success:
-                break
+        # Wait on the lock instead of polling it
+        success = self.thread_lock.acquire(timeout=lock_acquire_timeout)
 
         if not success:
             raise LibcloudError("Failed to acquire thread lock for path %s "
                                 "in %s seconds" % (self.path,
                                                    lock_acquire_timeout))
 
-        success = self.ipc_lock.acquire(blocking=True,
-                                        timeout=lock_acquire_timeout)
+        try:
+            success = self.ipc_lock.acquire(blocking=True,
+                                            timeout=lock_acquire_timeout)
+        except Exception:
+            self.thread_lock.release()
+            raise
 
         if not success:
+            self.thread_lock.release()
             raise LibcloudError("Failed to acquire IPC lock (%s) for path %s "
                                 "in %s seconds" %
                                 (self.ipc_lock_path, self.path,
                                  lock_acquire_timeout))
 
     def __exit__(self, type, value, traceback):
-        if self.thread_lock.locked():
-            self.thread_lock.release()
-
         if self.ipc_lock.exists():
             self.ipc_lock.release()
 
+        self.thread_lock.release()
+
         if value is not None:
             raise value
 
 
+class LocalStorageIndex(object):
+    """
+    Persistent index of the objects stored by the local storage driver.
+
+    Object names are stored together with the file size and timestamps in a
+    SQLite database. Rows are stored ordered by (container, object name)
+    which means listing (and prefix filtering) is a range scan.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Path to the index database file.
+        :type path: ``str``
+        """
+        if sqlite3 is None:
+            raise ImportError('Missing sqlite3 module which is needed for '
+                              'the local storage index')
+
+        self.path = path
+
+        # The connection is shared by all the threads, access is serialized
+        # using the lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS containers '
+                '(name TEXT PRIMARY KEY)')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS objects '
+                '(container TEXT, name TEXT, size INTEGER, ctime REAL, '
+                'atime REAL, mtime REAL, PRIMARY KEY (container, name)) '
+                'WITHOUT ROWID')
+
+    def is_indexed(self, container_name):
+        """
+        Return True if the objects in the provided container have been
+        indexed.
+
+        :rtype: ``bool``
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                'SELECT 1 FROM containers WHERE name = ?', (container_name,))
+            return cursor.fetchone() is not None
+
+    def rebuild(self, container_name, entries):
+        """
+        Replace all the index entries for the provided container.
+
+        :param entries: (object name, ``os.stat_result``) tuples.
+        :type entries: ``iterable``
+        """
+        rows = ((container_name, name, stat.st_size, stat.st_ctime,
+                 stat.st_atime, stat.st_mtime) for name, stat in entries)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM objects WHERE container = ?', (container_name,))
+            self._connection.executemany(
+                'INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?)', rows)
+            self._connection.execute(
+                'INSERT OR IGNORE INTO containers VALUES (?)',
+                (container_name,))
+
+    def iterate(self, container_name, prefix=None):
+        """
+        Return a generator of (name, size, ctime, atime, mtime) tuples for
+        the objects in the provided container ordered by name.
+
+        Rows are retrieved in pages so the lock is not held while the
+        caller processes the results.
+        """
+        prefix = prefix or ''
+        query = ('SELECT name, size, ctime, atime, mtime FROM objects '
+                 'WHERE container = ? AND name %s ? ORDER BY name LIMIT ?')
+        operator, last_name = '>=', prefix
+
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    query % (operator),
+                    (container_name, last_name, INDEX_PAGE_SIZE)).fetchall()
+
+            for row in rows:
+                if not row[0].startswith(prefix):
+                    return
+
+                yield row
+
+            if len(rows) < INDEX_PAGE_SIZE:
+                return
+
+            operator, last_name = '>', rows[-1][0]
+
+    def get(self, container_name, object_name):
+        """
+        Return a (name, size, ctime, atime, mtime) tuple for the provided
+        object or None if the object is not in the index.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                'SELECT name, size, ctime, atime, mtime FROM objects '
+                'WHERE container = ? AND name = ?',
+                (container_name, object_name))
+            return cursor.fetchone()
+
+    def put(self, container_name, object_name, size, ctime, atime, mtime):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?)',
+                (container_name, object_name, size, ctime, atime, mtime))
+
+    def delete(self, container_name, object_name):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM objects WHERE container = ? AND name = ?',
+                (container_name, object_name))
+
+    def delete_container(self, container_name):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM objects WHERE container = ?', (container_name,))
+            self._connection.execute(
+                'DELETE FROM containers WHERE name = ?', (container_name,))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
 class LocalStorageDriver(StorageDriver):
     """
     Implementation of local file-system based storage. This is helpful
     where the user would want to use the same code (using libcloud) and
     switch between cloud storage and local storage
+
+    Objects are listed ordered by name. If ``ex_use_index`` argument is
+    True, object metadata is stored in a persistent index (see
+    :class:`LocalStorageIndex`) so listing objects and retrieving an object
+    doesn't require walking the file-system. The index is updated by the
+    driver methods, :meth:`ex_rebuild_index` needs to be called if files in
+    a container are modified by other means.
     """
 
     connectionCls = Connection
     name = 'Local Storage'
     website = 'http://example.com'
     hash_type = 'md5'
+    supports_sorted_listing = True
 
     def __init__(self, key, secret=None, secure=True, host=None, port=None,
-                 **kwargs):
+                 ex_use_index=False, ex_index_path=None, **kwargs):
 
         # Use the key as the path to the storage
         self.base_path = key
@@ -127,6 +395,13 @@ class LocalStorageDriver(StorageDriver):
         if not os.path.isdir(self.base_path):
             raise LibcloudError('The base path is not a directory')
 
+        self.index = None
+
+        if ex_use_index:
+            index_path = ex_index_path or os.path.join(self.base_path,
+                                                       INDEX_FILE_NAME)
+            self.index = LocalStorageIndex(index_path)
+
         super(LocalStorageDriver, self).__init__(key=key, secret=secret,
                                                  secure=secure, host=host,
                                                  port=port, **kwargs)
@@ -200,28 +475,36 @@ class LocalStorageDriver(StorageDriver):
 
         full_path = os.path.join(self.base_path, container.name, object_name)
 
-        if os.path.isdir(full_path):
-            raise ObjectError(value=None, driver=self, object_name=object_name)
-
         try:
             stat = os.stat(full_path)
         except Exception:
             raise ObjectDoesNotExistError(value=None, driver=self,
                                           object_name=object_name)
 
+        if S_ISDIR(stat.st_mode):
+            raise ObjectError(value=None, driver=self, object_name=object_name)
+
+        return self._stat_to_object(container, object_name, stat)
+
+    def _stat_to_object(self, container, object_name, stat):
+        return self._to_object(container=container, object_name=object_name,
+                               size=stat.st_size, ctime=stat.st_ctime,
+                               atime=stat.st_atime, mtime=stat.st_mtime)
+
+    def _to_object(self, container, object_name, size, ctime, atime, mtime):
         # Make a hash for the file based on the metadata. We can safely
         # use only the mtime attribute here. If the file contents change,
         # the underlying file-system will change mtime
         data_hash = self._get_hash_function()
-        data_hash.update(u(stat.st_mtime).encode('ascii'))
+        data_hash.update(u(mtime).encode('ascii'))
         data_hash = data_hash.hexdigest()
 
         extra = {}
-        extra['creation_time'] = stat.st_ctime
-        extra['access_time'] = stat.st_atime
-        extra['modify_time'] = stat.st_mtime
+        extra['creation_time'] = ctime
+        extra['access_time'] = atime
+        extra['modify_time'] = mtime
 
-        return Object(name=object_name, size=stat.st_size, extra=extra,
+        return Object(name=object_name, size=size, extra=extra,
                       driver=self, container=container, hash=data_hash,
                       meta_data=None)
 
@@ -241,25 +524,111 @@ class LocalStorageDriver(StorageDriver):
 
     def _get_objects(self, container, prefix=None):
         """
-        Recursively iterate through the file-system and return the object names
+        Recursively iterate through the file-system (or the index) and return
+        the objects ordered by name
         """
 
         cpath = self.get_container_cdn_url(container, check=True)
 
-        fpath = cpath
-        if prefix:
-            fpath = os.path.join(cpath, prefix)
+        if self.index is not None:
+            if not self.index.is_indexed(container.name):
+                self.ex_rebuild_index(container)
+
+            for row in self.index.iterate(container.name, prefix):
+                yield self._to_object(container, *row)
+
+            return
+
+        for object_name, stat in self._scan_objects(cpath, prefix):
+            yield self._stat_to_object(container, object_name, stat)
+
+    def _scan_objects(self, container_path, prefix=None):
+        """
+        Return a generator of (object name, ``os.stat_result``) tuples for
+        the files inside the container directory ordered by object name.
+        """
+        prefix = prefix or ''
+
+        # All the matching objects are inside the directory part of the prefix
+        head = os.path.dirname(prefix)
+        path = os.path.join(container_path, head)
+        rel_path = head + os.sep if head else ''
+
+        return self._scandir_sorted(path, rel_path, prefix)
+
+    def _scandir_sorted(self, path, rel_path, prefix):
+        """
+        Recursively yield (object name, ``os.stat_result``) tuples for the
+        files inside the provided directory which start with the prefix.
+
+        Directory entries are sorted by name with a trailing separator so
+        the files inside a directory are yielded at the same position where
+        their full object names would be. Directories which can't contain a
+        matching object are skipped.
+        """
+        entries = []
+
+        try:
+            iterator = os.scandir(path)
+        except (IOError, OSError):
+            return
+
+        with iterator:
+            for entry in iterator:
+                name = rel_path + entry.name
 
-        for folder, subfolders, files in os.walk(fpath, topdown=True):
-            # Remove unwanted subfolders
-            for subf in IGNORE_FOLDERS:
-                if subf in subfolders:
-                    subfolders.remove(subf)
+                if entry.is_symlink() and _is_dir(entry):
+                    # Symlinked directories are not followed (same as
+                    # os.walk) so loops and directories outside of the
+                    # container are not listed
+                    continue
 
-            for name in files:
-                full_path = os.path.join(folder, name)
-                object_name = relpath(full_path, start=cpath)
-                yield self._make_object(container, object_name)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in IGNORE_FOLDERS:
+                        continue
+
+                    name += os.sep
+
+                    if name.startswith(prefix) or prefix.startswith(name):
+                        entries.append((name, entry, True))
+                elif name.startswith(prefix):
+                    entries.append((name, entry, False))
+
+        entries.sort(key=lambda item: item[0])
+
+        for name, entry, is_dir in entries:
+            if is_dir:
+                for item in self._scandir_sorted(entry.path, name, prefix):
+                    yield item
+            else:
+                # DirEntry caches the result so the file is only stat-ed once
+                yield name, entry.stat()
+
+    def ex_rebuild_index(self, container):
+        """
+        Rebuild the index for the provided container from the file-system.
+
+        :param container: Container instance
+        :type  container: :class:`Container`
+
+        :rtype: ``bool``
+        """
+        if self.index is None:
+            raise LibcloudError('Index is not enabled for this driver',
+                                driver=self)
+
+        cpath = self.get_container_cdn_url(container, check=True)
+        self.index.rebuild(container.name, self._scan_objects(cpath))
+        return True
+
+    def _add_to_index(self, obj):
+        if self.index is None or not self.index.is_indexed(obj.container.name):
+            return
+
+        self.index.put(obj.container.name, obj.name, size=obj.size,
+                       ctime=obj.extra['creation_time'],
+                       atime=obj.extra['access_time'],
+                       mtime=obj.extra['modify_time'])
 
     def iterate_container_objects(self, container, prefix=None,
                                   ex_prefix=None):
@@ -329,7 +698,16 @@ class LocalStorageDriver(StorageDriver):
         :rtype: :class:`Object`
         """
         container = self._make_container(container_name)
-        return self._make_object(container, object_name)
+
+        if self.index is not None:
+            row = self.index.get(container_name, object_name)
+
+            if row is not None:
+                return self._to_object(container, *row)
+
+        obj = self._make_object(container, object_name)
+        self._add_to_index(obj)
+        return obj
 
     def get_object_cdn_url(self, obj):
         """
@@ -414,7 +792,8 @@ class LocalStorageDriver(StorageDriver):
             overwrite_existing=overwrite_existing)
 
         try:
-            shutil.copy(obj_path, file_path)
+            _copy_file(obj_path, file_path)
+            shutil.copymode(obj_path, file_path)
         except IOError:
             if delete_on_failure:
                 try:
@@ -511,18 +890,8 @@ class LocalStorageDriver(StorageDriver):
         :rtype: ``object``
         """
 
-        path = self.get_container_cdn_url(container, check=True)
-        obj_path = os.path.join(path, object_name)
-        base_path = os.path.dirname(obj_path)
-
-        self._make_path(base_path)
-
-        with LockLocalStorage(obj_path):
-            shutil.copy(file_path, obj_path)
-
-        os.chmod(obj_path, int('664', 8))
-
-        return self._make_object(container, object_name)
+        return self._write_object(container, object_name,
+                                  partial(_copy_file, file_path))
 
     def upload_object_via_stream(self, iterator, container,
                                  object_name,
@@ -564,16 +933,74 @@ class LocalStorageDriver(StorageDriver):
 
         :rtype: ``object``
         """
-        path = self.get_container_cdn_url(container, check=True)
-        obj_path = os.path.join(path, object_name)
-        base_path = os.path.dirname(obj_path)
-        self._make_path(base_path)
-        with LockLocalStorage(obj_path):
-            with open(obj_path, 'wb') as obj_file:
+        def write(file_path):
+            with open(file_path, 'wb') as obj_file:
                 for data in iterator:
                     obj_file.write(data)
-        os.chmod(obj_path, int('664', 8))
-        return self._make_object(container, object_name)
+
+        return self._write_object(container, object_name, write)
+
+    def copy_object(self, obj, destination_container, destination_name=None):
+        """
+        @inherits: :class:`StorageDriver.copy_object`
+
+        If the destination container belongs to a local storage driver, the
+        file is cloned or copied in the kernel if the OS and the file-system
+        support it.
+        """
+        destination_name = destination_name or obj.name
+        driver = destination_container.driver
+
+        if not isinstance(driver, LocalStorageDriver):
+            return super(LocalStorageDriver, self).copy_object(
+                obj=obj, destination_container=destination_container,
+                destination_name=destination_name)
+
+        source_path = self.get_object_cdn_url(obj)
+
+        if not os.path.isfile(source_path):
+            raise ObjectDoesNotExistError(value=None, driver=self,
+                                          object_name=obj.name)
+
+        return driver._write_object(destination_container, destination_name,
+                                    partial(_copy_file, source_path))
+
+    def _write_object(self, container, object_name, write_func):
+        """
+        Write an object file atomically.
+
+        Data is written by ``write_func(file_path)`` to a temporary file
+        which replaces the object file once all the data has been written so
+        readers never see a partially written object. The object lock is
+        only held while the file is being replaced.
+        """
+        path = self.get_container_cdn_url(container, check=True)
+        obj_path = os.path.join(path, object_name)
+        temp_path = os.path.join(path, TEMP_FOLDER)
+
+        self._make_path(os.path.dirname(obj_path))
+        self._make_path(temp_path)
+
+        fd, temp_file_path = tempfile.mkstemp(dir=temp_path)
+        os.close(fd)
+
+        try:
+            write_func(temp_file_path)
+            os.chmod(temp_file_path, int('664', 8))
+
+            with LockLocalStorage(obj_path):
+                os.replace(temp_file_path, obj_path)
+        except BaseException:
+            try:
+                os.unlink(temp_file_path)
+            except OSError:
+                pass
+
+            raise
+
+        obj = self._make_object(container, object_name)
+        self._add_to_index(obj)
+        return obj
 
     def delete_object(self, obj):
         """
@@ -594,6 +1021,9 @@ class LocalStorageDriver(StorageDriver):
             except Exception:
                 return False
 
+        if self.index is not None:
+            self.index.delete(obj.container.name, obj.name)
+
         # Check and delete all the empty parent folders
         path = os.path.dirname(path)
         container_url = obj.container.get_cdn_url()
@@ -643,6 +1073,10 @@ class LocalStorageDriver(StorageDriver):
             raise LibcloudError(
                 'Error creating container %s' % container_name, driver=self)
 
+        if self.index is not None:
+            # New container is empty so its index is complete
+            self.index.rebuild(container_name, [])
+
         return self._make_container(container_name)
 
     def delete_container(self, container):
@@ -670,6 +1104,9 @@ class LocalStorageDriver(StorageDriver):
             except Exception:
                 return False
 
+        if self.index is not None:
+            self.index.delete_container(container.name)
+
         return True
 
     def _get_obj_file_path(self, obj, destination_path,
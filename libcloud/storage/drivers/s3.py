@@ -18,10 +18,15 @@ from typing import Optional
 
 import base64
 import hmac
+import math
 import time
+import queue
+import threading
 from hashlib import sha1
+from hashlib import md5
 import os
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import libcloud.utils.py3
 
@@ -41,6 +46,9 @@ from libcloud.utils.py3 import urlencode
 
 from libcloud.utils.xml import fixxpath, findtext
 from libcloud.utils.files import read_in_chunks
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import clone_driver
+from libcloud.utils.parallel import run_in_parallel
 from libcloud.common.types import InvalidCredsError, LibcloudError
 from libcloud.common.base import ConnectionUserAndKey, RawResponse
 from libcloud.common.aws import AWSBaseResponse, AWSDriver, \
@@ -117,6 +125,23 @@ CHUNK_SIZE = 5 * 1024 * 1024
 # ex_iterate_multipart_uploads.
 RESPONSES_PER_REQUEST = 100
 
+# Maximum number of keys which can be deleted using a single DeleteObjects
+# request
+MAX_DELETE_OBJECTS_PER_REQUEST = 1000
+
+# Objects larger than this need to be copied using UploadPartCopy requests
+MAX_COPY_OBJECT_SIZE = 5 * 1024 * 1024 * 1024
+
+# Default size of a part when copying large objects
+COPY_PART_SIZE = 512 * 1024 * 1024
+
+# Maximum number of parts in a single multipart upload
+MAX_MULTIPART_PARTS = 10000
+
+# Maximum number of listing pages fetched ahead of the consumer by each
+# worker in ex_iterate_container_objects_sharded
+SHARDED_LISTING_PREFETCH_PAGES = 4
+
 S3_CDN_URL_DATETIME_FORMAT = '%Y%m%dT%H%M%SZ'
 S3_CDN_URL_DATE_FORMAT = '%Y%m%d'
 S3_CDN_URL_EXPIRY_HOURS = float(
@@ -287,6 +312,10 @@ class BaseS3StorageDriver(StorageDriver):
     hash_type = 'md5'
     supports_chunked_encoding = False
     supports_s3_multipart_upload = True
+    supports_s3_multi_object_delete = True
+    supports_s3_list_objects_v2 = True
+    hash_is_content_digest = True
+    supports_sorted_listing = True
     ex_location_name = ''
     namespace = NAMESPACE
     http_vendor_prefix = 'x-amz'
@@ -320,19 +349,183 @@ class BaseS3StorageDriver(StorageDriver):
         """
         prefix = self._normalize_prefix_argument(prefix, ex_prefix)
 
+        for objects, _ in self._iterate_listing_pages(container=container,
+                                                      prefix=prefix):
+            for obj in objects:
+                yield obj
+
+    def ex_iterate_directory(self, container, prefix=None, delimiter='/'):
+        """
+        Return a generator of objects and "sub directories" which are direct
+        children of the provided prefix.
+
+        Object names are grouped by the part of the name which follows the
+        prefix and ends with the delimiter (common prefixes). Each group is
+        returned once as a ``str`` instead of returning all the objects in
+        it. Entries are returned ordered by name.
+
+        :param container: Container instance
+        :type container: :class:`Container`
+
+        :param prefix: Only return entries starting with prefix (e.g.
+                       ``photos/``).
+        :type prefix: ``str``
+
+        :param delimiter: Delimiter which separates the "directories" in the
+                          object name.
+        :type delimiter: ``str``
+
+        :return: A generator of Object instances and common prefixes.
+        :rtype: ``generator`` of :class:`Object` and ``str``
+        """
+        for objects, prefixes in self._iterate_listing_pages(
+                container=container, prefix=prefix, delimiter=delimiter):
+            entries = objects + prefixes
+            entries.sort(key=lambda entry: getattr(entry, 'name', entry))
+
+            for entry in entries:
+                yield entry
+
+    def ex_iterate_container_objects_sharded(self, container, prefix=None,
+                                             delimiter='/',
+                                             max_workers=DEFAULT_MAX_WORKERS,
+                                             ordered=False):
+        """
+        Return a generator of objects for the given container which lists
+        the container concurrently.
+
+        Common prefixes of the provided prefix are discovered first (see
+        :meth:`ex_iterate_directory`) and each of them is then listed by a
+        separate worker thread. Listing of a large container is only as fast
+        as the number of sequential requests needed, so this is useful when
+        the objects are evenly distributed among "directories". Containers
+        without a common prefix are listed serially.
+
+        :param container: Container instance
+        :type container: :class:`Container`
+
+        :param prefix: Only return objects starting with prefix
+        :type prefix: ``str``
+
+        :param delimiter: Delimiter used to discover the prefixes which are
+                          listed concurrently.
+        :type delimiter: ``str``
+
+        :param max_workers: Maximum number of prefixes listed at the same
+                            time.
+        :type max_workers: ``int``
+
+        :param ordered: True to return the objects ordered by name (the same
+                        order as :meth:`iterate_container_objects`). Otherwise
+                        objects are returned as soon as they are retrieved.
+        :type ordered: ``bool``
+
+        :return: A generator of Object instances.
+        :rtype: ``generator`` of :class:`Object`
+        """
+        entries = list(self.ex_iterate_directory(container=container,
+                                                 prefix=prefix,
+                                                 delimiter=delimiter))
+        shards = [entry for entry in entries if not isinstance(entry, Object)]
+
+        if not shards:
+            for obj in entries:
+                yield obj
+
+            return
+
+        stop = threading.Event()
+        local = threading.local()
+        executor = ThreadPoolExecutor(max_workers=max(max_workers or 1, 1))
+
+        def list_shard(shard, pages):
+            if stop.is_set():
+                return
+
+            if getattr(local, 'driver', None) is None:
+                local.driver = clone_driver(self)
+
+            try:
+                for objects, _ in local.driver._iterate_listing_pages(
+                        container=container, prefix=shard, stop=stop):
+                    self._put_listing_page(pages, objects, stop)
+            except Exception as e:
+                self._put_listing_page(pages, e, stop)
+
+            self._put_listing_page(pages, None, stop)
+
+        try:
+            if ordered:
+                # Keys which share a common prefix form a contiguous range so
+                # the shards only need to be returned in the discovery order.
+                # Workers pick up the shards in the same order which means
+                # the shard which is currently being consumed is always
+                # being listed.
+                queues = {}
+
+                for shard in shards:
+                    queues[shard] = queue.Queue(
+                        maxsize=SHARDED_LISTING_PREFETCH_PAGES)
+                    executor.submit(list_shard, shard, queues[shard])
+
+                for entry in entries:
+                    if isinstance(entry, Object):
+                        yield entry
+                        continue
+
+                    for objects in self._iterate_listing_queue(
+                            queues.pop(entry), pending=1):
+                        for obj in objects:
+                            yield obj
+            else:
+                pages = queue.Queue(
+                    maxsize=SHARDED_LISTING_PREFETCH_PAGES * len(shards))
+
+                for shard in shards:
+                    executor.submit(list_shard, shard, pages)
+
+                for entry in entries:
+                    if isinstance(entry, Object):
+                        yield entry
+
+                for objects in self._iterate_listing_queue(
+                        pages, pending=len(shards)):
+                    for obj in objects:
+                        yield obj
+        finally:
+            # Stop the workers in case the generator hasn't been exhausted
+            # (they finish at most one in-flight request)
+            stop.set()
+            executor.shutdown(wait=True)
+
+    def _iterate_listing_pages(self, container, prefix=None, delimiter=None,
+                               stop=None):
+        """
+        Return a generator of (objects, common prefixes) tuples, one for each
+        page of the container listing.
+
+        ListObjectsV2 with continuation tokens is used if the provider
+        supports it and ListObjects with markers otherwise.
+
+        :param stop: Event which, once set, stops the listing before the next
+                     page is requested.
+        :type stop: :class:`threading.Event`
+        """
         params = {}
 
+        if self.supports_s3_list_objects_v2:
+            params['list-type'] = '2'
+            params['fetch-owner'] = 'true'
+
         if prefix:
             params['prefix'] = prefix
 
-        last_key = None
-        exhausted = False
-        container_path = self._get_container_path(container)
+        if delimiter:
+            params['delimiter'] = delimiter
 
-        while not exhausted:
-            if last_key:
-                params['marker'] = last_key
+        container_path = self._get_container_path(container)
 
+        while stop is None or not stop.is_set():
             response = self.connection.request(container_path,
                                                params=params)
 
@@ -340,16 +533,62 @@ class BaseS3StorageDriver(StorageDriver):
                 raise LibcloudError('Unexpected status code: %s' %
                                     (response.status), driver=self)
 
-            objects = self._to_objs(obj=response.object,
-                                    xpath='Contents', container=container)
-            is_truncated = response.object.findtext(fixxpath(
+            body = response.object
+            objects = self._to_objs(obj=body, xpath='Contents',
+                                    container=container)
+            prefixes = [element.text for element in body.findall(fixxpath(
+                xpath='CommonPrefixes/Prefix', namespace=self.namespace))]
+
+            yield objects, prefixes
+
+            is_truncated = body.findtext(fixxpath(
                 xpath='IsTruncated', namespace=self.namespace)).lower()
-            exhausted = (is_truncated == 'false')
 
-            last_key = None
-            for obj in objects:
-                last_key = obj.name
-                yield obj
+            if is_truncated == 'false':
+                break
+
+            token = findtext(element=body, xpath='NextContinuationToken',
+                             namespace=self.namespace)
+
+            if token:
+                params['continuation-token'] = token
+                continue
+
+            # ListObjects (v1) response. NextMarker is only returned if a
+            # delimiter is used, otherwise the last key is the marker
+            marker = findtext(element=body, xpath='NextMarker',
+                              namespace=self.namespace)
+            names = [obj.name for obj in objects] + prefixes
+
+            if not marker and not names:
+                raise LibcloudError('Unable to determine the marker for the '
+                                    'next listing page', driver=self)
+
+            params.pop('continuation-token', None)
+            params['marker'] = marker or max(names)
+
+    def _put_listing_page(self, pages, page, stop):
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _iterate_listing_queue(self, pages, pending):
+        """
+        Return pages from the provided queue until ``pending`` workers have
+        finished.
+        """
+        while pending:
+            page = pages.get()
+
+            if page is None:
+                pending -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                yield page
 
     def get_container(self, container_name):
         try:
@@ -768,6 +1007,251 @@ class BaseS3StorageDriver(StorageDriver):
 
         return False
 
+    def delete_objects(self, objects, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        @inherits: :class:`StorageDriver.delete_objects`
+
+        Objects are deleted using DeleteObjects requests with up to 1000 keys
+        each.
+        """
+        if not self.supports_s3_multi_object_delete:
+            return super(BaseS3StorageDriver, self).delete_objects(
+                objects=objects, max_workers=max_workers)
+
+        return self._delete_objects_in_batches(
+            objects=objects, batch_size=MAX_DELETE_OBJECTS_PER_REQUEST,
+            max_workers=max_workers)
+
+    def _delete_objects_batch(self, objects):
+        """
+        Delete objects from a single container using a DeleteObjects request.
+        """
+        container = objects[0].container
+
+        root = Element('Delete')
+        quiet = SubElement(root, 'Quiet')
+        quiet.text = 'true'
+
+        for obj in objects:
+            item = SubElement(root, 'Object')
+            key = SubElement(item, 'Key')
+            key.text = obj.name
+
+        data = tostring(root)
+        data_md5 = base64.b64encode(md5(b(data)).digest()).decode('utf-8')
+
+        headers = {'Content-MD5': data_md5, 'Content-Length': len(data)}
+        params = {'delete': ''}
+        request_path = self._get_container_path(container)
+        response = self.connection.request(request_path, headers=headers,
+                                           params=params, data=data,
+                                           method='POST')
+
+        if response.status != httplib.OK:
+            # pylint: disable=maybe-no-member
+            code, message = response._parse_error_details(
+                element=response.object)
+            raise LibcloudError('Error deleting objects: %s (%s)' %
+                                (message, code), driver=self)
+
+        # In quiet mode, the response only includes keys which failed to be
+        # deleted
+        errors = {}
+        for element in response.object.findall(fixxpath(
+                xpath='Error', namespace=self.namespace)):
+            key = findtext(element=element, xpath='Key',
+                           namespace=self.namespace)
+            code = findtext(element=element, xpath='Code',
+                            namespace=self.namespace)
+            message = findtext(element=element, xpath='Message',
+                               namespace=self.namespace)
+            errors[key] = LibcloudError('Failed to delete object "%s": %s '
+                                        '(%s)' % (key, message, code),
+                                        driver=self)
+
+        return [errors.get(obj.name, None) for obj in objects]
+
+    def copy_object(self, obj, destination_container, destination_name=None,
+                    ex_part_size=COPY_PART_SIZE,
+                    ex_max_workers=DEFAULT_MAX_WORKERS):
+        """
+        @inherits: :class:`StorageDriver.copy_object`
+
+        Objects are copied on the server side using CopyObject request.
+        Objects larger than 5 GB are copied in parts using UploadPartCopy
+        requests.
+
+        :param ex_part_size: Size of a single part when copying objects
+                             larger than 5 GB.
+        :type ex_part_size: ``int``
+
+        :param ex_max_workers: Maximum number of parts which are copied
+                               concurrently.
+        :type ex_max_workers: ``int``
+        """
+        destination_name = destination_name or obj.name
+
+        if not self._supports_server_side_copy(destination_container):
+            return super(BaseS3StorageDriver, self).copy_object(
+                obj=obj, destination_container=destination_container,
+                destination_name=destination_name)
+
+        # Copy request needs to be sent to the destination bucket region
+        driver = destination_container.driver
+
+        if obj.size > MAX_COPY_OBJECT_SIZE and \
+                self.supports_s3_multipart_upload:
+            return driver._copy_object_multipart(
+                obj=obj, destination_container=destination_container,
+                destination_name=destination_name, part_size=ex_part_size,
+                max_workers=ex_max_workers)
+
+        headers = {self._get_copy_source_header(): self._get_object_path(
+            obj.container, obj.name)}
+        request_path = driver._get_object_path(destination_container,
+                                               destination_name)
+        response = driver.connection.request(request_path, method='PUT',
+                                             headers=headers)
+        element = driver._parse_copy_response(object_name=obj.name,
+                                              response=response)
+
+        etag = response.headers.get('etag', '')
+        extra = {'content_type': obj.extra.get('content_type', None)}
+
+        if element is not None:
+            etag = findtext(element=element, xpath='ETag',
+                            namespace=self.namespace)
+            extra['last_modified'] = findtext(element=element,
+                                              xpath='LastModified',
+                                              namespace=self.namespace)
+
+        extra['etag'] = etag
+
+        return Object(name=destination_name, size=obj.size,
+                      hash=etag.replace('"', ''), extra=extra,
+                      meta_data=obj.meta_data,
+                      container=destination_container, driver=driver)
+
+    def _copy_object_multipart(self, obj, destination_container,
+                               destination_name, part_size, max_workers):
+        """
+        Copy an object using a multipart upload with UploadPartCopy
+        requests.
+        """
+        # Object meta data is not copied with UploadPartCopy requests so it
+        # needs to be retrieved and specified when initiating the upload
+        source_path = self._get_object_path(obj.container, obj.name)
+        response = self.connection.request(source_path, method='HEAD')
+
+        if response.status == httplib.NOT_FOUND:
+            raise ObjectDoesNotExistError(value=None, driver=self,
+                                          object_name=obj.name)
+
+        source_obj = self._headers_to_object(object_name=obj.name,
+                                             container=obj.container,
+                                             headers=response.headers)
+
+        headers = {'Content-Type': source_obj.extra['content_type']}
+        for key, value in source_obj.meta_data.items():
+            headers[self.http_vendor_prefix + '-meta-%s' % (key)] = value
+
+        part_size = max(part_size, int(math.ceil(
+            source_obj.size / float(MAX_MULTIPART_PARTS))))
+        parts = []
+        for index, offset in enumerate(range(0, source_obj.size, part_size)):
+            end = min(offset + part_size, source_obj.size) - 1
+            parts.append((index + 1, offset, end))
+
+        upload_id = self._initiate_multipart(container=destination_container,
+                                             object_name=destination_name,
+                                             headers=headers)
+
+        def copy_part(driver, part):
+            return driver._copy_object_part(
+                obj=obj, destination_container=destination_container,
+                destination_name=destination_name, upload_id=upload_id,
+                part=part)
+
+        results = run_in_parallel(self, copy_part, parts,
+                                  max_workers=max_workers)
+        errors = [result.error for result in results if not result.success]
+
+        if errors:
+            self._abort_multipart(container=destination_container,
+                                  object_name=destination_name,
+                                  upload_id=upload_id)
+            raise errors[0]
+
+        chunks = [(part[0], result.result) for part, result in
+                  zip(parts, results)]
+        etag = self._commit_multipart(container=destination_container,
+                                      object_name=destination_name,
+                                      upload_id=upload_id, chunks=chunks)
+
+        extra = {'content_type': source_obj.extra['content_type'],
+                 'etag': etag}
+        return Object(name=destination_name, size=source_obj.size,
+                      hash=etag.replace('"', ''), extra=extra,
+                      meta_data=source_obj.meta_data,
+                      container=destination_container, driver=self)
+
+    def _copy_object_part(self, obj, destination_container,
+                          destination_name, upload_id, part):
+        """
+        Copy a single part of an object using UploadPartCopy request.
+
+        :param part: A tuple of (part number, first byte, last byte).
+        :type part: ``tuple``
+
+        :return: Part ETag.
+        :rtype: ``str``
+        """
+        part_number, start_bytes, end_bytes = part
+        source_path = self._get_object_path(obj.container, obj.name)
+        headers = {
+            self._get_copy_source_header(): source_path,
+            self._get_copy_source_header() + '-range': 'bytes=%s-%s' %
+            (start_bytes, end_bytes)
+        }
+        params = {'partNumber': part_number, 'uploadId': upload_id}
+        request_path = self._get_object_path(destination_container,
+                                             destination_name)
+        response = self.connection.request(request_path, method='PUT',
+                                           headers=headers, params=params)
+
+        element = self._parse_copy_response(object_name=obj.name,
+                                            response=response)
+        return findtext(element=element, xpath='ETag',
+                        namespace=self.namespace).replace('"', '')
+
+    def _get_copy_source_header(self):
+        return self.http_vendor_prefix + '-copy-source'
+
+    def _parse_copy_response(self, object_name, response):
+        """
+        Check the copy request response and return the parsed body.
+        """
+        if response.status == httplib.NOT_FOUND:
+            raise ObjectDoesNotExistError(value=None, driver=self,
+                                          object_name=object_name)
+
+        element = response.object if response.body else None
+
+        if element is None and response.status != httplib.OK:
+            raise LibcloudError('Unexpected status code, status_code=%s' %
+                                (response.status), driver=self)
+
+        # Copy request can fail after 200 OK has already been sent in which
+        # case the error is returned in the response body
+        if element is not None and (response.status != httplib.OK or
+                                    element.tag == 'Error'):
+            # pylint: disable=maybe-no-member
+            code, message = response._parse_error_details(element=element)
+            raise LibcloudError('Error copying object: %s (%s)' %
+                                (message, code), driver=self)
+
+        return element
+
     def ex_iterate_multipart_uploads(self, container, prefix=None,
                                      delimiter=None):
         """
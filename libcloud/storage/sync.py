@@ -0,0 +1,680 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module which mirrors objects from one container to another one, possibly
+belonging to a different provider.
+
+Both containers are listed ordered by object name and the listings are
+merge-joined so that neither of them needs to be held in memory. Only new and
+changed objects are transferred (using server side copy when both containers
+belong to the same account and streaming the data between the drivers
+otherwise).
+"""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import re
+import json
+import heapq
+import operator
+import tempfile
+import threading
+import time
+
+from libcloud.common.types import LibcloudError
+from libcloud.storage.base import Container, Object
+from libcloud.utils.parallel import DEFAULT_MAX_WORKERS
+from libcloud.utils.parallel import TaskResult
+from libcloud.utils.parallel import clone_driver
+from libcloud.utils.parallel import run_in_parallel
+
+__all__ = [
+    'DEFAULT_BATCH_SIZE',
+    'DEFAULT_MAX_OBJECTS_IN_MEMORY',
+
+    'ObjectChange',
+    'SyncStats',
+    'ContainerSyncResult',
+    'ContainerSyncer',
+
+    'iterate_sorted_objects',
+    'diff_containers',
+    'objects_match'
+]
+
+# Maximum number of changes which are processed (and checkpointed) together
+DEFAULT_BATCH_SIZE = 1000
+
+# Maximum number of objects which are buffered in memory when sorting listing
+# of a driver which doesn't list objects ordered by name
+DEFAULT_MAX_OBJECTS_IN_MEMORY = 100000
+
+HEX_DIGEST_LENGTHS = {'md5': 32, 'sha1': 40, 'sha256': 64}
+
+
+def iterate_sorted_objects(container,  # type: Container
+                           prefix=None,  # type: Optional[str]
+                           max_objects_in_memory=DEFAULT_MAX_OBJECTS_IN_MEMORY  # type: int  # noqa: E501
+                           ):
+    # type: (...) -> Iterator[Object]
+    """
+    Return an iterator of the container objects ordered by name.
+
+    If the driver lists objects ordered by name, the listing is streamed as
+    is. Otherwise objects are sorted and once more than
+    ``max_objects_in_memory`` objects are buffered, the buffer is sorted and
+    written to a temporary file and the resulting sorted runs are lazily
+    merged.
+
+    :param container: Container to list.
+    :type container: :class:`Container`
+
+    :param prefix: Only list objects starting with this prefix.
+    :type prefix: ``str``
+
+    :param max_objects_in_memory: Maximum number of objects to buffer in
+                                  memory when sorting the listing.
+    :type max_objects_in_memory: ``int``
+
+    :rtype: ``iterator`` of :class:`Object`
+    """
+    objects = container.iterate_objects(prefix=prefix)
+
+    if container.driver.supports_sorted_listing:
+        return _check_sorted(objects)
+
+    return _sort_objects(container=container, objects=objects,
+                         max_objects_in_memory=max_objects_in_memory)
+
+
+def _check_sorted(objects):
+    # type: (Iterator[Object]) -> Iterator[Object]
+    previous = None
+
+    for obj in objects:
+        if previous is not None and obj.name <= previous:
+            raise LibcloudError('Objects are not listed ordered by name ("%s" '
+                                'listed after "%s")' % (obj.name, previous),
+                                driver=obj.driver)
+
+        previous = obj.name
+        yield obj
+
+
+def _sort_objects(container, objects, max_objects_in_memory):
+    # type: (Container, Iterator[Object], int) -> Iterator[Object]
+    buffer = []  # type: List[Object]
+    runs = []  # type: List[IO[str]]
+
+    try:
+        for obj in objects:
+            buffer.append(obj)
+
+            if len(buffer) >= max_objects_in_memory:
+                runs.append(_write_sorted_run(buffer))
+                buffer = []
+
+        buffer.sort(key=operator.attrgetter('name'))
+
+        if not runs:
+            for obj in buffer:
+                yield obj
+            return
+
+        runs.append(_write_sorted_run(buffer))
+        del buffer
+
+        iterators = [_read_sorted_run(container, run) for run in runs]
+
+        for obj in heapq.merge(*iterators, key=operator.attrgetter('name')):
+            yield obj
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _write_sorted_run(objects):
+    # type: (List[Object]) -> IO[str]
+    """
+    Sort the provided objects and write the attributes which are needed to
+    compare and transfer them to a temporary file.
+    """
+    objects.sort(key=operator.attrgetter('name'))
+    fp = tempfile.TemporaryFile(mode='w+')
+
+    for obj in objects:
+        extra = dict((key, obj.extra[key]) for key in
+                     ['content_type', 'md5_hash'] if key in obj.extra)
+        fp.write(json.dumps([obj.name, obj.size, obj.hash, extra]))
+        fp.write('\n')
+
+    fp.seek(0)
+    return fp
+
+
+def _read_sorted_run(container, fp):
+    # type: (Container, IO[str]) -> Iterator[Object]
+    for line in fp:
+        name, size, hash, extra = json.loads(line)
+        yield Object(name=name, size=size, hash=hash, extra=extra,
+                     meta_data={}, container=container,
+                     driver=container.driver)
+
+
+def _get_content_digest(obj):
+    # type: (Object) -> Optional[tuple]
+    """
+    Return a (hash type, hex digest) tuple of the object content or None if
+    it's not known.
+    """
+    md5_hash = (obj.extra or {}).get('md5_hash', None)
+
+    if md5_hash:
+        return ('md5', md5_hash.lower())
+
+    driver = obj.driver
+
+    if not getattr(driver, 'hash_is_content_digest', False) or not obj.hash:
+        return None
+
+    digest = obj.hash.replace('"', '').lower()
+    length = HEX_DIGEST_LENGTHS.get(driver.hash_type, None)
+
+    # Multipart upload (and other composite object) hashes are not content
+    # digests
+    if len(digest) != length or not re.match('^[0-9a-f]+$', digest):
+        return None
+
+    return (driver.hash_type, digest)
+
+
+def objects_match(source, destination):
+    # type: (Object, Object) -> bool
+    """
+    Return True if the destination object doesn't need to be updated.
+
+    Objects are compared by size and content digest if it's known for both of
+    the objects (otherwise only the size is compared).
+    """
+    if int(source.size) != int(destination.size):
+        return False
+
+    source_digest = _get_content_digest(source)
+    destination_digest = _get_content_digest(destination)
+
+    if source_digest is None or destination_digest is None or \
+            source_digest[0] != destination_digest[0]:
+        return True
+
+    return source_digest[1] == destination_digest[1]
+
+
+class ObjectChange(object):
+    """
+    Difference between the source and the destination container for a
+    single object name.
+    """
+
+    CREATE = 'CREATE'
+    UPDATE = 'UPDATE'
+    DELETE = 'DELETE'
+    UNCHANGED = 'UNCHANGED'
+
+    def __init__(self, action, name, source=None, destination=None):
+        """
+        :param action: Action (``CREATE``, ``UPDATE``, ``DELETE`` or
+                       ``UNCHANGED``).
+        :type action: ``str``
+
+        :param name: Object name.
+        :type name: ``str``
+
+        :param source: Source object (None for ``DELETE``).
+        :type source: :class:`Object`
+
+        :param destination: Destination object (None for ``CREATE``).
+        :type destination: :class:`Object`
+        """
+        self.action = action
+        self.name = name
+        self.source = source
+        self.destination = destination
+
+    def __repr__(self):
+        return '<ObjectChange: action=%s, name=%s>' % (self.action, self.name)
+
+
+def diff_containers(source_objects,  # type: Iterable[Object]
+                    destination_objects,  # type: Iterable[Object]
+                    compare_func=objects_match,  # type: Callable[[Object, Object], bool]  # noqa: E501
+                    include_unchanged=False  # type: bool
+                    ):
+    # type: (...) -> Iterator[ObjectChange]
+    """
+    Lazily compute the changes which turn the destination objects into the
+    source objects.
+
+    Both of the provided iterables need to be ordered by object name (see
+    :func:`iterate_sorted_objects`).
+
+    :param source_objects: Source objects ordered by name.
+    :type source_objects: ``iterable`` of :class:`Object`
+
+    :param destination_objects: Destination objects ordered by name.
+    :type destination_objects: ``iterable`` of :class:`Object`
+
+    :param compare_func: Function which returns True if the destination
+                         object doesn't need to be updated.
+    :type compare_func: ``callable``
+
+    :param include_unchanged: Also yield ``UNCHANGED`` changes.
+    :type include_unchanged: ``bool``
+
+    :rtype: ``iterator`` of :class:`ObjectChange`
+    """
+    source_objects = iter(source_objects)
+    destination_objects = iter(destination_objects)
+
+    source = next(source_objects, None)
+    destination = next(destination_objects, None)
+
+    while source is not None or destination is not None:
+        if source is not None and \
+                (destination is None or source.name < destination.name):
+            yield ObjectChange(action=ObjectChange.CREATE, name=source.name,
+                               source=source)
+            source = next(source_objects, None)
+        elif destination is not None and \
+                (source is None or destination.name < source.name):
+            yield ObjectChange(action=ObjectChange.DELETE,
+                               name=destination.name, destination=destination)
+            destination = next(destination_objects, None)
+        else:
+            assert source is not None and destination is not None
+
+            if not compare_func(source, destination):
+                yield ObjectChange(action=ObjectChange.UPDATE,
+                                   name=source.name, source=source,
+                                   destination=destination)
+            elif include_unchanged:
+                yield ObjectChange(action=ObjectChange.UNCHANGED,
+                                   name=source.name, source=source,
+                                   destination=destination)
+
+            source = next(source_objects, None)
+            destination = next(destination_objects, None)
+
+
+class SyncStats(object):
+    """
+    Statistics of a single container sync.
+
+    Counters are updated as the sync progresses so they can be inspected
+    from a different thread.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.deleted = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.bytes_transferred = 0
+        self.start_time = time.time()
+        self.end_time = None  # type: Optional[float]
+        self._lock = threading.Lock()
+
+    def add(self, **counters):
+        # type: (**int) -> None
+        with self._lock:
+            for key, value in counters.items():
+                setattr(self, key, getattr(self, key) + value)
+
+    @property
+    def duration(self):
+        # type: () -> float
+        """
+        Sync duration in seconds.
+        """
+        return (self.end_time or time.time()) - self.start_time
+
+    @property
+    def objects_transferred(self):
+        # type: () -> int
+        return self.created + self.updated
+
+    @property
+    def throughput(self):
+        # type: () -> float
+        """
+        Average number of transferred bytes per second.
+        """
+        duration = self.duration
+        return self.bytes_transferred / duration if duration > 0 else 0.0
+
+    def __repr__(self):
+        return ('<SyncStats: created=%s, updated=%s, deleted=%s, '
+                'unchanged=%s, failed=%s, bytes_transferred=%s, '
+                'duration=%.2fs, throughput=%.1f B/s>' %
+                (self.created, self.updated, self.deleted, self.unchanged,
+                 self.failed, self.bytes_transferred, self.duration,
+                 self.throughput))
+
+
+class ContainerSyncResult(object):
+    """
+    Result of a single container sync.
+    """
+
+    def __init__(self, stats, errors=None, dry_run=False):
+        """
+        :param stats: Sync statistics.
+        :type stats: :class:`SyncStats`
+
+        :param errors: Results of the changes which failed.
+        :type errors: ``list`` of :class:`libcloud.utils.parallel.TaskResult`
+
+        :param dry_run: True if the changes were only computed and not
+                        applied.
+        :type dry_run: ``bool``
+        """
+        self.stats = stats
+        self.errors = errors or []
+        self.dry_run = dry_run
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return not self.errors
+
+    def __repr__(self):
+        return ('<ContainerSyncResult: success=%s, dry_run=%s, stats=%s>' %
+                (self.success, self.dry_run, self.stats))
+
+
+class ContainerSyncer(object):
+    """
+    Mirrors objects from the source container to the destination container.
+
+    Changes are applied in batches of concurrent transfers. After each
+    successfully applied batch, name of the last object in the batch is
+    stored in the checkpoint store so an interrupted sync can resume from
+    that position.
+
+    >>> syncer = ContainerSyncer(source_container=source,
+    ...                          destination_container=destination,
+    ...                          delete=True)  # doctest: +SKIP
+    >>> syncer.sync().stats  # doctest: +SKIP
+    <SyncStats: created=10, updated=1, deleted=2, ...>
+    """
+
+    def __init__(self,
+                 source_container,  # type: Container
+                 destination_container,  # type: Container
+                 prefix=None,  # type: Optional[str]
+                 delete=False,  # type: bool
+                 compare_func=objects_match,  # type: Callable[[Object, Object], bool]  # noqa: E501
+                 checkpoint_store=None,  # type: Optional[Dict[str, Any]]
+                 batch_size=DEFAULT_BATCH_SIZE,  # type: int
+                 max_workers=DEFAULT_MAX_WORKERS,  # type: int
+                 max_objects_in_memory=DEFAULT_MAX_OBJECTS_IN_MEMORY  # type: int  # noqa: E501
+                 ):
+        """
+        :param source_container: Container to copy objects from.
+        :type source_container: :class:`Container`
+
+        :param destination_container: Container to copy objects to. It can
+                                      belong to a different driver.
+        :type destination_container: :class:`Container`
+
+        :param prefix: Only sync objects starting with this prefix.
+        :type prefix: ``str``
+
+        :param delete: Delete destination objects which don't exist in the
+                       source container.
+        :type delete: ``bool``
+
+        :param compare_func: Function which returns True if the destination
+                             object doesn't need to be updated. Defaults to
+                             :func:`objects_match`.
+        :type compare_func: ``callable``
+
+        :param checkpoint_store: Dictionary like object where the sync
+                                 position is stored (e.g. a ``shelve``
+                                 instance for persistence across runs). If
+                                 not provided, sync can't be resumed.
+        :type checkpoint_store: ``dict``
+
+        :param batch_size: Maximum number of changes which are applied
+                           together.
+        :type batch_size: ``int``
+
+        :param max_workers: Maximum number of concurrent transfers.
+        :type max_workers: ``int``
+
+        :param max_objects_in_memory: Maximum number of objects to buffer in
+                                      memory when sorting listing of a driver
+                                      which doesn't list objects ordered by
+                                      name.
+        :type max_objects_in_memory: ``int``
+        """
+        self.source_container = source_container
+        self.destination_container = destination_container
+        self.prefix = prefix
+        self.delete = delete
+        self.compare_func = compare_func
+        self.checkpoint_store = checkpoint_store
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_objects_in_memory = max_objects_in_memory
+        self._local = threading.local()
+
+    @property
+    def checkpoint(self):
+        # type: () -> Optional[str]
+        """
+        Name of the last object which has been synchronized by a previous
+        interrupted sync (if any).
+        """
+        if self.checkpoint_store is None:
+            return None
+
+        return self.checkpoint_store.get(self._get_checkpoint_key(), None)
+
+    def diff(self, include_unchanged=False, start_after=None):
+        # type: (bool, Optional[str]) -> Iterator[ObjectChange]
+        """
+        Lazily compute the changes between the source and the destination
+        container.
+
+        :param include_unchanged: Also yield ``UNCHANGED`` changes.
+        :type include_unchanged: ``bool``
+
+        :param start_after: Skip objects with names which sort before or are
+                            equal to this one.
+        :type start_after: ``str``
+
+        :rtype: ``iterator`` of :class:`ObjectChange`
+        """
+        source_objects = iterate_sorted_objects(
+            container=self.source_container, prefix=self.prefix,
+            max_objects_in_memory=self.max_objects_in_memory)
+        destination_objects = iterate_sorted_objects(
+            container=self.destination_container, prefix=self.prefix,
+            max_objects_in_memory=self.max_objects_in_memory)
+
+        if start_after is not None:
+            source_objects = _skip_until(source_objects, start_after)
+            destination_objects = _skip_until(destination_objects,
+                                              start_after)
+
+        return diff_containers(source_objects=source_objects,
+                               destination_objects=destination_objects,
+                               compare_func=self.compare_func,
+                               include_unchanged=include_unchanged)
+
+    def sync(self, dry_run=False, resume=True):
+        # type: (bool, bool) -> ContainerSyncResult
+        """
+        Bring the destination container in sync with the source container.
+
+        :param dry_run: Only compute the changes and the statistics, don't
+                        apply them.
+        :type dry_run: ``bool``
+
+        :param resume: Resume from the checkpoint of a previous interrupted
+                       sync (if any).
+        :type resume: ``bool``
+
+        :rtype: :class:`ContainerSyncResult`
+        """
+        stats = SyncStats()
+        errors = []  # type: List[TaskResult]
+        start_after = self.checkpoint if resume else None
+        batch = []  # type: List[ObjectChange]
+
+        for change in self.diff(include_unchanged=True,
+                                start_after=start_after):
+            if change.action == ObjectChange.UNCHANGED:
+                stats.add(unchanged=1)
+                continue
+
+            if change.action == ObjectChange.DELETE and not self.delete:
+                continue
+
+            batch.append(change)
+
+            if len(batch) >= self.batch_size:
+                self._apply_batch(batch=batch, stats=stats, errors=errors,
+                                  dry_run=dry_run)
+                batch = []
+
+        if batch:
+            self._apply_batch(batch=batch, stats=stats, errors=errors,
+                              dry_run=dry_run)
+
+        if not dry_run and not errors and self.checkpoint_store is not None:
+            # Sync has finished, next one should start from the beginning
+            self.checkpoint_store.pop(self._get_checkpoint_key(), None)
+
+        stats.end_time = time.time()
+        return ContainerSyncResult(stats=stats, errors=errors,
+                                   dry_run=dry_run)
+
+    def _apply_batch(self, batch, stats, errors, dry_run):
+        # type: (List[ObjectChange], SyncStats, List[TaskResult], bool) -> None  # noqa: E501
+        """
+        Apply a batch of changes.
+
+        Checkpoint is only advanced if all the changes applied so far
+        succeeded.
+        """
+        transfers = [change for change in batch
+                     if change.action != ObjectChange.DELETE]
+        deletes = [change for change in batch
+                   if change.action == ObjectChange.DELETE]
+
+        if dry_run:
+            stats.add(created=len([change for change in transfers if
+                                   change.action == ObjectChange.CREATE]),
+                      updated=len(transfers) - len(
+                          [change for change in transfers if
+                           change.action == ObjectChange.CREATE]),
+                      deleted=len(deletes))
+            return
+
+        def transfer(driver, change):
+            obj = self._transfer(driver=driver, change=change)
+
+            if change.action == ObjectChange.CREATE:
+                stats.add(created=1, bytes_transferred=int(obj.size))
+            else:
+                stats.add(updated=1, bytes_transferred=int(obj.size))
+
+            return obj
+
+        results = run_in_parallel(self.source_container.driver, transfer,
+                                  transfers, max_workers=self.max_workers)
+
+        if deletes:
+            driver = self.destination_container.driver
+            delete_results = driver.delete_objects(
+                objects=[change.destination for change in deletes],
+                max_workers=self.max_workers)
+
+            for change, result in zip(deletes, delete_results):
+                # Report the change and not the object the same way as for
+                # the transfers
+                result.item = change
+                results.append(result)
+
+                if result.success:
+                    stats.add(deleted=1)
+
+        failed = [result for result in results if not result.success]
+        stats.add(failed=len(failed))
+        errors.extend(failed)
+
+        if not errors and self.checkpoint_store is not None:
+            self.checkpoint_store[self._get_checkpoint_key()] = batch[-1].name
+
+    def _transfer(self, driver, change):
+        # type: (Any, ObjectChange) -> Object
+        """
+        Copy a single object using the provided copy of the source driver.
+
+        Each worker thread uses its own copy of the destination driver.
+        """
+        destination_driver = getattr(self._local, 'destination_driver', None)
+
+        if destination_driver is None:
+            destination_driver = clone_driver(
+                self.destination_container.driver)
+            self._local.destination_driver = destination_driver
+
+        container = Container(name=self.destination_container.name,
+                              extra=self.destination_container.extra,
+                              driver=destination_driver)
+        return driver.copy_object(obj=change.source,
+                                  destination_container=container,
+                                  destination_name=change.source.name)
+
+    def _get_checkpoint_key(self):
+        # type: () -> str
+        return '%s:%s -> %s:%s [%s]' % (
+            _get_driver_id(self.source_container.driver),
+            self.source_container.name,
+            _get_driver_id(self.destination_container.driver),
+            self.destination_container.name, self.prefix or '')
+
+
+def _get_driver_id(driver):
+    # type: (Any) -> str
+    return getattr(driver, 'type', None) or driver.__class__.__name__
+
+
+def _skip_until(objects, start_after):
+    # type: (Iterator[Object], str) -> Iterator[Object]
+    for obj in objects:
+        if obj.name > start_after:
+            yield obj
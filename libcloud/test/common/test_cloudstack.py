@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
 import sys
+import weakref
 import unittest
 
 try:
@@ -27,6 +29,8 @@ from libcloud.utils.py3 import b
 from libcloud.utils.py3 import parse_qsl
 
 from libcloud.common.cloudstack import CloudStackConnection
+from libcloud.common.jobs import AsyncJobPoller
+from libcloud.common.jobs import wait_for_jobs
 from libcloud.common.types import MalformedResponseError
 
 from libcloud.test import MockHttp
@@ -87,6 +91,73 @@ class CloudStackCommonTest(unittest.TestCase):
         self.connection._async_request('fake')
         self.assertEqual(async_delay, 0)
 
+    def test_async_request_no_wait(self):
+        self.driver.path = '/async/success'
+        poller = AsyncJobPoller()
+        self.connection._async_request('fake')
+
+        job = self.connection.async_request(
+            action=None, context={'command': 'fake'}, wait=False,
+            poller=poller, result_func=lambda response: response['jobresult'])
+        self.assertEqual(job.result(timeout=5), {'fake': 'result'})
+        self.assertEqual(job.poll_count, 1)
+
+        job = self.connection._async_request('fake', wait=False)
+        called = []
+        job.add_done_callback(called.append)
+        self.assertEqual(job.result(timeout=5), {'fake': 'result'})
+        self.assertEqual(called, [job])
+
+    def test_async_request_no_wait_releases_connection(self):
+        self.driver.path = '/async/success'
+        self.driver.connection = self.connection
+        poller = AsyncJobPoller()
+
+        job = self.connection.async_request(
+            action=None, context={'command': 'fake'}, wait=False,
+            poller=poller)
+        job.result(timeout=5)
+
+        thread = poller._thread
+        if thread is not None:
+            thread.join(5)
+
+        self.assertEqual(poller._connections, {})
+
+        reference = weakref.ref(self.connection)
+        del job
+        self.connection = self.driver = None
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_async_request_no_wait_unsuccessful(self):
+        self.driver.path = '/async/fail'
+        job = self.connection._async_request('fake', wait=False)
+        self.assertRaisesRegex(Exception, CloudStackMockHttp.ERROR_TEXT,
+                               job.result, timeout=5)
+
+    def test_async_request_no_wait_batch_polling(self):
+        global async_delay
+        self.driver.path = '/async/batch'
+        self.connection.poll_interval = 0.2
+        async_delay = 2
+        CloudStackMockHttp.job_count = 0
+        CloudStackMockHttp.query_count = 0
+        poller = AsyncJobPoller(backoff=1, batch_window=10)
+
+        jobs = [self.connection.async_request(
+            action=None, context={'command': 'fake'}, wait=False,
+            poller=poller) for _ in range(3)]
+        done, not_done = wait_for_jobs(jobs, timeout=5)
+
+        self.assertEqual(len(done), 3)
+        self.assertEqual([job.result()['jobid'] for job in jobs],
+                         ['1', '2', '3'])
+        # All the jobs have been polled using listAsyncJobs, the job which
+        # isn't included in the listing is polled using queryAsyncJobResult
+        self.assertEqual(async_delay, 0)
+        self.assertEqual(CloudStackMockHttp.query_count, 1)
+
     def test_signature_algorithm(self):
         cases = [
             (
@@ -126,6 +197,9 @@ class CloudStackMockHttp(MockHttp, unittest.TestCase):
 
     ERROR_TEXT = 'ERROR TEXT'
 
+    job_count = 0
+    query_count = 0
+
     def _response(self, status, result, response):
         return (status, json.dumps(result), {}, response)
 
@@ -204,5 +278,30 @@ class CloudStackMockHttp(MockHttp, unittest.TestCase):
             result = {query['command'].lower() + 'response': {'jobid': '42'}}
         return self._response(httplib.OK, result, httplib.responses[httplib.OK])
 
+    def _async_batch(self, method, url, body, headers):
+        global async_delay
+
+        query = self._check_request(url)
+        command = query['command'].lower()
+
+        if command == 'listasyncjobs':
+            self.assertEqual(query['listall'], 'true')
+            status = 1 if async_delay == 1 else 0
+            async_delay -= 1
+            # Job "3" is missing in the listing
+            jobs = [{'jobid': job_id, 'jobstatus': status}
+                    for job_id in ['1', '2']]
+            result = {command + 'response': {'asyncjobs': jobs}}
+        elif command == 'queryasyncjobresult':
+            CloudStackMockHttp.query_count += 1
+            result = {command + 'response': {'jobid': query['jobid'],
+                                             'jobstatus': 1}}
+        else:
+            CloudStackMockHttp.job_count += 1
+            job_id = str(CloudStackMockHttp.job_count)
+            result = {command + 'response': {'jobid': job_id}}
+        return self._response(httplib.OK, result, httplib.responses[httplib.OK])
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+import requests_mock
+from mock import Mock
+
+from libcloud.common.base import Connection
+from libcloud.common.exceptions import BaseHTTPError
+from libcloud.common.metrics import LatencyHistogram
+from libcloud.common.metrics import RequestMetricsAggregator
+from libcloud.common.metrics import get_event_key
+from libcloud.common.metrics import has_request_hooks
+from libcloud.common.metrics import register_request_hook
+from libcloud.common.metrics import unregister_request_hook
+from libcloud.test import unittest
+
+
+class RequestHooksTestCase(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.aggregator = RequestMetricsAggregator()
+        register_request_hook(self.events.append)
+        register_request_hook(self.aggregator)
+
+        self.connection = Connection(url='http://test.com/')
+        self.connection.connect()
+
+    def tearDown(self):
+        unregister_request_hook(self.events.append)
+        unregister_request_hook(self.aggregator)
+
+    def test_request_events(self):
+        with requests_mock.mock() as m:
+            m.get('http://test.com/servers/12345', text='data')
+            m.post('http://test.com/servers', text='error', status_code=500)
+
+            self.connection.request('/servers/12345', params={'a': 'b'})
+            self.assertRaises(BaseHTTPError, self.connection.request,
+                              '/servers', data='body', method='POST')
+
+        event = self.events[0]
+        self.assertEqual(event.action, '/servers/12345')
+        self.assertEqual(event.method, 'GET')
+        self.assertEqual(event.params, {'a': 'b'})
+        self.assertEqual(event.status, 200)
+        self.assertTrue(event.success)
+        self.assertEqual(event.retry_count, 0)
+        self.assertEqual(event.response_bytes, 4)
+        self.assertTrue(event.latency >= event.ttfb >= 0)
+        self.assertTrue(event.body_time >= 0)
+        self.assertTrue(event.parse_time >= 0)
+
+        event = self.events[1]
+        self.assertEqual(event.status, 500)
+        self.assertFalse(event.success)
+        self.assertEqual(event.request_bytes, 4)
+        self.assertTrue(isinstance(event.error, BaseHTTPError))
+
+        snapshot = self.aggregator.snapshot(reset=True)
+        metrics = snapshot['Connection GET /servers/*']
+        self.assertEqual(metrics['count'], 1)
+        self.assertEqual(metrics['error_rate'], 0)
+        self.assertEqual(metrics['status_codes'], {200: 1})
+        self.assertEqual(metrics['latency']['count'], 1)
+        self.assertEqual(snapshot['Connection POST /servers']['errors'], 1)
+        self.assertEqual(self.aggregator.snapshot(), {})
+
+    def test_failing_hook_is_ignored(self):
+        hook = Mock(side_effect=ValueError('hook failed'))
+        register_request_hook(hook)
+
+        try:
+            with requests_mock.mock() as m:
+                m.get('http://test.com/test', text='data')
+                response = self.connection.request('/test')
+        finally:
+            unregister_request_hook(hook)
+
+        self.assertEqual(response.body, 'data')
+        self.assertEqual(hook.call_count, 1)
+        self.assertEqual(len(self.events), 1)
+
+    def test_unregister_request_hook(self):
+        unregister_request_hook(self.events.append)
+        unregister_request_hook(self.aggregator)
+        self.assertFalse(has_request_hooks())
+
+
+class RequestMetricsTestCase(unittest.TestCase):
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1, 10))
+        self.assertEqual(histogram.get_percentile(50), None)
+
+        for value in [0.05, 0.5, 0.6, 0.7, 20]:
+            histogram.add(value)
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['count'], 5)
+        self.assertEqual(snapshot['min'], 0.05)
+        self.assertEqual(snapshot['max'], 20)
+        self.assertEqual(snapshot['p50'], 1)
+        self.assertEqual(snapshot['p99'], 20)
+        self.assertEqual(snapshot['buckets'],
+                         {'0.1': 1, '1': 3, '10': 0, '+Inf': 1})
+
+    def test_get_event_key(self):
+        event = Mock(driver='Amazon EC2', method='GET', action='/',
+                     params={'Action': 'DescribeInstances'})
+        self.assertEqual(get_event_key(event),
+                         'Amazon EC2 GET /:DescribeInstances')
+
+        event = Mock(driver='OpenStack', method='DELETE',
+                     action='/v2/1337/servers/a1b2-c3?x=1', params={})
+        self.assertEqual(get_event_key(event),
+                         'OpenStack DELETE /v2/*/servers/*')
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -15,11 +15,20 @@
 
 import socket
 import ssl
+import time
 
 from mock import Mock, patch, MagicMock
 
 from libcloud.utils.retry import TRANSIENT_SSL_ERROR
+from libcloud.utils.retry import Retry
+from libcloud.utils.retry import TokenBucket
+from libcloud.utils.retry import AdaptiveConcurrencyLimiter
+from libcloud.utils.retry import RateLimiter
+from libcloud.utils.retry import get_rate_limiter
+from libcloud.utils.retry import get_retry_after
 from libcloud.common.base import Connection
+from libcloud.common.base import ConnectionKey
+from libcloud.common.exceptions import RateLimitReachedError
 from libcloud.test import unittest
 
 CONFLICT_RESPONSE_STATUS = [
@@ -56,5 +65,109 @@ class FailedRequestRetryTestCase(unittest.TestCase):
                 self.assertRaises(ssl.SSLError, conn.request, '/')
                 self.assertGreater(connection.request.call_count, 1)
 
+    @patch('libcloud.utils.retry.time.sleep')
+    def test_retry_delays_without_jitter_by_default(self, sleep):
+        # Delays grow exactly by the backoff factor unless jitter is enabled
+        conn = Connection(timeout=100, retry_delay=1, backoff=2)
+        sleep.side_effect = [None, None, None, ValueError('stop')]
+
+        with patch.object(conn, 'connect', Mock()):
+            with patch.object(conn, 'connection') as connection:
+                connection.request = MagicMock(
+                    __name__='request', side_effect=socket.error())
+
+                self.assertRaises(ValueError, conn.request, '/')
+
+        self.assertEqual([call[0][0] for call in sleep.call_args_list],
+                         [1, 2, 4, 8])
+
+
+class RetryJitterTestCase(unittest.TestCase):
+    def test_get_next_delay(self):
+        retry = Retry(retry_delay=1, backoff=2)
+        self.assertEqual(retry.get_next_delay(4), 8)
+
+        retry = Retry(retry_delay=1, backoff=2, jitter=True, max_delay=20)
+        delays = [retry.get_next_delay(2) for _ in range(100)]
+        self.assertTrue(all(1 <= delay <= 12 for delay in delays))
+        self.assertTrue(len(set(delays)) > 1)
+        self.assertTrue(retry.get_next_delay(100) <= 20)
+
+
+class RateLimiterTestCase(unittest.TestCase):
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=100, burst=2)
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertGreater(bucket.acquire(), 0)
+
+    def test_adaptive_concurrency_limiter(self):
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+        tokens = [limiter.acquire() for _ in range(3)]
+        self.assertEqual(limiter.in_flight, 3)
+
+        # Concurrent throttled requests only decrease the limit once
+        limiter.release(tokens[0], throttled=True)
+        limiter.release(tokens[1], throttled=True)
+        self.assertEqual(limiter.limit, 2)
+
+        limiter.release(tokens[2], throttled=None)
+        self.assertEqual(limiter.limit, 2)
+
+        limiter.release(limiter.acquire(), throttled=False)
+        self.assertEqual(limiter.limit, 2.5)
+        self.assertEqual(limiter.in_flight, 0)
+
+    @patch('libcloud.utils.retry.time.sleep')
+    def test_rate_limiter_honours_retry_after(self, sleep):
+        limiter = RateLimiter(max_concurrency=2)
+
+        limiter.release(limiter.acquire(), status=200)
+        self.assertEqual(sleep.call_count, 0)
+
+        limiter.release(limiter.acquire(), status=429,
+                        headers={'Retry-After': '5'})
+        self.assertEqual(limiter.throttled, 1)
+        self.assertEqual(limiter.concurrency.limit, 1)
+
+        limiter.acquire()
+        self.assertTrue(4 < sleep.call_args_list[0][0][0] <= 5)
+
+    def test_get_retry_after(self):
+        self.assertEqual(get_retry_after({'retry-after': '2'}), 2)
+        self.assertEqual(get_retry_after({}), None)
+        self.assertEqual(get_retry_after(None), None)
+
+        http_date = time.strftime('%a, %d %b %Y %H:%M:%S GMT',
+                                  time.gmtime(time.time() + 60))
+        retry_after = get_retry_after({'Retry-After': http_date})
+        self.assertTrue(55 < retry_after <= 60)
+
+    def test_connection_rate_limiter(self):
+        class RateLimitedConnection(ConnectionKey):
+            rate_limit = {'max_concurrency': 2}
+
+        con = RateLimitedConnection('key', host='example.com')
+        rate_limiter = get_rate_limiter(con)
+
+        # Shared by the connections with the same host and credentials
+        self.assertTrue(get_rate_limiter(RateLimitedConnection(
+            'key', host='example.com')) is rate_limiter)
+        self.assertFalse(get_rate_limiter(RateLimitedConnection(
+            'other', host='example.com')) is rate_limiter)
+        self.assertEqual(get_rate_limiter(Connection()), None)
+
+        con.connection = Mock()
+        con.responseCls = Mock(return_value=Mock(status=200, headers={}))
+        con.request('/')
+        self.assertEqual(rate_limiter.requests, 1)
+
+        con.responseCls = Mock(side_effect=RateLimitReachedError(
+            headers={'retry-after': '0'}))
+        self.assertRaises(RateLimitReachedError, con.request, '/')
+        self.assertEqual(rate_limiter.requests, 2)
+        self.assertEqual(rate_limiter.throttled, 1)
+        self.assertEqual(rate_limiter.concurrency.in_flight, 0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,8 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import sys
+import pickle
 import unittest
 
+from mock import Mock
+
 from libcloud.common.base import Connection, ConnectionKey, ConnectionUserAndKey
 from libcloud.common.types import LibcloudError
 from libcloud.compute.base import Node, NodeSize, NodeImage, NodeDriver, StorageVolume
@@ -45,6 +48,26 @@ class BaseTests(unittest.TestCase):
     def test_base_node_driver(self):
         NodeDriver('foo')
 
+    def test_node_interned_strings(self):
+        node = Node(id='1', name='node', state=''.join(['runn', 'ing']),
+                    public_ips=[], private_ips=[], driver=FakeDriver(),
+                    extra={'region': ''.join(['us-', 'east-1'])})
+
+        self.assertTrue(node.state is sys.intern('running'))
+        self.assertTrue(node.extra['region'] is sys.intern('us-east-1'))
+
+        # Attributes are stored in the instance __dict__
+        node.custom = 'value'
+        self.assertEqual(vars(node)['name'], 'node')
+        self.assertEqual(vars(node)['state'], 'running')
+        self.assertEqual(node.__dict__['custom'], 'value')
+
+        node.driver = None
+        node = pickle.loads(pickle.dumps(node))
+        self.assertEqual(node.name, 'node')
+        self.assertEqual(node.extra, {'region': 'us-east-1'})
+        self.assertEqual(node.custom, 'value')
+
     def test_base_connection_key(self):
         ConnectionKey('foo')
 
@@ -108,5 +131,53 @@ class TestValidateAuth(unittest.TestCase):
         self.assertRaises(LibcloudError, n._get_and_check_auth, auth)
 
 
+class BulkNodeOperationsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = NodeDriver('foo')
+
+        def create_node(name, size):
+            if name == 'node-2':
+                raise LibcloudError('failure')
+
+            return Node(id=name, name=name, state=None, public_ips=[],
+                        private_ips=[], driver=self.driver)
+
+        self.driver.create_node = Mock(side_effect=create_node)
+        self.driver.destroy_node = Mock(return_value=True)
+
+    def test_create_nodes(self):
+        results = self.driver.create_nodes(count=3, size='small',
+                                           max_workers=1)
+
+        self.assertEqual([result.item for result in results],
+                         ['node-1', 'node-2', 'node-3'])
+        self.assertEqual([result.success for result in results],
+                         [True, False, True])
+        self.assertEqual(results[2].result.name, 'node-3')
+        self.assertTrue(isinstance(results[1].error, LibcloudError))
+        self.driver.create_node.assert_called_with(name='node-3',
+                                                   size='small')
+
+        results = self.driver.create_nodes(names=['a', 'b'], size='small')
+        self.assertEqual(sorted(result.result.name for result in results),
+                         ['a', 'b'])
+
+        self.assertRaises(ValueError, self.driver.create_nodes)
+        self.assertRaises(ValueError, self.driver.create_nodes, count=1,
+                          names=['a'])
+
+    def test_destroy_nodes(self):
+        nodes = [Node(id=str(index), name='node', state=None, public_ips=[],
+                      private_ips=[], driver=self.driver)
+                 for index in range(3)]
+
+        results = self.driver.destroy_nodes(nodes, max_workers=2)
+
+        self.assertEqual([result.item for result in results], nodes)
+        self.assertEqual([result.result for result in results],
+                         [True, True, True])
+        self.assertEqual(self.driver.destroy_node.call_count, 3)
+
+
 if __name__ == '__main__':
     sys.exit(unittest.main())
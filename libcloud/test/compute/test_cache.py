@@ -0,0 +1,250 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import stat
+import pickle
+import shutil
+import tempfile
+
+from mock import Mock, patch
+
+from libcloud.test import unittest
+from libcloud.compute.base import NodeSize
+from libcloud.compute.deployment import ScriptDeployment
+from libcloud.compute.drivers.dummy import DummyNodeDriver
+from libcloud.compute.cache import CatalogCache
+from libcloud.compute.cache import FileCacheBackend
+from libcloud.compute.cache import MemoryCacheBackend
+from libcloud.compute.cache import get_driver_cache_key
+
+
+class DriverNodeSize(NodeSize):
+    pass
+
+
+class CatalogCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = DummyNodeDriver(0)
+        self.list_sizes = Mock(wraps=self.driver.list_sizes)
+        self.driver.list_sizes = self.list_sizes
+
+    def test_attach(self):
+        cache = CatalogCache()
+        cache.attach(self.driver)
+
+        sizes = self.driver.list_sizes()
+        cached_sizes = self.driver.list_sizes()
+
+        self.assertEqual(self.list_sizes.call_count, 1)
+        self.assertEqual([size.id for size in cached_sizes],
+                         [size.id for size in sizes])
+        self.assertTrue(cached_sizes[0].driver is self.driver)
+        # Every call returns a new copy
+        self.assertFalse(cached_sizes[0] is sizes[0])
+
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertEqual(cache.stats.hit_ratio, 0.5)
+
+        # Arguments are part of the key
+        location = self.driver.list_locations()[0]
+        self.driver.list_sizes(location=location)
+        self.driver.list_sizes(location=location)
+        self.assertEqual(self.list_sizes.call_count, 2)
+
+        cache.detach(self.driver)
+        self.driver.list_sizes()
+        self.assertTrue(self.driver.list_sizes is self.list_sizes)
+
+    def test_shared_between_drivers(self):
+        cache = CatalogCache()
+        cache.attach(self.driver)
+        self.driver.list_sizes()
+
+        driver = cache.attach(DummyNodeDriver(0))
+        driver.list_sizes = Mock(wraps=driver.list_sizes)
+        sizes = driver.list_sizes()
+        self.assertEqual(self.list_sizes.call_count, 1)
+        self.assertTrue(sizes[0].driver is driver)
+
+        # Different credentials
+        driver = DummyNodeDriver(0)
+        driver.key = 'other'
+        self.assertNotEqual(get_driver_cache_key(driver),
+                            get_driver_cache_key(self.driver))
+
+    def test_ttl_and_invalidate(self):
+        cache = CatalogCache(ttl=60, method_ttls={'list_images': 10})
+        cache.attach(self.driver)
+
+        with patch('time.time', Mock(return_value=1000)):
+            self.driver.list_sizes()
+
+        with patch('time.time', Mock(return_value=1059)):
+            self.driver.list_sizes()
+            self.assertEqual(self.list_sizes.call_count, 1)
+
+        with patch('time.time', Mock(return_value=1060)):
+            self.driver.list_sizes()
+            self.assertEqual(self.list_sizes.call_count, 2)
+
+        self.driver.list_images()
+        self.driver.list_sizes()
+        self.assertEqual(self.list_sizes.call_count, 3)
+
+        cache.invalidate(driver=self.driver, method='list_sizes')
+        self.assertEqual(len(cache.backend), 1)
+        self.driver.list_sizes()
+        self.assertEqual(self.list_sizes.call_count, 4)
+
+        cache.invalidate(driver=self.driver)
+        self.assertEqual(len(cache.backend), 0)
+
+    def test_exceptions_are_not_cached(self):
+        cache = CatalogCache()
+        self.list_sizes.side_effect = [ValueError('error'), []]
+        cache.attach(self.driver)
+
+        self.assertRaises(ValueError, self.driver.list_sizes)
+        self.assertEqual(self.driver.list_sizes(), [])
+        self.assertEqual(self.driver.list_sizes(), [])
+        self.assertEqual(self.list_sizes.call_count, 2)
+
+    def test_only_safe_classes_are_loaded(self):
+        class Tampered(object):
+            def __reduce__(self):
+                return (os.getcwd, ())
+
+        cache = CatalogCache()
+        cache.attach(self.driver)
+        self.driver.list_sizes()
+
+        key = list(cache.backend._entries.keys())[0]
+        cache.backend.set(key, pickle.dumps([Tampered()]), 60)
+
+        # Value is refused and treated as a cache miss
+        sizes = self.driver.list_sizes()
+        self.assertEqual(self.list_sizes.call_count, 2)
+        self.assertEqual(sizes[0].__class__.__name__, 'NodeSize')
+        self.assertEqual(cache.stats.misses, 2)
+
+        # libcloud classes which are not explicitly allowed are refused too
+        cache.backend.set(key, pickle.dumps([ScriptDeployment('ls')]), 60)
+        self.driver.list_sizes()
+        self.assertEqual(self.list_sizes.call_count, 3)
+        self.assertEqual(cache.stats.misses, 3)
+
+    def test_driver_catalog_classes_are_loaded(self):
+        list_sizes = Mock(return_value=[
+            DriverNodeSize(id=1, name='size', ram=512, disk=4, bandwidth=None,
+                           price=None, driver=self.driver)])
+        self.driver.list_sizes = list_sizes
+
+        cache = CatalogCache()
+        cache.attach(self.driver)
+        self.driver.list_sizes()
+        self.driver.list_sizes()
+        self.assertEqual(list_sizes.call_count, 2)
+        self.assertEqual(cache.stats.hits, 0)
+
+        # Driver model classes can only be loaded if the driver lists them
+        self.driver.catalog_classes = [DriverNodeSize]
+        sizes = self.driver.list_sizes()
+        self.assertEqual(list_sizes.call_count, 2)
+        self.assertTrue(isinstance(sizes[0], DriverNodeSize))
+
+
+class MemoryCacheBackendTestCase(unittest.TestCase):
+    def test_lru_eviction(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set('a', b'a', 60)
+        backend.set('b', b'b', 60)
+        self.assertEqual(backend.get('a'), b'a')
+
+        backend.set('c', b'c', 60)
+
+        self.assertEqual(len(backend), 2)
+        self.assertEqual(backend.get('b'), None)
+        self.assertEqual(backend.get('a'), b'a')
+
+
+class FileCacheBackendTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_shared_between_instances(self):
+        driver = DummyNodeDriver(0)
+        driver.list_images = Mock(wraps=driver.list_images)
+        CatalogCache(backend=FileCacheBackend(self.directory)).attach(driver)
+        images = driver.list_images()
+
+        # Different cache and backend instance (e.g. a different process)
+        driver = DummyNodeDriver(0)
+        list_images = Mock(wraps=driver.list_images)
+        driver.list_images = list_images
+        cache = CatalogCache(backend=FileCacheBackend(self.directory))
+        cache.attach(driver)
+        cached_images = driver.list_images()
+
+        self.assertEqual(list_images.call_count, 0)
+        self.assertEqual([image.name for image in cached_images],
+                         [image.name for image in images])
+        self.assertTrue(cached_images[0].driver is driver)
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_ttl_and_eviction(self):
+        backend = FileCacheBackend(self.directory, max_entries=2)
+
+        with patch('time.time', Mock(return_value=1000)):
+            backend.set('a', b'a', 60)
+
+        with patch('time.time', Mock(return_value=1060)):
+            self.assertEqual(backend.get('a'), None)
+
+        self.assertEqual(len(backend), 0)
+
+        backend.set('a', b'a', 60)
+        backend.set('b', b'b', 60)
+        backend.set('c', b'c', 60)
+        self.assertEqual(len(backend), 2)
+
+        backend.delete_prefix('c')
+        self.assertEqual(len(backend), 1)
+
+    @unittest.skipIf(not hasattr(os, 'getuid'), 'Requires POSIX')
+    def test_untrusted_directory_and_entries(self):
+        directory = os.path.join(self.directory, 'cache')
+        backend = FileCacheBackend(directory)
+        self.assertEqual(stat.S_IMODE(os.stat(directory).st_mode), 0o700)
+
+        backend.set('a', b'a', 60)
+        self.assertEqual(backend.get('a'), b'a')
+
+        with patch('os.getuid', Mock(return_value=os.getuid() + 1)):
+            # Entry owned by a different user is ignored
+            self.assertEqual(backend.get('a'), None)
+            self.assertRaises(ValueError, FileCacheBackend, directory)
+
+        os.chmod(directory, 0o777)
+        self.assertRaises(ValueError, FileCacheBackend, directory)
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -18,6 +18,7 @@ from __future__ import with_statement
 
 import os
 import sys
+import socket
 import time
 import unittest
 
@@ -36,6 +37,7 @@ from libcloud.compute.ssh import BaseSSHClient
 from libcloud.compute.ssh import have_paramiko
 from libcloud.compute.ssh import SSHCommandTimeoutError
 from libcloud.compute.drivers.rackspace import RackspaceFirstGenNodeDriver as Rackspace
+from libcloud.compute.drivers.dummy import DummyNodeDriver
 
 from libcloud.test import MockHttp, XML_HEADERS
 from libcloud.test.file_fixtures import ComputeFileFixtures
@@ -364,6 +366,61 @@ class DeploymentTests(unittest.TestCase):
         self.assertEqual(['67.23.21.33'], nodes[0][1])
         self.assertEqual(['67.23.21.34'], nodes[1][1])
 
+    @patch('libcloud.compute.base.time.sleep')
+    def test_wait_until_running_refreshes_only_pending_nodes(self, sleep):
+        self.node.state = NodeState.PENDING
+        self.node2.state = NodeState.PENDING
+        refreshed = []
+
+        def refresh_nodes(nodes, ex_list_nodes_kwargs=None):
+            refreshed.append([node.id for node in nodes])
+
+            # One node comes online per iteration
+            if len(refreshed) == 1:
+                self.node.state = NodeState.RUNNING
+            elif len(refreshed) == 3:
+                self.node2.state = NodeState.RUNNING
+
+            return nodes
+
+        self.driver._refresh_nodes = refresh_nodes
+
+        nodes = self.driver.wait_until_running(
+            nodes=[self.node, self.node2], wait_period=1, backoff=2,
+            max_wait_period=3, timeout=60)
+
+        self.assertEqual([node.id for node, _ in nodes], ['12345', '123456'])
+        self.assertEqual(refreshed, [['12345', '123456'], ['123456'],
+                                     ['123456']])
+
+        # Wait period grows with each iteration and is shortened by jitter
+        delays = [call[0][0] for call in sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0.75 <= delays[0] <= 1)
+        self.assertTrue(1.5 <= delays[1] <= 2)
+
+    def test_wait_until_running_ssh_port(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('127.0.0.1', 0))
+        server.listen(2)
+        port = server.getsockname()[1]
+        self.driver._refresh_nodes = Mock(side_effect=lambda nodes, **kwargs:
+                                          nodes)
+        self.node.public_ips = ['127.0.0.1']
+
+        try:
+            node, ips = self.driver.wait_until_running(
+                nodes=[self.node], wait_period=0.1, timeout=0.5,
+                ssh_port=port)[0]
+            self.assertEqual(ips, ['127.0.0.1'])
+        finally:
+            server.close()
+
+        # Nothing is listening on the port anymore
+        self.assertRaises(LibcloudError, self.driver.wait_until_running,
+                          nodes=[self.node], wait_period=0.1, timeout=0.2,
+                          ssh_port=port)
+
     def test_ssh_client_connect_success(self):
         mock_ssh_client = Mock()
         mock_ssh_client.return_value = None
@@ -733,6 +790,140 @@ class DeploymentTests(unittest.TestCase):
         self.assertEqual(self.node.id, node.id)
 
 
+class ConnectingMockClient(MockClient):
+    commands = []
+    failing_hostnames = ['127.0.0.4']
+
+    def __init__(self, hostname, *args, **kwargs):
+        super(ConnectingMockClient, self).__init__()
+        self.hostname = hostname
+
+    def connect(self):
+        if self.hostname in self.failing_hostnames:
+            raise LibcloudError('Authentication failed')
+
+        return True
+
+    def run(self, cmd, timeout=None):
+        self.commands.append((self.hostname, cmd))
+        self.stdout = 'hello from %s' % (self.hostname)
+        return self.stdout, self.stderr, self.exit_status
+
+    def close(self):
+        return True
+
+
+@patch('libcloud.compute.base.SSHClient', ConnectingMockClient)
+class DeployNodesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = DummyNodeDriver(0)
+        ConnectingMockClient.commands = []
+        ConnectingMockClient.failing_hostnames = ['127.0.0.4']
+
+    def test_deploy_nodes_success(self):
+        deploy = MultiStepDeployment([ScriptDeployment('echo hello')])
+
+        results = self.driver.deploy_nodes(deploy=deploy, count=5,
+                                           name='node', size=None,
+                                           image=None, ssh_key='key',
+                                           wait_period=0, max_workers=3)
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual([result.item for result in results],
+                         ['node-1', 'node-2', 'node-3', 'node-4', 'node-5'])
+
+        # Node with IP 127.0.0.4 fails to authenticate
+        failed = [result for result in results if not result.success]
+        self.assertEqual(len(failed), 1)
+        self.assertTrue(isinstance(failed[0].error, DeploymentError))
+        self.assertEqual(failed[0].error.node.public_ips, ['127.0.0.4'])
+
+        nodes = [result.result for result in results if result.success]
+        self.assertEqual(len(nodes), 4)
+        self.assertEqual(len(set(node.id for node in nodes)), 4)
+
+        for node in nodes:
+            self.assertTrue(node.driver is self.driver)
+
+        hostnames = sorted(hostname for hostname, _ in
+                           ConnectingMockClient.commands)
+        self.assertEqual(hostnames, ['127.0.0.3', '127.0.0.5', '127.0.0.6',
+                                     '127.0.0.7'])
+
+        # Original deployment object is not modified
+        self.assertEqual(deploy.steps[0].stdout, None)
+
+    def test_deploy_nodes_single_list_nodes_call_per_iteration(self):
+        created = []
+
+        def create_node(name, size, image):
+            node = Node(id=name, name=name, state=NodeState.PENDING,
+                        public_ips=['1.2.3.%s' % (len(created) + 1)],
+                        private_ips=[], driver=self.driver)
+            created.append(node)
+            return node
+
+        list_nodes_calls = []
+
+        def list_nodes():
+            list_nodes_calls.append(1)
+
+            # One node comes online per iteration, last one never does
+            for node in created[:len(list_nodes_calls)]:
+                if node.name != 'web-3':
+                    node.state = NodeState.RUNNING
+
+            return created
+
+        self.driver.create_node = create_node
+        self.driver.list_nodes = list_nodes
+
+        results = self.driver.deploy_nodes(deploy=ScriptDeployment('ls'),
+                                           names=['web-1', 'web-2', 'web-3'],
+                                           size=None, image=None,
+                                           ssh_key='key', wait_period=0.05,
+                                           timeout=1, max_workers=1)
+
+        self.assertEqual([result.success for result in results],
+                         [True, True, False])
+        self.assertTrue('Timed out' in str(results[2].error))
+        self.assertEqual(results[2].error.node.name, 'web-3')
+        self.assertTrue(len(list_nodes_calls) > 2)
+        self.assertEqual(len(ConnectingMockClient.commands), 2)
+
+    def test_deploy_nodes_create_node_failure(self):
+        create_node = self.driver.create_node
+
+        def failing_create_node(name, size, image):
+            if name == 'node-2':
+                raise ValueError('Quota exceeded')
+
+            return create_node(name=name, size=size, image=image)
+
+        self.driver.create_node = failing_create_node
+        ConnectingMockClient.failing_hostnames = []
+
+        results = self.driver.deploy_nodes(deploy=ScriptDeployment('ls'),
+                                           count=3, name='node', size=None,
+                                           image=None, ssh_key='key',
+                                           wait_period=0)
+
+        self.assertEqual([result.success for result in results],
+                         [True, False, True])
+        self.assertTrue(isinstance(results[1].error, ValueError))
+        self.assertEqual(len(ConnectingMockClient.commands), 2)
+
+    def test_deploy_nodes_invalid_arguments(self):
+        self.assertRaises(ValueError, self.driver.deploy_nodes,
+                          deploy=Mock(), ssh_key='key')
+        self.assertRaises(ValueError, self.driver.deploy_nodes,
+                          deploy=Mock(), count=2, names=['a', 'b'],
+                          ssh_key='key')
+        self.assertRaises(NotImplementedError, self.driver.deploy_nodes,
+                          deploy=Mock(), count=2)
+
+
 class RackspaceMockHttp(MockHttp):
     fixtures = ComputeFileFixtures('openstack')
 
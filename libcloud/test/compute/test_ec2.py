@@ -20,6 +20,7 @@ from collections import OrderedDict
 import os
 import sys
 import base64
+import tempfile
 from datetime import datetime
 from libcloud.utils.iso8601 import UTC
 
@@ -35,6 +36,11 @@ from libcloud.compute.drivers.ec2 import IdempotentParamError
 from libcloud.compute.drivers.ec2 import VALID_EC2_REGIONS
 from libcloud.compute.drivers.ec2 import ExEC2AvailabilityZone
 from libcloud.compute.drivers.ec2 import EC2NetworkSubnet
+from libcloud.compute.drivers.ec2 import RESOURCE_EXTRA_ATTRIBUTES_MAP
+from libcloud.compute.constants.ec2_catalog import EC2InstanceTypeCatalog
+from libcloud.compute.constants.ec2_catalog import build_catalog
+from libcloud.compute.constants.ec2_catalog import get_catalog
+from libcloud.compute.constants.ec2_catalog import write_catalog
 from libcloud.compute.base import Node, NodeImage, NodeSize, NodeLocation
 from libcloud.compute.base import StorageVolume, VolumeSnapshot
 from libcloud.compute.types import KeyPairDoesNotExistError, StorageVolumeState, \
@@ -177,6 +183,43 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertEqual(node.extra['tags']['Name'], 'foo')
         self.assertEqual(len(node.extra['tags']), 1)
 
+    def test_create_nodes(self):
+        # assertions are done in _create_nodes_RunInstances
+        EC2MockHttp.type = 'create_nodes'
+        image = NodeImage(id='ami-be3adfd7',
+                          name=self.image_name,
+                          driver=self.driver)
+        size = NodeSize('m1.small', 'Small Instance', None, None, None, None,
+                        driver=self.driver)
+        results = self.driver.create_nodes(count=2, name='foo', image=image,
+                                           size=size, ex_mincount=1,
+                                           max_workers=1)
+
+        # Only one of the instances has been launched
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].item, 'foo-1')
+        self.assertEqual(results[0].result.id, 'i-2ba64342')
+        self.assertEqual(results[0].result.name, 'foo-1')
+        self.assertEqual(results[0].result.extra['tags']['Name'], 'foo-1')
+        self.assertFalse(results[1].success)
+        self.assertEqual(results[1].item, 'foo-2')
+
+    def test_create_nodes_run_instances_failure(self):
+        EC2MockHttp.type = 'create_nodes_failure'
+        image = NodeImage(id='ami-be3adfd7',
+                          name=self.image_name,
+                          driver=self.driver)
+        size = NodeSize('m1.small', 'Small Instance', None, None, None, None,
+                        driver=self.driver)
+        results = self.driver.create_nodes(count=2, name='foo', image=image,
+                                           size=size, max_workers=1)
+
+        self.assertEqual([result.item for result in results],
+                         ['foo-1', 'foo-2'])
+        self.assertFalse(any(result.success for result in results))
+        self.assertTrue(results[0].error is results[1].error)
+
     def test_create_node_with_ex_assign_public_ip(self):
         # assertions are done in _create_ex_assign_public_ip_RunInstances
         EC2MockHttp.type = 'create_ex_assign_public_ip'
@@ -315,6 +358,21 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         self.assertIn('instance_type', ret_node1.extra)
         self.assertIn('instance_type', ret_node2.extra)
 
+    def test_list_nodes_extra_is_decoded_lazily(self):
+        node = self.driver.list_nodes()[0]
+
+        # Only the tags are decoded when the node is created
+        self.assertEqual(set(dict.keys(node.extra)), set(['tags']))
+        self.assertEqual(node.extra['image_id'], 'ami-3215fe5a')
+        self.assertEqual(set(dict.keys(node.extra)), set(['tags', 'image_id']))
+
+        expected = self.driver._get_extra_dict(node.extra._source, RESOURCE_EXTRA_ATTRIBUTES_MAP['node'])
+        extra = dict(node.extra)
+        self.assertEqual(len(extra['groups']), 2)
+
+        for key, value in expected.items():
+            self.assertEqual(extra[key], value)
+
     def test_ex_list_reserved_nodes(self):
         node = self.driver.ex_list_reserved_nodes()[0]
         self.assertEqual(node.id, '93bbbca2-c500-49d0-9ede-9d8737400498')
@@ -454,6 +512,40 @@ class EC2Tests(LibcloudTestCase, TestCaseMixin):
         ret = self.driver.destroy_node(node)
         self.assertTrue(ret)
 
+    def test_destroy_nodes(self):
+        # assertions are done in _destroy_nodes_TerminateInstances
+        EC2MockHttp.type = 'destroy_nodes'
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-00000000', None, None, None, None, self.driver)]
+
+        results = self.driver.destroy_nodes(nodes)
+
+        self.assertEqual([result.item for result in results], nodes)
+        self.assertTrue(results[0].result)
+        self.assertFalse(results[1].success)
+
+    def test_destroy_nodes_batch_failure(self):
+        # Batch request fails, nodes are destroyed one by one
+        EC2MockHttp.type = 'destroy_nodes_failure'
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-00000000', None, None, None, None, self.driver)]
+
+        results = self.driver.destroy_nodes(nodes, max_workers=1)
+
+        self.assertTrue(results[0].result)
+        self.assertFalse(results[1].success)
+
+    def test_refresh_nodes(self):
+        # assertions are done in _refresh_nodes_DescribeInstances
+        EC2MockHttp.type = 'refresh_nodes'
+        nodes = [Node('i-4382922a', None, None, None, None, self.driver),
+                 Node('i-00000000', None, None, None, None, self.driver)]
+
+        refreshed = self.driver._refresh_nodes(
+            nodes, ex_list_nodes_kwargs={'ex_filters': {'tag:env': 'dev'}})
+
+        self.assertEqual([node.id for node in refreshed], ['i-4382922a'])
+
     def test_list_sizes(self):
         region_old = self.driver.region_name
 
@@ -1413,6 +1505,60 @@ class EC2SAEastTests(EC2Tests):
     region = 'sa-east-1'
 
 
+class EC2InstanceTypeCatalogTests(unittest.TestCase):
+    instance_types = {
+        'm5.large': {'id': 'm5.large', 'name': 'm5.large', 'ram': 8192, 'disk': 0, 'bandwidth': 10,
+                     'extra': {'vcpu': '2', 'memory': '8 GiB', 'storage': 'EBS only'}},
+        'i3.large': {'id': 'i3.large', 'name': 'i3.large', 'ram': 15616, 'disk': 475, 'bandwidth': None,
+                     'extra': {'vcpu': '2', 'memory': '15.25 GiB', 'gpu': '0'}}
+    }
+    regions = {
+        'us-east-1': {'id': 'us-east-1', 'api_name': 'ec2_us_east', 'country': 'USA',
+                      'endpoint': 'ec2.us-east-1.amazonaws.com', 'signature_version': '2',
+                      'instance_types': ['m5.large', 'i3.large']},
+        'eu-west-3': {'id': 'eu-west-3', 'api_name': 'ec2_eu_west_paris', 'country': 'France',
+                      'endpoint': 'ec2.eu-west-3.amazonaws.com', 'signature_version': '4',
+                      'instance_types': ['m5.large']}
+    }
+
+    def test_build_write_and_load_catalog(self):
+        _, file_path = tempfile.mkstemp(suffix='.json')
+        self.addCleanup(os.unlink, file_path)
+
+        write_catalog(build_catalog(self.instance_types, self.regions), file_path=file_path)
+        catalog = EC2InstanceTypeCatalog.load(file_path=file_path)
+
+        self.assertEqual(catalog.list_instance_types(), ['i3.large', 'm5.large'])
+        self.assertEqual(catalog.list_regions(), ['eu-west-3', 'us-east-1'])
+
+        for name, attributes in self.instance_types.items():
+            self.assertEqual(catalog.get_instance_type(name), attributes)
+
+        for region, details in self.regions.items():
+            details = dict(details, instance_types=sorted(details['instance_types']))
+            self.assertEqual(catalog.get_region_details(region), details)
+
+        self.assertEqual(catalog.get_region_instance_types('eu-west-3'), ['m5.large'])
+        self.assertRaises(KeyError, catalog.get_instance_type, 'unknown.large')
+        self.assertRaises(KeyError, catalog.get_region_instance_types, 'unknown-1')
+
+        # Returned dictionaries can be modified by the caller
+        catalog.get_instance_type('m5.large')['extra']['vcpu'] = '4'
+        self.assertEqual(catalog.get_instance_type('m5.large')['extra']['vcpu'], '2')
+
+    def test_default_catalog_backward_compatibility(self):
+        from libcloud.compute.constants.ec2_instance_types import INSTANCE_TYPES
+        from libcloud.compute.constants.ec2_region_details_complete import REGION_DETAILS
+
+        catalog = get_catalog()
+        self.assertTrue(catalog is get_catalog())
+        self.assertEqual(INSTANCE_TYPES['m5.large'], catalog.get_instance_type('m5.large'))
+        self.assertEqual(INSTANCE_TYPES['m5.large']['ram'], 8192)
+        self.assertEqual(REGION_DETAILS['us-east-1']['instance_types'],
+                         catalog.get_region_instance_types('us-east-1'))
+        self.assertTrue('m5.large' in REGION_DETAILS['us-east-1']['instance_types'])
+
+
 class EC2MockHttp(MockHttp, unittest.TestCase):
     fixtures = ComputeFileFixtures('ec2')
 
@@ -1560,6 +1706,51 @@ class EC2MockHttp(MockHttp, unittest.TestCase):
         body = self.fixtures.load('run_instances_spot.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _create_nodes_RunInstances(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {'MinCount': '1',
+                                                'MaxCount': '2'})
+        body = self.fixtures.load('run_instances.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _create_nodes_CreateTags(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {'ResourceId.0': 'i-2ba64342',
+                                                'Tag.0.Key': 'Name',
+                                                'Tag.0.Value': 'foo-1'})
+        return self._CreateTags(method, url, body, headers)
+
+    def _create_nodes_failure_RunInstances(self, method, url, body, headers):
+        body = self.fixtures.load('run_instances_idem_mismatch.xml')
+        return (httplib.BAD_REQUEST, body, {}, httplib.responses[httplib.BAD_REQUEST])
+
+    def _destroy_nodes_TerminateInstances(self, method, url, body, headers):
+        self.assertUrlContainsQueryParams(url, {'InstanceId.1': 'i-4382922a',
+                                                'InstanceId.2': 'i-00000000'})
+        body = self.fixtures.load('terminate_instances.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _refresh_nodes_DescribeInstances(self, method, url, body, headers):
+        self.assertTrue('InstanceId.1' not in url)
+        self.assertUrlContainsQueryParams(url, {
+            'Filter.1.Name': 'tag:env',
+            'Filter.1.Value.1': 'dev',
+            'Filter.2.Name': 'instance-id',
+            'Filter.2.Value.1': 'i-4382922a',
+            'Filter.2.Value.2': 'i-00000000'
+        })
+        return self._DescribeInstances(method, url, body, headers)
+
+    def _refresh_nodes_DescribeAddresses(self, method, url, body, headers):
+        return self._DescribeAddresses(method, url, body, headers)
+
+    def _destroy_nodes_failure_TerminateInstances(self, method, url, body,
+                                                  headers):
+        if 'i-4382922a' in url and 'InstanceId.2' not in url:
+            return self._TerminateInstances(method, url, body, headers)
+
+        body = self.fixtures.load('run_instances_idem_mismatch.xml')
+        return (httplib.BAD_REQUEST, body, {},
+                httplib.responses[httplib.BAD_REQUEST])
+
     def _TerminateInstances(self, method, url, body, headers):
         body = self.fixtures.load('terminate_instances.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
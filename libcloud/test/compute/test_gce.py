@@ -26,12 +26,14 @@ from libcloud.compute.drivers.gce import (
     GCENodeDriver, API_VERSION, timestamp_to_datetime, GCEAddress, GCEBackend,
     GCEBackendService, GCEFirewall, GCEForwardingRule, GCEHealthCheck,
     GCENetwork, GCENodeImage, GCERoute, GCERegion, GCETargetHttpProxy,
-    GCEUrlMap, GCEZone, GCESubnetwork, GCEProject)
+    GCEUrlMap, GCEZone, GCESubnetwork, GCEProject, GCEImageIndex,
+    clear_image_index_cache)
 from libcloud.common.google import (GoogleBaseAuthConnection,
                                     ResourceNotFoundError, ResourceExistsError,
                                     GoogleBaseError)
 from libcloud.test.common.test_google import GoogleAuthMockHttp, GoogleTestCase
 from libcloud.compute.base import Node, StorageVolume
+from libcloud.compute.cache import get_driver_cache_key
 from libcloud.compute.types import NodeState
 
 from libcloud.test import MockHttp
@@ -59,6 +61,27 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         kwargs['auth_type'] = 'IA'
         kwargs['datacenter'] = self.datacenter
         self.driver = GCENodeDriver(*GCE_PARAMS, **kwargs)
+        # MockHttp doesn't support concurrent requests
+        self.driver.image_index_max_workers = 1
+        clear_image_index_cache()
+
+    def test_driver_cache_key_includes_zone(self):
+        kwargs = GCE_KEYWORD_PARAMS.copy()
+        kwargs['auth_type'] = 'IA'
+        kwargs['datacenter'] = 'us-central1-b'
+        driver = GCENodeDriver(*GCE_PARAMS, **kwargs)
+
+        # Zones in the same region
+        self.assertEqual(self.driver.zone.name, 'us-central1-a')
+        self.assertEqual(driver.zone.name, 'us-central1-b')
+        self.assertEqual(driver.region.name, self.driver.region.name)
+        self.assertNotEqual(get_driver_cache_key(driver),
+                            get_driver_cache_key(self.driver))
+
+        kwargs['datacenter'] = 'us-central1-a'
+        driver = GCENodeDriver(*GCE_PARAMS, **kwargs)
+        self.assertEqual(get_driver_cache_key(driver),
+                         get_driver_cache_key(self.driver))
 
     def test_default_scopes(self):
         self.assertIsNone(self.driver.scopes)
@@ -1527,6 +1550,21 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
                           base_name, size, image, number,
                           ex_image_family='coreos-stable')
 
+    def test_create_nodes(self):
+        image = self.driver.ex_get_image('debian-7')
+        size = self.driver.ex_get_size('n1-standard-1')
+        results = self.driver.create_nodes(names=['lcnode-000', 'lcnode-001'],
+                                           size=size, image=image,
+                                           poll_interval=0.1)
+
+        self.assertEqual([result.item for result in results],
+                         ['lcnode-000', 'lcnode-001'])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[1].result.name, 'lcnode-001')
+
+        self.assertRaises(ValueError, self.driver.ex_create_multiple_nodes,
+                          'lcnode', size, image, 3, ex_names=['lcnode-000'])
+
     def test_ex_create_targethttpproxy(self):
         proxy_name = 'web-proxy'
         urlmap_name = 'web-map'
@@ -1831,6 +1869,25 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         for d in destroyed:
             self.assertTrue(d)
 
+    def test_destroy_nodes(self):
+        nodes = [self.driver.ex_get_node('lcnode-000'),
+                 self.driver.ex_get_node('lcnode-001')]
+        results = self.driver.destroy_nodes(nodes)
+        self.assertEqual([result.item for result in results], nodes)
+        self.assertEqual([result.result for result in results], [True, True])
+
+    def test_refresh_nodes(self):
+        node = self.driver.ex_get_node('node-name', 'us-central1-a')
+        removed_node = self.driver.ex_get_node('lcnode-000')
+        removed_node.name = 'libcloud-lb-demo-www-002'
+        removed_node.extra['zone'] = self.driver.ex_get_zone('us-central1-b')
+        self.driver.list_nodes = mock.Mock()
+
+        refreshed = self.driver._refresh_nodes([node, removed_node])
+
+        self.assertEqual([n.name for n in refreshed], ['node-name'])
+        self.assertEqual(self.driver.list_nodes.call_count, 0)
+
     def test_destroy_targethttpproxy(self):
         proxy = self.driver.ex_get_targethttpproxy('web-proxy')
         destroyed = proxy.destroy()
@@ -1988,6 +2045,104 @@ class GCENodeDriverTest(GoogleTestCase, TestCaseMixin):
         self.assertRaises(ResourceNotFoundError,
                           self.driver.ex_get_image_from_family, 'nofamily')
 
+    def test_ex_get_image_standard_projects_index(self):
+        image = self.driver.ex_get_image('centos-6-v20131120')
+        self.assertEqual(image.name, 'centos-6-v20131120')
+        image = self.driver.ex_get_image('centos-6')
+        self.assertEqual(image.name, 'centos-6-v20141205')
+        # Deprecated images are used if no other image matches
+        image = self.driver.ex_get_image('debian-6-squeeze')
+        self.assertEqual(image.name, 'debian-6-squeeze-v20130926')
+
+        image = self.driver.ex_get_image('coreos-beta')
+        self.assertEqual(image.name, 'coreos-beta-1548-2-0-v20171012')
+        image = self.driver.ex_get_image('ubuntu-1404-trusty-v20141212')
+        self.assertEqual(image.name, 'ubuntu-1404-trusty-v20141212')
+
+        # Index is shared by all the driver instances
+        kwargs = GCE_KEYWORD_PARAMS.copy()
+        kwargs['auth_type'] = 'IA'
+        driver = GCENodeDriver(*GCE_PARAMS, **kwargs)
+
+        with mock.patch.object(GCEMockHttp,
+                               '_projects_coreos_cloud_global_images') as m:
+            image = driver.ex_get_image('coreos-stable')
+            self.assertEqual(image.name, 'coreos-stable-1520-6-0-v20171012')
+            self.assertEqual(image.driver, driver)
+            self.assertEqual(m.call_count, 0)
+
+    def test_ex_get_image_standard_projects_index_matching_projects(self):
+        build_image_index = GCENodeDriver._build_image_index
+
+        with mock.patch.object(GCENodeDriver, '_build_image_index',
+                               autospec=True,
+                               side_effect=build_image_index) as m:
+            # Only indexes of the projects with a matching image family are
+            # built
+            image = self.driver.ex_get_image('centos-6', ['suse-cloud'])
+            self.assertEqual(image.name, 'centos-6-v20141205')
+            self.assertEqual([call[0][1] for call in m.call_args_list],
+                             ['centos-cloud'])
+
+            self.assertIsNone(
+                self.driver._match_standard_images('nonexistent'))
+            self.assertEqual(m.call_count, 1)
+
+    def test_ex_get_image_standard_projects_index_expires(self):
+        self.driver.ex_get_image('coreos-beta')
+        indexes = self.driver._get_image_indexes(['coreos-cloud'])
+        self.assertEqual(len(indexes), 1)
+        self.assertEqual(self.driver._get_image_indexes(['coreos-cloud']),
+                         indexes)
+
+        indexes[0].expires_at = 0
+        new_indexes = self.driver._get_image_indexes(['coreos-cloud'])
+        self.assertEqual(len(new_indexes), 1)
+        self.assertNotEqual(new_indexes, indexes)
+        self.assertFalse(new_indexes[0].is_expired())
+
+    def test_image_index(self):
+        images = [
+            {'name': 'debian-9-v1', 'family': 'debian-9',
+             'creationTimestamp': '2019-01-01T00:00:00.000-07:00'},
+            {'name': 'debian-9-v2', 'family': 'debian-9',
+             'creationTimestamp': '2019-02-01T00:00:00.000-07:00'},
+            {'name': 'debian-9-v3', 'family': 'debian-9',
+             'creationTimestamp': '2019-03-01T00:00:00.000-07:00',
+             'deprecated': {'state': 'DEPRECATED'}},
+            {'name': 'debian-10-v1', 'family': 'debian-10',
+             'creationTimestamp': '2019-01-15T00:00:00.000-07:00'}
+        ]
+        index = GCEImageIndex('debian-cloud', images)
+
+        self.assertEqual(index.get_image('debian-9-v1')['name'],
+                         'debian-9-v1')
+        self.assertEqual(index.get_image('debian-9-v3')['name'],
+                         'debian-9-v3')
+        self.assertIsNone(index.get_image('debian-9'))
+        # Newer deprecated images are skipped
+        self.assertEqual(index.get_latest_image('debian-9')['name'],
+                         'debian-9-v2')
+        self.assertEqual(index.get_latest_image('debian-')['name'],
+                         'debian-9-v2')
+        # unless no other image matches
+        self.assertEqual(index.get_latest_image('debian-9-v3')['name'],
+                         'debian-9-v3')
+        self.assertEqual(index.get_latest_image('debian-10')['name'],
+                         'debian-10-v1')
+        self.assertIsNone(index.get_latest_image('centos'))
+        self.assertFalse(index.is_expired())
+        self.assertTrue(GCEImageIndex('debian-cloud', [], ttl=0).is_expired())
+
+    def test_connection_request_project(self):
+        request_path = self.driver.connection.request_path
+        response = self.driver.connection.request(
+            '/global/images/family/coreos-beta', method='GET',
+            project='coreos-cloud')
+        self.assertEqual(response.object['name'],
+                         'coreos-beta-522-3-0-v20141226')
+        self.assertEqual(self.driver.connection.request_path, request_path)
+
     def test_ex_get_route(self):
         route_name = 'lcdemoroute'
         route = self.driver.ex_get_route(route_name)
@@ -1241,6 +1241,25 @@ class OpenStack_1_1_Tests(unittest.TestCase, TestCaseMixin):
         node = self.driver.ex_get_node_details('does-not-exist')
         self.assertTrue(node is None)
 
+    def test_refresh_nodes(self):
+        self.driver.list_nodes = Mock(side_effect=self.driver.list_nodes)
+        nodes = [Node('12064', None, None, None, None, self.driver),
+                 Node('does-not-exist', None, None, None, None, self.driver)]
+
+        refreshed = self.driver._refresh_nodes(nodes)
+
+        self.assertEqual([node.id for node in refreshed], ['12064'])
+        self.assertEqual(self.driver.list_nodes.call_count, 0)
+
+        # Too many nodes, all the nodes are listed instead
+        nodes = [Node(str(node_id), None, None, None, None, self.driver)
+                 for node_id in range(12060, 12080)]
+        refreshed = self.driver._refresh_nodes(nodes)
+
+        self.assertEqual(self.driver.list_nodes.call_count, 1)
+        self.assertEqual(sorted(node.id for node in refreshed),
+                         ['12064', '12065'])
+
     def test_ex_get_size(self):
         size_id = '7'
         size = self.driver.ex_get_size(size_id)
@@ -19,7 +19,10 @@ from __future__ import with_statement
 
 import os
 import sys
+import time
+import select
 import tempfile
+import threading
 
 from libcloud import _init_once
 from libcloud.test import LibcloudTestCase
@@ -27,6 +30,8 @@ from libcloud.test import unittest
 from libcloud.compute.ssh import ParamikoSSHClient
 from libcloud.compute.ssh import ShellOutSSHClient
 from libcloud.compute.ssh import have_paramiko
+from libcloud.compute.ssh import ChannelOutputBuffer
+from libcloud.compute.ssh import SSHCommandTimeoutError
 
 from libcloud.utils.py3 import StringIO
 from libcloud.utils.py3 import u
@@ -402,10 +407,8 @@ class ParamikoSSHClientTests(LibcloudTestCase):
                          'port': 22}
         mock.client.connect.assert_called_once_with(**expected_conn)
 
-    @patch.object(ParamikoSSHClient, '_consume_stdout',
-                  MagicMock(return_value=StringIO('')))
-    @patch.object(ParamikoSSHClient, '_consume_stderr',
-                  MagicMock(return_value=StringIO('')))
+    @patch.object(ParamikoSSHClient, '_read_channel_output',
+                  MagicMock(return_value=None))
     def test_basic_usage_absolute_path(self):
         """
         Basic execution.
@@ -577,6 +580,82 @@ class ParamikoSSHClientTests(LibcloudTestCase):
         self.assertEqual('\x00\x00&\x01\x00ab', stderr)
         self.assertEqual(len(stderr), 7)
 
+    def _get_client_with_channel(self, chan):
+        client = ParamikoSSHClient(hostname='dummy.host.org',
+                                   username='ubuntu')
+        client.client = Mock()
+        client.client.get_transport.return_value.open_session.return_value = chan
+        return client
+
+    def test_run_event_driven(self):
+        chan = FakeChannel(stdout=[b'line 1\nli', b'ne 2\nline', b' 3'],
+                           stderr=[b'err\n'], exit_status=3)
+        client = self._get_client_with_channel(chan)
+        client.SLEEP_DELAY = 10
+
+        stdout_lines = []
+        stderr_lines = []
+        start = time.time()
+        stdout, stderr, status = client.run(
+            'cmd', stdout_line_callback=stdout_lines.append,
+            stderr_line_callback=stderr_lines.append)
+
+        # Sleep based polling is never used
+        self.assertTrue(time.time() - start < 5)
+        self.assertEqual(stdout, 'line 1\nline 2\nline 3')
+        self.assertEqual(stderr, 'err\n')
+        self.assertEqual(status, 3)
+        self.assertEqual(stdout_lines, ['line 1', 'line 2', 'line 3'])
+        self.assertEqual(stderr_lines, ['err'])
+        self.assertTrue(chan.select_calls > 0)
+        chan.close()
+
+    def test_run_max_output_size(self):
+        chan = FakeChannel(stdout=[b'a' * 100, b'b' * 100, b'c' * 10],
+                           stderr=[], exit_status=0)
+        client = self._get_client_with_channel(chan)
+
+        stdout, stderr, status = client.run('cmd', max_output_size=15)
+
+        self.assertEqual(stdout, 'b' * 5 + 'c' * 10)
+        self.assertEqual(stderr, '')
+        chan.close()
+
+    def test_run_timeout(self):
+        chan = FakeChannel(stdout=[b'partial'], stderr=[], exit_status=None)
+        client = self._get_client_with_channel(chan)
+
+        try:
+            client.run('cmd', timeout=0.3)
+        except SSHCommandTimeoutError as e:
+            self.assertEqual(e.stdout, 'partial')
+            self.assertEqual(e.timeout, 0.3)
+        else:
+            self.fail('Exception was not thrown')
+
+        self.assertTrue(chan.closed)
+
+    def test_channel_output_buffer(self):
+        lines = []
+        output = ChannelOutputBuffer(line_callback=lines.append)
+
+        # Multi byte character split over multiple chunks
+        for char in '\U0001F926\n'.encode('utf-8'):
+            output.write(bytes([char]))
+        output.write(b'foo')
+        output.flush()
+
+        self.assertEqual(output.getvalue(), '\U0001F926\nfoo')
+        self.assertEqual(lines, ['\U0001F926', 'foo'])
+
+        output = ChannelOutputBuffer(max_size=4)
+
+        for _ in range(10):
+            output.write(b'0123456789')
+
+        self.assertEqual(output.getvalue(), '6789')
+        self.assertTrue(len(output._buffer) <= 2 * 4 + 10)
+
     def test_keep_alive_and_compression(self):
         conn_params = {'hostname': 'dummy.host.org',
                        'username': 'ubuntu'}
@@ -818,6 +897,91 @@ class ParamikoSSHClientTests(LibcloudTestCase):
         self.assertRaisesRegex(Exception, "Fatal exception", client._get_sftp_client)
 
 
+class FakeChannel(object):
+    """
+    Paramiko channel stand-in which delivers the provided output chunks from
+    a background thread and supports select().
+    """
+
+    def __init__(self, stdout, stderr, exit_status):
+        self._stdout = list(stdout)
+        self._stderr = list(stderr)
+        self._received_stdout = []
+        self._received_stderr = []
+        self._exit_status = exit_status
+        self._lock = threading.Lock()
+        self._read_fd, self._write_fd = os.pipe()
+
+        self.closed = False
+        self.eof_received = False
+        self.status_event = threading.Event()
+        self.select_calls = 0
+
+        self._thread = threading.Thread(target=self._send)
+        self._thread.daemon = True
+
+    def _send(self):
+        while self._stdout or self._stderr:
+            time.sleep(0.05)
+
+            with self._lock:
+                if self._stdout:
+                    self._received_stdout.append(self._stdout.pop(0))
+                if self._stderr:
+                    self._received_stderr.append(self._stderr.pop(0))
+                os.write(self._write_fd, b'x')
+
+        if self._exit_status is not None:
+            self.eof_received = True
+            self.status_event.set()
+
+    def exec_command(self, cmd):
+        self._thread.start()
+
+    def makefile(self, *args):
+        return Mock()
+
+    def fileno(self):
+        self.select_calls += 1
+        return self._read_fd
+
+    def _clear_event(self):
+        if not self._received_stdout and not self._received_stderr:
+            while select.select([self._read_fd], [], [], 0)[0]:
+                os.read(self._read_fd, 1)
+
+    def recv_ready(self):
+        return bool(self._received_stdout)
+
+    def recv_stderr_ready(self):
+        return bool(self._received_stderr)
+
+    def recv(self, size):
+        with self._lock:
+            data = self._received_stdout.pop(0)
+            self._clear_event()
+        return data
+
+    def recv_stderr(self, size):
+        with self._lock:
+            data = self._received_stderr.pop(0)
+            self._clear_event()
+        return data
+
+    def exit_status_ready(self):
+        return self.status_event.is_set()
+
+    def recv_exit_status(self):
+        self.status_event.wait()
+        return self._exit_status
+
+    def close(self):
+        self.closed = True
+        self._thread.join()
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
 class ShellOutSSHClientTests(LibcloudTestCase):
 
     def test_password_auth_not_supported(self):
@@ -22,9 +22,11 @@ from mock import Mock
 
 from libcloud import __version__
 from libcloud.test import unittest
-from libcloud.dns.base import DNSDriver, Zone, Record
-from libcloud.dns.types import RecordType
+from libcloud.dns.base import DNSDriver, Zone, Record, RecordChange
+from libcloud.dns.types import RecordType, RecordAlreadyExistsError
+from libcloud.dns.drivers.dummy import DummyDNSDriver
 
+from libcloud.utils.py3 import StringIO
 from libcloud.utils.py3 import assertRegex
 
 
@@ -119,6 +121,64 @@ class BaseTestCase(unittest.TestCase):
             assertRegex(self, lines[10], r'example.com\.\s+900\s+IN\s+MX\s+10\s+mx.example.com')
             assertRegex(self, lines[11], r'example.com\.\s+900\s+IN\s+SRV\s+20\s+10 3333 example.com')
 
+    def _get_mock_zone(self, ids):
+        zone = Zone(id=1, domain='example.com', type='master', ttl=900,
+                    driver=self.driver)
+        records = [Record(id=record_id, name='www%s' % (record_id),
+                          type=RecordType.A, data='127.0.0.1', zone=zone,
+                          driver=self.driver)
+                   for record_id in ids]
+        self.driver.iterate_records = Mock()
+        self.driver.iterate_records.return_value = iter(records)
+        return zone
+
+    def test_export_zone_to_bind_stream_external_sort(self):
+        ids = [str(i) for i in range(100, 0, -1)] + ['b', 'a']
+        zone = self._get_mock_zone(ids)
+        stream = StringIO()
+
+        self.driver.export_zone_to_bind_stream(zone=zone, stream=stream,
+                                               max_records_in_memory=7)
+
+        lines = stream.getvalue().split('\n')
+        self.assertEqual(len(lines), 3 + 1 + 102)
+        self.assertEqual(lines[3], '')
+        names = [line.split('.')[0] for line in lines[4:]]
+        expected = ['www%s' % (i) for i in range(1, 101)] + ['wwwa', 'wwwb']
+        self.assertEqual(names, expected)
+
+    def test_export_zone_to_bind_stream_in_memory_and_external_sort_match(self):
+        ids = [str(i) for i in range(50, 0, -1)]
+
+        outputs = []
+        for max_records_in_memory in [3, 1000]:
+            zone = self._get_mock_zone(ids)
+            stream = StringIO()
+            zone.driver.export_zone_to_bind_stream(
+                zone=zone, stream=stream,
+                max_records_in_memory=max_records_in_memory)
+            outputs.append(stream.getvalue().split('\n')[1:])
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_export_zone_to_bind_stream_unsorted(self):
+        zone = self._get_mock_zone(['3', '1', '2'])
+        stream = StringIO()
+
+        zone.export_to_bind_stream(stream=stream, sort=False)
+
+        lines = stream.getvalue().split('\n')
+        names = [line.split('.')[0] for line in lines[4:]]
+        self.assertEqual(names, ['www3', 'www1', 'www2'])
+
+    def test_iterate_records_falls_back_to_list_records(self):
+        self.assertRaises(NotImplementedError, self.driver.iterate_records,
+                          None)
+
+        self.driver.list_records = Mock()
+        self.driver.list_records.return_value = ['a', 'b']
+        self.assertEqual(list(self.driver.iterate_records(None)), ['a', 'b'])
+
     def test_get_numeric_id(self):
         values = MOCK_RECORDS_VALUES[0].copy()
         values['driver'] = self.driver
@@ -146,6 +206,83 @@ class BaseTestCase(unittest.TestCase):
         self.assertEqual(result, '')
 
 
+class ApplyChangesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = DummyDNSDriver('key', 'secret')
+        self.zone = self.driver.create_zone(domain='example.com')
+
+    def test_ex_apply_changes(self):
+        existing = self.zone.create_record(name='old', type=RecordType.A,
+                                           data='127.0.0.1')
+        to_update = self.zone.create_record(name='upd', type=RecordType.A,
+                                            data='127.0.0.1')
+        changes = [RecordChange.create(name='www%s' % (i), type=RecordType.A,
+                                       data='127.0.0.%s' % (i))
+                   for i in range(20)]
+        changes.append(RecordChange.delete(record=existing))
+        changes.append(RecordChange.update(record=to_update, data='::1'))
+
+        results = self.driver.ex_apply_changes(zone=self.zone,
+                                               changes=changes)
+
+        self.assertEqual(len(results), 22)
+
+        for index, result in enumerate(results[:20]):
+            self.assertTrue(result.success)
+            self.assertEqual(result.item, changes[index])
+            self.assertEqual(result.result.name, 'www%s' % (index))
+
+        self.assertTrue(results[20].result)
+        self.assertEqual(results[21].result.data, '::1')
+
+        names = sorted(record.name for record in self.zone.list_records())
+        self.assertEqual(names, sorted(['upd'] + ['www%s' % (i)
+                                                  for i in range(20)]))
+
+    def test_ex_apply_changes_reports_failures(self):
+        changes = [RecordChange.create(name='www', type=RecordType.A,
+                                       data='127.0.0.1'),
+                   RecordChange.create(name='www', type=RecordType.A,
+                                       data='127.0.0.2')]
+        results = self.driver.ex_apply_changes(zone=self.zone,
+                                               changes=changes,
+                                               max_workers=1)
+
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertTrue(isinstance(results[1].error,
+                                   RecordAlreadyExistsError))
+
+    def test_ex_batch_changes(self):
+        with self.driver.ex_batch_changes(zone=self.zone) as batch:
+            batch.create_record(name='www', type=RecordType.A,
+                                data='127.0.0.1')
+            self.assertEqual(len(self.zone.list_records()), 0)
+
+        self.assertEqual(len(batch.results), 1)
+        self.assertEqual(len(self.zone.list_records()), 1)
+
+    def test_ex_batch_changes_discarded_on_exception(self):
+        try:
+            with self.driver.ex_batch_changes(zone=self.zone) as batch:
+                batch.create_record(name='www', type=RecordType.A,
+                                    data='127.0.0.1')
+                raise ValueError('test')
+        except ValueError:
+            pass
+
+        self.assertEqual(batch.results, None)
+        self.assertEqual(len(self.zone.list_records()), 0)
+
+    def test_record_change_validation(self):
+        self.assertRaises(ValueError, RecordChange, action='INVALID')
+        self.assertRaises(ValueError, RecordChange, action='DELETE')
+        self.assertRaises(ValueError, RecordChange, action='CREATE',
+                          name='www')
+        self.assertRaises(ValueError, RecordChange, action='CREATE',
+                          name='www', type=RecordType.A)
+
+
 def zero_pad(value: int) -> str:
     if value < 10:
         return "0" + str(value)
@@ -16,11 +16,14 @@
 import sys
 import unittest
 
+from libcloud.utils.py3 import ET
 from libcloud.utils.py3 import httplib
 
+from libcloud.dns.base import RecordChange
 from libcloud.dns.types import RecordType, ZoneDoesNotExistError
 from libcloud.dns.types import RecordDoesNotExistError
-from libcloud.dns.drivers.route53 import Route53DNSDriver
+from libcloud.dns.drivers.route53 import Route53DNSDriver, InvalidChangeBatch
+from libcloud.dns.drivers.route53 import NAMESPACE
 from libcloud.test import MockHttp
 from libcloud.test.file_fixtures import DNSFileFixtures
 from libcloud.test.secrets import DNS_PARAMS_ROUTE53
@@ -315,6 +318,66 @@ class Route53Tests(unittest.TestCase):
         else:
             self.fail('Exception was not thrown')
 
+    def test_ex_apply_changes_coalesces_changes_into_batches(self):
+        zone = self.driver.list_zones()[0]
+        record = self.driver.list_records(zone=zone)[1]
+        Route53MockHttp.type = 'BATCH'
+        Route53MockHttp.posted_batches = []
+
+        changes = [RecordChange.create(name='host%s' % (i), type=RecordType.A,
+                                       data='127.0.0.1')
+                   for i in range(1999)]
+        changes.append(RecordChange.update(record=record, data='::1'))
+        changes.append(RecordChange.delete(record=record))
+        changes.append(RecordChange.create(name='txt', type=RecordType.TXT,
+                                           data='foo bar'))
+
+        results = self.driver.ex_apply_changes(zone=zone, changes=changes)
+
+        # Update is a DELETE + CREATE pair and is never split across batches
+        self.assertEqual(Route53MockHttp.posted_batches, [1000, 999, 4])
+        self.assertEqual(len(results), len(changes))
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[0].result.id, 'A:host0')
+        self.assertEqual(results[1999].result.name, 'www')
+        self.assertEqual(results[1999].result.data, '::1')
+        self.assertTrue(results[2000].result)
+        self.assertEqual(results[2001].result.data, '"foo bar"')
+
+    def test_ex_apply_changes_failed_batch(self):
+        zone = self.driver.list_zones()[0]
+        record = self.driver.list_records(zone=zone)[0]
+        Route53MockHttp.type = 'RECORD_DOES_NOT_EXIST'
+
+        changes = [RecordChange.delete(record=record),
+                   RecordChange.create(name='www2', type=RecordType.A,
+                                       data='127.0.0.1')]
+        results = self.driver.ex_apply_changes(zone=zone, changes=changes)
+
+        self.assertEqual(len(results), 2)
+
+        for result, change in zip(results, changes):
+            self.assertFalse(result.success)
+            self.assertEqual(result.item, change)
+            self.assertTrue(isinstance(result.error, InvalidChangeBatch))
+
+    def test_ex_batch_changes_context_manager(self):
+        zone = self.driver.list_zones()[0]
+        record = self.driver.list_records(zone=zone)[0]
+        Route53MockHttp.type = 'BATCH'
+        Route53MockHttp.posted_batches = []
+
+        with self.driver.ex_batch_changes(zone=zone) as batch:
+            batch.create_record(name='www2', type=RecordType.A,
+                                data='127.0.0.1')
+            batch.delete_record(record=record)
+            self.assertEqual(Route53MockHttp.posted_batches, [])
+
+        self.assertEqual(Route53MockHttp.posted_batches, [2])
+        self.assertEqual(len(batch.results), 2)
+        self.assertEqual(batch.results[0].result.name, 'www2')
+        self.assertTrue(batch.results[1].result)
+
 
 class Route53MockHttp(MockHttp):
     fixtures = DNSFileFixtures('route53')
@@ -361,6 +424,19 @@ class Route53MockHttp(MockHttp):
         body = self.fixtures.load('record_does_not_exist.xml')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _2012_02_29_hostedzone_47234_rrset_BATCH(self, method, url, body,
+                                                 headers):
+        if method == 'POST':
+            changes = ET.XML(body).findall('.//{%s}Change' % (NAMESPACE))
+            self.posted_batches.append(len(changes))
+            return (httplib.OK, '', {}, httplib.responses[httplib.OK])
+        body = self.fixtures.load('list_records.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _2012_02_29_hostedzone_47234_BATCH(self, method, url, body, headers):
+        body = self.fixtures.load('get_zone.xml')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _2012_02_29_hostedzone_47234_RECORD_DOES_NOT_EXIST(self, method,
                                                            url, body, headers):
         body = self.fixtures.load('get_zone.xml')
@@ -0,0 +1,252 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import time
+
+from mock import Mock
+
+from libcloud.test import unittest
+from libcloud.dns.base import DNSDriver, Record
+from libcloud.dns.types import RecordType, RecordChangeAction
+from libcloud.dns.drivers.dummy import DummyDNSDriver
+from libcloud.dns.sync import ZoneIndex, ZoneSyncer, diff_zone
+
+
+class ZoneSyncTestCase(unittest.TestCase):
+    def setUp(self):
+        self.driver = DummyDNSDriver('key', 'secret')
+        self.zone = self.driver.create_zone(domain='example.com')
+        self.zone.create_record(name='www', type=RecordType.A,
+                                data='127.0.0.1')
+        self.zone.create_record(name='mail', type=RecordType.MX,
+                                data='mx.example.com.',
+                                extra={'priority': 10})
+        self.zone.create_record(name='old', type=RecordType.A,
+                                data='127.0.0.3')
+        self.zone.create_record(name='ns', type=RecordType.NS,
+                                data='ns1.example.com.')
+
+    def _record(self, name, type, data, extra=None):
+        return Record(id=None, name=name, type=type, data=data,
+                      zone=self.zone, driver=self.driver, extra=extra)
+
+    def _get_records(self):
+        return dict((record.name, record) for record in
+                    self.zone.list_records())
+
+    def test_zone_index(self):
+        index = ZoneIndex.from_zone(self.zone)
+
+        self.assertEqual(len(index), 4)
+        self.assertTrue(('WWW.', RecordType.A) in index)
+        self.assertFalse(('www', RecordType.AAAA) in index)
+        self.assertEqual(index.get('www', RecordType.A)[0].data, '127.0.0.1')
+        self.assertEqual(index.get('foo', RecordType.A), [])
+
+    def test_diff_zone(self):
+        index = ZoneIndex(self.zone.list_records())
+        desired = [
+            # Unchanged, host name comparison ignores trailing dot
+            self._record('www', RecordType.A, '127.0.0.1'),
+            self._record('mail', RecordType.MX, 'mx.example.com',
+                         extra={'priority': 10}),
+            # New
+            self._record('api', RecordType.A, '127.0.0.2'),
+        ]
+
+        diff = diff_zone(current=index, desired=desired)
+
+        self.assertEqual(len(diff.creates), 1)
+        self.assertEqual(diff.creates[0].name, 'api')
+        self.assertEqual(diff.updates, [])
+        # NS records are ignored by default
+        self.assertEqual(len(diff.deletes), 1)
+        self.assertEqual(diff.deletes[0].record.name, 'old')
+        self.assertEqual(diff.changes[0].action, 'DELETE')
+
+    def test_diff_zone_updates(self):
+        index = ZoneIndex(self.zone.list_records())
+        desired = [
+            self._record('www', RecordType.A, '127.0.0.10'),
+            self._record('mail', RecordType.MX, 'mx.example.com',
+                         extra={'priority': 20}),
+            self._record('old', RecordType.A, '127.0.0.3', extra={'ttl': 60}),
+        ]
+
+        diff = diff_zone(current=index, desired=desired, ignored_types=[])
+
+        self.assertEqual(diff.creates, [])
+        self.assertEqual(sorted(change.name for change in diff.updates),
+                         ['mail', 'old', 'www'])
+        self.assertEqual(len(diff.deletes), 1)
+        self.assertEqual(diff.deletes[0].record.type, RecordType.NS)
+
+    def test_diff_zone_no_changes(self):
+        index = ZoneIndex(self.zone.list_records())
+        desired = [record for record in self.zone.list_records()]
+
+        diff = diff_zone(current=index, desired=desired)
+        self.assertFalse(diff)
+        self.assertEqual(len(diff), 0)
+
+    def test_sync(self):
+        syncer = ZoneSyncer(driver=self.driver)
+        desired = [
+            self._record('www', RecordType.A, '127.0.0.10'),
+            self._record('mail', RecordType.MX, 'mx.example.com',
+                         extra={'priority': 10}),
+            self._record('api', RecordType.A, '127.0.0.2'),
+        ]
+
+        result = syncer.sync(zone=self.zone, desired=desired)
+
+        self.assertFalse(result.skipped)
+        self.assertTrue(result.success)
+        self.assertEqual(len(result.results), 3)
+
+        records = self._get_records()
+        self.assertEqual(sorted(records.keys()), ['api', 'mail', 'ns', 'www'])
+        self.assertEqual(records['www'].data, '127.0.0.10')
+
+        # Second sync results in no changes
+        syncer.invalidate(zone=self.zone)
+        result = syncer.sync(zone=self.zone, desired=desired)
+        self.assertFalse(result.diff)
+
+    def test_sync_deletes_before_creates(self):
+        events = []
+        delete_record = self.driver.delete_record
+        create_record = self.driver.create_record
+
+        def slow_delete_record(record):
+            time.sleep(0.2)
+            result = delete_record(record=record)
+            events.append(('delete', record.name))
+            return result
+
+        def create_record_(**kwargs):
+            events.append(('create', kwargs['name']))
+            return create_record(**kwargs)
+
+        self.driver.delete_record = slow_delete_record
+        self.driver.create_record = create_record_
+
+        # CNAME conflicts with the existing A record of the same name
+        syncer = ZoneSyncer(driver=self.driver, max_workers=4)
+        desired = [
+            self._record('www', RecordType.A, '127.0.0.1'),
+            self._record('mail', RecordType.MX, 'mx.example.com',
+                         extra={'priority': 10}),
+            self._record('old', RecordType.CNAME, 'www.example.com.'),
+        ]
+
+        result = syncer.sync(zone=self.zone, desired=desired)
+
+        self.assertTrue(result.success)
+        self.assertEqual(events, [('delete', 'old'), ('create', 'old')])
+        self.assertEqual(self._get_records()['old'].type, RecordType.CNAME)
+
+    def test_sync_applies_changes_in_single_native_batch(self):
+        calls = []
+
+        class BatchingDummyDNSDriver(DummyDNSDriver):
+            def ex_apply_changes(self, zone, changes, max_workers=1):
+                calls.append([change.action for change in changes])
+                return DNSDriver.ex_apply_changes(self, zone=zone,
+                                                  changes=changes,
+                                                  max_workers=1)
+
+        self.driver.__class__ = BatchingDummyDNSDriver
+
+        syncer = ZoneSyncer(driver=self.driver, max_workers=4)
+        desired = [
+            self._record('www', RecordType.A, '127.0.0.10'),
+            self._record('mail', RecordType.MX, 'mx.example.com',
+                         extra={'priority': 10}),
+            self._record('api', RecordType.A, '127.0.0.2'),
+        ]
+
+        result = syncer.sync(zone=self.zone, desired=desired)
+
+        self.assertTrue(result.success)
+        self.assertEqual(calls, [[RecordChangeAction.DELETE,
+                                  RecordChangeAction.UPDATE,
+                                  RecordChangeAction.CREATE]])
+        self.assertEqual(len(result.results), 3)
+
+    def test_sync_dry_run(self):
+        syncer = ZoneSyncer(driver=self.driver)
+        desired = [self._record('api', RecordType.A, '127.0.0.2')]
+
+        result = syncer.sync(zone=self.zone, desired=desired, dry_run=True)
+
+        self.assertEqual(len(result.diff), 4)
+        self.assertEqual(result.results, [])
+        self.assertEqual(len(self._get_records()), 4)
+
+    def test_sync_skips_unchanged_zones(self):
+        state_cache = {}
+        syncer = ZoneSyncer(driver=self.driver, state_cache=state_cache)
+        desired = [self._record('www', RecordType.A, '127.0.0.1')]
+
+        result = syncer.sync(zone=self.zone, desired=desired)
+        self.assertFalse(result.skipped)
+        self.assertEqual(len(state_cache), 1)
+
+        self.driver.iterate_records = Mock(
+            side_effect=AssertionError('records should not be listed'))
+
+        result = syncer.sync(zone=self.zone, desired=desired)
+        self.assertTrue(result.skipped)
+
+        # Different desired state
+        del self.driver.iterate_records
+        desired.append(self._record('api', RecordType.A, '127.0.0.2'))
+        result = syncer.sync(zone=self.zone, desired=desired)
+        self.assertFalse(result.skipped)
+        self.assertEqual(len(result.diff.creates), 1)
+
+        # Zone modified outside of the syncer
+        self.zone.create_record(name='other', type=RecordType.A,
+                                data='127.0.0.4')
+        result = syncer.sync(zone=self.zone, desired=desired)
+        self.assertFalse(result.skipped)
+        self.assertEqual(len(result.diff.deletes), 1)
+
+    def test_sync_without_zone_state_never_skips(self):
+        syncer = ZoneSyncer(driver=self.driver, state_func=None)
+        desired = [record for record in self.zone.list_records()]
+
+        syncer.sync(zone=self.zone, desired=desired)
+        result = syncer.sync(zone=self.zone, desired=desired)
+
+        self.assertFalse(result.skipped)
+        self.assertEqual(syncer.state_cache, {})
+
+    def test_sync_failure_is_not_cached(self):
+        syncer = ZoneSyncer(driver=self.driver)
+        self.driver.create_record = Mock(side_effect=ValueError('failure'))
+        desired = [self._record('api', RecordType.A, '127.0.0.2')]
+
+        result = syncer.sync(zone=self.zone, desired=desired)
+
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(syncer.state_cache, {})
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
@@ -16,10 +16,13 @@
 from __future__ import with_statement
 
 import os
+import re
 import sys
 import tempfile
 from io import BytesIO
 
+import mock
+
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import urlparse
 from libcloud.utils.py3 import parse_qs
@@ -232,6 +235,72 @@ class AzureBlobsMockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
                 headers,
                 httplib.responses[httplib.NOT_FOUND])
 
+    def _BATCH(self, method, url, body, headers):
+        # test_delete_objects
+        query = parse_qs(urlparse.urlsplit(url).query)
+        assert method == 'POST'
+        assert query['comp'] == ['batch']
+        assert headers['Content-Type'].startswith('multipart/mixed')
+
+        statuses = {'foo_bar_object': '202 Accepted',
+                    'foo_missing_object': '404 The specified blob does not '
+                                          'exist.',
+                    'foo_error_object': '403 Forbidden'}
+        requests = re.findall(r'Content-ID: (\d+)\r\n\r\n'
+                              r'DELETE \S+/([^/\s]+) HTTP/1.1\r\n'
+                              r'x-ms-date: .+\r\nAuthorization: SharedKey ',
+                              body)
+        assert len(requests) == 3
+
+        lines = []
+        for content_id, name in requests:
+            lines.extend(['--batchresponse_1',
+                          'Content-Type: application/http',
+                          'Content-ID: %s' % (content_id),
+                          '',
+                          'HTTP/1.1 %s' % (statuses[name]),
+                          'x-ms-delete-type-permanent: true',
+                          ''])
+        lines.append('--batchresponse_1--')
+
+        headers = {'content-type': 'multipart/mixed; '
+                                   'boundary=batchresponse_1'}
+        return (httplib.ACCEPTED,
+                '\r\n'.join(lines),
+                headers,
+                httplib.responses[httplib.ACCEPTED])
+
+    def _foo_bar_container_foo_copy_COPY(self, method, url, body, headers):
+        # test_copy_object
+        if method == 'PUT':
+            assert headers['x-ms-copy-source'].endswith(
+                '/foo_bar_container/foo_bar_object')
+            type(self).copy_status_requests = 0
+            headers = {'x-ms-copy-id': 'e6b3e1a4-51d2-4d3f-8c05-a6e3f1c5b6f5',
+                       'x-ms-copy-status': 'pending'}
+            return (httplib.ACCEPTED,
+                    '',
+                    headers,
+                    httplib.responses[httplib.ACCEPTED])
+
+        assert method == 'HEAD'
+        type(self).copy_status_requests += 1
+        headers = {'etag': '0x8CFB877BB56A6FB',
+                   'last-modified': 'Fri, 04 Jan 2013 09:48:06 GMT',
+                   'content-length': '12345',
+                   'content-type': 'application/zip',
+                   'x-ms-blob-type': 'BlockBlob',
+                   'x-ms-meta-rabbits': 'monkeys',
+                   'x-ms-copy-status': 'pending'}
+
+        if self.copy_status_requests > 1:
+            headers['x-ms-copy-status'] = 'success'
+
+        return (httplib.OK,
+                '',
+                headers,
+                httplib.responses[httplib.OK])
+
     def _foo_bar_container_foo_bar_object_NOT_FOUND(self, method, url, body,
                                                     headers):
         # test_delete_object_not_found
@@ -919,6 +988,45 @@ class AzureBlobsTests(unittest.TestCase):
         result = self.driver.delete_object(obj=obj)
         self.assertTrue(result)
 
+    def test_delete_objects(self):
+        self.mock_response_klass.type = 'BATCH'
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        objects = []
+        for name in ['foo_bar_object', 'foo_missing_object',
+                     'foo_error_object']:
+            objects.append(Object(name=name, size=1234, hash=None,
+                                  extra=None, meta_data=None,
+                                  container=container, driver=self.driver))
+
+        results = self.driver.delete_objects(objects=objects)
+
+        self.assertEqual([result.item for result in results], objects)
+        # Objects which don't exist are considered deleted
+        self.assertEqual([result.success for result in results],
+                         [True, True, False])
+        self.assertTrue('403 Forbidden' in str(results[2].error))
+
+    @mock.patch('libcloud.storage.drivers.azure_blobs.AZURE_COPY_POLL_INTERVAL',
+                0)
+    def test_copy_object(self):
+        self.mock_response_klass.type = 'COPY'
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        obj = Object(name='foo_bar_object', size=12345, hash=None, extra={},
+                     meta_data=None, container=container, driver=self.driver)
+
+        copied = self.driver.copy_object(obj=obj,
+                                         destination_container=container,
+                                         destination_name='foo_copy')
+
+        # Copy status is polled until the copy finishes
+        self.assertEqual(self.mock_response_klass.copy_status_requests, 2)
+        self.assertEqual(copied.name, 'foo_copy')
+        self.assertEqual(copied.size, 12345)
+        self.assertEqual(copied.meta_data, {'rabbits': 'monkeys'})
+        self.assertEqual(copied.container, container)
+
     def test_storage_driver_host(self):
         # Non regression tests for issue LIBCLOUD-399 dealing with the bad
         # management of the connectionCls.host class attribute
@@ -15,6 +15,7 @@
 
 import os
 import sys
+import hashlib
 import tempfile
 
 import mock
@@ -23,6 +24,7 @@ import json
 from libcloud.storage.drivers.backblaze_b2 import BackblazeB2StorageDriver
 from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import b
+from libcloud.common.exceptions import BaseHTTPError
 from libcloud.utils.files import exhaust_iterator
 from libcloud.test import unittest
 from libcloud.test import MockHttp
@@ -43,8 +45,15 @@ class BackblazeB2StorageDriverTestCase(unittest.TestCase):
             BackblazeB2MockHttp
 
         BackblazeB2MockHttp.type = None
+        BackblazeB2MockHttp.upload_failures = []
+        BackblazeB2MockHttp.requests = []
+        BackblazeB2MockHttp.uploaded_parts = {}
         self.driver = self.driver_klass(*self.driver_args)
 
+    def _get_requests(self, action):
+        return [body for name, body in BackblazeB2MockHttp.requests
+                if name == action]
+
     def test_list_containers(self):
         containers = self.driver.list_containers()
         self.assertEqual(len(containers), 3)
@@ -125,6 +134,107 @@ class BackblazeB2StorageDriverTestCase(unittest.TestCase):
         self.assertEqual(obj.size, 24)
         self.assertEqual(obj.extra['fileId'], 'abcde')
 
+    def test_upload_object_upload_url_is_reused(self):
+        file_path = os.path.abspath(__file__)
+        container = self.driver.list_containers()[0]
+
+        for _ in range(3):
+            obj = self.driver.upload_object(file_path=file_path,
+                                            container=container,
+                                            object_name='test0007.txt')
+            self.assertEqual(obj.extra['fileId'], 'abcde')
+
+        self.assertEqual(len(self._get_requests('b2_get_upload_url')), 1)
+        self.assertEqual(len(self._get_requests('b2_upload_file')), 3)
+
+    def test_upload_object_upload_url_is_refreshed_on_error(self):
+        container = self.driver.list_containers()[0]
+        BackblazeB2MockHttp.upload_failures = [httplib.SERVICE_UNAVAILABLE,
+                                               httplib.UNAUTHORIZED]
+
+        obj = self.driver.upload_object_via_stream(iterator=iter([b'data']),
+                                                   container=container,
+                                                   object_name='test0007.txt')
+
+        self.assertEqual(obj.extra['fileId'], 'abcde')
+        self.assertEqual(len(self._get_requests('b2_get_upload_url')), 3)
+        self.assertEqual(len(self._get_requests('b2_upload_file')), 3)
+
+        # Too many failures
+        BackblazeB2MockHttp.upload_failures = [httplib.SERVICE_UNAVAILABLE] * 3
+
+        self.assertRaises(BaseHTTPError, self.driver.upload_object_via_stream,
+                          iterator=iter([b'data']), container=container,
+                          object_name='test0007.txt')
+
+    def test_upload_object_large_file(self):
+        container = self.driver.list_containers()[0]
+        data = b'0123456789' * 2 + b'abcde'
+
+        _, file_path = tempfile.mkstemp()
+        self.addCleanup(os.unlink, file_path)
+
+        with open(file_path, 'wb') as fp:
+            fp.write(data)
+
+        obj = self.driver.upload_object(file_path=file_path,
+                                        container=container,
+                                        object_name='large.bin',
+                                        ex_part_size=10)
+
+        self.assertEqual(obj.name, 'large.bin')
+        self.assertEqual(obj.size, 25)
+        self.assertEqual(obj.extra['fileId'], 'large_file_id')
+
+        parts = BackblazeB2MockHttp.uploaded_parts
+        self.assertEqual(parts, {'1': b'0123456789', '2': b'0123456789',
+                                 '3': b'abcde'})
+
+        start_data = self._get_requests('b2_start_large_file')[0]
+        self.assertEqual(start_data['fileName'], 'large.bin')
+        self.assertEqual(start_data['bucketId'], container.extra['id'])
+
+        finish_data = self._get_requests('b2_finish_large_file')[0]
+        self.assertEqual(finish_data['fileId'], 'large_file_id')
+        self.assertEqual(finish_data['partSha1Array'],
+                         [hashlib.sha1(parts[str(index)]).hexdigest()
+                          for index in range(1, 4)])
+
+        # Upload part URL is reused for all the parts
+        self.assertEqual(len(self._get_requests('b2_get_upload_part_url')), 1)
+        self.assertEqual(self.driver._upload_data_pool, {})
+
+    def test_upload_object_via_stream_large_file_parallel(self):
+        container = self.driver.list_containers()[0]
+        iterator = iter([b'0123', b'456789', b'0123456789', b'abcde'])
+
+        obj = self.driver.upload_object_via_stream(iterator=iterator,
+                                                   container=container,
+                                                   object_name='large.bin',
+                                                   ex_part_size=10,
+                                                   ex_max_workers=2)
+
+        self.assertEqual(obj.extra['fileId'], 'large_file_id')
+        self.assertEqual(BackblazeB2MockHttp.uploaded_parts,
+                         {'1': b'0123456789', '2': b'0123456789',
+                          '3': b'abcde'})
+
+        finish_data = self._get_requests('b2_finish_large_file')[0]
+        self.assertEqual(len(finish_data['partSha1Array']), 3)
+        self.assertEqual(finish_data['partSha1Array'][2],
+                         hashlib.sha1(b'abcde').hexdigest())
+
+    def test_upload_object_large_file_failure_cancels_upload(self):
+        container = self.driver.list_containers()[0]
+        BackblazeB2MockHttp.upload_failures = [httplib.BAD_REQUEST]
+
+        self.assertRaises(BaseHTTPError, self.driver.upload_object_via_stream,
+                          iterator=iter([b'a' * 25]), container=container,
+                          object_name='large.bin', ex_part_size=10)
+
+        self.assertEqual(len(self._get_requests('b2_cancel_large_file')), 1)
+        self.assertEqual(len(self._get_requests('b2_finish_large_file')), 0)
+
     def test_delete_object(self):
         container = self.driver.list_containers()[0]
         obj = self.driver.list_container_objects(container=container)[0]
@@ -162,6 +272,30 @@ class BackblazeB2StorageDriverTestCase(unittest.TestCase):
 class BackblazeB2MockHttp(MockHttp):
     fixtures = StorageFileFixtures('backblaze_b2')
 
+    # Status codes returned by the following upload requests
+    upload_failures = []
+
+    # List of (action, request body) tuples for the tracked requests
+    requests = []
+
+    # Maps part number to the part data
+    uploaded_parts = {}
+
+    def _track_request(self, action, body):
+        if body and not isinstance(body, bytes):
+            body = json.loads(body)
+
+        self.requests.append((action, body))
+
+    def _get_upload_failure(self):
+        if self.upload_failures:
+            status = self.upload_failures.pop(0)
+            body = json.dumps({'status': status, 'code': 'failure',
+                               'message': 'failure'})
+            return (status, body, {}, httplib.responses[status])
+
+        return None
+
     def _b2api_v1_b2_authorize_account(self, method, url, body, headers):
         if method == 'GET':
             body = json.dumps({
@@ -211,6 +345,7 @@ class BackblazeB2MockHttp(MockHttp):
 
     def _b2api_v1_b2_get_upload_url(self, method, url, body, headers):
         # test_upload_object
+        self._track_request('b2_get_upload_url', None)
         if method == 'GET':
             body = self.fixtures.load('b2_get_upload_url.json')
         else:
@@ -219,12 +354,68 @@ class BackblazeB2MockHttp(MockHttp):
 
     def _b2api_v1_b2_upload_file_abcd_defg(self, method, url, body, headers):
         # test_upload_object
+        self._track_request('b2_upload_file', None)
+        failure = self._get_upload_failure()
+        if failure:
+            return failure
+
         if method == 'POST':
             body = self.fixtures.load('b2_upload_file.json')
         else:
             raise AssertionError('Unsupported method')
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _b2api_v1_b2_start_large_file(self, method, url, body, headers):
+        self._track_request('b2_start_large_file', body)
+        if method == 'POST':
+            body = self.fixtures.load('b2_start_large_file.json')
+        else:
+            raise AssertionError('Unsupported method')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _b2api_v1_b2_get_upload_part_url(self, method, url, body, headers):
+        self._track_request('b2_get_upload_part_url', body)
+        if method == 'POST':
+            body = self.fixtures.load('b2_get_upload_part_url.json')
+        else:
+            raise AssertionError('Unsupported method')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _b2api_v1_b2_upload_part_abcd_defg(self, method, url, body, headers):
+        self._track_request('b2_upload_part', None)
+        failure = self._get_upload_failure()
+        if failure:
+            return failure
+
+        if method == 'POST':
+            sha1 = hashlib.sha1(body).hexdigest()
+            assert headers['X-Bz-Content-Sha1'] == sha1
+            part_number = headers['X-Bz-Part-Number']
+            self.uploaded_parts[part_number] = body
+            body = json.dumps({'fileId': 'large_file_id',
+                               'partNumber': int(part_number),
+                               'contentLength': len(body),
+                               'contentSha1': sha1})
+        else:
+            raise AssertionError('Unsupported method')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _b2api_v1_b2_finish_large_file(self, method, url, body, headers):
+        self._track_request('b2_finish_large_file', body)
+        if method == 'POST':
+            body = self.fixtures.load('b2_finish_large_file.json')
+        else:
+            raise AssertionError('Unsupported method')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _b2api_v1_b2_cancel_large_file(self, method, url, body, headers):
+        self._track_request('b2_cancel_large_file', body)
+        if method == 'POST':
+            body = self.fixtures.load('b2_cancel_large_file.json')
+        else:
+            raise AssertionError('Unsupported method')
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _b2api_v1_b2_list_file_versions(self, method, url, body, headers):
         if method == 'GET':
             body = self.fixtures.load('b2_list_file_versions.json')
@@ -29,8 +29,12 @@ from libcloud.utils.py3 import b
 from libcloud.utils.py3 import PY2
 from libcloud.utils.py3 import assertRaisesRegex
 
+from libcloud.common.types import LibcloudError
 from libcloud.storage.base import StorageDriver
+from libcloud.storage.base import Container
+from libcloud.storage.base import Object
 from libcloud.storage.base import DEFAULT_CONTENT_TYPE
+from libcloud.storage.types import ObjectDoesNotExistError
 
 from libcloud.test import unittest
 from libcloud.test import MockHttp
@@ -275,6 +279,92 @@ class BaseStorageTests(unittest.TestCase):
         result = self.driver1._get_standard_range_str(10, 11, True)
         self.assertEqual(result, 'bytes=10-11')
 
+    def test_delete_objects(self):
+        container = Container(name='test', extra={}, driver=self.driver1)
+        objects = [Object(name=name, size=0, hash=None, extra={},
+                          meta_data={}, container=container,
+                          driver=self.driver1)
+                   for name in ['deleted', 'missing', 'failed', 'error']]
+
+        def delete_object(obj):
+            if obj.name == 'missing':
+                raise ObjectDoesNotExistError(value=None, driver=None,
+                                              object_name=obj.name)
+            elif obj.name == 'error':
+                raise ValueError('error')
+
+            return obj.name == 'deleted'
+
+        self.driver1.delete_object = Mock(side_effect=delete_object)
+
+        for max_workers in [1, 4]:
+            results = self.driver1.delete_objects(objects=objects,
+                                                  max_workers=max_workers)
+
+            self.assertEqual([result.item for result in results], objects)
+            self.assertEqual([result.success for result in results],
+                             [True, True, False, False])
+            self.assertTrue(isinstance(results[2].error, LibcloudError))
+            self.assertTrue(isinstance(results[3].error, ValueError))
+
+        self.assertEqual(self.driver1.delete_object.call_count, 8)
+
+    def test_copy_object_via_stream(self):
+        container1 = Container(name='source', extra={}, driver=self.driver1)
+        container2 = Container(name='destination', extra={},
+                               driver=self.driver2)
+        obj = Object(name='foo', size=3, hash=None,
+                     extra={'content_type': 'text/plain'},
+                     meta_data={'foo': 'bar', 'owner': {'id': '1'}},
+                     container=container1, driver=self.driver1)
+
+        self.driver1.download_object_as_stream = Mock(
+            return_value=iter([b('a'), b('bc')]))
+        self.driver2.upload_object_via_stream = Mock(return_value='copied')
+
+        result = self.driver1.copy_object(obj=obj,
+                                          destination_container=container2)
+
+        self.assertEqual(result, 'copied')
+        self.driver1.download_object_as_stream.assert_called_once_with(
+            obj=obj)
+        kwargs = self.driver2.upload_object_via_stream.call_args[1]
+        self.assertEqual(list(kwargs['iterator']), [b('a'), b('bc')])
+        self.assertEqual(kwargs['container'], container2)
+        self.assertEqual(kwargs['object_name'], 'foo')
+        # Values which can't be stored as meta data are skipped
+        self.assertEqual(kwargs['extra'], {'content_type': 'text/plain',
+                                           'meta_data': {'foo': 'bar'}})
+
+    def test_move_and_rename_object(self):
+        container = Container(name='test', extra={}, driver=self.driver1)
+        obj = Object(name='foo', size=3, hash=None, extra={}, meta_data={},
+                     container=container, driver=self.driver1)
+
+        self.driver1.copy_object = Mock(return_value='copied')
+        self.driver1.delete_object = Mock(return_value=True)
+
+        result = self.driver1.rename_object(obj=obj, new_name='bar')
+
+        self.assertEqual(result, 'copied')
+        self.driver1.copy_object.assert_called_once_with(
+            obj=obj, destination_container=container,
+            destination_name='bar')
+        self.driver1.delete_object.assert_called_once_with(obj=obj)
+
+        # Source object is not deleted if copy fails
+        self.driver1.copy_object.side_effect = LibcloudError('failure')
+        self.driver1.delete_object.reset_mock()
+
+        self.assertRaises(LibcloudError, self.driver1.move_object, obj=obj,
+                          destination_container=container,
+                          destination_name='bar')
+        self.assertEqual(self.driver1.delete_object.call_count, 0)
+
+        # Object can't be moved to itself
+        self.assertRaises(ValueError, self.driver1.rename_object, obj=obj,
+                          new_name='foo')
+
     @mock.patch('os.environ', {'LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS': True})
     def test_should_retry_rate_limited_errors(self):
         class SecondException(Exception):
@@ -21,6 +21,7 @@ import math
 import sys
 import copy
 from io import BytesIO
+import json
 import hashlib
 from hashlib import sha1
 
@@ -613,6 +614,52 @@ class CloudFilesTests(unittest.TestCase):
         else:
             self.fail('Object does not exist but an exception was not thrown')
 
+    def test_copy_object(self):
+        CloudFilesMockHttp.type = 'COPY'
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        obj = Object(name='foo_bar_object', size=1000, hash=None, extra={},
+                     container=container, meta_data={'foo': 'bar'},
+                     driver=self.driver)
+
+        copied = self.driver.copy_object(obj=obj,
+                                         destination_container=container,
+                                         destination_name='foo copy')
+
+        self.assertEqual(copied.name, 'foo copy')
+        self.assertEqual(copied.size, 1000)
+        self.assertEqual(copied.extra['content_type'], 'text/plain')
+        self.assertEqual(copied.meta_data, {'foo': 'bar'})
+
+    def test_delete_objects(self):
+        CloudFilesMockHttp.type = 'BULK_DELETE'
+        container = Container(name='foo_bar_container', extra={}, driver=self)
+        objects = []
+        for name in ['foo_bar_object', 'foo_error_object', 'foo bar']:
+            objects.append(Object(name=name, size=1000, hash=None, extra={},
+                                  container=container, meta_data=None,
+                                  driver=self.driver))
+
+        results = self.driver.delete_objects(objects=objects)
+
+        self.assertEqual([result.item for result in results], objects)
+        self.assertEqual([result.success for result in results],
+                         [True, False, True])
+        self.assertTrue('403 Forbidden' in str(results[1].error))
+
+    def test_delete_objects_request_failure(self):
+        CloudFilesMockHttp.type = 'BULK_DELETE_FAILURE'
+        container = Container(name='foo_bar_container', extra={}, driver=self)
+        objects = [Object(name='foo_bar_object', size=1000, hash=None,
+                          extra={}, container=container, meta_data=None,
+                          driver=self.driver)]
+
+        results = self.driver.delete_objects(objects=objects)
+
+        self.assertFalse(results[0].success)
+        self.assertTrue('Max delete failures exceeded' in
+                        str(results[0].error))
+
     def test_ex_get_meta_data(self):
         meta_data = self.driver.ex_get_meta_data()
         self.assertTrue(isinstance(meta_data, dict))
@@ -686,6 +733,86 @@ class CloudFilesTests(unittest.TestCase):
         self.assertEqual(mocked__upload_object_part.call_count, parts)
         self.assertTrue(mocked__upload_object_manifest.call_count, 1)
 
+    def _upload_object_parts(self, **kwargs):
+        uploaded = {}
+
+        def _put_object(driver, container, object_name, extra=None,
+                        stream=None, verify_hash=True, **kwargs):
+            data = b('').join(stream)
+            uploaded[object_name] = data
+            return Object(name=object_name, size=len(data),
+                          hash=hashlib.md5(data).hexdigest(), extra=None,
+                          meta_data=None, container=container, driver=driver)
+
+        file_path = os.path.abspath(__file__)
+        container = Container(name='foo_bar_container', extra={}, driver=self)
+
+        with mock.patch.object(CloudFilesStorageDriver, '_put_object',
+                               _put_object):
+            obj = self.driver.ex_multipart_upload_object(
+                file_path=file_path, container=container,
+                object_name='foo_test_upload', chunk_size=1000, **kwargs)
+
+        return obj, uploaded
+
+    def test_ex_multipart_upload_object_parallel(self):
+        self.driver._upload_object_manifest = Mock(return_value='manifest')
+
+        obj, uploaded = self._upload_object_parts(ex_max_workers=4)
+
+        self.assertEqual(obj, 'manifest')
+
+        with open(os.path.abspath(__file__), 'rb') as fp:
+            content = fp.read()
+
+        names = sorted(uploaded.keys())
+        self.assertEqual(len(names), int(math.ceil(len(content) / 1000.0)))
+        self.assertEqual(names[0], 'foo_test_upload/00000000')
+        self.assertEqual(b('').join([uploaded[name] for name in names]),
+                         content)
+
+    def test_ex_multipart_upload_object_slo(self):
+        requests = []
+
+        def request(action, params=None, data='', headers=None,
+                    method='GET', **kwargs):
+            requests.append((action, params, data, headers, method))
+            etags = ''.join([item['etag'] for item in json.loads(data)])
+            etag = '"%s"' % (hashlib.md5(b(etags)).hexdigest())
+            return Mock(status=httplib.CREATED, headers={'etag': etag})
+
+        self.driver.connection.request = request
+
+        obj, uploaded = self._upload_object_parts(
+            ex_max_workers=2, ex_use_slo=True,
+            extra={'meta_data': {'foo': 'bar'}})
+
+        self.assertEqual(len(requests), 1)
+        action, params, data, headers, method = requests[0]
+        self.assertEqual(action, '/foo_bar_container/foo_test_upload')
+        self.assertEqual(params, {'multipart-manifest': 'put'})
+        self.assertEqual(method, 'PUT')
+        self.assertEqual(headers['X-Object-Meta-foo'], 'bar')
+
+        manifest = json.loads(data)
+        self.assertEqual(len(manifest), len(uploaded))
+        self.assertEqual(manifest[1]['path'],
+                         '/foo_bar_container/foo_test_upload/00000001')
+        self.assertEqual(manifest[1]['size_bytes'], 1000)
+        self.assertEqual(
+            manifest[1]['etag'],
+            hashlib.md5(uploaded['foo_test_upload/00000001']).hexdigest())
+
+        self.assertEqual(obj.size, os.path.getsize(os.path.abspath(__file__)))
+        self.assertTrue(obj.extra['static_large_object'])
+
+    def test_ex_multipart_upload_object_slo_wrong_hash(self):
+        self.driver.connection.request = Mock(return_value=Mock(
+            status=httplib.CREATED, headers={'etag': '0000000'}))
+
+        self.assertRaises(ObjectHashMismatchError, self._upload_object_parts,
+                          ex_use_slo=True)
+
     def test__upload_object_part(self):
         _put_object = CloudFilesStorageDriver._put_object
         mocked__put_object = mock.Mock(return_value="test")
@@ -994,6 +1121,54 @@ class CloudFilesMockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
             status_code = httplib.NO_CONTENT
         return (status_code, body, headers, httplib.responses[httplib.OK])
 
+    def _v1_MossoCloudFS_foo_bar_container_foo_bar_object_COPY(
+            self, method, url, body, headers):
+        # test_copy_object
+        assert method == 'COPY'
+        assert headers['Destination'] == '/foo_bar_container/foo%20copy'
+
+        headers = {'etag': '"16b0a46c1f2ee27f8a7bcf44bb2e6ded"',
+                   'content-type': 'text/plain',
+                   'last-modified': 'Tue, 21 Sep 2021 10:21:31 GMT',
+                   'x-copied-from': 'foo_bar_container/foo_bar_object'}
+        return (httplib.CREATED,
+                '',
+                headers,
+                httplib.responses[httplib.CREATED])
+
+    def _v1_MossoCloudFS_BULK_DELETE(self, method, url, body, headers):
+        # test_delete_objects
+        assert method == 'POST'
+        assert 'bulk-delete' in url
+        assert headers['Content-Type'] == 'text/plain'
+
+        paths = body.split('\n')
+        errors = [[path, '403 Forbidden'] for path in paths
+                  if path.endswith('/foo_error_object')]
+        body = json.dumps({'Number Deleted': len(paths) - len(errors),
+                           'Number Not Found': 0,
+                           'Response Body': '',
+                           'Response Status': '400 Bad Request' if errors
+                           else '200 OK',
+                           'Errors': errors})
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
+    def _v1_MossoCloudFS_BULK_DELETE_FAILURE(self, method, url, body,
+                                             headers):
+        # test_delete_objects_request_failure
+        body = json.dumps({'Number Deleted': 0,
+                           'Number Not Found': 0,
+                           'Response Body': 'Max delete failures exceeded',
+                           'Response Status': '400 Bad Request',
+                           'Errors': []})
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
     def _v1_MossoCloudFS_not_found(self, method, url, body, headers):
         # test_get_object_not_found
         if method == 'HEAD':
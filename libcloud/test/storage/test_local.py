@@ -17,13 +17,17 @@ from __future__ import with_statement
 
 import os
 import sys
+import errno
 import platform
 import shutil
 import unittest
 import time
 import tempfile
+import threading
 import multiprocessing
 
+import mock
+
 from libcloud.common.types import LibcloudError
 from libcloud.storage.base import Container
 from libcloud.storage.base import Object
@@ -36,26 +40,17 @@ from libcloud.utils.files import exhaust_iterator
 try:
     from libcloud.storage.drivers.local import LocalStorageDriver
     from libcloud.storage.drivers.local import LockLocalStorage
+    from libcloud.storage.drivers.local import _copy_file
     import fasteners
 except ImportError:
     print('fasteners library is not available, skipping local_storage tests...')
     LocalStorageDriver = None
 
 
-class LocalTests(unittest.TestCase):
-    driver_type = LocalStorageDriver
-
-    @classmethod
-    def create_driver(self):
-        self.key = tempfile.mkdtemp()
-        return self.driver_type(self.key, None)
-
-    def setUp(self):
-        self.driver = self.create_driver()
-
-    def tearDown(self):
-        shutil.rmtree(self.key)
-        self.key = None
+class LocalListingTestsMixin(object):
+    """
+    Listing tests which are run both with and without the index.
+    """
 
     def make_tmp_file(self, content=None):
         if not content:
@@ -74,6 +69,116 @@ class LocalTests(unittest.TestCase):
                 return
             raise e
 
+    def test_objects_success(self):
+        tmppath = self.make_tmp_file()
+
+        container = self.driver.create_container('test3')
+        obj1 = container.upload_object(tmppath, 'object1')
+        obj2 = container.upload_object(tmppath, 'path/object2')
+        obj3 = container.upload_object(tmppath, 'path/to/object3')
+        obj4 = container.upload_object(tmppath, 'path/to/object4.ext')
+        with open(tmppath, 'rb') as tmpfile:
+            obj5 = container.upload_object_via_stream(tmpfile, 'object5')
+
+        objects = self.driver.list_container_objects(container=container)
+        self.assertEqual(len(objects), 5)
+
+        prefix = os.path.join('path', 'invalid')
+        objects = self.driver.list_container_objects(container=container,
+                                                     prefix=prefix)
+        self.assertEqual(len(objects), 0)
+
+        prefix = os.path.join('path', 'to')
+        objects = self.driver.list_container_objects(container=container,
+                                                     prefix=prefix)
+        self.assertEqual(len(objects), 2)
+
+        for obj in objects:
+            self.assertNotEqual(obj.hash, None)
+            self.assertEqual(obj.size, 4096)
+            self.assertEqual(obj.container.name, 'test3')
+            self.assertTrue('creation_time' in obj.extra)
+            self.assertTrue('modify_time' in obj.extra)
+            self.assertTrue('access_time' in obj.extra)
+
+        obj1.delete()
+        obj2.delete()
+
+        objects = container.list_objects()
+        self.assertEqual(len(objects), 3)
+
+        container.delete_object(obj3)
+        container.delete_object(obj4)
+        container.delete_object(obj5)
+
+        objects = container.list_objects()
+        self.assertEqual(len(objects), 0)
+
+        container.delete()
+        self.remove_tmp_file(tmppath)
+
+    def test_list_container_objects_sorted_with_prefix(self):
+        container = self.driver.create_container('test4')
+
+        for name in ['b0.txt', 'a.txt', 'b/c.txt', 'ba/d.txt', 'c/b.txt']:
+            container.upload_object_via_stream(iter([b'data']), name)
+
+        objects = container.list_objects()
+        self.assertEqual([obj.name for obj in objects],
+                         ['a.txt', 'b/c.txt', 'b0.txt', 'ba/d.txt', 'c/b.txt'])
+
+        # Prefix is matched against the whole object name, not only against
+        # directory names
+        objects = container.list_objects(prefix='b')
+        self.assertEqual([obj.name for obj in objects],
+                         ['b/c.txt', 'b0.txt', 'ba/d.txt'])
+
+        objects = container.list_objects(prefix='ba/')
+        self.assertEqual([obj.name for obj in objects], ['ba/d.txt'])
+
+        objects = container.list_objects(prefix='c/a')
+        self.assertEqual(objects, [])
+
+    @unittest.skipIf(platform.system().lower() == 'windows', 'Unsupported on Windows')
+    def test_list_container_objects_symlinked_directories(self):
+        container = self.driver.create_container('test7')
+        container.upload_object_via_stream(iter([b'data']), 'd/f')
+
+        outside = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(outside, 'g'), 'wb') as fp:
+                fp.write(b'data')
+
+            cpath = os.path.join(self.key, 'test7')
+            # Symlink loop and symlink to a directory outside the container
+            # are not followed
+            os.symlink('..', os.path.join(cpath, 'd', 'loop'))
+            os.symlink(outside, os.path.join(cpath, 'outside'))
+
+            if self.driver.index is not None:
+                self.driver.ex_rebuild_index(container)
+
+            objects = container.list_objects()
+            self.assertEqual([obj.name for obj in objects], ['d/f'])
+        finally:
+            shutil.rmtree(outside)
+
+
+class LocalTests(LocalListingTestsMixin, unittest.TestCase):
+    driver_type = LocalStorageDriver
+
+    @classmethod
+    def create_driver(self):
+        self.key = tempfile.mkdtemp()
+        return self.driver_type(self.key, None)
+
+    def setUp(self):
+        self.driver = self.create_driver()
+
+    def tearDown(self):
+        shutil.rmtree(self.key)
+        self.key = None
+
     @unittest.skipIf(platform.system().lower() == 'windows', 'Unsupported on Windows')
     def test_lock_local_storage(self):
         # 1. Acquire succeeds
@@ -123,6 +228,30 @@ class LocalTests(unittest.TestCase):
         self.assertEqual(bool(success_1.value), True, "Check didn't pass")
         self.assertEqual(bool(success_2.value), True, "Second check didn't pass")
 
+    def test_lock_local_storage_shared_between_instances(self):
+        lock1 = LockLocalStorage('/tmp/d', timeout=5)
+        lock2 = LockLocalStorage('/tmp/d', timeout=5)
+        self.assertTrue(lock1.thread_lock is lock2.thread_lock)
+        self.assertFalse(lock1.thread_lock is
+                         LockLocalStorage('/tmp/e').thread_lock)
+
+        events = []
+
+        def acquire():
+            with lock2:
+                events.append('acquired')
+
+        with lock1:
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            # Second thread waits for the lock to be released
+            thread.join(0.2)
+            self.assertTrue(thread.is_alive())
+            events.append('released')
+
+        thread.join()
+        self.assertEqual(events, ['released', 'acquired'])
+
     def test_list_containers_empty(self):
         containers = self.driver.list_containers()
         self.assertEqual(len(containers), 0)
@@ -148,54 +277,6 @@ class LocalTests(unittest.TestCase):
         for container in containers:
             self.driver.delete_container(container)
 
-    def test_objects_success(self):
-        tmppath = self.make_tmp_file()
-
-        container = self.driver.create_container('test3')
-        obj1 = container.upload_object(tmppath, 'object1')
-        obj2 = container.upload_object(tmppath, 'path/object2')
-        obj3 = container.upload_object(tmppath, 'path/to/object3')
-        obj4 = container.upload_object(tmppath, 'path/to/object4.ext')
-        with open(tmppath, 'rb') as tmpfile:
-            obj5 = container.upload_object_via_stream(tmpfile, 'object5')
-
-        objects = self.driver.list_container_objects(container=container)
-        self.assertEqual(len(objects), 5)
-
-        prefix = os.path.join('path', 'invalid')
-        objects = self.driver.list_container_objects(container=container,
-                                                     prefix=prefix)
-        self.assertEqual(len(objects), 0)
-
-        prefix = os.path.join('path', 'to')
-        objects = self.driver.list_container_objects(container=container,
-                                                     prefix=prefix)
-        self.assertEqual(len(objects), 2)
-
-        for obj in objects:
-            self.assertNotEqual(obj.hash, None)
-            self.assertEqual(obj.size, 4096)
-            self.assertEqual(obj.container.name, 'test3')
-            self.assertTrue('creation_time' in obj.extra)
-            self.assertTrue('modify_time' in obj.extra)
-            self.assertTrue('access_time' in obj.extra)
-
-        obj1.delete()
-        obj2.delete()
-
-        objects = container.list_objects()
-        self.assertEqual(len(objects), 3)
-
-        container.delete_object(obj3)
-        container.delete_object(obj4)
-        container.delete_object(obj5)
-
-        objects = container.list_objects()
-        self.assertEqual(len(objects), 0)
-
-        container.delete()
-        self.remove_tmp_file(tmppath)
-
     def test_get_container_doesnt_exist(self):
         try:
             self.driver.get_container(container_name='container1')
@@ -585,11 +666,151 @@ class LocalTests(unittest.TestCase):
         container.delete()
         self.remove_tmp_file(tmppath)
 
+    def test_copy_file_fallbacks(self):
+        content = b'a' * 1024 * 1024
+        source_path = self.make_tmp_file(content=content)
+        destination_path = source_path + '.copy'
+
+        not_supported = OSError(errno.EXDEV, 'not supported')
+
+        try:
+            _copy_file(source_path, destination_path)
+
+            with open(destination_path, 'rb') as fp:
+                self.assertEqual(fp.read(), content)
+
+            # Kernel copy methods fail, data is copied using Python buffers
+            with mock.patch('fcntl.ioctl', side_effect=not_supported), \
+                    mock.patch('os.copy_file_range', create=True,
+                               side_effect=not_supported), \
+                    mock.patch('os.sendfile', side_effect=not_supported):
+                _copy_file(source_path, destination_path)
+
+            with open(destination_path, 'rb') as fp:
+                self.assertEqual(fp.read(), content)
+
+            # Unexpected errors are propagated
+            error = OSError(errno.EIO, 'I/O error')
+
+            with mock.patch('fcntl.ioctl', side_effect=error):
+                self.assertRaises(OSError, _copy_file, source_path,
+                                  destination_path)
+        finally:
+            self.remove_tmp_file(source_path)
+            self.remove_tmp_file(destination_path)
+
+    def test_upload_object_via_stream_is_atomic(self):
+        container = self.driver.create_container('test7')
+        container.upload_object_via_stream(iter([b'old']), 'a.txt')
+
+        def iterator():
+            yield b'new'
+            raise ValueError('stream failed')
+
+        self.assertRaises(ValueError, container.upload_object_via_stream,
+                          iterator(), 'a.txt')
+
+        obj = container.get_object('a.txt')
+        self.assertEqual(b''.join(obj.as_stream()), b'old')
+        self.assertEqual(os.listdir(os.path.join(self.key, 'test7',
+                                                 '.libcloud_tmp')), [])
+        self.assertEqual([obj.name for obj in container.list_objects()],
+                         ['a.txt'])
+
+    def test_copy_object(self):
+        container = self.driver.create_container('test8')
+        obj = container.upload_object_via_stream(iter([b'data']), 'a.txt')
+
+        key = tempfile.mkdtemp()
+
+        try:
+            driver = self.driver_type(key, None)
+            destination = driver.create_container('test9')
+
+            with mock.patch.object(self.driver,
+                                   'download_object_as_stream') as mock_stream:
+                copy = self.driver.copy_object(
+                    obj=obj, destination_container=destination,
+                    destination_name='b/c.txt')
+                self.assertEqual(mock_stream.call_count, 0)
+
+            self.assertEqual(copy.name, 'b/c.txt')
+            self.assertEqual(copy.driver, driver)
+            self.assertEqual(b''.join(copy.as_stream()), b'data')
+        finally:
+            shutil.rmtree(key)
+
+
+class LocalIndexTests(LocalListingTestsMixin, unittest.TestCase):
+    driver_type = LocalStorageDriver
+
+    @classmethod
+    def create_driver(self):
+        self.key = tempfile.mkdtemp()
+        return self.driver_type(self.key, None, ex_use_index=True)
+
+    def setUp(self):
+        self.driver = self.create_driver()
+
+    def tearDown(self):
+        self.driver.index.close()
+        shutil.rmtree(self.key)
+        self.key = None
+
+    def test_index_is_used_for_listing_and_get_object(self):
+        container = self.driver.create_container('test5')
+        container.upload_object_via_stream(iter([b'data']), 'a/b.txt')
+        container.upload_object_via_stream(iter([b'data']), 'c.txt')
+
+        with mock.patch('os.scandir') as mock_scandir, \
+                mock.patch('os.stat', wraps=os.stat) as mock_stat:
+            objects = container.list_objects()
+            self.assertEqual([obj.name for obj in objects],
+                             ['a/b.txt', 'c.txt'])
+
+            obj = self.driver.get_object('test5', 'c.txt')
+            self.assertEqual(obj.size, 4)
+            self.assertEqual(obj.hash, objects[1].hash)
+
+            self.assertEqual(mock_scandir.call_count, 0)
+            # Only the container directory is stat-ed
+            for call in mock_stat.call_args_list:
+                self.assertEqual(call[0][0],
+                                 os.path.join(self.key, 'test5'))
+
+        obj.delete()
+        self.assertEqual([obj.name for obj in container.list_objects()],
+                         ['a/b.txt'])
+
+    def test_ex_rebuild_index(self):
+        container = self.driver.create_container('test6')
+        container.upload_object_via_stream(iter([b'data']), 'a.txt')
+
+        # File created without using the driver
+        with open(os.path.join(self.key, 'test6', 'b.txt'), 'wb') as fp:
+            fp.write(b'data')
+
+        self.assertEqual([obj.name for obj in container.list_objects()],
+                         ['a.txt'])
+
+        self.driver.ex_rebuild_index(container)
+        self.assertEqual([obj.name for obj in container.list_objects()],
+                         ['a.txt', 'b.txt'])
+
+        # Index is persistent
+        driver = self.driver_type(self.key, None, ex_use_index=True)
+        objects = driver.list_container_objects(container)
+        self.assertEqual([obj.name for obj in objects], ['a.txt', 'b.txt'])
+        driver.index.close()
+
 
 if not LocalStorageDriver:
     class LocalTests(unittest.TestCase):  # NOQA
         pass
 
+    class LocalIndexTests(unittest.TestCase):  # NOQA
+        pass
+
 
 if __name__ == '__main__':
     sys.exit(unittest.main())
@@ -17,6 +17,7 @@ import base64
 import hmac
 import os
 import sys
+import time
 
 from io import BytesIO
 from hashlib import sha1
@@ -59,6 +60,7 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
 
     fixtures = StorageFileFixtures('s3')
     base_headers = {}
+    listing_requests = []
 
     def _UNAUTHORIZED(self, method, url, body, headers):
         return (httplib.UNAUTHORIZED,
@@ -122,6 +124,57 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
                 self.base_headers,
                 httplib.responses[httplib.OK])
 
+    def _test_container_LIST_V2(self, method, url, body, headers):
+        query = parse_qs(urlparse.urlparse(url).query)
+        assert query['list-type'] == ['2']
+
+        if 'continuation-token' in query:
+            file_name = 'list_container_objects_v2_2.xml'
+        else:
+            file_name = 'list_container_objects_v2_1.xml'
+
+        body = self.fixtures.load(file_name)
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
+    def _test_container_DIRECTORY(self, method, url, body, headers):
+        query = parse_qs(urlparse.urlparse(url).query)
+        prefix = query.get('prefix', [''])[0]
+
+        if prefix == 'videos/':
+            file_name = 'list_directory_videos.xml'
+        elif prefix == 'photos/' and 'continuation-token' in query:
+            file_name = 'list_container_objects_v2_2.xml'
+        elif prefix == 'photos/':
+            file_name = 'list_container_objects_v2_1.xml'
+        else:
+            assert query['delimiter'] == ['/']
+            file_name = 'list_directory.xml'
+
+        body = self.fixtures.load(file_name)
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
+    def _test_container_ENDLESS(self, method, url, body, headers):
+        query = parse_qs(urlparse.urlparse(url).query)
+
+        if 'delimiter' in query:
+            file_name = 'list_directory.xml'
+        else:
+            # Listing of each shard is always truncated
+            self.listing_requests.append(query['prefix'][0])
+            file_name = 'list_container_objects_v2_1.xml'
+
+        body = self.fixtures.load(file_name)
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
     def _test2_get_object(self, method, url, body, headers):
         body = self.fixtures.load('list_container_objects.xml')
         return (httplib.OK,
@@ -261,6 +314,90 @@ class S3MockHttp(BaseRangeDownloadMockHttp, unittest.TestCase):
                 headers,
                 httplib.responses[httplib.OK])
 
+    def _foo_bar_container_DELETE_OBJECTS(self, method, url, body, headers):
+        # test_delete_objects
+        assert method == 'POST'
+        assert 'delete' in parse_qs(urlparse.urlparse(url).query,
+                                    keep_blank_values=True)
+        assert 'Content-MD5' in headers
+
+        keys = [element.text for element in ET.XML(body).iter('Key')]
+        self.delete_requests.append(keys)
+
+        body = self.fixtures.load('delete_objects.xml')
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
+    def _get_copy_source(self, headers):
+        for key, value in headers.items():
+            if key.lower().endswith('-copy-source'):
+                return value
+
+        return None
+
+    def _foo_bar_container_foo_copy_COPY(self, method, url, body, headers):
+        # test_copy_object
+        assert method == 'PUT'
+        assert self._get_copy_source(headers) == \
+            '/foo_bar_container/foo%20bar%20object'
+
+        body = self.fixtures.load('copy_object.xml')
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
+    def _foo_bar_container_foo_copy_COPY_ERROR(self, method, url, body,
+                                               headers):
+        # test_copy_object_error_in_body
+        body = self.fixtures.load('copy_object_error.xml')
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
+    def _foo_bar_container_foo_bar_object_COPY_MULTIPART(self, method, url,
+                                                         body, headers):
+        # test_copy_object_multipart
+        assert method == 'HEAD'
+        headers = {'etag': '"e31208036b0b6e1c0ef0cea5d4d0c5d1-3"',
+                   'content-type': 'video/mp4',
+                   'content-length': str(11 * 1024 * 1024 * 1024),
+                   'x-amz-meta-rabbits': 'monkeys'}
+        return (httplib.OK,
+                '',
+                headers,
+                httplib.responses[httplib.OK])
+
+    def _foo_bar_container_foo_copy_COPY_MULTIPART(self, method, url, body,
+                                                   headers):
+        # test_copy_object_multipart
+        query = parse_qs(urlparse.urlparse(url).query,
+                         keep_blank_values=True)
+
+        if method == 'POST' and 'uploads' in query:
+            assert headers['Content-Type'] == 'video/mp4'
+            assert headers['x-amz-meta-rabbits'] == 'monkeys'
+            body = self.fixtures.load('initiate_multipart.xml')
+        elif method == 'POST':
+            parts = [element.text for element in
+                     ET.XML(body).iter('PartNumber')]
+            assert parts == ['1', '2', '3']
+            body = self.fixtures.load('complete_multipart.xml')
+        else:
+            assert method == 'PUT'
+            assert self._get_copy_source(headers) == \
+                '/foo_bar_container/foo_bar_object'
+            self.copied_ranges.append(headers['x-amz-copy-source-range'])
+            body = self.fixtures.load('copy_part.xml')
+
+        return (httplib.OK,
+                body,
+                self.base_headers,
+                httplib.responses[httplib.OK])
+
     def _foo_bar_container_foo_test_stream_data(self, method, url, body,
                                                 headers):
         # test_upload_object_via_stream
@@ -540,6 +677,105 @@ class S3Tests(unittest.TestCase):
         self.assertTrue(obj in objects)
         self.assertEqual(len(objects), 5)
 
+    def test_list_container_objects_v2_continuation_token(self):
+        if not self.driver.supports_s3_list_objects_v2:
+            return
+
+        self.mock_response_klass.type = 'LIST_V2'
+        container = Container(name='test_container', extra={},
+                              driver=self.driver)
+        objects = self.driver.list_container_objects(container=container,
+                                                     prefix='photos/')
+
+        self.assertEqual([obj.name for obj in objects],
+                         ['photos/1.jpg', 'photos/2.jpg', 'photos/3.jpg'])
+        self.assertTrue('owner' in objects[0].meta_data)
+
+    def test_ex_iterate_directory(self):
+        if not self.driver.supports_s3_list_objects_v2:
+            return
+
+        self.mock_response_klass.type = 'DIRECTORY'
+        container = Container(name='test_container', extra={},
+                              driver=self.driver)
+        entries = list(self.driver.ex_iterate_directory(container=container))
+
+        self.assertEqual([getattr(entry, 'name', entry) for entry in entries],
+                         ['a.txt', 'photos/', 'videos/', 'z.txt'])
+        self.assertTrue(isinstance(entries[0], Object))
+        self.assertEqual(entries[1], 'photos/')
+
+    def test_ex_iterate_container_objects_sharded(self):
+        if not self.driver.supports_s3_list_objects_v2:
+            return
+
+        self.mock_response_klass.type = 'DIRECTORY'
+        container = Container(name='test_container', extra={},
+                              driver=self.driver)
+        expected = ['a.txt', 'photos/1.jpg', 'photos/2.jpg', 'photos/3.jpg',
+                    'videos/1.mp4', 'z.txt']
+
+        objects = self.driver.ex_iterate_container_objects_sharded(
+            container=container, max_workers=2, ordered=True)
+        self.assertEqual([obj.name for obj in objects], expected)
+
+        objects = self.driver.ex_iterate_container_objects_sharded(
+            container=container, max_workers=2)
+        self.assertEqual(sorted(obj.name for obj in objects), expected)
+
+    def test_ex_iterate_container_objects_sharded_error(self):
+        if not self.driver.supports_s3_list_objects_v2:
+            return
+
+        self.mock_response_klass.type = 'DIRECTORY'
+        container = Container(name='test_container', extra={},
+                              driver=self.driver)
+        original_iterate_listing_pages = self.driver._iterate_listing_pages
+
+        def iterate_listing_pages(container, prefix=None, delimiter=None,
+                                  stop=None):
+            if prefix == 'videos/':
+                raise LibcloudError('listing failed')
+
+            return original_iterate_listing_pages(container=container,
+                                                  prefix=prefix,
+                                                  delimiter=delimiter,
+                                                  stop=stop)
+
+        with mock.patch.object(self.driver_type, '_iterate_listing_pages',
+                               autospec=True) as mock_iterate:
+            mock_iterate.side_effect = \
+                lambda driver, **kwargs: iterate_listing_pages(**kwargs)
+            objects = self.driver.ex_iterate_container_objects_sharded(
+                container=container, max_workers=2)
+
+            self.assertRaisesRegex(LibcloudError, 'listing failed', list,
+                                   objects)
+
+    def test_ex_iterate_container_objects_sharded_abandoned(self):
+        if not self.driver.supports_s3_list_objects_v2:
+            return
+
+        self.mock_response_klass.type = 'ENDLESS'
+        self.mock_response_klass.listing_requests = []
+        container = Container(name='test_container', extra={},
+                              driver=self.driver)
+
+        # MockHttp doesn't support concurrent requests
+        objects = self.driver.ex_iterate_container_objects_sharded(
+            container=container, max_workers=1)
+
+        for _ in range(10):
+            next(objects)
+
+        # Workers are stopped when the generator is closed
+        objects.close()
+        requests = list(self.mock_response_klass.listing_requests)
+        time.sleep(0.3)
+        self.assertEqual(self.mock_response_klass.listing_requests, requests)
+        # Shard which hasn't been started yet is never listed
+        self.assertFalse('videos/' in requests)
+
     def test_list_container_objects_with_prefix(self):
         self.mock_response_klass.type = None
         container = Container(name='test_container', extra={},
@@ -1168,6 +1404,95 @@ class S3Tests(unittest.TestCase):
         result = self.driver.delete_object(obj=obj)
         self.assertTrue(result)
 
+    def test_delete_objects(self):
+        if not self.driver.supports_s3_multi_object_delete:
+            return
+
+        self.mock_response_klass.type = 'DELETE_OBJECTS'
+        self.mock_response_klass.delete_requests = []
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        objects = [Object(name='foo_object_%s' % (index), size=1, hash=None,
+                          extra=None, meta_data=None, container=container,
+                          driver=self.driver) for index in range(2500)]
+        objects.append(Object(name='foo_error_object', size=1, hash=None,
+                              extra=None, meta_data=None, container=container,
+                              driver=self.driver))
+
+        results = self.driver.delete_objects(objects=objects, max_workers=1)
+
+        # Keys are deleted in batches of up to 1000 keys
+        requests = self.mock_response_klass.delete_requests
+        self.assertEqual([len(keys) for keys in requests], [1000, 1000, 501])
+        self.assertEqual(requests[0][0], 'foo_object_0')
+
+        self.assertEqual(len(results), 2501)
+        self.assertEqual([result.item for result in results], objects)
+        self.assertTrue(all(result.success for result in results[:-1]))
+        self.assertFalse(results[-1].success)
+        self.assertFalse(results[-1].result)
+        self.assertTrue('AccessDenied' in str(results[-1].error))
+
+    def test_copy_object(self):
+        self.mock_response_klass.type = 'COPY'
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        obj = Object(name='foo bar object', size=1234, hash=None,
+                     extra={'content_type': 'text/plain'},
+                     meta_data={'rabbits': 'monkeys'}, container=container,
+                     driver=self.driver)
+
+        copied = self.driver.copy_object(obj=obj,
+                                         destination_container=container,
+                                         destination_name='foo_copy')
+
+        self.assertEqual(copied.name, 'foo_copy')
+        self.assertEqual(copied.size, 1234)
+        self.assertEqual(copied.hash, '9b2cf535f27731c974343645a3985328')
+        self.assertEqual(copied.extra['content_type'], 'text/plain')
+        self.assertEqual(copied.meta_data, {'rabbits': 'monkeys'})
+        self.assertEqual(copied.container, container)
+
+    def test_copy_object_error_in_body(self):
+        self.mock_response_klass.type = 'COPY_ERROR'
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        obj = Object(name='foo_bar_object', size=1234, hash=None, extra={},
+                     meta_data={}, container=container, driver=self.driver)
+
+        expected_msg = 'Error copying object: .*InternalError'
+        self.assertRaisesRegex(LibcloudError, expected_msg,
+                               self.driver.copy_object, obj=obj,
+                               destination_container=container,
+                               destination_name='foo_copy')
+
+    def test_copy_object_multipart(self):
+        if not self.driver.supports_s3_multipart_upload:
+            return
+
+        self.mock_response_klass.type = 'COPY_MULTIPART'
+        self.mock_response_klass.copied_ranges = []
+        gb = 1024 * 1024 * 1024
+        container = Container(name='foo_bar_container', extra={},
+                              driver=self.driver)
+        obj = Object(name='foo_bar_object', size=11 * gb, hash=None,
+                     extra={}, meta_data={}, container=container,
+                     driver=self.driver)
+
+        copied = self.driver.copy_object(obj=obj,
+                                         destination_container=container,
+                                         destination_name='foo_copy',
+                                         ex_part_size=5 * gb)
+
+        self.assertEqual(sorted(self.mock_response_klass.copied_ranges),
+                         ['bytes=0-%s' % (5 * gb - 1),
+                          'bytes=%s-%s' % (10 * gb, 11 * gb - 1),
+                          'bytes=%s-%s' % (5 * gb, 10 * gb - 1)])
+        self.assertEqual(copied.name, 'foo_copy')
+        self.assertEqual(copied.size, 11 * gb)
+        self.assertEqual(copied.extra['content_type'], 'video/mp4')
+        self.assertEqual(copied.meta_data, {'rabbits': 'monkeys'})
+
     def test_region_keyword_argument(self):
         # Default region
         driver  = S3StorageDriver(*self.driver_args)
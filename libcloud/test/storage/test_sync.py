@@ -0,0 +1,234 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import shutil
+import tempfile
+
+from mock import Mock
+
+from libcloud.common.types import LibcloudError
+from libcloud.storage.base import Object
+from libcloud.storage.sync import ContainerSyncer
+from libcloud.storage.sync import ObjectChange
+from libcloud.storage.sync import diff_containers
+from libcloud.storage.sync import iterate_sorted_objects
+from libcloud.storage.sync import objects_match
+from libcloud.test import unittest
+
+try:
+    from libcloud.storage.drivers.local import LocalStorageDriver
+except ImportError:
+    LocalStorageDriver = None
+
+
+def _iterator(*chunks):
+    return iter([chunk.encode('utf-8') for chunk in chunks])
+
+
+@unittest.skipIf(LocalStorageDriver is None,
+                 'fasteners library is not available')
+class ContainerSyncTestCase(unittest.TestCase):
+    def setUp(self):
+        self.source_path = tempfile.mkdtemp()
+        self.destination_path = tempfile.mkdtemp()
+
+        self.source_driver = LocalStorageDriver(self.source_path)
+        self.destination_driver = LocalStorageDriver(self.destination_path)
+
+        self.source = self.source_driver.create_container('source')
+        self.destination = self.destination_driver.create_container(
+            'destination')
+
+        for name, data in [('a.txt', 'a'), ('b/c.txt', 'bc'),
+                           ('b0.txt', 'b0'), ('d/e/f.txt', 'def'),
+                           ('g.txt', 'g')]:
+            self._upload(self.source, name, data)
+
+        self._upload(self.destination, 'a.txt', 'a')
+        self._upload(self.destination, 'b0.txt', 'outdated')
+        self._upload(self.destination, 'old.txt', 'old')
+
+    def tearDown(self):
+        shutil.rmtree(self.source_path)
+        shutil.rmtree(self.destination_path)
+
+    def _upload(self, container, name, data):
+        return container.upload_object_via_stream(iterator=_iterator(data),
+                                                  object_name=name)
+
+    def _get_contents(self, container):
+        return dict((obj.name, b''.join(obj.as_stream()).decode('utf-8'))
+                    for obj in container.iterate_objects())
+
+    def _object(self, name, size, hash=None, extra=None):
+        return Object(name=name, size=size, hash=hash, extra=extra or {},
+                      meta_data={}, container=self.source,
+                      driver=self.source_driver)
+
+    def test_local_driver_lists_objects_sorted(self):
+        names = [obj.name for obj in self.source.iterate_objects()]
+        self.assertEqual(names, ['a.txt', 'b/c.txt', 'b0.txt', 'd/e/f.txt',
+                                 'g.txt'])
+
+    def test_iterate_sorted_objects_external_sort(self):
+        self.source_driver.supports_sorted_listing = False
+        self.source_driver.iterate_container_objects = Mock(
+            return_value=iter([self._object(name, 1) for name in
+                               ['e', 'a', 'd', 'c', 'b']]))
+
+        objects = list(iterate_sorted_objects(self.source,
+                                              max_objects_in_memory=2))
+
+        self.assertEqual([obj.name for obj in objects],
+                         ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(objects[0].container, self.source)
+
+    def test_iterate_sorted_objects_unsorted_listing(self):
+        self.source_driver.iterate_container_objects = Mock(
+            return_value=iter([self._object(name, 1) for name in
+                               ['a', 'c', 'b']]))
+
+        objects = iterate_sorted_objects(self.source)
+        self.assertRaises(LibcloudError, list, objects)
+
+    def test_objects_match(self):
+        md5_1 = '0cc175b9c0f1b6a831c399e269772661'
+        md5_2 = '92eb5ffee6ae2fec3ad71c777531578f'
+        source = self._object('a', 1, extra={'md5_hash': md5_1})
+
+        self.assertTrue(objects_match(source, self._object('a', 1)))
+        self.assertFalse(objects_match(source, self._object('a', 2)))
+        self.assertTrue(objects_match(source, self._object(
+            'a', 1, extra={'md5_hash': md5_1.upper()})))
+        self.assertFalse(objects_match(source, self._object(
+            'a', 1, extra={'md5_hash': md5_2})))
+
+        # Local driver hash is not a content digest
+        self.assertTrue(objects_match(self._object('a', 1, hash=md5_1),
+                                      self._object('a', 1, hash=md5_2)))
+
+    def test_diff_containers(self):
+        source = [self._object('a', 1), self._object('b', 1),
+                  self._object('d', 1)]
+        destination = [self._object('b', 2), self._object('c', 1),
+                       self._object('d', 1)]
+
+        changes = list(diff_containers(source, destination,
+                                       include_unchanged=True))
+
+        self.assertEqual([(change.action, change.name) for change in changes],
+                         [(ObjectChange.CREATE, 'a'),
+                          (ObjectChange.UPDATE, 'b'),
+                          (ObjectChange.DELETE, 'c'),
+                          (ObjectChange.UNCHANGED, 'd')])
+        self.assertEqual(len(list(diff_containers(source, destination))), 3)
+
+    def test_sync(self):
+        syncer = ContainerSyncer(source_container=self.source,
+                                 destination_container=self.destination,
+                                 delete=True, max_workers=4)
+
+        result = syncer.sync()
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.stats.created, 3)
+        self.assertEqual(result.stats.updated, 1)
+        self.assertEqual(result.stats.deleted, 1)
+        self.assertEqual(result.stats.unchanged, 1)
+        self.assertEqual(result.stats.bytes_transferred, 8)
+        self.assertTrue(result.stats.throughput > 0)
+        self.assertEqual(self._get_contents(self.destination),
+                         self._get_contents(self.source))
+
+        result = syncer.sync()
+        self.assertEqual(result.stats.objects_transferred, 0)
+        self.assertEqual(result.stats.unchanged, 5)
+
+    def test_sync_without_delete(self):
+        syncer = ContainerSyncer(source_container=self.source,
+                                 destination_container=self.destination)
+
+        result = syncer.sync()
+
+        self.assertEqual(result.stats.deleted, 0)
+        self.assertTrue('old.txt' in self._get_contents(self.destination))
+
+    def test_sync_prefix(self):
+        syncer = ContainerSyncer(source_container=self.source,
+                                 destination_container=self.destination,
+                                 prefix='d', delete=True)
+
+        result = syncer.sync()
+
+        self.assertEqual(result.stats.created, 1)
+        self.assertEqual(sorted(self._get_contents(self.destination)),
+                         ['a.txt', 'b0.txt', 'd/e/f.txt', 'old.txt'])
+
+    def test_sync_dry_run(self):
+        syncer = ContainerSyncer(source_container=self.source,
+                                 destination_container=self.destination,
+                                 delete=True)
+
+        result = syncer.sync(dry_run=True)
+
+        self.assertTrue(result.dry_run)
+        self.assertEqual(result.stats.created, 3)
+        self.assertEqual(result.stats.updated, 1)
+        self.assertEqual(result.stats.deleted, 1)
+        self.assertEqual(result.stats.bytes_transferred, 0)
+        self.assertEqual(sorted(self._get_contents(self.destination)),
+                         ['a.txt', 'b0.txt', 'old.txt'])
+
+    def test_sync_checkpoint_resume(self):
+        checkpoint_store = {}
+        syncer = ContainerSyncer(source_container=self.source,
+                                 destination_container=self.destination,
+                                 checkpoint_store=checkpoint_store,
+                                 batch_size=2, max_workers=1)
+
+        copy_object = self.source_driver.copy_object
+
+        def failing_copy_object(obj, **kwargs):
+            if obj.name == 'd/e/f.txt':
+                raise LibcloudError('failure')
+
+            return copy_object(obj=obj, **kwargs)
+
+        self.source_driver.copy_object = Mock(side_effect=failing_copy_object)
+
+        result = syncer.sync()
+
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.errors[0].item.name, 'd/e/f.txt')
+        self.assertEqual(result.stats.failed, 1)
+        # First batch (b/c.txt, b0.txt) has been synchronized
+        self.assertEqual(syncer.checkpoint, 'b0.txt')
+
+        self.source_driver.copy_object = Mock(side_effect=copy_object)
+        result = syncer.sync()
+
+        self.assertTrue(result.success)
+        # g.txt has already been copied by the failed run
+        self.assertEqual(self.source_driver.copy_object.call_count, 1)
+        self.assertEqual(result.stats.created, 1)
+        self.assertEqual(result.stats.unchanged, 1)
+        self.assertEqual(syncer.checkpoint, None)
+        self.assertEqual(checkpoint_store, {})
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
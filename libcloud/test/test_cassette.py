@@ -0,0 +1,174 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import json
+import gzip
+import shutil
+import tempfile
+
+import requests_mock
+from mock import patch
+
+from libcloud.test import unittest
+from libcloud.common.base import Connection
+from libcloud.common.types import LibcloudError
+from libcloud.http import LibcloudConnection
+from libcloud.utils.cassette import Cassette
+from libcloud.utils.cassette import use_cassette
+
+
+class CassetteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cassette.jsonl.gz')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _record(self):
+        with requests_mock.mock() as m:
+            m.get('http://test.com/servers?Signature=abc&a=1',
+                  [{'text': 'first', 'headers': {'X-Auth-Token': 'secret'}},
+                   {'text': 'second'}])
+            m.post('http://test.com/servers', text='created',
+                   status_code=201)
+            m.get('http://test.com/binary', content=b'\xff\x00')
+
+            with use_cassette(self.path, mode='record') as cassette:
+                connection = Connection(url='http://test.com/')
+                connection.request('/servers',
+                                   params={'a': 1, 'Signature': 'abc',
+                                           'Timestamp': '1'})
+                connection.request('/servers',
+                                   params={'a': 1, 'Signature': 'abc',
+                                           'Timestamp': '2'})
+                connection.request('/servers', method='POST', data='data')
+                connection.request('/binary')
+
+        self.assertEqual(len(cassette), 4)
+        self.assertTrue(Connection.conn_class is LibcloudConnection)
+
+    def test_record_and_replay(self):
+        self._record()
+
+        with gzip.open(self.path, 'rb') as fp:
+            content = fp.read().decode('utf-8')
+
+        # Secrets are scrubbed
+        self.assertFalse('secret' in content)
+        self.assertFalse('abc' in content)
+        self.assertTrue('Signature=SCRUBBED' in content)
+
+        with use_cassette(self.path, mode='replay'):
+            connection = Connection(url='http://test.com/')
+
+            # Interactions with the same key are served in the recorded order
+            params = {'a': 1, 'Signature': 'xyz', 'Timestamp': '3'}
+            self.assertEqual(connection.request('/servers',
+                                                params=params).body, 'first')
+            response = connection.request('/servers', params=params)
+            self.assertEqual(response.body, 'second')
+            self.assertEqual(response.status, 200)
+            self.assertEqual(connection.request('/servers',
+                                                params=params).body, 'second')
+
+            response = connection.request('/servers', method='POST',
+                                          data='data')
+            self.assertEqual(response.status, 201)
+            self.assertEqual(response.body, 'created')
+
+            self.assertRaises(LibcloudError, connection.request, '/servers',
+                              method='POST', data='other')
+            self.assertRaises(LibcloudError, connection.request, '/missing')
+
+    def test_replay_binary_response(self):
+        self._record()
+
+        with use_cassette(self.path, mode='replay'):
+            connection = Connection(url='http://test.com/')
+            response = connection.request('/binary', raw=True)
+            self.assertEqual(b''.join(response.iter_content(1)), b'\xff\x00')
+
+    @patch('libcloud.utils.cassette.time.sleep')
+    def test_replay_latency(self, sleep):
+        self._record()
+
+        with use_cassette(self.path, mode='replay', latency=0.5):
+            Connection(url='http://test.com/').request('/binary')
+
+        sleep.assert_called_once_with(0.5)
+
+    def test_record_auth_response_tokens_are_scrubbed(self):
+        keystone = {'access': {'token': {'id': 'keystone-token-id',
+                                         'expires': '2030-01-01T00:00:00Z'},
+                               'serviceCatalog': [{'type': 'compute'}]}}
+        oauth = {'access_token': 'oauth-access-token',
+                 'refresh_token': 'oauth-refresh-token',
+                 'token_type': 'Bearer', 'expires_in': 3600}
+
+        def scrub_body(url, body):
+            return body.replace('tenant-secret', 'SCRUBBED')
+
+        with requests_mock.mock() as m:
+            m.post('http://test.com/v2.0/tokens', json=keystone)
+            m.post('http://test.com/o/oauth2/token', json=oauth)
+            m.get('http://test.com/tenant', text='tenant-secret')
+
+            with use_cassette(self.path, mode='record',
+                              scrub_body=scrub_body):
+                connection = Connection(url='http://test.com/')
+                connection.request('/v2.0/tokens', method='POST', data='{}')
+                connection.request('/o/oauth2/token', method='POST',
+                                   data='grant_type=refresh_token')
+                connection.request('/tenant')
+
+        with gzip.open(self.path, 'rb') as fp:
+            content = fp.read().decode('utf-8')
+
+        for secret in ['keystone-token-id', 'oauth-access-token',
+                       'oauth-refresh-token', 'tenant-secret']:
+            self.assertFalse(secret in content)
+
+        with use_cassette(self.path, mode='replay'):
+            connection = Connection(url='http://test.com/')
+            body = json.loads(connection.request('/v2.0/tokens',
+                                                 method='POST',
+                                                 data='{}').body)
+            self.assertEqual(body['access']['token'],
+                             {'id': 'SCRUBBED',
+                              'expires': '2030-01-01T00:00:00Z'})
+            self.assertEqual(body['access']['serviceCatalog'],
+                             [{'type': 'compute'}])
+
+            body = connection.request('/o/oauth2/token', method='POST',
+                                      data='grant_type=refresh_token')
+            self.assertEqual(json.loads(body.body),
+                             {'access_token': 'SCRUBBED',
+                              'refresh_token': 'SCRUBBED',
+                              'token_type': 'Bearer', 'expires_in': 3600})
+
+    def test_cassette_url(self):
+        cassette = Cassette(ignored_params=['t'], scrubbed_params=['key'])
+        self.assertEqual(cassette.get_url('https://a.com/p?t=1&key=2&b=3&a=4'),
+                         'https://a.com/p?a=4&b=3&key=SCRUBBED')
+
+        self.assertRaises(ValueError, use_cassette(self.path,
+                                                   mode='other').__enter__)
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
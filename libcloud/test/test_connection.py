@@ -29,6 +29,7 @@ import libcloud.common.base
 
 from libcloud.test import unittest
 from libcloud.common.base import Connection, CertificateConnection
+from libcloud.common.base import ConditionalRequestCache
 from libcloud.common.exceptions import RateLimitReachedError
 from libcloud.http import LibcloudBaseConnection
 from libcloud.http import LibcloudConnection
@@ -217,6 +218,60 @@ class BaseConnectionClassTestCase(unittest.TestCase):
             response = conn.request('/test')
         self.assertEqual(response.body, 'data')
 
+    def test_conditional_request_cache(self):
+        conn = Connection(url='http://test.com/')
+        conn.conditional_cache = ConditionalRequestCache()
+        conn.connect()
+
+        with requests_mock.mock() as m:
+            m.get('http://test.com/test', text='data',
+                  headers={'ETag': '"1"'})
+            response = conn.request('/test')
+            self.assertFalse(response.not_modified)
+            self.assertFalse('If-None-Match' in m.last_request.headers)
+
+            m.get('http://test.com/test', status_code=304)
+            cached_response = conn.request('/test')
+            self.assertEqual(m.last_request.headers['If-None-Match'], '"1"')
+            self.assertTrue(cached_response.not_modified)
+            self.assertEqual(cached_response.status, 200)
+            self.assertEqual(cached_response.object, 'data')
+            self.assertEqual(cached_response.headers['etag'], '"1"')
+
+            # Parameters are part of the key
+            m.get('http://test.com/test?a=b', text='other')
+            response = conn.request('/test', params={'a': 'b'})
+            self.assertEqual(response.object, 'other')
+
+            # Only GET and HEAD requests are cached
+            m.post('http://test.com/test', text='post')
+            conn.request('/test', method='POST')
+            self.assertFalse('If-None-Match' in m.last_request.headers)
+
+            # Resource has changed
+            m.get('http://test.com/test', text='data2',
+                  headers={'ETag': '"2"'})
+            response = conn.request('/test')
+            self.assertFalse(response.not_modified)
+            self.assertEqual(response.object, 'data2')
+            self.assertEqual(conn.conditional_cache.get(
+                conn.conditional_cache.get_key(conn, '/test', {}, {},
+                                               'GET'))[0], '"2"')
+
+        self.assertEqual(conn.conditional_cache.hits, 1)
+        self.assertEqual(conn.conditional_cache.misses, 3)
+
+    def test_conditional_request_cache_eviction(self):
+        cache = ConditionalRequestCache(max_entries=2)
+        cache.set('a', '1', 'a')
+        cache.set('b', '2', 'b')
+        cache.get('a')
+        cache.set('c', '3', 'c')
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('a'), ('1', 'a'))
+
     def test_morph_action_hook(self):
         conn = Connection(url="http://test.com")
 
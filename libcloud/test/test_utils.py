@@ -15,6 +15,8 @@
 # limitations under the License.
 
 import sys
+import json
+import pickle
 import pytest
 import socket
 import codecs
@@ -42,6 +44,7 @@ from libcloud.compute.types import Provider
 from libcloud.compute.providers import DRIVERS
 from libcloud.compute.drivers.dummy import DummyNodeDriver
 from libcloud.utils.misc import get_secure_random_string
+from libcloud.utils.misc import LazyDict
 from libcloud.utils.networking import is_public_subnet
 from libcloud.utils.networking import is_private_subnet
 from libcloud.utils.networking import is_valid_ip_address
@@ -49,10 +52,12 @@ from libcloud.utils.networking import join_ipv4_segments
 from libcloud.utils.networking import increment_ipv4_segments
 from libcloud.utils.decorators import wrap_non_libcloud_exceptions
 from libcloud.utils.connection import get_response_object
+from libcloud.utils.parallel import chunks, clone_driver, run_in_parallel
 from libcloud.utils.publickey import (
     get_pubkey_openssh_fingerprint,
     get_pubkey_ssh2_fingerprint,
 )
+from libcloud.common.base import Connection
 from libcloud.common.types import LibcloudError
 from libcloud.storage.drivers.dummy import DummyIterator
 
@@ -403,6 +408,92 @@ class NetworkingUtilsTestCase(unittest.TestCase):
             self.assertEqual(result, incremented_ip)
 
 
+class LazyDictTestCase(unittest.TestCase):
+    def test_values_are_decoded_on_access(self):
+        decoded = []
+
+        def decode(key):
+            def func(source):
+                decoded.append(key)
+                return source[key]
+            return func
+
+        source = {'a': 'value a', 'b': 2}
+        extra = LazyDict(source, {'a': decode('a'), 'b': decode('b')},
+                         tags={'Name': 'node'})
+
+        self.assertTrue('a' in extra)
+        self.assertFalse('c' in extra)
+        self.assertEqual(extra['a'], 'value a')
+        self.assertEqual(extra['a'], 'value a')
+        self.assertEqual(extra.get('c', 'default'), 'default')
+        self.assertRaises(KeyError, lambda: extra['c'])
+        self.assertEqual(decoded, ['a'])
+
+        extra['b'] = 3
+        self.assertEqual(extra['b'], 3)
+        self.assertEqual(decoded, ['a'])
+
+        # Whole dictionary is needed - pending values are decoded
+        self.assertEqual(extra, {'a': 'value a', 'b': 3,
+                                 'tags': {'Name': 'node'}})
+        self.assertEqual(list(extra.keys()), ['a', 'b', 'tags'])
+        self.assertEqual(json.loads(json.dumps(extra)),
+                         {'a': 'value a', 'b': 3, 'tags': {'Name': 'node'}})
+
+        copied = pickle.loads(pickle.dumps(LazyDict(source, {'b': decode('b')})))
+        self.assertEqual(copied, {'b': 2})
+        self.assertEqual(type(copied), dict)
+
+
+class ParallelUtilsTestCase(unittest.TestCase):
+    def test_chunks(self):
+        self.assertEqual(list(chunks([], 2)), [])
+        self.assertEqual(list(chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunks(iter(range(4)), 2)), [[0, 1], [2, 3]])
+
+    def test_clone_driver_uses_new_connection(self):
+        driver = DummyNodeDriver(0)
+        driver.connection = Connection()
+        driver.connection.driver = driver
+        driver.connection.connect()
+
+        clone = clone_driver(driver)
+
+        self.assertTrue(clone is not driver)
+        self.assertTrue(clone.connection is not driver.connection)
+        self.assertTrue(clone.connection.connection is not
+                        driver.connection.connection)
+        self.assertTrue(clone.connection.driver is clone)
+        self.assertTrue(driver.connection.driver is driver)
+
+    def test_run_in_parallel(self):
+        driver = DummyNodeDriver(0)
+
+        def func(driver, item):
+            if item == 3:
+                raise ValueError('fail')
+            return item * 2
+
+        for max_workers in [1, 4]:
+            results = run_in_parallel(driver=driver, func=func,
+                                      items=range(10),
+                                      max_workers=max_workers)
+            self.assertEqual([result.item for result in results],
+                             list(range(10)))
+            self.assertEqual([result.result for result in results],
+                             [0, 2, 4, None, 8, 10, 12, 14, 16, 18])
+            self.assertFalse(results[3].success)
+            self.assertTrue(isinstance(results[3].error, ValueError))
+
+    def test_run_in_parallel_serial_uses_original_driver(self):
+        driver = DummyNodeDriver(0)
+        results = run_in_parallel(driver=driver,
+                                  func=lambda driver, item: driver,
+                                  items=[1, 2], max_workers=1)
+        self.assertTrue(all(result.result is driver for result in results))
+
+
 class TestPublicKeyUtils(unittest.TestCase):
 
     PUBKEY = (
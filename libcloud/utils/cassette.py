@@ -0,0 +1,491 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Record and replay HTTP traffic.
+
+:class:`RecordingConnection` captures request / response pairs made by the
+drivers into a :class:`Cassette` (with credentials in the headers, query
+parameters and JSON bodies scrubbed) and
+:class:`ReplayConnection` serves them back without touching the network,
+optionally with an injected latency. This is useful for reproducible
+performance testing of the drivers with realistic traffic::
+
+    with use_cassette('ec2.jsonl.gz', mode='record'):
+        driver.list_nodes()
+
+    with use_cassette('ec2.jsonl.gz', mode='replay', latency=0.05):
+        driver.list_nodes()
+
+Cassette is a (optionally gzip compressed) file with one JSON encoded
+interaction per line.
+"""
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import io
+import json
+import gzip
+import time
+import base64
+import hashlib
+import datetime
+import threading
+import contextlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from libcloud.utils.py3 import b
+from libcloud.utils.py3 import urlparse
+from libcloud.utils.py3 import parse_qsl
+from libcloud.utils.py3 import urlencode
+from libcloud.common.types import LibcloudError
+from libcloud.http import LibcloudConnection
+
+__all__ = [
+    'SCRUBBED_VALUE',
+    'SCRUBBED_HEADERS',
+    'SCRUBBED_PARAMS',
+    'SCRUBBED_BODY_KEYS',
+    'IGNORED_PARAMS',
+
+    'Cassette',
+    'RecordingConnection',
+    'ReplayConnection',
+
+    'use_cassette'
+]
+
+# Value which replaces scrubbed secrets
+SCRUBBED_VALUE = 'SCRUBBED'
+
+# Response headers which are scrubbed
+SCRUBBED_HEADERS = ['authorization', 'set-cookie', 'x-auth-token',
+                    'x-subject-token', 'x-amz-security-token']
+
+# Query parameters which are scrubbed
+SCRUBBED_PARAMS = ['AWSAccessKeyId', 'Signature', 'X-Amz-Credential',
+                   'X-Amz-Signature', 'X-Amz-Security-Token', 'SecurityToken',
+                   'access_token', 'apikey', 'api_key', 'signature', 'key',
+                   'password', 'token']
+
+# Keys of the JSON response body values which are scrubbed (e.g. OAuth2
+# tokens). If the value is an object, its "id" is scrubbed (e.g. OpenStack
+# Keystone "access.token.id").
+SCRUBBED_BODY_KEYS = ['access_token', 'refresh_token', 'id_token', 'token',
+                      'password', 'secret', 'client_secret', 'apikey',
+                      'api_key', 'private_key', 'SecretAccessKey',
+                      'SessionToken']
+
+# Query parameters which change with every request and are ignored when
+# matching requests
+IGNORED_PARAMS = ['Timestamp', 'Expires', 'X-Amz-Date', 'SignatureNonce',
+                  'nonce', 'timestamp', 'cache-busting']
+
+# Response headers which don't apply to the recorded (decoded) body
+DROPPED_HEADERS = ['content-encoding', 'content-length', 'transfer-encoding']
+
+
+class Cassette(object):
+    """
+    Collection of the recorded HTTP interactions.
+
+    Requests are matched by the method, URL (without the scrubbed and the
+    ignored query parameters) and optionally a hash of the request body.
+    Interactions with the same key are served in the recorded order and the
+    last one is repeated once all of them have been served.
+    """
+
+    def __init__(self, path=None, match_body=True,
+                 scrubbed_headers=SCRUBBED_HEADERS,
+                 scrubbed_params=SCRUBBED_PARAMS,
+                 scrubbed_body_keys=SCRUBBED_BODY_KEYS,
+                 ignored_params=IGNORED_PARAMS,
+                 scrub_body=None):
+        """
+        :param path: Path to the cassette file. Files which end with ``.gz``
+                     are gzip compressed.
+        :type path: ``str``
+
+        :param match_body: True to also match the request body.
+        :type match_body: ``bool``
+
+        :param scrubbed_headers: Response headers which are scrubbed.
+        :type scrubbed_headers: ``list`` of ``str``
+
+        :param scrubbed_params: Query parameters which are scrubbed.
+        :type scrubbed_params: ``list`` of ``str``
+
+        :param scrubbed_body_keys: Keys of the JSON response body values
+                                   which are scrubbed.
+        :type scrubbed_body_keys: ``list`` of ``str``
+
+        :param ignored_params: Query parameters which are ignored when
+                               matching the requests.
+        :type ignored_params: ``list`` of ``str``
+
+        :param scrub_body: Optional function which is called with the
+                           request URL and the (already scrubbed) response
+                           body text and returns the body which is recorded.
+                           It can be used to scrub provider specific secrets.
+        :type scrub_body: ``callable``
+        """
+        self.path = path
+        self.match_body = match_body
+        self.scrubbed_headers = set(h.lower() for h in scrubbed_headers)
+        self.scrubbed_params = set(scrubbed_params)
+        self.scrubbed_body_keys = set(scrubbed_body_keys)
+        self.ignored_params = set(ignored_params)
+        self.scrub_body = scrub_body
+
+        self.interactions = []  # type: List[Dict[str, Any]]
+        self._index = {}  # type: Dict[tuple, List[Dict[str, Any]]]
+        self._positions = {}  # type: Dict[tuple, int]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.interactions)
+
+    def load(self):
+        """
+        Load interactions from the cassette file.
+        """
+        with self._open('rb') as fp:
+            for line in fp:
+                line = line.strip()
+
+                if line:
+                    self.add(json.loads(line.decode('utf-8')))
+
+    def save(self):
+        """
+        Write all the interactions to the cassette file.
+        """
+        with self._open('wb') as fp:
+            for interaction in self.interactions:
+                line = json.dumps(interaction, sort_keys=True,
+                                  separators=(',', ':'))
+                fp.write(b(line + '\n'))
+
+    def add(self, interaction):
+        """
+        Add interaction (a dictionary) to the cassette.
+        """
+        key = (interaction['method'], interaction['url'],
+               interaction['body_hash'] if self.match_body else None)
+
+        with self._lock:
+            self.interactions.append(interaction)
+            self._index.setdefault(key, []).append(interaction)
+
+    def record(self, method, url, body, response):
+        """
+        Record a request and the response to it.
+
+        :param response: Response returned by the ``requests`` library.
+        :type response: :class:`requests.Response`
+        """
+        content = response.content or b''
+
+        try:
+            body_text = content.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            body_text = base64.b64encode(content).decode('utf-8')
+            encoding = 'base64'
+        else:
+            body_text = self.get_body(url, body_text)
+
+        headers = {}
+
+        for name, value in response.headers.items():
+            if name.lower() in DROPPED_HEADERS:
+                continue
+
+            if name.lower() in self.scrubbed_headers:
+                value = SCRUBBED_VALUE
+
+            headers[name] = value
+
+        self.add({
+            'method': method.upper(),
+            'url': self.get_url(url),
+            'body_hash': self.get_body_hash(body),
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+            'body': body_text,
+            'encoding': encoding,
+            'elapsed': response.elapsed.total_seconds()
+        })
+
+    def find(self, method, url, body):
+        """
+        Return recorded interaction for the provided request or None if the
+        request hasn't been recorded.
+
+        :rtype: ``dict``
+        """
+        key = (method.upper(), self.get_url(url),
+               self.get_body_hash(body) if self.match_body else None)
+
+        with self._lock:
+            interactions = self._index.get(key, None)
+
+            if not interactions:
+                return None
+
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+
+        return interactions[min(position, len(interactions) - 1)]
+
+    def rewind(self):
+        """
+        Serve the interactions from the beginning again.
+        """
+        with self._lock:
+            self._positions = {}
+
+    def get_url(self, url):
+        """
+        Return URL which is stored in the cassette - query parameters are
+        sorted, ignored parameters are removed and secrets are scrubbed.
+        """
+        parsed = urlparse.urlparse(url)
+        params = []
+
+        for name, value in parse_qsl(parsed.query, keep_blank_values=True):
+            if name in self.ignored_params:
+                continue
+
+            if name in self.scrubbed_params:
+                value = SCRUBBED_VALUE
+
+            params.append((name, value))
+
+        url = '%s://%s%s' % (parsed.scheme, parsed.netloc, parsed.path)
+
+        if params:
+            url = '%s?%s' % (url, urlencode(sorted(params)))
+
+        return url
+
+    def get_body(self, url, body):
+        """
+        Return response body which is stored in the cassette - secrets in
+        the JSON bodies are scrubbed and ``scrub_body`` function is applied.
+        """
+        try:
+            data = json.loads(body)
+        except ValueError:
+            data = None
+
+        if isinstance(data, (dict, list)) and self._scrub_json(data):
+            body = json.dumps(data)
+
+        if self.scrub_body is not None:
+            body = self.scrub_body(url, body)
+
+        return body
+
+    def _scrub_json(self, data):
+        # type: (Any) -> bool
+        """
+        Scrub secrets in the decoded JSON value in place.
+
+        :return: True if any value has been scrubbed.
+        """
+        scrubbed = False
+
+        if isinstance(data, list):
+            items = list(enumerate(data))
+        elif isinstance(data, dict):
+            items = list(data.items())
+        else:
+            return False
+
+        for key, value in items:
+            if key in self.scrubbed_body_keys:
+                if isinstance(value, dict) and \
+                        isinstance(value.get('id', None), str):
+                    value['id'] = SCRUBBED_VALUE
+                    scrubbed = True
+                elif isinstance(value, (str, int, float)) and \
+                        not isinstance(value, bool) and value != '':
+                    data[key] = SCRUBBED_VALUE
+                    scrubbed = True
+                    continue
+
+            if self._scrub_json(value):
+                scrubbed = True
+
+        return scrubbed
+
+    def get_body_hash(self, body):
+        if body is None or body == '' or body == b'':
+            return None
+
+        if not isinstance(body, (str, bytes, bytearray)):
+            # File-like objects and iterators can't be hashed without
+            # consuming them
+            return None
+
+        return hashlib.sha1(b(body)).hexdigest()
+
+    def _open(self, mode):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, mode)
+
+        return open(self.path, mode)
+
+
+class RecordingConnection(LibcloudConnection):
+    """
+    Connection which records all the requests and responses to
+    :attr:`cassette`.
+    """
+
+    cassette = None  # type: Optional[Cassette]
+
+    def request(self, method, url, body=None, headers=None, raw=False,
+                stream=False, hooks=None):
+        super(RecordingConnection, self).request(
+            method=method, url=url, body=body, headers=headers, raw=raw,
+            stream=stream, hooks=hooks)
+        self.cassette.record(method=method,
+                             url=urlparse.urljoin(self.host, url), body=body,
+                             response=self.response)
+
+    def prepared_request(self, method, url, body=None, headers=None,
+                         raw=False, stream=False):
+        super(RecordingConnection, self).prepared_request(
+            method=method, url=url, body=body, headers=headers, raw=raw,
+            stream=stream)
+        self.cassette.record(method=method, url=''.join([self.host, url]),
+                             body=body, response=self.response)
+
+
+class ReplayConnection(LibcloudConnection):
+    """
+    Connection which serves responses from :attr:`cassette` instead of
+    sending the requests.
+
+    If :attr:`latency` (seconds) is set, each response is delayed by this
+    value. If it's ``True``, the recorded response time is used.
+    """
+
+    cassette = None  # type: Optional[Cassette]
+    latency = 0  # type: Any
+
+    def request(self, method, url, body=None, headers=None, raw=False,
+                stream=False, hooks=None):
+        self.response = self._replay(method=method,
+                                     url=urlparse.urljoin(self.host, url),
+                                     body=body)
+
+    def prepared_request(self, method, url, body=None, headers=None,
+                         raw=False, stream=False):
+        self.response = self._replay(method=method,
+                                     url=''.join([self.host, url]),
+                                     body=body)
+
+    def _replay(self, method, url, body):
+        interaction = self.cassette.find(method=method, url=url, body=body)
+
+        if interaction is None:
+            raise LibcloudError('No recorded response for %s %s' %
+                                (method, self.cassette.get_url(url)))
+
+        latency = self.latency
+
+        if latency is True:
+            latency = interaction.get('elapsed', 0)
+
+        if latency:
+            time.sleep(latency)
+
+        if interaction['encoding'] == 'base64':
+            content = base64.b64decode(interaction['body'])
+        else:
+            content = interaction['body'].encode('utf-8')
+
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.reason = interaction['reason']
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(
+            response.headers)
+        response.url = url
+        response.raw = io.BytesIO(content)
+        response.elapsed = datetime.timedelta(seconds=latency or 0)
+        response._content = content
+        response._content_consumed = True
+        return response
+
+
+@contextlib.contextmanager
+def use_cassette(path, mode='replay', latency=0, **kwargs):
+    """
+    Record or replay all the HTTP requests made within the context.
+
+    Only connections which are established within the context and which use
+    the default ``Connection.conn_class`` are affected.
+
+    :param path: Path to the cassette file.
+    :type path: ``str``
+
+    :param mode: ``record`` or ``replay``.
+    :type mode: ``str``
+
+    :param latency: Latency which is injected in the replay mode (see
+                    :class:`ReplayConnection`).
+    :type latency: ``float`` or ``bool``
+
+    Other keyword arguments are passed to the :class:`Cassette` constructor.
+
+    :return: Cassette which is used.
+    :rtype: :class:`Cassette`
+    """
+    # NOTE: Late import to avoid circular import
+    from libcloud.common.base import Connection
+
+    if mode not in ['record', 'replay']:
+        raise ValueError('mode argument must either be record or replay')
+
+    cassette = Cassette(path=path, **kwargs)
+
+    if mode == 'record':
+        conn_class = type('RecordingConnection', (RecordingConnection,),
+                          {'cassette': cassette})
+    else:
+        cassette.load()
+        conn_class = type('ReplayConnection', (ReplayConnection,),
+                          {'cassette': cassette, 'latency': latency})
+
+    original_conn_class = Connection.conn_class
+    Connection.conn_class = conn_class
+
+    try:
+        yield cassette
+    finally:
+        Connection.conn_class = original_conn_class
+
+        if mode == 'record':
+            cassette.save()
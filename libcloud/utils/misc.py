@@ -16,6 +16,7 @@
 from typing import List
 
 import os
+import sys
 import binascii
 
 from libcloud.common.providers import get_driver as _get_driver
@@ -36,12 +37,15 @@ __all__ = [
     'set_driver',
     'merge_valid_keys',
     'get_new_obj',
+    'intern_string',
+    'intern_values',
     'str2dicts',
     'dict2str',
     'reverse_dict',
     'lowercase_keys',
     'get_secure_random_string',
-    'ReprMixin'
+    'ReprMixin',
+    'LazyDict'
 ]
 
 
@@ -58,6 +62,10 @@ set_driver = _set_driver
 # been moved to "libcloud.util.retry" module
 retry = Retry
 
+# Strings which are longer than this are not interned since they are most
+# likely unique (descriptions, URLs, etc.)
+MAX_INTERNED_STRING_LENGTH = 64
+
 
 def merge_valid_keys(params, valid_keys, extra):
     """
@@ -112,6 +120,36 @@ def get_new_obj(obj, klass, attributes):
     return klass(**kwargs)
 
 
+def intern_string(value):
+    """
+    Return interned version of the string 'value' so repeated values (node
+    states, regions, record types, etc.) share a single object in memory.
+
+    Other values and long strings are returned as-is.
+    """
+    if type(value) is str and len(value) <= MAX_INTERNED_STRING_LENGTH:
+        return sys.intern(value)
+
+    return value
+
+
+def intern_values(dictionary):
+    """
+    Intern short string values of the dictionary in place.
+
+    :return: Passed in dictionary.
+    :rtype: ``dict``
+    """
+    if type(dictionary) is not dict:
+        return dictionary
+
+    for key, value in dictionary.items():
+        if type(value) is str and len(value) <= MAX_INTERNED_STRING_LENGTH:
+            dictionary[key] = sys.intern(value)
+
+    return dictionary
+
+
 def str2dicts(data):
     """
     Create a list of dictionaries from a whitespace and newline delimited text.
@@ -257,3 +295,126 @@ class ReprMixin(object):
 
     def __str__(self):
         return str(self.__repr__())
+
+
+class LazyDict(dict):
+    """
+    Dictionary which values are decoded from the raw source (parsed XML
+    element, API response dictionary, etc.) on first access.
+
+    Values are decoded one by one on item access. All the pending values are
+    decoded and the reference to the source is released when the whole
+    dictionary is needed (iteration, comparison, copying, etc.).
+    """
+
+    __slots__ = ('_source', '_fields')
+
+    def __init__(self, source, fields, *args, **kwargs):
+        """
+        :param source: Raw object which the values are decoded from.
+        :type source: ``object``
+
+        :param fields: Dictionary which maps keys to the functions which take
+                       the source and return the decoded value. It's not
+                       modified and can be shared between the instances.
+        :type fields: ``dict``
+
+        Other arguments are used to populate the dictionary with values
+        which are already known.
+        """
+        dict.__init__(self, *args, **kwargs)
+        self._source = source
+        self._fields = fields
+
+    def __missing__(self, key):
+        fields = self._fields
+
+        if fields is None or key not in fields:
+            raise KeyError(key)
+
+        value = intern_string(fields[key](self._source))
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+
+        return self._fields is not None and key in self._fields
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def materialize(self):
+        """
+        Decode all the pending values and release the source.
+
+        :rtype: :class:`LazyDict`
+        """
+        fields = self._fields
+
+        if fields is None:
+            return self
+
+        # Preserve order of the keys - fields first, followed by the values
+        # which have been set directly
+        items = [(key, self[key]) for key in fields]
+        items.extend([(key, value) for key, value in dict.items(self)
+                      if key not in fields])
+
+        dict.clear(self)
+        dict.update(self, items)
+        self._source = None
+        self._fields = None
+        return self
+
+    def __iter__(self):
+        return dict.__iter__(self.materialize())
+
+    def __reversed__(self):
+        return reversed(list(self.materialize().keys()))
+
+    def __len__(self):
+        return dict.__len__(self.materialize())
+
+    def __bool__(self):
+        return dict.__len__(self) > 0 or bool(self._fields)
+
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
+
+    def __eq__(self, other):
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other):
+        return dict.__ne__(self.materialize(), other)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self.materialize(), key)
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (list(self.items()),))
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def copy(self):
+        return dict(self.items())
+
+    def pop(self, key, *args):
+        return dict.pop(self.materialize(), key, *args)
+
+    def popitem(self):
+        return dict.popitem(self.materialize())
+
+    def setdefault(self, key, default=None):
+        return dict.setdefault(self.materialize(), key, default)
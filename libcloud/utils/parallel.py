@@ -0,0 +1,184 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for running driver operations concurrently.
+
+Driver and connection objects are not thread safe (the underlying
+``LibcloudConnection`` stores the last response on the instance), so each
+worker thread operates on its own shallow copy of the driver which has a
+dedicated connection object.
+"""
+
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+__all__ = [
+    'DEFAULT_MAX_WORKERS',
+
+    'TaskResult',
+
+    'clone_driver',
+    'chunks',
+    'run_in_parallel'
+]
+
+# Default number of worker threads used by the bulk operation fallbacks
+DEFAULT_MAX_WORKERS = 8
+
+
+class TaskResult(object):
+    """
+    Result of a single task executed as part of a bulk operation.
+    """
+
+    def __init__(self, item, result=None, error=None):
+        """
+        :param item: Item the task was executed for (e.g. a record change,
+                     an object or a node).
+        :type item: ``object``
+
+        :param result: Value returned by the task.
+        :type result: ``object``
+
+        :param error: Exception raised by the task (if any).
+        :type error: :class:`Exception`
+        """
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def success(self):
+        # type: () -> bool
+        return self.error is None
+
+    def __repr__(self):
+        return ('<TaskResult: item=%s, success=%s, result=%s, error=%r>' %
+                (self.item, self.success, self.result, self.error))
+
+
+def clone_driver(driver):
+    """
+    Return a shallow copy of the provided driver which uses its own
+    connection object.
+
+    All the driver state (credentials, region, cached tokens, etc.) is shared
+    with the original driver, only the HTTP connection is not.
+
+    :param driver: Driver instance to clone.
+    :type driver: :class:`libcloud.common.base.BaseDriver`
+
+    :rtype: :class:`libcloud.common.base.BaseDriver`
+    """
+    clone = copy.copy(driver)
+    connection = getattr(driver, 'connection', None)
+
+    if connection is None:
+        return clone
+
+    connection = copy.copy(connection)
+    connection.context = {}
+    connection.driver = clone
+    connection.connection = None
+    connection.connect()
+    clone.connection = connection
+    return clone
+
+
+def chunks(items, size):
+    """
+    Split the provided items into lists of at most ``size`` elements.
+
+    :type items: ``iterable``
+    :type size: ``int``
+
+    :rtype: ``generator`` of ``list``
+    """
+    chunk = []
+
+    for item in items:
+        chunk.append(item)
+
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def run_in_parallel(driver,  # type: Any
+                    func,  # type: Callable[[Any, Any], Any]
+                    items,  # type: Iterable[Any]
+                    max_workers=DEFAULT_MAX_WORKERS  # type: Optional[int]
+                    ):
+    # type: (...) -> List[TaskResult]
+    """
+    Call ``func(driver, item)`` for each of the provided items using a bounded
+    pool of worker threads.
+
+    Each worker thread uses its own copy of the driver (see
+    :func:`clone_driver`). Exceptions are not propagated, they are captured in
+    the corresponding :class:`TaskResult` instead.
+
+    :param driver: Driver instance passed to ``func``.
+    :type driver: :class:`libcloud.common.base.BaseDriver`
+
+    :param func: Function to call for each item.
+    :type func: ``callable``
+
+    :param items: Items to process.
+    :type items: ``iterable``
+
+    :param max_workers: Maximum number of worker threads. If it's 1 (or
+                        there is only a single item), tasks are executed
+                        serially in the calling thread using the original
+                        driver.
+    :type max_workers: ``int``
+
+    :return: Results in the same order as the provided items.
+    :rtype: ``list`` of :class:`TaskResult`
+    """
+    items = list(items)
+    max_workers = min(max_workers or DEFAULT_MAX_WORKERS, len(items))
+
+    if max_workers <= 1:
+        return [_run_task(func, driver, item) for item in items]
+
+    local = threading.local()
+
+    def run(item):
+        if getattr(local, 'driver', None) is None:
+            local.driver = clone_driver(driver)
+
+        return _run_task(func, local.driver, item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, items))
+
+
+def _run_task(func, driver, item):
+    try:
+        return TaskResult(item=item, result=func(driver, item))
+    except Exception as e:
+        return TaskResult(item=item, error=e)
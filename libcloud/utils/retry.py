@@ -13,10 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any
+from typing import Dict
+from typing import Optional
+
 import socket
 import ssl
 import time
-from datetime import datetime, timedelta
+import random
+import hashlib
+import threading
+from email.utils import parsedate_tz, mktime_tz
 from functools import wraps
 import logging
 
@@ -26,6 +33,15 @@ from libcloud.common.exceptions import RateLimitReachedError
 __all__ = [
     'Retry',
     'RetryForeverOnRateLimitError',
+
+    'TokenBucket',
+    'AdaptiveConcurrencyLimiter',
+    'RateLimiter',
+
+    'RATE_LIMITS',
+    'set_rate_limit',
+    'get_rate_limiter',
+    'get_retry_after'
 ]
 
 _logger = logging.getLogger(__name__)
@@ -44,6 +60,7 @@ class TransientSSLError(ssl.SSLError):
 DEFAULT_TIMEOUT = 30  # default retry timeout
 DEFAULT_DELAY = 1  # default sleep delay used in each iterator
 DEFAULT_BACKOFF = 1  # retry backup multiplier
+DEFAULT_MAX_DELAY = 30  # upper bound for the delay when jitter is enabled
 RETRY_EXCEPTIONS = (RateLimitReachedError, socket.error, socket.gaierror,
                     httplib.NotConnected, httplib.ImproperConnectionState,
                     TransientSSLError)
@@ -52,7 +69,8 @@ RETRY_EXCEPTIONS = (RateLimitReachedError, socket.error, socket.gaierror,
 class MinimalRetry:
 
     def __init__(self, retry_delay=DEFAULT_DELAY,
-                 timeout=DEFAULT_TIMEOUT, backoff=DEFAULT_BACKOFF):
+                 timeout=DEFAULT_TIMEOUT, backoff=DEFAULT_BACKOFF,
+                 jitter=False, max_delay=DEFAULT_MAX_DELAY):
         """
         Wrapper around retrying that helps to handle common transient
         exceptions.
@@ -62,6 +80,12 @@ class MinimalRetry:
         :param retry_delay: retry delay between the attempts.
         :param timeout: maximum time to wait.
         :param backoff: multiplier added to delay between attempts.
+        :param jitter: use "decorrelated jitter" delays (random delay between
+                       ``retry_delay`` and three times the previous delay
+                       multiplied by ``backoff``) so clients which failed at
+                       the same time don't retry at the same time.
+        :param max_delay: maximum delay between the attempts when jitter is
+                          enabled.
 
         :Example:
 
@@ -81,6 +105,8 @@ class MinimalRetry:
         self.retry_delay = retry_delay
         self.timeout = timeout
         self.backoff = backoff
+        self.jitter = jitter
+        self.max_delay = max_delay
 
     def __call__(self, func):
         def transform_ssl_error(function, *args, **kwargs):
@@ -95,10 +121,10 @@ class MinimalRetry:
         @wraps(func)
         def retry_loop(*args, **kwargs):
             current_delay = self.retry_delay
-            end = datetime.now() + timedelta(seconds=self.timeout)
+            end = time.monotonic() + self.timeout
             last_exc = None
 
-            while datetime.now() < end:
+            while time.monotonic() < end:
                 try:
                     return transform_ssl_error(func, *args, **kwargs)
                 except Exception as exc:
@@ -120,7 +146,7 @@ class MinimalRetry:
                         current_delay = self.retry_delay
                     elif self.should_retry(exc):
                         time.sleep(current_delay)
-                        current_delay *= self.backoff
+                        current_delay = self.get_next_delay(current_delay)
                     else:
                         raise
 
@@ -131,12 +157,24 @@ class MinimalRetry:
     def should_retry(self, exception):
         return False
 
+    def get_next_delay(self, delay):
+        """
+        Return delay which is used after the attempt which followed the
+        provided delay.
+        """
+        if not self.jitter:
+            return delay * self.backoff
+
+        upper = max(delay * self.backoff * 3, self.retry_delay)
+        return min(self.max_delay, random.uniform(self.retry_delay, upper))
+
 
 class Retry(MinimalRetry):
 
     def __init__(self, retry_exceptions=RETRY_EXCEPTIONS,
                  retry_delay=DEFAULT_DELAY, timeout=DEFAULT_TIMEOUT,
-                 backoff=DEFAULT_BACKOFF):
+                 backoff=DEFAULT_BACKOFF, jitter=False,
+                 max_delay=DEFAULT_MAX_DELAY):
         """
         Wrapper around retrying that helps to handle common transient
         exceptions.
@@ -149,6 +187,9 @@ class Retry(MinimalRetry):
         :param retry_delay: retry delay between the attempts.
         :param timeout: maximum time to wait.
         :param backoff: multiplier added to delay between attempts.
+        :param jitter: use "decorrelated jitter" delays.
+        :param max_delay: maximum delay between the attempts when jitter is
+                          enabled.
 
         :Example:
 
@@ -158,7 +199,7 @@ class Retry(MinimalRetry):
         """
 
         super().__init__(retry_delay=retry_delay, timeout=timeout,
-                         backoff=backoff)
+                         backoff=backoff, jitter=jitter, max_delay=max_delay)
         if retry_exceptions is None:
             retry_exceptions = RETRY_EXCEPTIONS
         self.retry_exceptions = retry_exceptions
@@ -193,7 +234,7 @@ class RetryForeverOnRateLimitError(Retry):
         @wraps(func)
         def retry_loop(*args, **kwargs):
             current_delay = self.retry_delay
-            end = datetime.now() + timedelta(seconds=self.timeout)
+            end = time.monotonic() + self.timeout
 
             while True:
                 try:
@@ -205,14 +246,363 @@ class RetryForeverOnRateLimitError(Retry):
                         # Reset retries if we're told to wait due to rate
                         # limiting
                         current_delay = self.retry_delay
-                        end = datetime.now() + timedelta(
-                            seconds=exc.retry_after + self.timeout)
-                    elif datetime.now() >= end:
+                        end = (time.monotonic() + exc.retry_after +
+                               self.timeout)
+                    elif time.monotonic() >= end:
                         raise
                     elif self.should_retry(exc):
                         time.sleep(current_delay)
-                        current_delay *= self.backoff
+                        current_delay = self.get_next_delay(current_delay)
                     else:
                         raise
 
         return retry_loop
+
+
+# Rate limiter configuration per provider (driver type), e.g.
+# RATE_LIMITS[Provider.EC2] = {'rate': 20, 'burst': 40, 'max_concurrency': 16}
+# Keyword arguments are passed to the RateLimiter constructor. Connection
+# classes can also define their own configuration in the ``rate_limit``
+# attribute.
+RATE_LIMITS = {}  # type: Dict[str, Dict[str, Any]]
+
+# Responses with these status codes indicate the client is being throttled
+THROTTLED_STATUS_CODES = (httplib.TOO_MANY_REQUESTS,)
+
+# How long to pause all the requests (in seconds) if a throttled response
+# doesn't include the Retry-After header
+DEFAULT_RETRY_AFTER = 1
+
+_rate_limiters = {}  # type: Dict[tuple, RateLimiter]
+_rate_limiters_lock = threading.Lock()
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket which allows ``rate`` operations per second on
+    average and bursts of up to ``burst`` operations.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        :param rate: Number of tokens which are added per second.
+        :type rate: ``float``
+
+        :param burst: Maximum number of tokens in the bucket (defaults to
+                      ``rate``).
+        :type burst: ``float``
+        """
+        self.rate = float(rate)
+        self.burst = float(burst or max(rate, 1))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens from the bucket, blocking until they are available.
+
+        :return: Number of seconds spent waiting.
+        :rtype: ``float``
+        """
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+
+                if now > self.updated:
+                    self.tokens = min(self.burst, self.tokens +
+                                      (now - self.updated) * self.rate)
+                    self.updated = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+
+                # Bucket may have been drained until a time in the future
+                delay = (max(self.updated - now, 0) +
+                         (tokens - self.tokens) / self.rate)
+
+            time.sleep(delay)
+            waited += delay
+
+    def drain(self, until=None):
+        """
+        Remove all the tokens from the bucket. If ``until`` (monotonic time)
+        is provided, tokens are not added before that time.
+        """
+        with self._lock:
+            self.tokens = 0
+            self.updated = max(self.updated, until or time.monotonic())
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """
+    Limit the number of concurrent operations using an AIMD (additive
+    increase, multiplicative decrease) algorithm.
+
+    Limit grows by ``increase / limit`` after each successful operation
+    (i.e. by ``increase`` per "window" of operations) and it's multiplied by
+    ``decrease`` if an operation is throttled. Operations which were started
+    before the last decrease don't decrease the limit again so a burst of
+    throttled responses to concurrent requests only counts once.
+    """
+
+    def __init__(self, max_concurrency, min_concurrency=1,
+                 initial_concurrency=None, increase=1, decrease=0.5):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.increase = increase
+        self.decrease = decrease
+
+        self.limit = float(initial_concurrency or max_concurrency)
+        self.in_flight = 0
+        self._generation = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Block until a new operation can be started.
+
+        :return: Token which needs to be passed to :meth:`release`.
+        :rtype: ``int``
+        """
+        with self._condition:
+            while self.in_flight >= max(int(self.limit), 1):
+                self._condition.wait()
+
+            self.in_flight += 1
+            return self._generation
+
+    def release(self, token, throttled=None):
+        """
+        Mark operation as finished.
+
+        :param token: Value returned by :meth:`acquire`.
+        :type token: ``int``
+
+        :param throttled: True if the operation was throttled, False if it
+                          succeeded and None if the outcome is unknown (e.g.
+                          connection error) and the limit shouldn't change.
+        :type throttled: ``bool``
+        """
+        with self._condition:
+            self.in_flight -= 1
+
+            if throttled and token == self._generation:
+                self.limit = max(self.min_concurrency,
+                                 self.limit * self.decrease)
+                self._generation += 1
+            elif throttled is False:
+                self.limit = min(self.max_concurrency,
+                                 self.limit + self.increase / self.limit)
+
+            self._condition.notify_all()
+
+
+class RateLimiter(object):
+    """
+    Client side rate limiter which is shared by all the connections which
+    talk to the same API using the same credentials (see
+    :func:`get_rate_limiter`).
+
+    Requests are limited using a token bucket (``rate`` and ``burst``) and an
+    adaptive concurrency limit (``max_concurrency``). Throttled responses
+    pause all the requests for the duration specified in the ``Retry-After``
+    header.
+    """
+
+    def __init__(self, rate=None, burst=None, max_concurrency=None,
+                 min_concurrency=1,
+                 throttled_status_codes=THROTTLED_STATUS_CODES,
+                 default_retry_after=DEFAULT_RETRY_AFTER):
+        """
+        :param rate: Maximum average number of requests per second.
+        :type rate: ``float``
+
+        :param burst: Maximum number of requests which can be sent at once
+                      after a period of inactivity.
+        :type burst: ``int``
+
+        :param max_concurrency: Maximum number of requests in flight.
+        :type max_concurrency: ``int``
+
+        :param min_concurrency: Lower bound for the adaptive concurrency
+                                limit.
+        :type min_concurrency: ``int``
+
+        :param throttled_status_codes: Status codes which indicate the
+                                       request has been throttled.
+        :type throttled_status_codes: ``tuple`` of ``int``
+
+        :param default_retry_after: Number of seconds to pause the requests
+                                    for if a throttled response doesn't
+                                    include the Retry-After header.
+        :type default_retry_after: ``float``
+        """
+        self.bucket = None  # type: Optional[TokenBucket]
+        self.concurrency = None  # type: Optional[AdaptiveConcurrencyLimiter]
+
+        if rate:
+            self.bucket = TokenBucket(rate=rate, burst=burst)
+
+        if max_concurrency:
+            self.concurrency = AdaptiveConcurrencyLimiter(
+                max_concurrency=max_concurrency,
+                min_concurrency=min_concurrency)
+
+        self.throttled_status_codes = throttled_status_codes
+        self.default_retry_after = default_retry_after
+
+        self.requests = 0
+        self.throttled = 0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a new request can be sent.
+
+        :return: Token which needs to be passed to :meth:`release`.
+        """
+        token = None
+
+        if self.concurrency is not None:
+            token = self.concurrency.acquire()
+
+        delay = self._paused_until - time.monotonic()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.bucket is not None:
+            self.bucket.acquire()
+
+        return token
+
+    def release(self, token, status=None, headers=None):
+        """
+        Mark request as finished.
+
+        :param token: Value returned by :meth:`acquire`.
+
+        :param status: Response status code (None if the request failed
+                       without a response).
+        :type status: ``int``
+
+        :param headers: Response headers.
+        :type headers: ``dict``
+        """
+        throttled = None
+
+        if status is not None:
+            throttled = status in self.throttled_status_codes
+
+        with self._lock:
+            self.requests += 1
+
+            if throttled:
+                self.throttled += 1
+                retry_after = get_retry_after(headers)
+
+                if retry_after is None:
+                    retry_after = self.default_retry_after
+
+                self._paused_until = max(self._paused_until,
+                                         time.monotonic() + retry_after)
+
+                if self.bucket is not None:
+                    self.bucket.drain(until=self._paused_until)
+
+        if self.concurrency is not None:
+            self.concurrency.release(token, throttled=throttled)
+
+
+def get_retry_after(headers):
+    """
+    Return value of the Retry-After header (which is either a number of
+    seconds or HTTP-date) in seconds.
+
+    :rtype: ``float`` or ``None``
+    """
+    value = None
+
+    for key in (headers or {}):
+        if key.lower() == 'retry-after':
+            value = headers[key]
+            break
+
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    http_date = parsedate_tz(value)
+
+    if http_date is None:
+        return None
+
+    return max(0.0, mktime_tz(http_date) - time.time())
+
+
+def set_rate_limit(provider, **kwargs):
+    """
+    Configure rate limiting for the connections of the provided driver type.
+
+    Keyword arguments are passed to the :class:`RateLimiter` constructor, no
+    arguments disable rate limiting.
+
+    :param provider: Driver type (e.g. ``Provider.EC2``).
+    :type provider: ``str``
+    """
+    with _rate_limiters_lock:
+        if kwargs:
+            RATE_LIMITS[provider] = kwargs
+        else:
+            RATE_LIMITS.pop(provider, None)
+
+        for key in list(_rate_limiters.keys()):
+            if key[0] == provider:
+                del _rate_limiters[key]
+
+
+def get_rate_limiter(connection):
+    """
+    Return rate limiter for the provided connection or None if rate limiting
+    is not configured.
+
+    Connections of the same driver type which talk to the same host using
+    the same credentials share a single limiter.
+
+    :rtype: :class:`RateLimiter`
+    """
+    config = getattr(connection, 'rate_limit', None)
+    driver = getattr(connection, 'driver', None)
+    provider = getattr(driver, 'type', None)
+
+    if config is None:
+        if not RATE_LIMITS:
+            return None
+
+        config = RATE_LIMITS.get(provider, None)
+
+    if not config:
+        return None
+
+    credentials = repr((getattr(connection, 'user_id', None),
+                        getattr(connection, 'key', None)))
+    key = (provider or connection.__class__.__name__, connection.host,
+           hashlib.sha256(credentials.encode('utf-8')).hexdigest())
+
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(key, None)
+
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(**config)
+            _rate_limiters[key] = rate_limiter
+
+    return rate_limiter